@@ -0,0 +1,119 @@
+import argparse
+import json
+import sys
+from typing import List as list
+
+from fit_tool.profile_schema import get_default_schema
+from fit_tool.skim_scanner import CRC_MISMATCH, SkimReport, SkimScanner, to_utc
+
+
+def get_message_name(global_id: int) -> str:
+    name = get_default_schema().get_message_name(global_id)
+    return name if name else str(global_id)
+
+
+def format_stat(report: SkimReport) -> str:
+    lines = [report.path]
+    header = report.header
+    if header is not None:
+        lines.append(
+            f"  size: {report.size} bytes, records: {report.records_size} bytes, "
+            f"protocol {header.protocol_version}, profile {header.profile_version}"
+        )
+
+    crc = report.crc_status
+    if report.file_crc is not None:
+        crc += f" (file {report.file_crc:#06x}"
+        if report.calculated_crc is not None:
+            crc += f", calculated {report.calculated_crc:#06x}"
+        crc += ")"
+    lines.append(f"  crc: {crc}")
+
+    lines.append(
+        f"  records: {report.record_count}, messages: {report.message_count}, "
+        f"definitions: {report.definition_count}"
+    )
+
+    if report.start_time is not None:
+        lines.append(
+            f"  time: {to_utc(report.start_time).isoformat()} - "
+            f"{to_utc(report.end_time).isoformat()} ({report.duration} s)"
+        )
+
+    if report.trailing_size:
+        lines.append(f"  trailing bytes: {report.trailing_size}")
+
+    if report.message_counts or report.definition_counts:
+        lines.append(f"  {'message':<32}{'count':>10}{'definitions':>13}")
+        for global_id in sorted(set(report.message_counts) | set(report.definition_counts)):
+            lines.append(
+                f"  {get_message_name(global_id):<32}"
+                f"{report.message_counts.get(global_id, 0):>10}"
+                f"{report.definition_counts.get(global_id, 0):>13}"
+            )
+
+    if report.developer_fields:
+        fields = ", ".join(
+            f"{index}:{field_id} ({count})"
+            for (index, field_id), count in sorted(report.developer_fields.items())
+        )
+        lines.append(f"  developer fields: {fields}")
+
+    if report.error:
+        lines.append(f"  error: {report.error}")
+
+    return "\n".join(lines)
+
+
+def stat(paths: list[str], check_crc: bool = True, as_json: bool = False) -> int:
+    """Print a skim of each file; returns 1 if any file is damaged, else 0."""
+    scanner = SkimScanner(check_crc=check_crc)
+    reports = []
+    exit_code = 0
+
+    for path in paths:
+        try:
+            report = scanner.scan_file(path)
+        except Exception as e:
+            report = SkimReport(path)
+            report.error = str(e)
+
+        if report.error or report.crc_status == CRC_MISMATCH:
+            exit_code = 1
+
+        if as_json:
+            reports.append(report.to_dict())
+        else:
+            print(format_stat(report))
+
+    if as_json:
+        print(json.dumps(reports, indent=2))
+
+    return exit_code
+
+
+def parse_args(args: list[str] = None):
+    parser = argparse.ArgumentParser(prog="python -m fit_tool")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    stat_parser = subparsers.add_parser(
+        "stat",
+        help="count the messages and definitions of FIT files and check their CRC "
+        "without decoding the data messages",
+    )
+    stat_parser.add_argument("files", nargs="+", help="FIT files to scan")
+    stat_parser.add_argument("--no-crc", action="store_true", help="skip the CRC check")
+    stat_parser.add_argument("--json", action="store_true", help="print the results as JSON")
+
+    return parser.parse_args(args)
+
+
+def main(args: list[str] = None):
+    args = parse_args(args)
+
+    if args.command == "stat":
+        sys.exit(stat(args.files, check_crc=not args.no_crc, as_json=args.json))
+
+
+if __name__ == "__main__":
+    main()
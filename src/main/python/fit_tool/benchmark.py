@@ -0,0 +1,318 @@
+import argparse
+import glob
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+from typing import Dict as dict
+from typing import List as list
+
+from fit_tool import SDK_VERSION
+from fit_tool.concurrent_decoder import ConcurrentDecoder, is_free_threaded
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_builder import FitFileBuilder
+from fit_tool.fit_file_generator import FitFileGenerator
+from fit_tool.profile.messages.record_message import RecordMessage
+from fit_tool.summary_aggregator import SummaryAggregator
+from fit_tool.utils.crc import crc16
+
+SDK_DATA_PATH = os.path.join(os.path.dirname(__file__), "tests", "data", "sdk")
+
+DEFAULT_RECORD_COUNT = 100000
+DEFAULT_DEVELOPER_FIELD_COUNT = 8
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_REPEAT = 3
+
+BENCHMARK_NAMES = ["decode", "encode", "crc", "csv", "summary"]
+
+
+def measure(function: Callable, repeat: int = DEFAULT_REPEAT, trace: bool = True) -> dict:
+    """Time the best of repeat untraced runs of function, then run it once under
+    tracemalloc for the peak memory and the number of memory blocks it allocated
+    that are still held once it returns."""
+    seconds = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+
+    result = {"seconds": seconds}
+    if trace:
+        tracemalloc.start()
+        try:
+            blocks = len(tracemalloc.take_snapshot().traces)
+            function()
+            _, peak = tracemalloc.get_traced_memory()
+            result["peak_memory"] = peak
+            result["retained_blocks"] = len(tracemalloc.take_snapshot().traces) - blocks
+        finally:
+            tracemalloc.stop()
+
+    return result
+
+
+def benchmark_file(
+    name: str, bytes_buffer: bytes, repeat: int = DEFAULT_REPEAT, trace: bool = True
+) -> dict:
+    fit_file = FitFile.from_bytes(bytes_buffer)
+    record_count = len(fit_file.records)
+    messages = [x.message for x in fit_file.records if not x.is_definition]
+    columns = fit_file.to_columns(RecordMessage.ID)
+    aggregator = SummaryAggregator(columns)
+
+    def encode():
+        builder = FitFileBuilder(auto_define=True)
+        builder.add_all(messages)
+        builder.build().to_bytes()
+
+    with tempfile.TemporaryDirectory() as directory:
+        functions = {
+            "decode": lambda: FitFile.from_bytes(bytes_buffer),
+            "encode": encode,
+            "crc": lambda: crc16(bytes_buffer),
+            "csv": lambda: fit_file.to_csv(os.path.join(directory, "benchmark.csv")),
+            "summary": lambda: aggregator.summarize(0, aggregator.record_count),
+        }
+
+        benchmarks = {}
+        for benchmark_name, function in functions.items():
+            result = measure(function, repeat=repeat, trace=trace)
+            result["records_per_second"] = record_count / result["seconds"]
+            result["mb_per_second"] = len(bytes_buffer) / 1e6 / result["seconds"]
+            benchmarks[benchmark_name] = result
+
+    return {
+        "name": name,
+        "size": len(bytes_buffer),
+        "records": record_count,
+        "benchmarks": benchmarks,
+    }
+
+
+def benchmark_threads(
+    name: str, bytes_buffer: bytes, thread_counts: list[int], repeat: int = DEFAULT_REPEAT
+) -> dict:
+    """Time decoding copies of a file with a ConcurrentDecoder for each thread
+    count. The speed-up is relative to the first thread count; it only grows with
+    the threads on a free-threaded build."""
+    bytes_buffers = [bytes_buffer] * (2 * max(thread_counts))
+    results = []
+
+    for thread_count in thread_counts:
+        with ConcurrentDecoder(max_workers=thread_count) as decoder:
+            result = measure(
+                lambda: decoder.decode_all_bytes(bytes_buffers), repeat=repeat, trace=False
+            )
+
+        result["threads"] = thread_count
+        result["files_per_second"] = len(bytes_buffers) / result["seconds"]
+        result["speedup"] = results[0]["seconds"] / result["seconds"] if results else 1.0
+        results.append(result)
+
+    return {
+        "name": name,
+        "files": len(bytes_buffers),
+        "free_threaded": is_free_threaded(),
+        "results": results,
+    }
+
+
+def run(
+    paths: list[str],
+    record_count: int = DEFAULT_RECORD_COUNT,
+    developer_field_count: int = DEFAULT_DEVELOPER_FIELD_COUNT,
+    repeat: int = DEFAULT_REPEAT,
+    trace: bool = True,
+    thread_counts: list[int] = None,
+) -> dict:
+    """Benchmark each file and a generated activity. With thread_counts, the
+    concurrent decoding of the last of them is measured as well."""
+    results = []
+    last_file = None
+
+    for path in paths:
+        with open(path, "rb") as file_object:
+            bytes_buffer = file_object.read()
+        last_file = (os.path.basename(path), bytes_buffer)
+
+        try:
+            results.append(
+                benchmark_file(
+                    os.path.basename(path), bytes_buffer, repeat=repeat, trace=trace
+                )
+            )
+        except Exception as e:
+            results.append({"name": os.path.basename(path), "error": str(e)})
+
+    if record_count > 0:
+        generator = FitFileGenerator(
+            record_count=record_count,
+            developer_field_count=developer_field_count,
+            lap_interval=3600,
+            event_interval=600,
+        )
+        bytes_buffer = FitFileGenerator.to_bytes(generator.activity())
+        name = f"generated_{record_count}_records_{developer_field_count}_developer_fields"
+        results.append(benchmark_file(name, bytes_buffer, repeat=repeat, trace=trace))
+        last_file = (name, bytes_buffer)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sdk_version": SDK_VERSION,
+        "results": results,
+    }
+
+    if thread_counts and last_file is not None:
+        report["threads"] = benchmark_threads(*last_file, thread_counts, repeat=repeat)
+
+    return report
+
+
+def compare(report: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """Return a line for each benchmark that is slower or uses more peak memory
+    than in the baseline by more than threshold (relative)."""
+    baseline_results = {x["name"]: x for x in baseline["results"] if "error" not in x}
+    regressions = []
+
+    for result in report["results"]:
+        baseline_result = baseline_results.get(result["name"])
+        if baseline_result is None or "error" in result:
+            continue
+
+        for benchmark_name, benchmark in result["benchmarks"].items():
+            baseline_benchmark = baseline_result["benchmarks"].get(benchmark_name)
+            if baseline_benchmark is None:
+                continue
+
+            for key in ["seconds", "peak_memory"]:
+                if key not in benchmark or key not in baseline_benchmark:
+                    continue
+
+                ratio = benchmark[key] / baseline_benchmark[key] if baseline_benchmark[key] else 1.0
+                if ratio > 1.0 + threshold:
+                    regressions.append(
+                        f"{result['name']} {benchmark_name} {key}: "
+                        f"{baseline_benchmark[key]:.4g} -> {benchmark[key]:.4g} ({ratio:.2f}x)"
+                    )
+
+    return regressions
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f"{'file':<48} {'benchmark':<8} {'seconds':>9} {'records/s':>11} {'MB/s':>8} {'peak MB':>8}"
+    ]
+    for result in report["results"]:
+        if "error" in result:
+            lines.append(f"{result['name']:<48} error: {result['error']}")
+            continue
+
+        for benchmark_name, benchmark in result["benchmarks"].items():
+            peak = benchmark.get("peak_memory")
+            lines.append(
+                f"{result['name']:<48} {benchmark_name:<8} {benchmark['seconds']:>9.4f} "
+                f"{benchmark['records_per_second']:>11.0f} {benchmark['mb_per_second']:>8.2f} "
+                f"{'' if peak is None else f'{peak / 1e6:.2f}':>8}"
+            )
+
+    threads = report.get("threads")
+    if threads:
+        lines.append("")
+        lines.append(
+            f"{threads['files']} x {threads['name']}, "
+            f"{'free-threaded' if threads['free_threaded'] else 'GIL enabled'}"
+        )
+        lines.append(f"{'threads':>7} {'seconds':>9} {'files/s':>9} {'speed-up':>8}")
+        for result in threads["results"]:
+            lines.append(
+                f"{result['threads']:>7} {result['seconds']:>9.4f} "
+                f"{result['files_per_second']:>9.2f} {result['speedup']:>8.2f}"
+            )
+
+    return "\n".join(lines)
+
+
+def parse_args(args: list[str] = None):
+    parser = argparse.ArgumentParser(
+        description="Measure decode, encode, CRC, CSV export and summary throughput and memory, "
+        "and optionally the scaling of concurrent decoding."
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="FIT files to benchmark (default: the SDK example files)",
+    )
+    parser.add_argument(
+        "--records",
+        type=int,
+        default=DEFAULT_RECORD_COUNT,
+        help="record count of the generated activity, 0 to skip it",
+    )
+    parser.add_argument(
+        "--developer-fields",
+        type=int,
+        default=DEFAULT_DEVELOPER_FIELD_COUNT,
+        help="developer fields per record of the generated activity",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per benchmark"
+    )
+    parser.add_argument("--no-trace", action="store_true", help="skip memory measurements")
+    parser.add_argument(
+        "--threads",
+        help="comma separated thread counts to measure concurrent decoding with, e.g. 1,2,4",
+    )
+    parser.add_argument("--output", help="write the results as JSON to this path")
+    parser.add_argument("--baseline", help="compare against results saved with --output")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative slowdown or memory increase reported as a regression",
+    )
+
+    return parser.parse_args(args)
+
+
+def main(args: list[str] = None):
+    """Exits with 1 if a file could not be benchmarked or a regression was found."""
+    args = parse_args(args)
+    paths = args.files if args.files else sorted(glob.glob(os.path.join(SDK_DATA_PATH, "*.fit")))
+
+    report = run(
+        paths,
+        args.records,
+        args.developer_fields,
+        repeat=args.repeat,
+        trace=not args.no_trace,
+        thread_counts=[int(x) for x in args.threads.split(",")] if args.threads else None,
+    )
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, "w") as file_object:
+            json.dump(report, file_object, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file_object:
+            baseline = json.load(file_object)
+
+        regressions = compare(report, baseline, threshold=args.threshold)
+        for regression in regressions:
+            print(f"regression: {regression}")
+
+        if regressions:
+            sys.exit(1)
+
+    if any("error" in x for x in report["results"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
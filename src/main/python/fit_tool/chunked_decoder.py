@@ -0,0 +1,228 @@
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict as dict
+from typing import Iterator
+from typing import List as list
+
+from fit_tool.decoder_context import DecoderContext
+from fit_tool.definition_message import DefinitionMessage
+from fit_tool.field import DecodeMode
+from fit_tool.fit_file import records_to_columns
+from fit_tool.fit_file_header import FitFileHeader
+from fit_tool.profile.messages.field_description_message import FieldDescriptionMessage
+from fit_tool.record import Record, RecordHeader
+from fit_tool.record_layout import get_definition_size
+from fit_tool.utils.crc import crc16
+
+# chunks per worker, so that workers finishing early pick up more work
+CHUNKS_PER_WORKER = 4
+MIN_CHUNK_SIZE = 1 << 16
+
+
+class Chunk:
+    """A range of the records of a file with the definition state at its start:
+    the records to decode before the first one, which are the field description
+    messages read so far, each after its definition, followed by the active
+    definition messages."""
+
+    def __init__(self, start: int, end: int, record_index: int, prelude: list[bytes]):
+        self.start = start
+        self.end = end
+        self.record_index = record_index
+        self.prelude = prelude
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start
+
+
+def scan_chunks(bytes_buffer: bytes, chunk_size: int) -> tuple:
+    """Split the records of a file into chunks of about chunk_size bytes in one
+    pass that reads the record headers and definitions only. Data records are
+    skipped by the size of their definition, except field descriptions which are
+    kept for the chunks that follow. Returns the file header and the chunks."""
+    header = FitFileHeader.from_bytes(bytes_buffer[: bytes_buffer[0]])
+    offset = bytes_buffer[0]
+    end = offset + header.records_size
+
+    definitions = {}
+    developer_prelude = []
+    chunks = []
+    chunk = Chunk(offset, offset, 0, [])
+    record_index = 0
+
+    while offset < end:
+        if offset - chunk.start >= chunk_size:
+            chunk.end = offset
+            chunks.append(chunk)
+            prelude = developer_prelude + [x[1] for x in definitions.values()]
+            chunk = Chunk(offset, offset, record_index, prelude)
+
+        record_header = RecordHeader.from_bytes(bytes_buffer, offset=offset)
+        if record_header.is_definition:
+            size = get_definition_size(bytes_buffer, offset, record_header)
+            definition_message = DefinitionMessage.from_bytes(
+                bytes_buffer,
+                offset=offset + RecordHeader.HEADER_SIZE,
+                has_developer_fields=record_header.has_developer_fields,
+            )
+            definitions[record_header.local_id] = (
+                definition_message,
+                bytes_buffer[offset : offset + size],
+            )
+        else:
+            definition = definitions.get(record_header.local_id)
+            if definition is None:
+                raise Exception(
+                    f"DefinitionMessage not defined for local_id: {record_header.local_id}"
+                )
+
+            definition_message, definition_bytes = definition
+            size = RecordHeader.HEADER_SIZE + definition_message.defined_data_size
+            if definition_message.global_id == FieldDescriptionMessage.ID:
+                developer_prelude.append(definition_bytes)
+                developer_prelude.append(bytes_buffer[offset : offset + size])
+
+        offset += size
+        record_index += 1
+
+    chunk.end = offset
+    chunks.append(chunk)
+    return header, chunks
+
+
+def decode_records(context: DecoderContext, bytes_buffer: bytes) -> Iterator[Record]:
+    """Decode the records of a buffer holding whole records only."""
+    offset = 0
+    while offset < len(bytes_buffer):
+        record = context.decode_record(bytes_buffer, offset)
+        record_header = record.header
+        if record_header.is_definition:
+            offset += get_definition_size(bytes_buffer, offset, record_header)
+        else:
+            definition_message = context.get_definition_message(record_header.local_id)
+            offset += RecordHeader.HEADER_SIZE + definition_message.defined_data_size
+
+        yield record
+
+
+def decode_chunk_columns(
+    bytes_buffer: bytes, prelude: list[bytes], global_id: int, decode_mode: DecodeMode
+) -> tuple:
+    """Decode the records of a chunk after its prelude. Returns the columns of the
+    messages with the given global id and their row count."""
+    context = DecoderContext(decode_mode=decode_mode)
+    for record_bytes in prelude:
+        context.decode_record(record_bytes)
+
+    records = [
+        x
+        for x in decode_records(context, bytes_buffer)
+        if not x.is_definition and x.message.global_id == global_id
+    ]
+    return records_to_columns(records, global_id, decode_mode=decode_mode), len(records)
+
+
+def concatenate_columns(results: list[tuple]) -> dict[str, list]:
+    """Concatenate the columns and row counts of consecutive chunks. Columns
+    missing from a chunk are None for its rows."""
+    columns = {}
+    row_count = 0
+
+    for chunk_columns, chunk_row_count in results:
+        for name, column in chunk_columns.items():
+            result = columns.get(name)
+            if result is None:
+                result = [None] * row_count
+                columns[name] = result
+            result.extend(column)
+
+        row_count += chunk_row_count
+        for column in columns.values():
+            if len(column) < row_count:
+                column.extend([None] * (row_count - len(column)))
+
+    return columns
+
+
+class ChunkedDecoder:
+    """Decodes one large file on several processes.
+
+    A sequential scan reads the record headers and definitions only, and splits
+    the records into chunks, each with the definitions and developer fields
+    active at its start. The chunks are then decoded in parallel in a process
+    pool, while the parent checks the file CRC, and their results are
+    concatenated in order.
+
+    Chunks return the columns of one message type, as FitFile.to_columns does:
+    pickling decoded records back to the parent would cost more than decoding
+    them.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        chunk_size: int = None,
+        check_crc: bool = True,
+        decode_mode: DecodeMode = DecodeMode.RAW,
+    ):
+        self.max_workers = max_workers if max_workers else os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.check_crc = check_crc
+        self.decode_mode = decode_mode
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    def get_chunk_size(self, records_size: int) -> int:
+        if self.chunk_size:
+            return self.chunk_size
+
+        chunk_count = self.max_workers * CHUNKS_PER_WORKER
+        return max(MIN_CHUNK_SIZE, -(-records_size // chunk_count))
+
+    def to_columns(self, bytes_buffer: bytes, global_id: int) -> dict[str, list]:
+        """Return the columns of the messages with the given global id of a file,
+        the same as FitFile.to_columns."""
+        header, chunks = scan_chunks(bytes_buffer, self.get_chunk_size(len(bytes_buffer)))
+
+        futures = [
+            self.executor.submit(
+                decode_chunk_columns,
+                bytes_buffer[x.start : x.end],
+                x.prelude,
+                global_id,
+                self.decode_mode,
+            )
+            for x in chunks
+        ]
+
+        if self.check_crc:
+            self.check_file_crc(bytes_buffer, header)
+
+        return concatenate_columns([x.result() for x in futures])
+
+    def file_to_columns(self, path: str, global_id: int) -> dict[str, list]:
+        with open(path, "rb") as file_object:
+            bytes_buffer = file_object.read()
+
+        return self.to_columns(bytes_buffer, global_id)
+
+    @staticmethod
+    def check_file_crc(bytes_buffer: bytes, header: FitFileHeader):
+        end = bytes_buffer[0] + header.records_size
+        (file_crc,) = struct.unpack_from("<H", bytes_buffer, end)
+        crc = crc16(bytes_buffer[:end])
+
+        if crc != file_crc:
+            raise Exception(
+                f"Calculated crc ({hex(crc)}) does not match crc in file ({hex(file_crc)})."
+            )
@@ -0,0 +1,304 @@
+import heapq
+import math
+from typing import List as list
+from typing import Optional
+
+from fit_tool.data_message import DataMessage
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_builder import FitFileBuilder
+from fit_tool.geo import EARTH_RADIUS, cumulative_distances
+from fit_tool.profile.messages.course_point_message import CoursePointMessage
+from fit_tool.profile.messages.lap_message import LapMessage
+from fit_tool.profile.messages.record_message import RecordMessage
+
+DOUGLAS_PEUCKER = "douglas_peucker"
+VISVALINGAM = "visvalingam"
+
+
+def project(
+    latitudes: list[float], longitudes: list[float], mean_latitude: float = None
+) -> tuple:
+    """Project positions in degrees to x, y meters on a plane tangent at their mean
+    latitude (equirectangular), precise enough for the extent of a course."""
+    if mean_latitude is None:
+        mean_latitude = sum(latitudes) / len(latitudes) if latitudes else 0.0
+    x_scale = math.radians(1.0) * EARTH_RADIUS * math.cos(math.radians(mean_latitude))
+    y_scale = math.radians(1.0) * EARTH_RADIUS
+
+    return [x * x_scale for x in longitudes], [y * y_scale for y in latitudes]
+
+
+def segment_distance(xs: list[float], ys: list[float], i: int, start: int, end: int) -> float:
+    """Distance from point i to the segment between points start and end."""
+    dx = xs[end] - xs[start]
+    dy = ys[end] - ys[start]
+    length_squared = dx * dx + dy * dy
+
+    if length_squared == 0.0:
+        return math.hypot(xs[i] - xs[start], ys[i] - ys[start])
+
+    t = ((xs[i] - xs[start]) * dx + (ys[i] - ys[start]) * dy) / length_squared
+    t = max(0.0, min(1.0, t))
+    return math.hypot(xs[i] - (xs[start] + t * dx), ys[i] - (ys[start] + t * dy))
+
+
+def triangle_area(xs: list[float], ys: list[float], i: int, j: int, k: int) -> float:
+    return abs((xs[j] - xs[i]) * (ys[k] - ys[i]) - (xs[k] - xs[i]) * (ys[j] - ys[i])) / 2
+
+
+def douglas_peucker(
+    xs: list[float],
+    ys: list[float],
+    tolerance: float = None,
+    max_points: int = None,
+    keep_indexes: set = None,
+) -> list[int]:
+    """Return the indexes of the points kept by Douglas-Peucker.
+
+    Segments are split at their farthest point, farthest first, until no point is
+    more than tolerance away from its segment or max_points are kept. Points in
+    keep_indexes and the end points are always kept.
+    """
+    count = len(xs)
+    if count <= 2:
+        return [i for i in range(count)]
+
+    kept = {0, count - 1}
+    # split at the points that must be kept first, those are not subject to the bounds
+    boundaries = sorted(kept | set(x for x in keep_indexes or () if 0 <= x < count))
+    kept.update(boundaries)
+
+    heap = []
+
+    def push(start: int, end: int):
+        if end - start < 2:
+            return
+        farthest_index, farthest_distance = start, -1.0
+        for i in range(start + 1, end):
+            distance = segment_distance(xs, ys, i, start, end)
+            if distance > farthest_distance:
+                farthest_index, farthest_distance = i, distance
+        heapq.heappush(heap, (-farthest_distance, farthest_index, start, end))
+
+    for start, end in zip(boundaries, boundaries[1:]):
+        push(start, end)
+
+    while heap:
+        distance, index, start, end = heapq.heappop(heap)
+        if tolerance is not None and -distance <= tolerance:
+            break
+        if max_points is not None and len(kept) >= max_points:
+            break
+
+        kept.add(index)
+        push(start, index)
+        push(index, end)
+
+    return sorted(kept)
+
+
+def visvalingam(
+    xs: list[float],
+    ys: list[float],
+    tolerance: float = None,
+    max_points: int = None,
+    keep_indexes: set = None,
+) -> list[int]:
+    """Return the indexes of the points kept by Visvalingam-Whyatt.
+
+    The point forming the smallest triangle with its neighbours is removed until
+    the smallest area exceeds tolerance (square meters) or only max_points are
+    left. Points in keep_indexes and the end points are always kept.
+    """
+    count = len(xs)
+    if count <= 2:
+        return [i for i in range(count)]
+
+    keep_indexes = keep_indexes or set()
+    previous = [i - 1 for i in range(count)]
+    following = [i + 1 for i in range(count)]
+    removed = [False] * count
+    areas = [math.inf] * count
+    remaining = count
+
+    heap = []
+    for i in range(1, count - 1):
+        if i not in keep_indexes:
+            areas[i] = triangle_area(xs, ys, i - 1, i, i + 1)
+            heap.append((areas[i], i))
+    heapq.heapify(heap)
+
+    while heap:
+        area, i = heapq.heappop(heap)
+        if removed[i] or area != areas[i]:
+            # stale entry, the area changed when a neighbour was removed
+            continue
+        if max_points is not None and remaining <= max_points:
+            break
+        if tolerance is not None and area > tolerance:
+            break
+
+        removed[i] = True
+        remaining -= 1
+        previous_index, following_index = previous[i], following[i]
+        following[previous_index] = following_index
+        previous[following_index] = previous_index
+
+        for j in (previous_index, following_index):
+            if 0 < j < count - 1 and j not in keep_indexes:
+                # the area of a point never drops below that of a removed neighbour,
+                # so points are removed in order of increasing effective area
+                areas[j] = max(area, triangle_area(xs, ys, previous[j], j, following[j]))
+                heapq.heappush(heap, (areas[j], j))
+
+    return [i for i in range(count) if not removed[i]]
+
+
+def set_distance(message: DataMessage, distance: float):
+    """Set the distance of a message, adding the field to its definition if a
+    decoded message does not have one."""
+    if message.get_field_by_name("distance") is None and not message.growable:
+        message.growable = True
+        message.distance = distance
+        message.update_definition_message()
+    else:
+        message.distance = distance
+
+
+class CourseSimplifier:
+    """Reduces the track points of a course.
+
+    Records are simplified with Douglas-Peucker (tolerance in meters) or
+    Visvalingam-Whyatt (tolerance in square meters), bounded by a tolerance, a
+    maximum number of points or both. The records nearest to the course points
+    (turn points) are always kept, and the distances of the kept records, the course
+    points and the laps are recomputed along the simplified track.
+    """
+
+    def __init__(
+        self,
+        tolerance: float = None,
+        max_points: int = None,
+        method: str = DOUGLAS_PEUCKER,
+    ):
+        if tolerance is None and max_points is None:
+            raise Exception("A tolerance or a maximum number of points is required.")
+        if method not in (DOUGLAS_PEUCKER, VISVALINGAM):
+            raise Exception(f"Unknown simplification method: {method}")
+
+        self.tolerance = tolerance
+        self.max_points = max_points
+        self.method = method
+
+    @staticmethod
+    def find_nearest_index(
+        xs: list[float], ys: list[float], x: float, y: float
+    ) -> Optional[int]:
+        nearest_index, nearest_distance = None, math.inf
+        for i in range(len(xs)):
+            distance = (xs[i] - x) ** 2 + (ys[i] - y) ** 2
+            if distance < nearest_distance:
+                nearest_index, nearest_distance = i, distance
+        return nearest_index
+
+    def simplify(
+        self,
+        records: list[RecordMessage],
+        course_points: list[CoursePointMessage] = None,
+    ) -> list[RecordMessage]:
+        """Return the kept records, records without a position are dropped. The
+        distance of the kept records and of the course points is updated."""
+        records = [
+            x for x in records if x.position_lat is not None and x.position_long is not None
+        ]
+        if not records:
+            return records
+
+        latitudes = [x.position_lat for x in records]
+        longitudes = [x.position_long for x in records]
+        mean_latitude = sum(latitudes) / len(latitudes)
+        xs, ys = project(latitudes, longitudes, mean_latitude)
+
+        keep_indexes = set()
+        nearest_indexes = []
+        for course_point in course_points or []:
+            nearest_index = None
+            if course_point.position_lat is not None and course_point.position_long is not None:
+                (x,), (y,) = project(
+                    [course_point.position_lat], [course_point.position_long], mean_latitude
+                )
+                nearest_index = self.find_nearest_index(xs, ys, x, y)
+                keep_indexes.add(nearest_index)
+            nearest_indexes.append(nearest_index)
+
+        function = douglas_peucker if self.method == DOUGLAS_PEUCKER else visvalingam
+        kept_indexes = function(xs, ys, self.tolerance, self.max_points, keep_indexes)
+        distances = cumulative_distances(
+            [latitudes[i] for i in kept_indexes], [longitudes[i] for i in kept_indexes]
+        )
+
+        distances_by_index = {}
+        for i, distance in zip(kept_indexes, distances):
+            set_distance(records[i], distance)
+            distances_by_index[i] = distance
+
+        for course_point, nearest_index in zip(course_points or [], nearest_indexes):
+            if nearest_index is not None:
+                set_distance(course_point, distances_by_index[nearest_index])
+
+        return [records[i] for i in kept_indexes]
+
+    @staticmethod
+    def get_lap_distance(
+        lap: LapMessage, kept_records: list[RecordMessage], file_order_records: list
+    ) -> float:
+        """Return the simplified distance of a lap: from the last kept record before
+        its start to the last kept record up to its end. Laps without start and end
+        times span the records between the previous lap and this one."""
+        records = kept_records
+        if (
+            lap.start_time is not None
+            and lap.timestamp is not None
+            and all(x.timestamp is not None for x in kept_records)
+        ):
+            before = [x for x in records if x.timestamp < lap.start_time]
+            records = [x for x in records if lap.start_time <= x.timestamp <= lap.timestamp]
+        else:
+            before, records = file_order_records
+
+        if not records:
+            return 0.0
+
+        return records[-1].distance - (before[-1].distance if before else 0.0)
+
+    def simplify_fit_file(self, fit_file: FitFile) -> FitFile:
+        """Build a course file with the records simplified. All other messages are
+        kept in place; the total distance of each lap is recomputed over its
+        simplified records. The messages of fit_file are left unchanged."""
+        messages = [x.message.copy() for x in fit_file.records if not x.is_definition]
+        records = [x for x in messages if isinstance(x, RecordMessage)]
+        course_points = [x for x in messages if isinstance(x, CoursePointMessage)]
+
+        kept_records = self.simplify(records, course_points)
+        kept_record_ids = set(id(x) for x in kept_records)
+
+        builder = FitFileBuilder(auto_define=True)
+        # kept records before the previous lap and since then, in file order
+        previous_lap_records = []
+        lap_records = []
+        for message in messages:
+            if isinstance(message, RecordMessage):
+                if id(message) not in kept_record_ids:
+                    continue
+                lap_records.append(message)
+            elif isinstance(message, LapMessage):
+                if message.total_distance is not None:
+                    message.total_distance = self.get_lap_distance(
+                        message, kept_records, (previous_lap_records, lap_records)
+                    )
+                previous_lap_records = previous_lap_records + lap_records
+                lap_records = []
+
+            builder.add(message)
+
+        return builder.build()
@@ -1,15 +1,27 @@
+import threading
 from typing import List as list
 from typing import Optional
 
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
+from fit_tool.diagnostics import UNDEFINED_DEVELOPER_FIELD, UNDEFINED_FIELD, Diagnostics
 from fit_tool.endian import Endian
-from fit_tool.field import Field
+from fit_tool.field import DecodeMode, Field
 from fit_tool.message import Message
 from fit_tool.utils.logging import logger
 
+# names of the profile fields of each message class, see get_column_name. Filled
+# on first use under the lock, as readers on several threads share it.
+_profile_field_names_by_type = {}
+_profile_field_names_lock = threading.Lock()
+
 
 class DataMessage(Message):
+    # Field classes of a profile message keyed by field id, in profile order.
+    # Only the fields present in the definition message are instantiated, the
+    # others are created on first set.
+    FIELD_TYPES = {}
+
     def __init__(
         self,
         local_id: int = 0,
@@ -19,14 +31,24 @@ class DataMessage(Message):
         definition_message: DefinitionMessage = None,
         fields: list[Field] = None,
         developer_fields: list[DeveloperField] = None,
+        field_types: dict = None,
     ):
         super().__init__(local_id=local_id, global_id=global_id, endian=endian)
 
         self.name = name
         self.definition_message = definition_message
+        self.field_types = field_types if field_types else {}
+        self.growable = definition_message is None
+
+        if fields is None and definition_message:
+            fields = self.create_defined_fields(definition_message)
+
         self.fields = fields if fields else []
         self.developer_fields = developer_fields if developer_fields else []
 
+        self.fields_by_id = {field.field_id: field for field in self.fields}
+        self.link_sub_fields()
+
     @staticmethod
     def from_definition(
         definition_message: DefinitionMessage, developer_fields: list[DeveloperField]
@@ -42,9 +64,28 @@ class DataMessage(Message):
         developer_fields: list[DeveloperField],
         bytes_buffer: bytes,
         offset: int = 0,
+        decode_mode: DecodeMode = None,
+        diagnostics: Diagnostics = None,
+        message_factory=None,
     ):
-        message = DataMessage.from_definition(definition_message, developer_fields)
-        message.read_from_bytes(bytes_buffer, offset)
+        if message_factory is None:
+            message = DataMessage.from_definition(definition_message, developer_fields)
+        else:
+            message = message_factory.from_definition(definition_message, developer_fields)
+        if decode_mode is not None and decode_mode != DecodeMode.VALUE:
+            message.set_decode_mode(decode_mode)
+        message.read_from_bytes(bytes_buffer, offset, diagnostics=diagnostics)
+        return message
+
+    def copy(self):
+        """Return a copy of the message with copies of its fields, sharing the
+        definition message."""
+        message = object.__new__(type(self))
+        message.__dict__.update(self.__dict__)
+        message.fields = [x.copy() for x in self.fields]
+        message.developer_fields = [x.copy() for x in self.developer_fields]
+        message.fields_by_id = {x.field_id: x for x in message.fields}
+        message.link_sub_fields()
         return message
 
     @property
@@ -82,12 +123,99 @@ class DataMessage(Message):
             else:
                 field.size = 0
 
+    def update_definition_message(self):
+        """Derive the definition message again from the valid fields, after fields
+        were added to or removed from a decoded message."""
+        self.definition_message = None
+        self.set_definition_message(DefinitionMessage.from_data_message(self))
+
+    def create_defined_fields(self, definition_message: DefinitionMessage) -> list[Field]:
+        fields = []
+        for field_definition in definition_message.field_definitions:
+            field_type = self.field_types.get(field_definition.field_id)
+            if field_type:
+                fields.append(field_type(size=field_definition.size, growable=False))
+
+        return fields
+
     def get_field(self, field_id: int) -> Optional[Field]:
-        return next((x for x in self.fields if x.field_id == field_id), None)
+        return self.fields_by_id.get(field_id)
+
+    def get_or_create_field(self, field_id: int) -> Optional[Field]:
+        field = self.fields_by_id.get(field_id)
+        if field is None:
+            field_type = self.field_types.get(field_id)
+            if field_type is None:
+                return None
+
+            field = field_type(size=0, growable=self.growable)
+            self.add_field(field)
+
+        return field
+
+    def add_field(self, field: Field):
+        self.fields_by_id[field.field_id] = field
+
+        if self.field_types:
+            # keep profile order
+            self.fields = [
+                self.fields_by_id[field_id]
+                for field_id in self.field_types
+                if field_id in self.fields_by_id
+            ]
+        else:
+            self.fields.append(field)
+
+        self.link_sub_fields()
 
     def get_field_by_name(self, name: str) -> Optional[Field]:
         return next((x for x in self.fields if x.name == name), None)
 
+    def get_profile_field_names(self) -> frozenset:
+        names = _profile_field_names_by_type.get(type(self))
+        if names is None:
+            with _profile_field_names_lock:
+                names = _profile_field_names_by_type.get(type(self))
+                if names is None:
+                    names = frozenset(x(size=0).name for x in self.field_types.values())
+                    _profile_field_names_by_type[type(self)] = names
+
+        return names
+
+    def get_column_name(self, field: Field) -> str:
+        """Return the name of the column holding the values of a field, unique within
+        the message type. Developer fields without a name, or named like a profile
+        field or another developer field, are named after their developer data index
+        and field id."""
+        if not isinstance(field, DeveloperField):
+            return field.name
+
+        if (
+            field.name
+            and field.name not in self.get_profile_field_names()
+            and not any(x.name == field.name for x in self.developer_fields if x is not field)
+        ):
+            return field.name
+
+        return f"developer_{field.developer_data_index}_{field.field_id}"
+
+    def set_decode_mode(self, decode_mode: DecodeMode):
+        for field in self.fields:
+            field.decode_mode = decode_mode
+
+        for field in self.developer_fields:
+            field.decode_mode = decode_mode
+
+    def link_sub_fields(self):
+        for field in self.fields:
+            if field.sub_fields:
+                field.link_reference_fields(self.fields_by_id)
+
+    def resolve_sub_fields(self):
+        for field in self.fields:
+            if field.sub_fields and field.is_valid():
+                field.get_valid_sub_field()
+
     def clear_field_by_id(self, field_id: int):
         field = self.get_field(field_id)
         if field:
@@ -115,7 +243,9 @@ class DataMessage(Message):
     def get_developer_field_by_name(self, name: str) -> Optional[DeveloperField]:
         return next(iter([x for x in self.developer_fields if x.name == name]))
 
-    def read_from_bytes(self, bytes_buffer: bytes, offset: int = 0):
+    def read_from_bytes(
+        self, bytes_buffer: bytes, offset: int = 0, diagnostics: Diagnostics = None
+    ):
         start = offset
 
         if not self.definition_message:
@@ -125,9 +255,7 @@ class DataMessage(Message):
             field = self.get_field(field_definition.field_id)
 
             if not field:
-                logger.warning(
-                    f"Field id: {field_definition.field_id} is not defined for message {self.name}:{self.global_id}. Skipping this field"
-                )
+                self.add_diagnostic(diagnostics, UNDEFINED_FIELD, field_definition.field_id)
                 start += field_definition.size
                 continue
 
@@ -147,8 +275,8 @@ class DataMessage(Message):
             )
 
             if not field:
-                logger.warning(
-                    f"Developer Field id: {developer_field_definition.field_id} is not defined for message {self.name}:{self.global_id}. Skipping this field"
+                self.add_diagnostic(
+                    diagnostics, UNDEFINED_DEVELOPER_FIELD, developer_field_definition.field_id
                 )
                 start += developer_field_definition.size
                 continue
@@ -160,6 +288,15 @@ class DataMessage(Message):
             else:
                 raise Exception(f"Developer Field ${field.name} is empty")
 
+        self.resolve_sub_fields()
+
+    def add_diagnostic(self, diagnostics: Diagnostics, kind: str, field_id: int):
+        key = (kind, self.name, self.global_id, field_id)
+        if diagnostics is None:
+            logger.warning(Diagnostics.format(key, ()))
+        else:
+            diagnostics.add(*key)
+
     def to_row(self) -> list:
         row = [self.name]
 
@@ -185,7 +322,9 @@ class DataMessage(Message):
 
                 if field is None:
                     raise Exception(
-                        f"Developer field for id: {field_definition.developer_data_index}:{field_definition.field_id} not found."
+                        "Developer field for id: "
+                        f"{field_definition.developer_data_index}:{field_definition.field_id} "
+                        "not found."
                     )
 
                 if field.is_valid():
@@ -233,7 +372,9 @@ class DataMessage(Message):
 
                 if field is None:
                     raise Exception(
-                        f"Developer field for id: {field_definition.developer_data_index}:{field_definition.field_id} not found."
+                        "Developer field for id: "
+                        f"{field_definition.developer_data_index}:{field_definition.field_id} "
+                        "not found."
                     )
 
                 if field.is_valid():
@@ -0,0 +1,127 @@
+import hashlib
+import os
+import pickle
+import struct
+import tempfile
+
+from fit_tool import SDK_VERSION
+
+DEFAULT_MAX_SIZE = 1 << 30
+CACHE_FILE_EXTENSION = ".pickle"
+TEMP_FILE_EXTENSION = ".tmp"
+
+# bump when the layout of decoded objects changes so older entries are not used
+CACHE_VERSION = 1
+
+
+class DecodeCache:
+    """On-disk cache of decoded FIT files.
+
+    Entries are pickled objects stored in one file each, named after a key derived
+    from the FIT file: its size, modification time and trailing CRC, or with
+    hash_content a SHA-256 of its bytes. Reading an entry marks it as recently
+    used; once the cache grows beyond max_size bytes the least recently used
+    entries are removed. FitFile.from_file stores the compact form returned by
+    FitFile.to_cache_entry.
+    """
+
+    def __init__(
+        self, directory: str, max_size: int = DEFAULT_MAX_SIZE, hash_content: bool = False
+    ):
+        self.directory = directory
+        self.max_size = max_size
+        self.hash_content = hash_content
+
+        os.makedirs(directory, exist_ok=True)
+
+    def get_key(self, path: str, *args) -> str:
+        key = hashlib.sha256(f"{CACHE_VERSION}:{SDK_VERSION}:{args}".encode())
+
+        with open(path, "rb") as file_object:
+            if self.hash_content:
+                for chunk in iter(lambda: file_object.read(1 << 20), b""):
+                    key.update(chunk)
+            else:
+                stat = os.fstat(file_object.fileno())
+                file_object.seek(-2, os.SEEK_END)
+                (crc,) = struct.unpack("<H", file_object.read(2))
+                key.update(f"{stat.st_size}:{stat.st_mtime_ns}:{crc}".encode())
+
+        return key.hexdigest()
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_FILE_EXTENSION)
+
+    def get(self, key: str):
+        path = self.get_path(key)
+
+        try:
+            with open(path, "rb") as file_object:
+                value = pickle.load(file_object)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            self.remove(key)
+            return None
+
+        os.utime(path)
+        return value
+
+    def put(self, key: str, value):
+        # a unique temporary file per write, so that concurrent writers of the same
+        # key never share one; the last replace wins
+        file_descriptor, temp_path = tempfile.mkstemp(
+            prefix=key, suffix=TEMP_FILE_EXTENSION, dir=self.directory
+        )
+
+        try:
+            with os.fdopen(file_descriptor, "wb") as file_object:
+                pickle.dump(value, file_object, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.get_path(key))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        self.evict()
+
+    def remove(self, key: str):
+        try:
+            os.remove(self.get_path(key))
+        except FileNotFoundError:
+            pass
+
+    def entries(self) -> list:
+        """Return (last used time, size, path) of all entries, least recently used
+        first."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(CACHE_FILE_EXTENSION):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        entries.sort()
+        return entries
+
+    @property
+    def size(self) -> int:
+        return sum(entry[1] for entry in self.entries())
+
+    def evict(self):
+        entries = self.entries()
+        size = sum(entry[1] for entry in entries)
+
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+
+            os.remove(path)
+            size -= entry_size
+
+    def clear(self):
+        """Remove all entries, and temporary files left behind by interrupted
+        writes."""
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(
+                (CACHE_FILE_EXTENSION, TEMP_FILE_EXTENSION)
+            ):
+                os.remove(entry.path)
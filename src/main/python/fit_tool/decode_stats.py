@@ -0,0 +1,200 @@
+from typing import Dict as dict
+from typing import List as list
+
+from fit_tool.definition_message import DefinitionMessage
+from fit_tool.generic_message import GenericMessage
+from fit_tool.record import Record
+
+
+class MessageStats:
+    """Counters for the data messages of one message type or one definition."""
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self.count = 0
+        self.size = 0
+        self.seconds = 0.0
+        self.developer_field_size = 0
+
+    def add(self, size: int, seconds: float, developer_field_size: int):
+        self.count += 1
+        self.size += size
+        self.seconds += seconds
+        self.developer_field_size += developer_field_size
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "size": self.size,
+            "seconds": self.seconds,
+            "developer_field_size": self.developer_field_size,
+        }
+
+
+class DecodeStats:
+    """Collects record counts, bytes and decode time per global message id and per
+    definition while a file is decoded.
+
+    Definitions are numbered in the order they appear. A redefinition replaces the
+    active definition of a local id with a different one, a repeated definition
+    defines a local id again the same way; both count as definition churn.
+    """
+
+    def __init__(self):
+        self.messages_by_global_id = {}
+        self.messages_by_definition = {}
+        self.definition_count = 0
+        self.definition_size = 0
+        self.definition_seconds = 0.0
+        self.redefinition_count = 0
+        self.repeated_definition_count = 0
+        # re-encoding records to verify them, not part of the decode time
+        self.verify_seconds = 0.0
+
+        self.definition_numbers_by_local_id = {}
+        self.definition_bytes_by_local_id = {}
+        self.developer_field_sizes = {}
+
+    def add_record(self, record: Record, record_bytes: bytes, seconds: float):
+        if record.is_definition:
+            self.add_definition(record.local_id, record.message, record_bytes, seconds)
+        else:
+            self.add_data(record, len(record_bytes), seconds)
+
+    def add_verification(self, seconds: float):
+        self.verify_seconds += seconds
+
+    def add_definition(
+        self,
+        local_id: int,
+        definition_message: DefinitionMessage,
+        record_bytes: bytes,
+        seconds: float,
+    ):
+        self.definition_count += 1
+        self.definition_size += len(record_bytes)
+        self.definition_seconds += seconds
+
+        active_bytes = self.definition_bytes_by_local_id.get(local_id)
+        if active_bytes == record_bytes:
+            self.repeated_definition_count += 1
+        elif active_bytes is not None:
+            self.redefinition_count += 1
+
+        self.definition_bytes_by_local_id[local_id] = record_bytes
+        self.definition_numbers_by_local_id[local_id] = self.definition_count
+        self.developer_field_sizes[self.definition_count] = sum(
+            x.size for x in definition_message.developer_field_definitions
+        )
+
+    def add_data(self, record: Record, size: int, seconds: float):
+        message = record.message
+        definition_number = self.definition_numbers_by_local_id.get(record.local_id, 0)
+        developer_field_size = self.developer_field_sizes.get(definition_number, 0)
+
+        message_stats = self.messages_by_global_id.get(message.global_id)
+        if message_stats is None:
+            message_stats = MessageStats(self.get_message_name(message))
+            self.messages_by_global_id[message.global_id] = message_stats
+        message_stats.add(size, seconds, developer_field_size)
+
+        definition_stats = self.messages_by_definition.get(definition_number)
+        if definition_stats is None:
+            definition_stats = MessageStats(
+                f"#{definition_number} local {record.local_id} {message_stats.name}"
+            )
+            self.messages_by_definition[definition_number] = definition_stats
+        definition_stats.add(size, seconds, developer_field_size)
+
+    @staticmethod
+    def get_message_name(message) -> str:
+        if isinstance(message, GenericMessage):
+            return f"message_{message.global_id}"
+
+        return message.name
+
+    @property
+    def record_count(self) -> int:
+        return self.definition_count + sum(
+            x.count for x in self.messages_by_global_id.values()
+        )
+
+    @property
+    def size(self) -> int:
+        return self.definition_size + sum(x.size for x in self.messages_by_global_id.values())
+
+    @property
+    def seconds(self) -> float:
+        return self.definition_seconds + sum(
+            x.seconds for x in self.messages_by_global_id.values()
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "record_count": self.record_count,
+            "size": self.size,
+            "seconds": self.seconds,
+            "verify_seconds": self.verify_seconds,
+            "definitions": {
+                "count": self.definition_count,
+                "size": self.definition_size,
+                "seconds": self.definition_seconds,
+                "redefinitions": self.redefinition_count,
+                "repeated": self.repeated_definition_count,
+            },
+            "messages": {
+                global_id: x.to_dict() for global_id, x in self.messages_by_global_id.items()
+            },
+            "messages_by_definition": {
+                number: x.to_dict() for number, x in self.messages_by_definition.items()
+            },
+        }
+
+    @staticmethod
+    def format_rows(title: str, rows: list[tuple], total_seconds: float) -> list[str]:
+        lines = [
+            f"{title:<40} {'count':>9} {'bytes':>11} {'dev bytes':>10} {'seconds':>9} {'time %':>7}"
+        ]
+        for name, stats in sorted(rows, key=lambda x: x[1].seconds, reverse=True):
+            percent = 100.0 * stats.seconds / total_seconds if total_seconds else 0.0
+            lines.append(
+                f"{name:<40} {stats.count:>9} {stats.size:>11} {stats.developer_field_size:>10} "
+                f"{stats.seconds:>9.4f} {percent:>6.1f}%"
+            )
+
+        return lines
+
+    def report(self) -> str:
+        """Return the totals followed by tables of the messages by type and by
+        definition. The time % column is relative to the decode seconds, which
+        exclude verify_seconds; a record that fails to decode raises before it is
+        counted, so its time is not in any total."""
+        total_seconds = self.seconds
+        lines = [
+            f"records: {self.record_count}, bytes: {self.size}, "
+            f"decode seconds: {total_seconds:.4f}",
+            f"definitions: {self.definition_count} ({self.definition_size} bytes, "
+            f"{self.definition_seconds:.4f} s), redefinitions: {self.redefinition_count}, "
+            f"repeated: {self.repeated_definition_count}",
+        ]
+        if self.verify_seconds:
+            lines.append(f"verify seconds: {self.verify_seconds:.4f}")
+        lines.append("")
+
+        lines += self.format_rows(
+            "message",
+            [(f"{x.name} ({global_id})", x) for global_id, x in self.messages_by_global_id.items()],
+            total_seconds,
+        )
+        lines.append("")
+        lines += self.format_rows(
+            "definition",
+            [(x.name, x) for x in self.messages_by_definition.values()],
+            total_seconds,
+        )
+
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.report()
@@ -0,0 +1,102 @@
+from typing import Dict as dict
+
+from fit_tool.base_type import BaseType
+from fit_tool.data_message import DataMessage
+from fit_tool.definition_message import DefinitionMessage
+from fit_tool.developer_field import DeveloperField
+from fit_tool.diagnostics import Diagnostics
+from fit_tool.field import DecodeMode
+from fit_tool.profile.messages.field_description_message import FieldDescriptionMessage
+from fit_tool.record import Record
+
+
+class DecoderContext:
+    """The state of decoding one stream of records: the active definition message of
+    each local id and the developer fields described so far, together with the
+    decode options.
+
+    Everything a record is decoded with is held by the context and passed down
+    explicitly; the message factories and field classes keep no mutable state of
+    their own. Each file decoded concurrently needs its own context, and a context
+    must only be used by one thread at a time.
+    """
+
+    def __init__(
+        self,
+        decode_mode: DecodeMode = None,
+        diagnostics: Diagnostics = None,
+        message_factory=None,
+    ):
+        self.decode_mode = decode_mode
+        self.diagnostics = diagnostics if diagnostics is not None else Diagnostics()
+        self.message_factory = message_factory
+
+        self.definition_messages: dict[int, DefinitionMessage] = {}
+        self.developer_fields_by_data_index: dict[int, dict[int, DeveloperField]] = {}
+
+    def clear(self):
+        self.definition_messages = {}
+        self.developer_fields_by_data_index = {}
+
+    def get_definition_message(self, local_id: int) -> DefinitionMessage:
+        definition_message = self.definition_messages.get(local_id)
+        if definition_message is None:
+            raise Exception(f"DefinitionMessage not defined for local_id: {local_id}")
+
+        return definition_message
+
+    def add_developer_field(self, message: DataMessage):
+        """Register the developer field described by a field description message,
+        generated or built from the profile schema."""
+        developer_field = DeveloperField(
+            developer_data_index=message.developer_data_index,
+            field_id=message.field_definition_number,
+            base_type=BaseType(message.fit_base_type_id),
+            name=message.field_name,
+            scale=message.scale,
+            offset=message.offset,
+            units=message.units,
+        )
+        developer_fields = self.developer_fields_by_data_index.setdefault(
+            developer_field.developer_data_index, {}
+        )
+        developer_fields[developer_field.field_id] = developer_field
+
+    def create_message(self, definition_message: DefinitionMessage) -> DataMessage:
+        """Create the empty data message of a definition, with its developer fields,
+        as decoding does before reading the field values."""
+        if self.developer_fields_by_data_index:
+            developer_fields = definition_message.get_developer_fields(
+                self.developer_fields_by_data_index
+            )
+        else:
+            developer_fields = []
+
+        if self.message_factory is None:
+            message = DataMessage.from_definition(definition_message, developer_fields)
+        else:
+            message = self.message_factory.from_definition(definition_message, developer_fields)
+
+        if self.decode_mode is not None and self.decode_mode != DecodeMode.VALUE:
+            message.set_decode_mode(self.decode_mode)
+        return message
+
+    def decode_record(self, record_bytes: bytes, offset: int = 0) -> Record:
+        """Decode the record at offset and keep the definitions and developer fields
+        it declares for the records that follow."""
+        record = Record.from_bytes(
+            definition_messages=self.definition_messages,
+            bytes_buffer=record_bytes,
+            offset=offset,
+            developer_fields_by_data_index=self.developer_fields_by_data_index,
+            decode_mode=self.decode_mode,
+            diagnostics=self.diagnostics,
+            message_factory=self.message_factory,
+        )
+
+        if record.is_definition:
+            self.definition_messages[record.local_id] = record.message
+        elif record.message.global_id == FieldDescriptionMessage.ID:
+            self.add_developer_field(record.message)
+
+        return record
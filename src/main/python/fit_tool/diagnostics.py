@@ -0,0 +1,85 @@
+from typing import Dict as dict
+from typing import List as list
+
+from fit_tool.utils.logging import logger
+
+DEFAULT_MAX_SAMPLES = 3
+
+UNDEFINED_FIELD = "undefined_field"
+UNDEFINED_DEVELOPER_FIELD = "undefined_developer_field"
+SIZE_MISMATCH = "size_mismatch"
+BYTES_MISMATCH = "bytes_mismatch"
+
+# formatted with the sample values and the message name, global id and field id
+TEMPLATES = {
+    UNDEFINED_FIELD: "Field id: {field_id} is not defined for message {name}:{global_id}. "
+    "Skipping this field",
+    UNDEFINED_DEVELOPER_FIELD: "Developer Field id: {field_id} is not defined for message "
+    "{name}:{global_id}. Skipping this field",
+    SIZE_MISMATCH: "Record {0}, {name}:{global_id}: size ({1}) != defined size ({2}). "
+    "Some fields were not read correctly.",
+    BYTES_MISMATCH: "- {0} - {name}:{global_id}\n\tactual: {1}\n\trecord: {2}",
+}
+
+
+class Diagnostics:
+    """Aggregates decode problems instead of logging each one as it happens.
+
+    Problems are counted per (kind, message name, global id, field id) and only
+    the values of the first max_samples occurrences of each are kept. Messages are
+    formatted when a summary is requested.
+    """
+
+    def __init__(self, max_samples: int = DEFAULT_MAX_SAMPLES):
+        self.max_samples = max_samples
+        self.counts = {}
+        self.samples = {}
+
+    def __len__(self) -> int:
+        return sum(self.counts.values())
+
+    def add(self, kind: str, name: str, global_id: int, field_id: int = None, sample: tuple = ()):
+        key = (kind, name, global_id, field_id)
+        count = self.counts.get(key, 0)
+        self.counts[key] = count + 1
+
+        if count < self.max_samples:
+            self.samples.setdefault(key, []).append(sample)
+
+    def get_count(self, kind: str) -> int:
+        return sum(count for key, count in self.counts.items() if key[0] == kind)
+
+    @staticmethod
+    def format(key: tuple, sample: tuple) -> str:
+        kind, name, global_id, field_id = key
+        return TEMPLATES[kind].format(*sample, name=name, global_id=global_id, field_id=field_id)
+
+    def summary(self) -> list[dict]:
+        return [
+            {
+                "kind": key[0],
+                "message": key[1],
+                "global_id": key[2],
+                "field_id": key[3],
+                "count": count,
+                "samples": [self.format(key, sample) for sample in self.samples.get(key, [])],
+            }
+            for key, count in self.counts.items()
+        ]
+
+    def report(self) -> str:
+        lines = []
+        for entry in self.summary():
+            lines.append(f"{entry['count']} x {entry['samples'][0]}")
+            for sample in entry["samples"][1:]:
+                lines.append(f"\t{sample}")
+
+        return "\n".join(lines)
+
+    def log_summary(self):
+        for key, count in self.counts.items():
+            logger.warning("%s (%d occurrences)", self.format(key, self.samples[key][0]), count)
+
+    def clear(self):
+        self.counts = {}
+        self.samples = {}
@@ -2,9 +2,9 @@ import datetime
 
 import gpxpy
 import math
-from geopy.distance import geodesic
 
 from fit_tool.fit_file_builder import FitFileBuilder
+from fit_tool.geo import VINCENTY, cumulative_distances
 from fit_tool.profile.messages.event_message import EventMessage
 from fit_tool.profile.messages.file_id_message import FileIdMessage
 from fit_tool.profile.messages.record_message import RecordMessage
@@ -48,33 +48,26 @@ def main():
     message.timestamp = start_timestamp
     builder.add(message)
 
-    distance = 0.0
     timestamp = start_timestamp
 
     records = []
 
-    prev_coordinate = None
-
     for index, track_point in enumerate(gpx.tracks[0].segments[0].points):
-        current_coordinate = (track_point.latitude, track_point.longitude)
-
-        # calculate distance from previous coordinate and accumulate distance
-        if prev_coordinate:
-            delta = geodesic(prev_coordinate, current_coordinate).meters
-        else:
-            delta = 0.0
-        distance += delta
-
         message = RecordMessage()
         message.position_lat = track_point.latitude
         message.position_long = track_point.longitude
-        message.distance = distance
         message.timestamp = timestamp
         message.power = round(20 * math.sin(2 * math.pi * index / 50) + 200)
         records.append(message)
 
         timestamp += 10000
-        prev_coordinate = current_coordinate
+
+    # calculate the cumulative distance of all track points at once
+    distances = cumulative_distances(
+        [x.position_lat for x in records], [x.position_long for x in records], method=VINCENTY
+    )
+    for message, distance in zip(records, distances):
+        message.distance = distance
 
     builder.add_all(records)
 
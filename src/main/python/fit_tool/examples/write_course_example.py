@@ -1,9 +1,10 @@
 import datetime
 
 import gpxpy
-from geopy.distance import geodesic
 
+from fit_tool.course_simplifier import CourseSimplifier
 from fit_tool.fit_file_builder import FitFileBuilder
+from fit_tool.geo import VINCENTY, cumulative_distances
 from fit_tool.profile.messages.course_message import CourseMessage
 from fit_tool.profile.messages.course_point_message import CoursePointMessage
 from fit_tool.profile.messages.event_message import EventMessage
@@ -50,32 +51,27 @@ def main():
     message.timestamp = start_timestamp
     builder.add(message)
 
-    distance = 0.0
     timestamp = start_timestamp
 
     course_records = []  # track points
 
-    prev_coordinate = None
-
     for track_point in gpx.tracks[0].segments[0].points:
-        current_coordinate = (track_point.latitude, track_point.longitude)
-
-        # calculate distance from previous coordinate and accumulate distance
-        if prev_coordinate:
-            delta = geodesic(prev_coordinate, current_coordinate).meters
-        else:
-            delta = 0.0
-        distance += delta
-
         message = RecordMessage()
         message.position_lat = track_point.latitude
         message.position_long = track_point.longitude
-        message.distance = distance
         message.timestamp = timestamp
         course_records.append(message)
 
         timestamp += 10000
-        prev_coordinate = current_coordinate
+
+    # calculate the cumulative distance of all track points at once
+    distances = cumulative_distances(
+        [x.position_lat for x in course_records],
+        [x.position_long for x in course_records],
+        method=VINCENTY,
+    )
+    for message, distance in zip(course_records, distances):
+        message.distance = distance
 
     builder.add_all(course_records)
 
@@ -126,6 +122,11 @@ def main():
     csv_path = "../tests/out/old_stage_course.csv"
     fit_file.to_csv(csv_path)
 
+    # Reduce the track to 200 points for devices with limited memory, the course points
+    # are kept and the distances are recomputed along the simplified track.
+    simplified_fit_file = CourseSimplifier(max_points=200).simplify_fit_file(fit_file)
+    simplified_fit_file.to_file("../tests/out/old_stage_course_simplified.fit")
+
 
 if __name__ == "__main__":
     main()
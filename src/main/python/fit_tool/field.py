@@ -17,8 +17,17 @@ class ArrayType(Enum):
     VARIABLE = 1
 
 
+class DecodeMode(Enum):
+    # scaled values, date_time fields as timezone aware datetime objects
+    VALUE = 0
+    # scaled values, date_time fields as milliseconds since Unix epoch
+    SCALED = 1
+    # encoded values as stored in the file, date_time fields as seconds since FIT epoch
+    RAW = 2
+
+
 class Field:
-    encoded_values = []
+    decode_mode = DecodeMode.VALUE
 
     def __init__(
         self,
@@ -60,6 +69,13 @@ class Field:
             None for _ in range(Field.get_length_from_size(base_type, size))
         ]
 
+        # Sub-field selection is cached once the owning message has linked the
+        # reference fields; changes to a reference field invalidate the cache.
+        self.reference_fields = None
+        self.dependent_fields = []
+        self.resolved_sub_field = None
+        self.is_sub_field_resolved = False
+
     @classmethod
     def from_field(cls, other):
         field = Field(
@@ -77,7 +93,19 @@ class Field:
             growable=other.growable,
             type_name=other.type_name,
         )
-        field.encoded_values = other.encoded_values
+        field.encoded_values = other.encoded_values.copy()
+        return field
+
+    def copy(self):
+        """Return a copy of the same class with its own encoded values, not linked
+        to the fields of any message. Cheaper than constructing a field."""
+        field = object.__new__(type(self))
+        field.__dict__.update(self.__dict__)
+        field.encoded_values = self.encoded_values.copy()
+        field.reference_fields = None
+        field.dependent_fields = []
+        field.resolved_sub_field = None
+        field.is_sub_field_resolved = False
         return field
 
     @classmethod
@@ -218,6 +246,7 @@ class Field:
     def clear(self):
         self.size = 0
         self.encoded_values = []
+        self.invalidate_dependent_sub_fields()
 
     def is_valid(self) -> bool:
         return self.size != 0
@@ -225,29 +254,44 @@ class Field:
     def is_not_valid(self) -> bool:
         return not self.is_valid()
 
-    def get_value(self, index: int = 0, sub_field: SubField = None):
+    def get_value(
+        self, index: int = 0, sub_field: SubField = None, decode_mode: DecodeMode = None
+    ):
         if index < 0 or index >= len(self.encoded_values):
             return None
 
         encoded_value = self.encoded_values[index]
-        return self.decode_value(encoded_value, sub_field)
+        return self.decode_value(encoded_value, sub_field, decode_mode=decode_mode)
 
     # Return values as a list
-    def get_values(self):
+    def get_values(self, sub_field: SubField = None, decode_mode: DecodeMode = None):
         return [
-            self.decode_value(encoded_value) for encoded_value in self.encoded_values
+            self.decode_value(encoded_value, sub_field, decode_mode=decode_mode)
+            for encoded_value in self.encoded_values
         ]
 
     def set_values(self, values):
         for index, value in enumerate(values):
             self.set_value(index, value)
 
-    def decode_value(self, encoded_value, sub_field: SubField = None):
+    def decode_value(
+        self, encoded_value, sub_field: SubField = None, decode_mode: DecodeMode = None
+    ):
         if encoded_value is None or isinstance(encoded_value, str):
             return encoded_value
 
-        scale = self.get_scale(sub_field=sub_field)
-        offset = self.get_offset(sub_field=sub_field)
+        if decode_mode is None:
+            decode_mode = self.decode_mode
+
+        if decode_mode == DecodeMode.RAW:
+            return encoded_value
+
+        if sub_field:
+            scale = sub_field.scale
+            offset = sub_field.offset
+        else:
+            scale = self.scale
+            offset = self.offset
 
         value_to_process = encoded_value
 
@@ -261,6 +305,9 @@ class Field:
             value = self.un_scale_offset_value(value_to_process, scale, offset)
 
         if self.type_name == "date_time" and isinstance(value, (int, float)):
+            if decode_mode == DecodeMode.SCALED:
+                return round(value)
+
             try:
                 return datetime.fromtimestamp(value / 1000.0, tz=timezone.utc)
             except Exception:
@@ -295,7 +342,8 @@ class Field:
         if check_validity and self.base_type != BaseType.STRING:
             if not self.base_type.is_valid(encoded_value):
                 raise Exception(
-                    f"{self.name} encoded value {encoded_value} is not in valid range [{self.base_type.min}, {self.base_type.max}]"
+                    f"{self.name} encoded value {encoded_value} is not in valid range "
+                    f"[{self.base_type.min}, {self.base_type.max}]"
                 )
 
         size_changed = False
@@ -310,12 +358,16 @@ class Field:
 
         self.encoded_values[index] = encoded_value
 
+        if self.dependent_fields:
+            self.invalidate_dependent_sub_fields()
+
         if size_changed or self.base_type == BaseType.STRING:
             new_size = self.calculate_size()
             if new_size > self.size:
                 if not self.growable:
                     raise Exception(
-                        f"Size exceeds fixed field size of {self.size} bytes. Consider making field growable."
+                        f"Size exceeds fixed field size of {self.size} bytes. "
+                        "Consider making field growable."
                     )
                 self.size = new_size
 
@@ -339,7 +391,8 @@ class Field:
                     )  # Convert to ms timestamp
                 elif not isinstance(value, (int, float)):
                     raise TypeError(
-                        f"Field '{self.name}' with type_name 'date_time' expects a datetime object or a numeric timestamp, but got {type(value)}"
+                        f"Field '{self.name}' with type_name 'date_time' expects a datetime "
+                        f"object or a numeric timestamp, but got {type(value)}"
                     )
 
             scale = self.get_scale(sub_field=sub_field)
@@ -352,12 +405,15 @@ class Field:
                     encoded_value = int(processed_value)
                 except (TypeError, ValueError) as e:
                     raise TypeError(
-                        f"Cannot convert value '{processed_value}' (type: {type(processed_value)}) to int for field '{self.name}' without scale/offset. Original value: '{value}'. Error: {e}"
+                        f"Cannot convert value '{processed_value}' "
+                        f"(type: {type(processed_value)}) to int for field '{self.name}' "
+                        f"without scale/offset. Original value: '{value}'. Error: {e}"
                     )
             else:
                 if not isinstance(processed_value, (int, float)):
                     raise TypeError(
-                        f"Value '{processed_value}' (type: {type(processed_value)}) must be a number for scaling in field '{self.name}'. Original value: '{value}'"
+                        f"Value '{processed_value}' (type: {type(processed_value)}) must be a "
+                        f"number for scaling in field '{self.name}'. Original value: '{value}'"
                     )
                 current_scale = scale if scale is not None else 1.0
                 current_offset = offset if offset is not None else 0.0
@@ -392,6 +448,7 @@ class Field:
         strings = [x for x in strings if x]
         self.encoded_values = []
         self.encoded_values.extend(strings)
+        self.invalidate_dependent_sub_fields()
 
     @staticmethod
     def get_length_from_size(base_type: BaseType, size: int) -> int:
@@ -523,16 +580,53 @@ class Field:
 
         return bytes_buffer
 
-    def get_valid_sub_field(self, fields: list) -> Optional[SubField]:
+    def get_valid_sub_field(self, fields: list = None) -> Optional[SubField]:
         if not self.sub_fields:
             return None
 
+        if self.is_sub_field_resolved:
+            return self.resolved_sub_field
+
+        if self.reference_fields is None:
+            # not linked to a message, resolve against the given fields every time
+            return self.resolve_sub_field(fields if fields else [])
+
+        self.resolved_sub_field = self.resolve_sub_field(self.reference_fields)
+        self.is_sub_field_resolved = True
+        return self.resolved_sub_field
+
+    def resolve_sub_field(self, fields: list) -> Optional[SubField]:
         for sub_field in self.sub_fields:
             if sub_field.is_valid(fields):
                 return sub_field
 
         return None
 
+    def link_reference_fields(self, fields_by_id: dict):
+        self.reference_fields = []
+        for sub_field in self.sub_fields:
+            for field_id in sub_field.reference_map:
+                reference_field = fields_by_id.get(field_id)
+                if (
+                    reference_field is None
+                    or reference_field in self.reference_fields
+                ):
+                    continue
+
+                self.reference_fields.append(reference_field)
+                if self not in reference_field.dependent_fields:
+                    reference_field.dependent_fields.append(self)
+
+        self.is_sub_field_resolved = False
+
+    def invalidate_sub_field(self):
+        self.is_sub_field_resolved = False
+        self.resolved_sub_field = None
+
+    def invalidate_dependent_sub_fields(self):
+        for field in self.dependent_fields:
+            field.invalidate_sub_field()
+
     def to_row(self, sub_field: SubField = None) -> list:
         row = []
         values = []
@@ -0,0 +1,158 @@
+from typing import Generic, Optional, TypeVar, overload
+from typing import List as list
+
+from fit_tool.data_message import DataMessage
+from fit_tool.field import Field
+from fit_tool.sub_field import SubField
+
+T = TypeVar("T")
+
+# Generated profile messages describe their fields with a table of specs instead of
+# one hand-written class and property pair per field:
+#
+#   field spec: (class name, field id, name, base type, offset, scale, units,
+#                type name, sub field specs)
+#   sub field spec: (name, base type, scale, offset, units, reference map)
+#
+# create_field_types builds the Field subclasses of a message from its table, and
+# the properties of the message are FieldProperty and SubFieldProperty descriptors
+# holding the field id they read and write. The descriptors are generic in the type
+# of the value, so the generated class attributes are annotated for type checkers,
+# e.g. heart_rate: FieldProperty[int].
+
+
+def create_field_type(
+    module_name: str,
+    class_name: str,
+    field_id: int,
+    name: str,
+    base_type,
+    offset: float,
+    scale: float,
+    units: str,
+    type_name: str,
+    sub_field_specs: list,
+) -> type:
+    """Return a Field subclass with the ID class attribute and the constructor
+    signature of the generated field classes. The class belongs to the module
+    module_name, so that fields can be pickled."""
+
+    def __init__(self, size: int = 0, growable: bool = True):
+        Field.__init__(
+            self,
+            name=name,
+            field_id=field_id,
+            base_type=base_type,
+            offset=offset,
+            scale=scale,
+            size=size,
+            units=units,
+            type_name=type_name,
+            growable=growable,
+            sub_fields=[
+                SubField(
+                    name=x[0],
+                    base_type=x[1],
+                    scale=x[2],
+                    offset=x[3],
+                    units=x[4],
+                    reference_map=x[5],
+                )
+                for x in sub_field_specs
+            ],
+        )
+
+    return type(
+        class_name,
+        (Field,),
+        {"ID": field_id, "__init__": __init__, "__module__": module_name},
+    )
+
+
+def create_field_types(module_name: str, field_specs: list) -> list[type]:
+    return [create_field_type(module_name, *x) for x in field_specs]
+
+
+class FieldProperty(Generic[T]):
+    """Reads and writes the value of a field of a data message. Array fields are
+    read and written as lists."""
+
+    __slots__ = ("field_id", "is_array")
+
+    def __init__(self, field_id: int, is_array: bool = False):
+        self.field_id = field_id
+        self.is_array = is_array
+
+    @overload
+    def __get__(self, message: None, owner=None) -> "FieldProperty[T]": ...
+
+    @overload
+    def __get__(self, message: DataMessage, owner=None) -> Optional[T]: ...
+
+    def __get__(self, message, owner=None):
+        if message is None:
+            return self
+
+        field = message.fields_by_id.get(self.field_id)
+        if field is None or field.is_not_valid():
+            return None
+
+        if self.is_array:
+            return field.get_values()
+
+        return field.get_value(sub_field=field.get_valid_sub_field(message.fields))
+
+    def __set__(self, message: DataMessage, value: Optional[T]):
+        field = message.get_or_create_field(self.field_id)
+        if field is None:
+            return
+
+        if value is None:
+            field.clear()
+        elif self.is_array:
+            field.set_values(value)
+        else:
+            field.set_value(0, value, field.get_valid_sub_field(message.fields))
+
+
+class SubFieldProperty(Generic[T]):
+    """Reads the value of a field of a data message as one of its sub-fields, which
+    applies if the reference field has one of the reference values. Writing sets
+    the value of the field."""
+
+    __slots__ = ("field_id", "reference_field_id", "reference_values")
+
+    def __init__(self, field_id: int, reference_field_id: int, reference_values: list):
+        self.field_id = field_id
+        self.reference_field_id = reference_field_id
+        self.reference_values = reference_values
+
+    @overload
+    def __get__(self, message: None, owner=None) -> "SubFieldProperty[T]": ...
+
+    @overload
+    def __get__(self, message: DataMessage, owner=None) -> Optional[T]: ...
+
+    def __get__(self, message, owner=None):
+        if message is None:
+            return self
+
+        field = message.fields_by_id.get(self.field_id)
+        if field is None or field.is_not_valid():
+            return None
+
+        reference_field = message.fields_by_id.get(self.reference_field_id)
+        if reference_field is None or reference_field.get_value() not in self.reference_values:
+            return None
+
+        return field.get_value(sub_field=field.get_valid_sub_field(message.fields))
+
+    def __set__(self, message: DataMessage, value: Optional[T]):
+        field = message.get_or_create_field(self.field_id)
+        if field is None:
+            return
+
+        if value is None:
+            field.clear()
+        else:
+            field.set_value(0, value, field.get_valid_sub_field(message.fields))
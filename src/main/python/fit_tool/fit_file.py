@@ -1,12 +1,19 @@
 import csv
 import struct
+from typing import Dict as dict
+from typing import Iterable
 from typing import List as list
 
-from fit_tool.base_type import BaseType
-from fit_tool.developer_field import DeveloperField
+from fit_tool.decode_cache import DecodeCache
+from fit_tool.decode_stats import DecodeStats
+from fit_tool.decoder_context import DecoderContext
+from fit_tool.diagnostics import Diagnostics
+from fit_tool.field import DecodeMode
 from fit_tool.fit_file_header import FitFileHeader
+from fit_tool.fit_file_reader import FitFileReader
 from fit_tool.profile.messages.field_description_message import FieldDescriptionMessage
-from fit_tool.record import Record
+from fit_tool.record import Record, RecordHeader
+from fit_tool.sqlite_exporter import SqliteExporter
 from fit_tool.utils.crc import crc16
 from fit_tool.utils.logging import logger
 
@@ -18,99 +25,144 @@ class FitFile:
         self.crc = crc  # crc16 of header and records
 
     @classmethod
-    def from_file(cls, path: str):
+    def from_file(
+        cls,
+        path: str,
+        decode_mode: DecodeMode = None,
+        cache: DecodeCache = None,
+        stats: DecodeStats = None,
+        diagnostics: Diagnostics = None,
+        message_factory=None,
+    ):
+        """Decode a FIT file. With a cache, the encoded values of the decoded records
+        are stored and later calls rebuild the messages from them instead of decoding
+        the bytes again. Rebuilding still creates every message and field object, so
+        a hit takes about a quarter of the decode time (about 1 s for a 300 KB
+        activity) rather than milliseconds."""
+        if cache:
+            key = cache.get_key(path, decode_mode, get_factory_name(message_factory))
+            entry = cache.get(key)
+            if entry is not None:
+                try:
+                    return FitFile.from_cache_entry(
+                        entry, decode_mode=decode_mode, message_factory=message_factory
+                    )
+                except Exception as e:
+                    logger.warning(f"Ignoring cache entry of {path}: {e}")
+                    cache.remove(key)
+
         with open(path, "rb") as file_object:
             bytes_buffer = file_object.read()
-            fit_file = FitFile.from_bytes(bytes_buffer)
-            return fit_file
-
-    @classmethod
-    def from_bytes(cls, bytes_buffer: bytes, check_crc: bool = True):
-        crc = 0
-        offset = 0
+            fit_file = FitFile.from_bytes(
+                bytes_buffer,
+                decode_mode=decode_mode,
+                stats=stats,
+                diagnostics=diagnostics,
+                message_factory=message_factory,
+            )
 
-        header_size = bytes_buffer[0]
+        if cache:
+            cache.put(key, fit_file.to_cache_entry())
 
-        header_bytes = bytes_buffer[:header_size]
-        header = FitFileHeader.from_bytes(header_bytes)
-        crc = crc16(header_bytes, crc=crc)
-        offset += header_size
+        return fit_file
 
+    @classmethod
+    def from_bytes(
+        cls,
+        bytes_buffer: bytes,
+        check_crc: bool = True,
+        decode_mode: DecodeMode = None,
+        stats: DecodeStats = None,
+        diagnostics: Diagnostics = None,
+        message_factory=None,
+    ):
+        reader = FitFileReader.from_bytes(
+            bytes_buffer,
+            check_crc=check_crc,
+            decode_mode=decode_mode,
+            stats=stats,
+            diagnostics=diagnostics,
+            message_factory=message_factory,
+        )
+        reader.verify_records = True
+        records = [record for record in reader.records()]
+
+        return FitFile(reader.header, records, reader.crc)
+
+    def to_cache_entry(self) -> tuple:
+        """Return the compact form of the file stored by DecodeCache: the header
+        bytes, the CRC and per record either the bytes of a definition or the header
+        byte of a data message with the encoded values of its fields, in the order
+        of the field and developer field definitions, None for undefined fields."""
         records = []
-        definition_messages = {}
-        developer_fields_by_data_index = {}
-
-        record_index = 0
-        record_bytes_remaining_count = header.records_size
-        while record_bytes_remaining_count > 0:
-            record = Record.from_bytes(
-                definition_messages=definition_messages,
-                bytes_buffer=bytes_buffer,
-                offset=offset,
-                developer_fields_by_data_index=developer_fields_by_data_index,
-            )
-
+        for record in self.records:
             if record.is_definition:
-                definition_messages[record.local_id] = record.message
-            elif isinstance(record.message, FieldDescriptionMessage):
-                message = record.message
-                developer_field = DeveloperField(
-                    developer_data_index=message.developer_data_index,
-                    field_id=message.field_definition_number,
-                    base_type=BaseType(message.fit_base_type_id),
-                    name=message.field_name,
-                    scale=message.scale,
-                    offset=message.offset,
-                    units=message.units,
-                )
-                if (
-                    developer_field.developer_data_index
-                    not in developer_fields_by_data_index
-                ):
-                    developer_fields_by_data_index[
-                        developer_field.developer_data_index
-                    ] = {}
-
-                developer_fields_by_data_index[developer_field.developer_data_index][
-                    developer_field.field_id
-                ] = developer_field
-
-            records.append(record)
-            definition_message = definition_messages[record.local_id]
-            record_size = record.size
-            defined_size = record.defined_size(definition_message)
-            crc = crc16(bytes_buffer[offset : offset + defined_size], crc=crc)
-
-            if record_size != defined_size:
-                logger.warning(
-                    f"Record {record_index}, {record.message}: size ({record_size}) != defined size ({defined_size}). Some fields were not read correctly."
+                records.append(record.to_bytes())
+                continue
+
+            message = record.message
+            definition_message = message.definition_message
+            values = []
+            for field_definition in definition_message.field_definitions:
+                field = message.get_field(field_definition.field_id)
+                values.append(field.encoded_values if field else None)
+
+            developer_fields = {
+                (x.developer_data_index, x.field_id): x for x in message.developer_fields
+            }
+            for field_definition in definition_message.developer_field_definitions:
+                field = developer_fields.get(
+                    (field_definition.developer_data_index, field_definition.field_id)
                 )
+                values.append(field.encoded_values if field else None)
 
-            actual_bytes = bytes_buffer[offset : offset + defined_size]
-            record_bytes = record.to_bytes()
+            records.append((record.header.to_bytes()[0], values))
 
-            if actual_bytes != record_bytes:
-                logger.warning(
-                    f"- {record_index} -\n\tactual: {actual_bytes}\n\trecord: {record_bytes}"
-                )
+        return self.header.to_bytes(), self.crc, records
 
-            record_bytes_remaining_count -= defined_size
-            offset += defined_size
-            record_index += 1
+    @classmethod
+    def from_cache_entry(
+        cls, entry: tuple, decode_mode: DecodeMode = None, message_factory=None
+    ):
+        """Rebuild a file from the form returned by to_cache_entry. Messages are
+        created from their definitions and given the cached encoded values, without
+        parsing or verifying any bytes."""
+        header_bytes, crc, cached_records = entry
+        context = DecoderContext(decode_mode=decode_mode, message_factory=message_factory)
+        # empty message of each definition, copied for its data messages, and the
+        # index in fields + developer_fields of each cached list of values
+        prototypes = {}
+        records = []
 
-        (file_crc,) = struct.unpack("<H", bytes_buffer[offset : offset + 2])
+        for cached_record in cached_records:
+            if isinstance(cached_record, bytes):
+                records.append(context.decode_record(cached_record))
+                continue
 
-        if crc != file_crc:
-            message = (
-                f"Calculated crc ({hex(crc)}) does match crc in file ({hex(file_crc)})."
-            )
+            header_byte, values = cached_record
+            header = RecordHeader.from_bytes(bytes((header_byte,)))
+            definition_message = context.get_definition_message(header.local_id)
 
-            if check_crc:
-                raise Exception(message)
-            else:
-                logger.warning(message)
+            prototype = prototypes.get(id(definition_message))
+            if prototype is None:
+                message = context.create_message(definition_message)
+                prototype = (message, get_cached_value_indexes(message, definition_message))
+                prototypes[id(definition_message)] = prototype
+
+            message = prototype[0].copy()
+            fields = message.fields + message.developer_fields
+            for index, encoded_values in zip(prototype[1], values):
+                if index is not None and encoded_values is not None:
+                    fields[index].encoded_values = encoded_values
+
+            message.resolve_sub_fields()
+            if message.global_id == FieldDescriptionMessage.ID:
+                context.add_developer_field(message)
+                prototypes = {}
 
-        return FitFile(header, records, crc)
+            records.append(Record(header, message))
+
+        return FitFile(FitFileHeader.from_bytes(header_bytes), records, crc)
 
     def to_bytes(self, check_crc: bool = True):
         calculated_crc = 0
@@ -140,6 +192,13 @@ class FitFile:
 
         return bytes(bytes_buffer)
 
+    def to_columns(
+        self, global_id: int, decode_mode: DecodeMode = DecodeMode.RAW
+    ) -> dict[str, list]:
+        """Collect the values of all data messages with the given global id into
+        columns keyed by field name. Fields missing from a message are None."""
+        return records_to_columns(self.records, global_id, decode_mode=decode_mode)
+
     def to_rows(self) -> list[list]:
         result = []
 
@@ -149,26 +208,98 @@ class FitFile:
             max_columns = max(max_columns, len(row))
             result.append(row)
 
-        header_row = ["Type", "Local ID", "Message"]
         max_fields = (max_columns - 3) // 3
-
-        for i in range(max_fields):
-            header_row.extend([f"Field {i}", f"Value {i}", f"Units {i}"])
-
-        result.insert(0, header_row)
+        result.insert(0, Record.header_row(max_fields))
 
         return result
 
     def to_csv(self, path: str):
-        rows = self.to_rows()
+        max_fields = Record.max_field_count(
+            record.message for record in self.records if record.is_definition
+        )
 
         with open(path, "w", newline="") as csv_file:
             csv_writer = csv.writer(
                 csv_file, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL
             )
-            for row in rows:
-                csv_writer.writerow(row)
+            csv_writer.writerow(Record.header_row(max_fields))
+            for record in self.records:
+                csv_writer.writerow(record.to_row())
+
+    def to_sqlite(self, path: str, name: str = "") -> int:
+        with SqliteExporter.from_path(path) as exporter:
+            return exporter.export(self.records, name=name, crc=self.crc)
 
     def to_file(self, path: str):
         with open(path, "wb") as file_object:
             file_object.write(self.to_bytes())
+
+
+def get_factory_name(message_factory) -> str:
+    """Return the qualified name of a message factory passed as a class or as an
+    instance, None for the default factory."""
+    if message_factory is None:
+        return "None"
+
+    factory_type = message_factory if isinstance(message_factory, type) else type(message_factory)
+    return f"{factory_type.__module__}.{factory_type.__qualname__}"
+
+
+def get_cached_value_indexes(message, definition_message) -> list:
+    """Return the index in fields + developer_fields of a message of the field of
+    each field and developer field definition, None for undefined fields."""
+    fields = message.fields + message.developer_fields
+    indexes = {id(x): i for i, x in enumerate(fields)}
+    developer_fields = {
+        (x.developer_data_index, x.field_id): x for x in message.developer_fields
+    }
+
+    result = []
+    for field_definition in definition_message.field_definitions:
+        field = message.get_field(field_definition.field_id)
+        result.append(indexes[id(field)] if field else None)
+
+    for field_definition in definition_message.developer_field_definitions:
+        field = developer_fields.get(
+            (field_definition.developer_data_index, field_definition.field_id)
+        )
+        result.append(indexes[id(field)] if field else None)
+
+    return result
+
+
+def records_to_columns(
+    records: Iterable[Record], global_id: int, decode_mode: DecodeMode = DecodeMode.RAW
+) -> dict[str, list]:
+    """Collect the values of the data messages with the given global id into
+    columns keyed by field name. Fields missing from a message are None."""
+    columns = {}
+    row_count = 0
+
+    for record in records:
+        message = record.message
+        if record.is_definition or message.global_id != global_id:
+            continue
+
+        for field in message.fields + message.developer_fields:
+            if field.is_not_valid():
+                continue
+
+            name = message.get_column_name(field)
+            column = columns.get(name)
+            if column is None:
+                column = [None] * row_count
+                columns[name] = column
+
+            sub_field = field.get_valid_sub_field(message.fields)
+            if field.length == 1:
+                column.append(field.get_value(sub_field=sub_field, decode_mode=decode_mode))
+            else:
+                column.append(field.get_values(sub_field=sub_field, decode_mode=decode_mode))
+
+        row_count += 1
+        for column in columns.values():
+            if len(column) < row_count:
+                column.append(None)
+
+    return columns
@@ -0,0 +1,406 @@
+import argparse
+import math
+import random
+from typing import List as list
+
+from fit_tool.base_type import BaseType
+from fit_tool.data_message import DataMessage
+from fit_tool.developer_field import DeveloperField
+from fit_tool.endian import Endian
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_builder import FitFileBuilder
+from fit_tool.profile.messages.activity_message import ActivityMessage
+from fit_tool.profile.messages.developer_data_id_message import DeveloperDataIdMessage
+from fit_tool.profile.messages.event_message import EventMessage
+from fit_tool.profile.messages.field_description_message import FieldDescriptionMessage
+from fit_tool.profile.messages.file_id_message import FileIdMessage
+from fit_tool.profile.messages.lap_message import LapMessage
+from fit_tool.profile.messages.location_message import LocationMessage
+from fit_tool.profile.messages.location_settings_message import LocationSettingsMessage
+from fit_tool.profile.messages.monitoring_info_message import MonitoringInfoMessage
+from fit_tool.profile.messages.monitoring_message import MonitoringMessage
+from fit_tool.profile.messages.record_message import RecordMessage
+from fit_tool.profile.messages.session_message import SessionMessage
+from fit_tool.profile.profile_type import (
+    Activity,
+    ActivityType,
+    Event,
+    EventType,
+    FileType,
+    LapTrigger,
+    LocationSettings,
+    Manufacturer,
+    Sport,
+)
+from fit_tool.record import RecordHeader
+from fit_tool.utils.conversions import to_seconds_since_1989_epoch
+
+# 2022-05-10 05:05:05 UTC
+START_TIMESTAMP = 1652159105000
+
+START_POSITION = (47.3769, 8.5417)
+
+METERS_PER_DEGREE = 111320.0
+
+FILE_TYPES = ["activity", "monitoring", "locations"]
+
+# base types of the generated developer fields, cycled through
+DEVELOPER_FIELD_TYPES = [BaseType.UINT8, BaseType.UINT16, BaseType.SINT32, BaseType.FLOAT32]
+
+# local ids: samples use 0 so that they can have compressed timestamp headers
+SAMPLE_LOCAL_ID = 0
+EVENT_LOCAL_ID = 1
+LAP_LOCAL_ID = 2
+OTHER_LOCAL_ID = 3
+
+MAX_COMPRESSED_TIME_OFFSET = RecordHeader.TIME_OFFSET_BIT_MASK
+
+
+class FitFileGenerator:
+    """Generates synthetic activity, monitoring and locations files with
+    FitFileBuilder and the profile messages.
+
+    The output only depends on the options and the seed. record_count samples
+    (record, monitoring or location messages) are spread over segment_count
+    chained FIT files, sample_rate is in samples per second. With
+    compressed_timestamps, samples use compressed timestamp headers instead of a
+    timestamp field; with big_endian, all messages are defined big-endian.
+    lap_interval and event_interval are in samples, 0 disables them.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        record_count: int = 3600,
+        sample_rate: float = 1.0,
+        developer_field_count: int = 0,
+        lap_interval: int = 0,
+        event_interval: int = 0,
+        segment_count: int = 1,
+        compressed_timestamps: bool = False,
+        big_endian: bool = False,
+        start_timestamp: int = START_TIMESTAMP,
+    ):
+        if compressed_timestamps and 1.0 / sample_rate > MAX_COMPRESSED_TIME_OFFSET:
+            raise Exception(
+                "Compressed timestamps need a sample interval of at most "
+                f"{MAX_COMPRESSED_TIME_OFFSET} s."
+            )
+
+        self.seed = seed
+        self.record_count = record_count
+        self.sample_rate = sample_rate
+        self.developer_field_count = developer_field_count
+        self.lap_interval = lap_interval
+        self.event_interval = event_interval
+        self.segment_count = max(segment_count, 1)
+        self.compressed_timestamps = compressed_timestamps
+        self.big_endian = big_endian
+        self.start_timestamp = start_timestamp
+
+        self.random = random.Random()
+        self.builder = None
+
+    def get_timestamp(self, sample_index: int) -> int:
+        return self.start_timestamp + round(sample_index * 1000 / self.sample_rate)
+
+    def get_segment_ranges(self) -> list[range]:
+        segment_size = math.ceil(self.record_count / self.segment_count)
+        return [
+            range(start, min(start + segment_size, self.record_count))
+            for start in range(0, self.record_count, segment_size)
+        ] or [range(0)]
+
+    def add(self, message: DataMessage, local_id: int = OTHER_LOCAL_ID):
+        message.local_id = local_id
+        if self.big_endian:
+            message.endian = Endian.BIG
+
+        self.builder.add(message)
+
+    def add_sample(self, message: DataMessage, timestamp: int):
+        if self.compressed_timestamps:
+            self.add(message, local_id=SAMPLE_LOCAL_ID)
+            self.builder.records[-1].header = RecordHeader(
+                is_time_compressed=True,
+                is_definition=False,
+                local_id=SAMPLE_LOCAL_ID,
+                time_offset_seconds=(timestamp // 1000) & MAX_COMPRESSED_TIME_OFFSET,
+            )
+        else:
+            message.timestamp = timestamp
+            self.add(message, local_id=SAMPLE_LOCAL_ID)
+
+    def start_segment(self, file_type: FileType, timestamp: int):
+        self.builder = FitFileBuilder(auto_define=True, min_string_size=16)
+
+        message = FileIdMessage()
+        message.type = file_type
+        message.manufacturer = Manufacturer.DEVELOPMENT.value
+        message.product = 0
+        message.time_created = timestamp
+        message.serial_number = self.seed & 0xFFFFFFFF
+        self.add(message)
+
+        if self.developer_field_count > 0:
+            message = DeveloperDataIdMessage()
+            message.application_id = b"fit_tool"
+            message.developer_data_index = 0
+            self.add(message)
+
+            for field_id in range(self.developer_field_count):
+                message = FieldDescriptionMessage()
+                message.developer_data_index = 0
+                message.field_definition_number = field_id
+                message.fit_base_type_id = self.get_developer_field_type(field_id)
+                message.field_name = f"developer_field_{field_id}"
+                self.add(message)
+
+    @staticmethod
+    def get_developer_field_type(field_id: int) -> BaseType:
+        return DEVELOPER_FIELD_TYPES[field_id % len(DEVELOPER_FIELD_TYPES)]
+
+    def create_developer_fields(self) -> list[DeveloperField]:
+        developer_fields = []
+
+        for field_id in range(self.developer_field_count):
+            base_type = self.get_developer_field_type(field_id)
+            developer_field = DeveloperField(
+                developer_data_index=0,
+                field_id=field_id,
+                base_type=base_type,
+                size=base_type.size,
+            )
+
+            if base_type == BaseType.FLOAT32:
+                value = self.random.uniform(-100.0, 100.0)
+            elif base_type == BaseType.SINT32:
+                value = self.random.randint(-1000000, 1000000)
+            else:
+                value = self.random.randint(0, base_type.size * 100)
+            developer_field.set_value(0, value)
+            developer_fields.append(developer_field)
+
+        return developer_fields
+
+    def add_event(self, timestamp: int, event: Event, event_type: EventType):
+        message = EventMessage()
+        message.timestamp = timestamp
+        message.event = event
+        message.event_type = event_type
+        self.add(message, local_id=EVENT_LOCAL_ID)
+
+    def activity(self) -> list[FitFile]:
+        """Generate an activity: records with position, distance, speed, altitude,
+        heart rate, cadence and power, and a lap, session and activity summary."""
+        self.random.seed(self.seed)
+        fit_files = []
+        latitude, longitude = START_POSITION
+        bearing = self.random.uniform(0, 2 * math.pi)
+        distance = 0.0
+        altitude = 400.0
+        heart_rate = 110.0
+        lap_start_index = 0
+        lap_index = 0
+        interval = 1.0 / self.sample_rate
+
+        for segment_range in self.get_segment_ranges():
+            segment_start = self.get_timestamp(segment_range.start)
+            self.start_segment(FileType.ACTIVITY, segment_start)
+            self.add_event(segment_start, Event.TIMER, EventType.START)
+
+            first_lap_index = lap_index
+            for i in segment_range:
+                timestamp = self.get_timestamp(i)
+
+                speed = max(0.0, 8.0 + self.random.gauss(0, 1.0))
+                bearing += self.random.gauss(0, 0.05)
+                step = speed * interval
+                latitude += step * math.cos(bearing) / METERS_PER_DEGREE
+                longitude += (
+                    step
+                    * math.sin(bearing)
+                    / (METERS_PER_DEGREE * math.cos(math.radians(latitude)))
+                )
+                distance += step
+                altitude = min(max(altitude + self.random.gauss(0, 0.5), 0.0), 2000.0)
+                heart_rate = min(max(heart_rate + self.random.gauss(0, 1.0), 60.0), 190.0)
+
+                message = RecordMessage(developer_fields=self.create_developer_fields())
+                message.position_lat = latitude
+                message.position_long = longitude
+                message.distance = distance
+                message.speed = speed
+                message.altitude = altitude
+                message.heart_rate = round(heart_rate)
+                message.cadence = self.random.randint(80, 95)
+                message.power = self.random.randint(150, 300)
+                self.add_sample(message, timestamp)
+
+                if self.event_interval and (i + 1) % self.event_interval == 0:
+                    self.add_event(timestamp, Event.BATTERY, EventType.MARKER)
+
+                is_last = i == segment_range.stop - 1
+                if is_last or (self.lap_interval and (i + 1) % self.lap_interval == 0):
+                    self.add_lap(lap_index, lap_start_index, i, distance)
+                    lap_index += 1
+                    lap_start_index = i + 1
+
+            segment_end = self.get_timestamp(max(segment_range.stop - 1, segment_range.start))
+            self.add_event(segment_end, Event.TIMER, EventType.STOP_ALL)
+
+            elapsed_time = (segment_end - segment_start) / 1000.0
+            message = SessionMessage()
+            message.timestamp = segment_end
+            message.start_time = segment_start
+            message.total_elapsed_time = elapsed_time
+            message.total_timer_time = elapsed_time
+            message.total_distance = distance
+            message.sport = Sport.CYCLING
+            message.first_lap_index = first_lap_index
+            message.num_laps = lap_index - first_lap_index
+            self.add(message)
+
+            message = ActivityMessage()
+            message.timestamp = segment_end
+            message.total_timer_time = elapsed_time
+            message.num_sessions = 1
+            message.type = Activity.MANUAL
+            message.event = Event.ACTIVITY
+            message.event_type = EventType.STOP
+            self.add(message)
+
+            fit_files.append(self.builder.build())
+
+        return fit_files
+
+    def add_lap(self, lap_index: int, start_index: int, end_index: int, distance: float):
+        start_time = self.get_timestamp(start_index)
+        timestamp = self.get_timestamp(end_index)
+
+        message = LapMessage()
+        message.message_index = lap_index
+        message.timestamp = timestamp
+        message.start_time = start_time
+        message.total_elapsed_time = (timestamp - start_time) / 1000.0
+        message.total_timer_time = (timestamp - start_time) / 1000.0
+        message.total_distance = distance
+        message.event = Event.LAP
+        message.event_type = EventType.STOP
+        message.lap_trigger = LapTrigger.TIME if self.lap_interval else LapTrigger.SESSION_END
+        self.add(message, local_id=LAP_LOCAL_ID)
+
+    def monitoring(self) -> list[FitFile]:
+        """Generate monitoring data: steps, active time, calories and heart rate."""
+        self.random.seed(self.seed)
+        fit_files = []
+        steps = 0
+        calories = 0
+
+        for segment_range in self.get_segment_ranges():
+            segment_start = self.get_timestamp(segment_range.start)
+            self.start_segment(FileType.MONITORING_B, segment_start)
+
+            message = MonitoringInfoMessage()
+            message.timestamp = segment_start
+            message.local_timestamp = to_seconds_since_1989_epoch(segment_start)
+            self.add(message)
+
+            for i in segment_range:
+                timestamp = self.get_timestamp(i)
+                steps += self.random.randint(0, 30)
+                calories += self.random.randint(0, 2)
+
+                message = MonitoringMessage(developer_fields=self.create_developer_fields())
+                message.activity_type = ActivityType.WALKING
+                message.steps = steps
+                message.calories = calories
+                message.active_time = float(i) / self.sample_rate
+                message.heart_rate = self.random.randint(55, 120)
+                self.add_sample(message, timestamp)
+
+                if self.event_interval and (i + 1) % self.event_interval == 0:
+                    self.add_event(timestamp, Event.BATTERY, EventType.MARKER)
+
+            fit_files.append(self.builder.build())
+
+        return fit_files
+
+    def locations(self) -> list[FitFile]:
+        """Generate saved locations around a start position. Locations always have
+        a timestamp field."""
+        self.random.seed(self.seed)
+        fit_files = []
+
+        for segment_range in self.get_segment_ranges():
+            self.start_segment(FileType.LOCATIONS, self.get_timestamp(segment_range.start))
+
+            message = LocationSettingsMessage()
+            message.location_settings = LocationSettings.ADD
+            self.add(message)
+
+            for i in segment_range:
+                message = LocationMessage(developer_fields=self.create_developer_fields())
+                message.message_index = i
+                message.timestamp = self.get_timestamp(i)
+                message.location_name = f"Location {i}"
+                message.position_lat = START_POSITION[0] + self.random.uniform(-0.5, 0.5)
+                message.position_long = START_POSITION[1] + self.random.uniform(-0.5, 0.5)
+                message.altitude = self.random.uniform(300.0, 2500.0)
+                message.symbol = self.random.randint(0, 100)
+                message.description = f"Generated location {i}"
+                self.add(message, local_id=SAMPLE_LOCAL_ID)
+
+            fit_files.append(self.builder.build())
+
+        return fit_files
+
+    def generate(self, file_type: str) -> list[FitFile]:
+        if file_type not in FILE_TYPES:
+            raise Exception(f"Unknown file type: {file_type}")
+
+        return getattr(self, file_type)()
+
+    @staticmethod
+    def to_bytes(fit_files: list[FitFile]) -> bytes:
+        """Chain the segments into one FIT file."""
+        return b"".join([fit_file.to_bytes() for fit_file in fit_files])
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate synthetic FIT files.")
+    parser.add_argument("file_type", choices=FILE_TYPES, help="kind of file to generate")
+    parser.add_argument("output", help="path of the generated FIT file")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--records", type=int, default=3600, help="number of samples")
+    parser.add_argument("--sample-rate", type=float, default=1.0, help="samples per second")
+    parser.add_argument("--developer-fields", type=int, default=0)
+    parser.add_argument("--lap-interval", type=int, default=0, help="samples per lap")
+    parser.add_argument("--event-interval", type=int, default=0, help="samples per event")
+    parser.add_argument("--segments", type=int, default=1, help="number of chained files")
+    parser.add_argument("--compressed-timestamps", action="store_true")
+    parser.add_argument("--big-endian", action="store_true")
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    generator = FitFileGenerator(
+        seed=args.seed,
+        record_count=args.records,
+        sample_rate=args.sample_rate,
+        developer_field_count=args.developer_fields,
+        lap_interval=args.lap_interval,
+        event_interval=args.event_interval,
+        segment_count=args.segments,
+        compressed_timestamps=args.compressed_timestamps,
+        big_endian=args.big_endian,
+    )
+
+    with open(args.output, "wb") as file_object:
+        file_object.write(FitFileGenerator.to_bytes(generator.generate(args.file_type)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+import heapq
+from collections import OrderedDict
+from typing import Iterator, Optional
+from typing import List as list
+
+from fit_tool.data_message import DataMessage
+from fit_tool.definition_message import DefinitionMessage
+from fit_tool.field import Field
+from fit_tool.fit_file_reader import FitFileReader
+from fit_tool.fit_file_writer import FitFileWriter
+from fit_tool.profile.messages.device_info_message import (
+    DeviceInfoDeviceIndexField,
+    DeviceInfoManufacturerField,
+    DeviceInfoMessage,
+    DeviceInfoProductField,
+    DeviceInfoSerialNumberField,
+)
+from fit_tool.profile.messages.record_message import RecordMessage
+from fit_tool.record_layout import COMPRESSED_TIMESTAMP_MASK, TIMESTAMP_FIELD_ID
+
+# orders messages without a timestamp before all timestamped ones
+NO_TIMESTAMP = -1
+
+MAX_LOCAL_ID = 15
+
+DEVICE_INFO_KEY_FIELD_IDS = [
+    DeviceInfoDeviceIndexField.ID,
+    DeviceInfoManufacturerField.ID,
+    DeviceInfoSerialNumberField.ID,
+    DeviceInfoProductField.ID,
+]
+
+
+def is_field_set(field: Optional[Field]) -> bool:
+    if field is None or not field.is_valid():
+        return False
+
+    invalid_value = field.base_type.invalid_raw_value()
+    return any(x is not None and x != invalid_value for x in field.encoded_values)
+
+
+def get_encoded_timestamp(message: DataMessage) -> Optional[int]:
+    field = message.get_field(TIMESTAMP_FIELD_ID)
+    if not is_field_set(field):
+        return None
+
+    return field.encoded_values[0]
+
+
+class FitFileMerger:
+    """Merges FIT files recorded by several devices during the same session.
+
+    The inputs are read through streaming readers and merged by timestamp with a
+    heap holding the next message of each input, so memory grows with the number
+    of inputs and not with the number of records. Messages without a timestamp keep
+    their place after the previous timestamped message of their input.
+
+    The first input is the primary one: its file id and all of its messages other
+    than records are kept. Of the other inputs only records and device infos are
+    used, without their developer fields. The device infos of each device are only
+    taken from the first input describing it. With combine_records, records of
+    different inputs with the same timestamp are combined into one; fields missing
+    from the earlier input's record are taken from the later ones.
+    """
+
+    def __init__(
+        self, paths: list[str], combine_records: bool = True, check_crc: bool = True
+    ):
+        self.paths = paths
+        self.combine_records = combine_records
+        self.check_crc = check_crc
+
+        self.local_ids_by_definition = OrderedDict()
+        self.input_indexes_by_device = {}
+        self.message_count = 0
+        self.combined_count = 0
+
+    def messages(self, reader: FitFileReader, input_index: int) -> Iterator[tuple]:
+        """Yield the heap entries of the data messages of one input. Timestamps of
+        compressed timestamp records are expanded into their timestamp field."""
+        last_timestamp = NO_TIMESTAMP
+
+        for sequence, record in enumerate(reader.records()):
+            if record.is_definition:
+                continue
+
+            message = record.message
+            timestamp = get_encoded_timestamp(message)
+
+            if timestamp is None and record.header.is_time_compressed:
+                if last_timestamp != NO_TIMESTAMP:
+                    time_offset = record.header.time_offset_seconds
+                    timestamp = last_timestamp + (
+                        (time_offset - last_timestamp) & COMPRESSED_TIMESTAMP_MASK
+                    )
+                    field_type = message.field_types.get(TIMESTAMP_FIELD_ID)
+                    if field_type is not None:
+                        field = field_type(size=4, growable=False)
+                        field.set_encoded_value(0, timestamp)
+                        message.add_field(field)
+                        message.update_definition_message()
+
+            if timestamp is None:
+                yield last_timestamp, input_index, sequence, message
+            else:
+                last_timestamp = timestamp
+                yield timestamp, input_index, sequence, message
+
+    def get_local_id(self, definition_message: DefinitionMessage) -> int:
+        """Return the local id of a definition, reusing the least recently used local
+        id once all are taken, so that records of different layouts from several
+        inputs do not redefine the same local id over and over."""
+        key = definition_message.to_bytes()
+        local_id = self.local_ids_by_definition.pop(key, None)
+
+        if local_id is None:
+            if len(self.local_ids_by_definition) > MAX_LOCAL_ID:
+                _, local_id = self.local_ids_by_definition.popitem(last=False)
+            else:
+                local_id = len(self.local_ids_by_definition)
+
+        self.local_ids_by_definition[key] = local_id
+        return local_id
+
+    def is_new_device(self, message: DeviceInfoMessage, input_index: int) -> bool:
+        """Return False for device infos of a device already described by another
+        input."""
+        fields = [message.get_field(x) for x in DEVICE_INFO_KEY_FIELD_IDS]
+        key = tuple(tuple(x.encoded_values) if is_field_set(x) else None for x in fields)
+
+        return self.input_indexes_by_device.setdefault(key, input_index) == input_index
+
+    def combine(self, message: RecordMessage, other: RecordMessage):
+        changed = False
+        for field in other.fields:
+            if is_field_set(field) and not is_field_set(message.get_field(field.field_id)):
+                message.add_field(field)
+                changed = True
+
+        if changed:
+            message.update_definition_message()
+        self.combined_count += 1
+
+    def write(self, writer: FitFileWriter, message: DataMessage, input_index: int):
+        if input_index != 0 and message.developer_fields:
+            message.developer_fields = []
+            message.update_definition_message()
+
+        message.local_id = self.get_local_id(DefinitionMessage.from_data_message(message))
+        writer.write_message(message)
+        self.message_count += 1
+
+    def merge(self, readers: list[FitFileReader], writer: FitFileWriter):
+        self.local_ids_by_definition = OrderedDict()
+        self.input_indexes_by_device = {}
+        self.message_count = 0
+        self.combined_count = 0
+
+        iterators = [self.messages(reader, i) for i, reader in enumerate(readers)]
+        heap = []
+        for iterator in iterators:
+            entry = next(iterator, None)
+            if entry is not None:
+                heap.append(entry)
+        heapq.heapify(heap)
+
+        def advance(input_index: int):
+            entry = next(iterators[input_index], None)
+            if entry is not None:
+                heapq.heappush(heap, entry)
+
+        # the last record read, written once no record of another input with the same
+        # timestamp can follow, and the messages read after it, which are written
+        # after it so that each input keeps its order
+        pending = None
+        pending_input_indexes = set()
+        held = []
+
+        def flush():
+            self.write(writer, pending[2], pending[1])
+            for held_message, held_input_index in held:
+                self.write(writer, held_message, held_input_index)
+            held.clear()
+
+        while heap:
+            timestamp, input_index, _, message = heapq.heappop(heap)
+            advance(input_index)
+
+            if pending is not None and pending[0] != timestamp:
+                flush()
+                pending = None
+
+            if isinstance(message, RecordMessage):
+                if self.combine_records and pending is not None and (
+                    input_index not in pending_input_indexes
+                ):
+                    self.combine(pending[2], message)
+                    pending_input_indexes.add(input_index)
+                    continue
+
+                if pending is not None:
+                    flush()
+
+                pending = (timestamp, input_index, message)
+                pending_input_indexes = {input_index}
+                continue
+
+            if isinstance(message, DeviceInfoMessage):
+                if not self.is_new_device(message, input_index):
+                    continue
+            elif input_index != 0:
+                continue
+
+            if pending is None:
+                self.write(writer, message, input_index)
+            else:
+                held.append((message, input_index))
+
+        if pending is not None:
+            flush()
+
+    def merge_to_file(self, path: str):
+        readers = [FitFileReader.from_file(x, check_crc=self.check_crc) for x in self.paths]
+        try:
+            header = readers[0].read_header()
+            with FitFileWriter.from_file(
+                path, header.protocol_version, header.profile_version
+            ) as writer:
+                self.merge(readers, writer)
+        finally:
+            for reader in readers:
+                reader.close()
@@ -0,0 +1,359 @@
+import mmap
+import os
+import struct
+from array import array
+from typing import Callable
+from typing import Dict as dict
+from typing import List as list
+from typing import Optional
+
+from fit_tool.base_type import BaseType
+from fit_tool.definition_message import DefinitionMessage
+from fit_tool.endian import Endian
+from fit_tool.geo import SEMICIRCLES_PER_DEGREE
+from fit_tool.profile.messages.file_id_message import FileIdMessage, FileIdSerialNumberField
+from fit_tool.profile.messages.message_factory import MessageFactory
+from fit_tool.record import RecordHeader
+from fit_tool.record_index import RecordIndex, get_index_path, read_file_crc
+from fit_tool.record_layout import (
+    COMPRESSED_TIMESTAMP_MASK,
+    INVALID_TIMESTAMP,
+    MIN_DATE_TIME,
+    TIMESTAMP_FIELD_ID,
+    get_timestamp_layout,
+)
+from fit_tool.utils.crc import crc16
+
+# base types whose encoded values can be patched, with their struct format
+STRUCT_FORMATS = {
+    BaseType.ENUM: "B",
+    BaseType.SINT8: "b",
+    BaseType.UINT8: "B",
+    BaseType.UINT8Z: "B",
+    BaseType.BYTE: "B",
+    BaseType.SINT16: "h",
+    BaseType.UINT16: "H",
+    BaseType.UINT16Z: "H",
+    BaseType.SINT32: "i",
+    BaseType.UINT32: "I",
+    BaseType.UINT32Z: "I",
+    BaseType.SINT64: "q",
+    BaseType.UINT64: "Q",
+    BaseType.UINT64Z: "Q",
+}
+
+DATE_TIME_TYPE_NAMES = {"date_time", "local_date_time"}
+
+# byte offset of the records size within the file header
+RECORDS_SIZE_OFFSET = 4
+
+
+def get_field_types(global_id: int) -> dict:
+    """Return the profile field classes by field id of a message type, empty for
+    messages that are not in the profile."""
+    message = MessageFactory.from_definition(DefinitionMessage(global_id=global_id), [])
+    return getattr(type(message), "FIELD_TYPES", {})
+
+
+def shift_date_time(value: int, seconds: int) -> int:
+    """Return a date_time value shifted by seconds, leaving values relative to a
+    device power up alone. Raises if the shifted value leaves the date_time range."""
+    if value < MIN_DATE_TIME:
+        return value
+
+    shifted_value = value + seconds
+    if not MIN_DATE_TIME <= shifted_value < INVALID_TIMESTAMP:
+        raise Exception(
+            f"Shifting date_time {value} by {seconds} s leaves the date_time range."
+        )
+
+    return shifted_value
+
+
+class FitFilePatcher:
+    """Overwrites encoded field values of a FIT file in place.
+
+    The file is memory mapped and its RecordIndex gives the offset of every data
+    record and of the definition it uses, so field values are located from the
+    definitions alone without decoding any data message. Only integer fields can be
+    patched since the record sizes must stay the same. Closing the patcher
+    recomputes the trailing CRC in one pass over the header and records and
+    refreshes a sidecar index if there is one.
+
+    Only the first file of a chained FIT file is patched.
+    """
+
+    def __init__(self, path: str, index: RecordIndex = None):
+        self.path = path
+        self.index = index if index is not None else RecordIndex.open(path, save=False)
+        self.file_object = open(path, "r+b")
+        self.buffer = mmap.mmap(self.file_object.fileno(), 0)
+        self.definition_messages_by_index = {}
+        self.field_types_by_global_id = {}
+        self.modified = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.buffer.closed:
+            return
+
+        if self.modified:
+            self.update_crc()
+            self.buffer.flush()
+
+        self.buffer.close()
+        self.file_object.close()
+
+        index_path = get_index_path(self.path)
+        if self.modified and os.path.exists(index_path):
+            self.index.file_crc = read_file_crc(self.path)
+            self.index.save(index_path)
+
+    def get_definition_message(self, definition_index: int) -> DefinitionMessage:
+        definition_message = self.definition_messages_by_index.get(definition_index)
+
+        if definition_message is None:
+            offset = self.index.offsets[definition_index]
+            record_header = RecordHeader.from_bytes(self.buffer[offset : offset + 1])
+            definition_message = DefinitionMessage.from_bytes(
+                self.buffer,
+                offset=offset + RecordHeader.HEADER_SIZE,
+                has_developer_fields=record_header.has_developer_fields,
+            )
+            self.definition_messages_by_index[definition_index] = definition_message
+
+        return definition_message
+
+    def get_field_types(self, global_id: int) -> dict:
+        field_types = self.field_types_by_global_id.get(global_id)
+
+        if field_types is None:
+            field_types = {
+                field_id: field_type()
+                for field_id, field_type in get_field_types(global_id).items()
+            }
+            self.field_types_by_global_id[global_id] = field_types
+
+        return field_types
+
+    def get_field_layouts(self, definition_index: int, field_ids: list[int]) -> list[tuple]:
+        """Return the offset within the record, struct, value count and invalid value
+        of each of the fields present in messages using this definition."""
+        definition_message = self.get_definition_message(definition_index)
+        endian_symbol = "<" if definition_message.endian == Endian.LITTLE else ">"
+
+        layouts = []
+        offset = RecordHeader.HEADER_SIZE
+        for field_definition in definition_message.field_definitions:
+            if field_definition.field_id in field_ids:
+                base_type = field_definition.base_type
+                struct_format = STRUCT_FORMATS.get(base_type)
+                if struct_format is None:
+                    raise Exception(
+                        f"Field {field_definition.field_id} of message "
+                        f"{definition_message.global_id} has base type {base_type.name}, "
+                        f"which cannot be patched in place."
+                    )
+
+                layouts.append(
+                    (
+                        offset,
+                        struct.Struct(endian_symbol + struct_format),
+                        field_definition.size // base_type.size,
+                        base_type.invalid_raw_value(),
+                    )
+                )
+
+            offset += field_definition.size
+
+        return layouts
+
+    def patch_fields(
+        self,
+        field_ids_by_global_id: dict[int, list[int]],
+        function: Callable[[int], Optional[int]],
+        include_invalid: bool = False,
+    ) -> int:
+        """Replace every encoded value of the given fields with function(value), invalid
+        values are left alone unless include_invalid is set. A result of None
+        invalidates the value. Returns the number of values changed."""
+        buffer = self.buffer
+        offsets = self.index.offsets
+        global_ids = self.index.global_ids
+        definition_indexes = self.index.definition_indexes
+        layouts_by_definition_index = {}
+        changed_count = 0
+
+        for record_index, definition_index in enumerate(definition_indexes):
+            if definition_index == record_index:
+                continue
+
+            field_ids = field_ids_by_global_id.get(global_ids[record_index])
+            if not field_ids:
+                continue
+
+            layouts = layouts_by_definition_index.get(definition_index)
+            if layouts is None:
+                layouts = self.get_field_layouts(definition_index, field_ids)
+                layouts_by_definition_index[definition_index] = layouts
+
+            record_offset = offsets[record_index]
+            for offset, value_struct, count, invalid_value in layouts:
+                position = record_offset + offset
+                for _ in range(count):
+                    (value,) = value_struct.unpack_from(buffer, position)
+                    if include_invalid or value != invalid_value:
+                        new_value = function(value)
+                        if new_value is None:
+                            new_value = invalid_value
+                        if new_value != value:
+                            value_struct.pack_into(buffer, position, new_value)
+                            changed_count += 1
+
+                    position += value_struct.size
+
+        if changed_count:
+            self.modified = True
+            if any(TIMESTAMP_FIELD_ID in x for x in field_ids_by_global_id.values()):
+                self.update_index_timestamps()
+
+        return changed_count
+
+    def update_index_timestamps(self):
+        """Read the timestamps of the index again from the records, after timestamp
+        fields or compressed timestamp headers were patched, so that the saved index
+        matches the file."""
+        index = self.index
+        layouts_by_definition_index = {}
+        last_timestamp = INVALID_TIMESTAMP
+
+        for record_index, offset in enumerate(index.offsets):
+            definition_index = index.definition_indexes[record_index]
+            if definition_index == record_index:
+                continue
+
+            timestamp = INVALID_TIMESTAMP
+            header = self.buffer[offset]
+            if header & RecordHeader.IS_TIME_COMPRESSED_BIT_MASK:
+                if last_timestamp != INVALID_TIMESTAMP:
+                    time_offset = header & COMPRESSED_TIMESTAMP_MASK
+                    timestamp = last_timestamp + (
+                        (time_offset - last_timestamp) & COMPRESSED_TIMESTAMP_MASK
+                    )
+            else:
+                if definition_index not in layouts_by_definition_index:
+                    layouts_by_definition_index[definition_index] = get_timestamp_layout(
+                        self.get_definition_message(definition_index)
+                    )
+                layout = layouts_by_definition_index[definition_index]
+                if layout:
+                    (timestamp,) = struct.unpack_from(layout[0], self.buffer, offset + layout[1])
+
+            if timestamp != INVALID_TIMESTAMP:
+                last_timestamp = timestamp
+            index.timestamps[record_index] = timestamp
+
+        index.timed_timestamps = None
+
+    def patch_field(
+        self,
+        global_id: int,
+        field_id: int,
+        function: Callable[[int], Optional[int]],
+        include_invalid: bool = False,
+    ) -> int:
+        return self.patch_fields({global_id: [field_id]}, function, include_invalid)
+
+    def select_fields(self, predicate: Callable) -> dict[int, list[int]]:
+        """Return the ids of the profile fields matching predicate, by global id, for
+        the message types present in the file."""
+        field_ids_by_global_id = {}
+        for global_id in set(self.index.global_ids):
+            field_ids = [
+                field_id
+                for field_id, field in self.get_field_types(global_id).items()
+                if predicate(field)
+            ]
+            if field_ids:
+                field_ids_by_global_id[global_id] = field_ids
+
+        return field_ids_by_global_id
+
+    def set_serial_number(self, serial_number: int) -> int:
+        return self.patch_field(
+            FileIdMessage.ID,
+            FileIdSerialNumberField.ID,
+            lambda value: serial_number,
+            include_invalid=True,
+        )
+
+    def shift_timestamps(self, seconds: int) -> int:
+        """Shift all date_time and local_date_time fields by seconds, including the
+        time offsets of compressed timestamp headers. Values below MIN_DATE_TIME are
+        relative to a device power up and are left alone.
+
+        All shifted values are checked before any is written, so a shift that takes
+        a value out of the date_time range raises without changing the file."""
+        field_ids_by_global_id = self.select_fields(
+            lambda field: field.type_name in DATE_TIME_TYPE_NAMES
+        )
+
+        def check(value: int) -> int:
+            shift_date_time(value, seconds)
+            return value
+
+        self.patch_fields(field_ids_by_global_id, check)
+        timestamps = array(self.index.timestamps.typecode, self.index.timestamps)
+        for timestamp in timestamps:
+            if timestamp != INVALID_TIMESTAMP:
+                shift_date_time(timestamp, seconds)
+
+        changed_count = self.patch_fields(
+            field_ids_by_global_id, lambda value: shift_date_time(value, seconds)
+        )
+
+        header_count = 0
+        for record_index, offset in enumerate(self.index.offsets):
+            timestamp = timestamps[record_index]
+            if timestamp == INVALID_TIMESTAMP or timestamp < MIN_DATE_TIME:
+                continue
+
+            header = self.buffer[offset]
+            if header & RecordHeader.IS_TIME_COMPRESSED_BIT_MASK:
+                self.buffer[offset] = (header & ~COMPRESSED_TIMESTAMP_MASK) | (
+                    (timestamp + seconds) & COMPRESSED_TIMESTAMP_MASK
+                )
+                header_count += 1
+
+        if header_count:
+            self.modified = True
+            self.update_index_timestamps()
+
+        return changed_count + header_count
+
+    def anonymize_positions(self) -> int:
+        """Invalidate all latitude and longitude fields (semicircles)."""
+        return self.patch_fields(
+            self.select_fields(
+                lambda field: field.base_type == BaseType.SINT32
+                and field.scale is not None
+                and abs(field.scale - SEMICIRCLES_PER_DEGREE) < 1e-3
+            ),
+            lambda value: None,
+        )
+
+    def get_records_end(self) -> int:
+        (records_size,) = struct.unpack_from("<I", self.buffer, RECORDS_SIZE_OFFSET)
+        return self.buffer[0] + records_size
+
+    def update_crc(self) -> int:
+        records_end = self.get_records_end()
+        with memoryview(self.buffer) as view, view[:records_end] as records_view:
+            crc = crc16(records_view)
+        struct.pack_into("<H", self.buffer, records_end, crc)
+        return crc
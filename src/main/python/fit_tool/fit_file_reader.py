@@ -0,0 +1,316 @@
+import csv
+import io
+import struct
+import time
+from typing import Dict as dict
+from typing import Iterator
+
+from fit_tool.decode_stats import DecodeStats
+from fit_tool.decoder_context import DecoderContext
+from fit_tool.definition_message import DefinitionMessage
+from fit_tool.developer_field_definition import DeveloperFieldDefinition
+from fit_tool.diagnostics import BYTES_MISMATCH, SIZE_MISMATCH, Diagnostics
+from fit_tool.field import DecodeMode
+from fit_tool.field_definition import FieldDefinition
+from fit_tool.fit_file_header import FitFileHeader
+from fit_tool.record import Record, RecordHeader
+from fit_tool.record_layout import DEFINITION_FIXED_SIZE
+from fit_tool.utils.crc import crc16
+from fit_tool.utils.logging import logger
+
+
+class FitFileReader:
+    """Reads the records of a FIT file one at a time from a binary stream.
+
+    Only the header, the active definition messages and the developer fields are
+    kept in memory, so files of any size can be processed in constant memory.
+
+    If stats is given, counts, bytes and decode time of every record are added to
+    it, with the time spent verifying records kept apart from the decode time.
+    Decode problems are collected in diagnostics; unless a Diagnostics object is
+    passed in, a summary is logged once all records have been read.
+
+    Data messages are created by message_factory, by default the MessageFactory
+    of the generated message classes; SchemaMessageFactory creates them from the
+    profile schema instead.
+
+    The definitions, developer fields and decode options live in a DecoderContext
+    owned by the reader, so readers of different files can run in parallel
+    threads.
+    """
+
+    def __init__(
+        self,
+        file_object,
+        check_crc: bool = True,
+        decode_mode: DecodeMode = None,
+        verify_records: bool = False,
+        stats: DecodeStats = None,
+        diagnostics: Diagnostics = None,
+        message_factory=None,
+    ):
+        self.file_object = file_object
+        self.check_crc = check_crc
+        self.verify_records = verify_records
+        self.stats = stats
+        self.log_diagnostics = diagnostics is None
+        self.context = DecoderContext(
+            decode_mode=decode_mode,
+            diagnostics=diagnostics,
+            message_factory=message_factory,
+        )
+
+        self.header = None
+        self.header_crc = 0
+        self.crc = 0
+        self.file_crc = None
+        self.records_offset = 0
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        check_crc: bool = True,
+        decode_mode: DecodeMode = None,
+        stats: DecodeStats = None,
+        diagnostics: Diagnostics = None,
+        message_factory=None,
+    ):
+        return cls(
+            open(path, "rb"),
+            check_crc=check_crc,
+            decode_mode=decode_mode,
+            stats=stats,
+            diagnostics=diagnostics,
+            message_factory=message_factory,
+        )
+
+    @classmethod
+    def from_bytes(
+        cls,
+        bytes_buffer: bytes,
+        check_crc: bool = True,
+        decode_mode: DecodeMode = None,
+        stats: DecodeStats = None,
+        diagnostics: Diagnostics = None,
+        message_factory=None,
+    ):
+        return cls(
+            io.BytesIO(bytes_buffer),
+            check_crc=check_crc,
+            decode_mode=decode_mode,
+            stats=stats,
+            diagnostics=diagnostics,
+            message_factory=message_factory,
+        )
+
+    @property
+    def decode_mode(self) -> DecodeMode:
+        return self.context.decode_mode
+
+    @property
+    def diagnostics(self) -> Diagnostics:
+        return self.context.diagnostics
+
+    @property
+    def message_factory(self):
+        return self.context.message_factory
+
+    @property
+    def definition_messages(self) -> dict:
+        return self.context.definition_messages
+
+    @definition_messages.setter
+    def definition_messages(self, definition_messages: dict):
+        self.context.definition_messages = definition_messages
+
+    @property
+    def developer_fields_by_data_index(self) -> dict:
+        return self.context.developer_fields_by_data_index
+
+    @developer_fields_by_data_index.setter
+    def developer_fields_by_data_index(self, developer_fields_by_data_index: dict):
+        self.context.developer_fields_by_data_index = developer_fields_by_data_index
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self) -> Iterator[Record]:
+        return self.records()
+
+    def close(self):
+        self.file_object.close()
+
+    def read_bytes(self, size: int) -> bytes:
+        bytes_buffer = self.file_object.read(size)
+        if len(bytes_buffer) != size:
+            raise Exception(
+                f"Unexpected end of file: expected {size} bytes, got {len(bytes_buffer)}."
+            )
+        return bytes_buffer
+
+    def read_header(self) -> FitFileHeader:
+        if self.header is None:
+            header_size = self.read_bytes(1)
+            header_bytes = header_size + self.read_bytes(header_size[0] - 1)
+            self.header = FitFileHeader.from_bytes(header_bytes)
+            self.header_crc = crc16(header_bytes)
+            self.crc = self.header_crc
+            self.records_offset = len(header_bytes)
+
+        return self.header
+
+    def rewind(self):
+        self.file_object.seek(self.records_offset)
+        self.crc = self.header_crc
+        self.file_crc = None
+        self.context.clear()
+        self.diagnostics.clear()
+
+    def read_record_bytes(self) -> bytes:
+        header_bytes = self.read_bytes(RecordHeader.HEADER_SIZE)
+        header = RecordHeader.from_bytes(header_bytes)
+
+        if header.is_definition:
+            return header_bytes + self.read_definition_bytes(header)
+
+        definition_message = self.get_definition_message(header.local_id)
+        return header_bytes + self.read_bytes(definition_message.defined_data_size)
+
+    def read_definition_bytes(self, header: RecordHeader) -> bytes:
+        fixed_bytes = self.read_bytes(DEFINITION_FIXED_SIZE)
+        field_count = fixed_bytes[DEFINITION_FIXED_SIZE - 1]
+        definition_bytes = fixed_bytes + self.read_bytes(
+            field_count * FieldDefinition.field_definition_size()
+        )
+
+        if header.has_developer_fields:
+            count_bytes = self.read_bytes(1)
+            definition_bytes += count_bytes + self.read_bytes(
+                count_bytes[0] * DeveloperFieldDefinition.field_definition_size()
+            )
+
+        return definition_bytes
+
+    def get_definition_message(self, local_id: int) -> DefinitionMessage:
+        return self.context.get_definition_message(local_id)
+
+    def add_developer_field(self, message):
+        self.context.add_developer_field(message)
+
+    def decode_record(self, record_bytes: bytes, record_index: int = 0) -> Record:
+        record = self.context.decode_record(record_bytes)
+
+        if self.verify_records:
+            self.verify_record(record, record_bytes, record_index)
+
+        return record
+
+    def verify_record(self, record: Record, record_bytes: bytes, record_index: int):
+        """Check that the record encodes back to the bytes it was decoded from."""
+        record_size = record.size
+        defined_size = len(record_bytes)
+        if record_size != defined_size:
+            self.add_diagnostic(SIZE_MISMATCH, record, (record_index, record_size, defined_size))
+
+        encoded_bytes = record.to_bytes()
+        if encoded_bytes != record_bytes:
+            self.add_diagnostic(
+                BYTES_MISMATCH, record, (record_index, record_bytes, encoded_bytes)
+            )
+
+    def add_diagnostic(self, kind: str, record: Record, sample: tuple):
+        message = record.message
+        name = "definition" if record.is_definition else message.name
+        self.diagnostics.add(kind, name, message.global_id, sample=sample)
+
+    def records(self) -> Iterator[Record]:
+        header = self.read_header()
+
+        record_index = 0
+        record_bytes_remaining_count = header.records_size
+        while record_bytes_remaining_count > 0:
+            record_bytes = self.read_record_bytes()
+            self.crc = crc16(record_bytes, crc=self.crc)
+
+            if self.stats is None:
+                yield self.decode_record(record_bytes, record_index)
+            else:
+                # the verification re-encodes the record, so it is timed on its own
+                start = time.perf_counter()
+                record = self.context.decode_record(record_bytes)
+                self.stats.add_record(record, record_bytes, time.perf_counter() - start)
+
+                if self.verify_records:
+                    start = time.perf_counter()
+                    self.verify_record(record, record_bytes, record_index)
+                    self.stats.add_verification(time.perf_counter() - start)
+
+                yield record
+
+            record_bytes_remaining_count -= len(record_bytes)
+            record_index += 1
+
+        if self.log_diagnostics:
+            self.diagnostics.log_summary()
+
+        self.check_file_crc()
+
+    def definitions(self) -> Iterator[DefinitionMessage]:
+        """Yield the definition messages only, skipping over the data messages."""
+        header = self.read_header()
+
+        record_bytes_remaining_count = header.records_size
+        while record_bytes_remaining_count > 0:
+            record_header = RecordHeader.from_bytes(
+                self.read_bytes(RecordHeader.HEADER_SIZE)
+            )
+
+            if record_header.is_definition:
+                definition_bytes = self.read_definition_bytes(record_header)
+                definition_message = DefinitionMessage.from_bytes(
+                    definition_bytes,
+                    has_developer_fields=record_header.has_developer_fields,
+                )
+                self.definition_messages[record_header.local_id] = definition_message
+                data_size = len(definition_bytes)
+
+                yield definition_message
+            else:
+                definition_message = self.get_definition_message(record_header.local_id)
+                data_size = definition_message.defined_data_size
+                self.file_object.seek(data_size, io.SEEK_CUR)
+
+            record_bytes_remaining_count -= RecordHeader.HEADER_SIZE + data_size
+
+    def to_csv(self, path: str):
+        """Write all records to a CSV file in two passes over the stream: the header
+        is computed from the definition messages, then each record is decoded and
+        written straight to the CSV writer."""
+        max_fields = Record.max_field_count(self.definitions())
+        self.rewind()
+
+        with open(path, "w", newline="") as csv_file:
+            csv_writer = csv.writer(
+                csv_file, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL
+            )
+            csv_writer.writerow(Record.header_row(max_fields))
+            for record in self.records():
+                csv_writer.writerow(record.to_row())
+
+    def check_file_crc(self):
+        (self.file_crc,) = struct.unpack("<H", self.read_bytes(2))
+
+        if self.crc != self.file_crc:
+            message = (
+                f"Calculated crc ({hex(self.crc)}) does match crc in file "
+                f"({hex(self.file_crc)})."
+            )
+
+            if self.check_crc:
+                raise Exception(message)
+            else:
+                logger.warning(message)
@@ -0,0 +1,225 @@
+import os
+import struct
+import time
+from typing import Callable, Iterator, Optional
+from typing import List as list
+
+from fit_tool.developer_field_definition import DeveloperFieldDefinition
+from fit_tool.field import DecodeMode
+from fit_tool.field_definition import FieldDefinition
+from fit_tool.fit_file_header import FitFileHeader
+from fit_tool.fit_file_reader import FitFileReader
+from fit_tool.record import Record, RecordHeader
+from fit_tool.record_layout import DEFINITION_FIXED_SIZE
+from fit_tool.utils.crc import crc16
+from fit_tool.utils.logging import logger
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+CRC_SIZE = 2
+
+
+class FitFileTailReader:
+    """Decodes the records of a FIT file that is still being written.
+
+    The reader keeps the file offset, the active definitions and the running CRC
+    between polls, so each poll only decodes the bytes appended since the previous
+    one. A partial record at the end of the file is kept until the rest of it has
+    been written. Chained FIT files are followed across their headers.
+
+    poll() can be called from a file watcher (e.g. on an inotify IN_MODIFY event);
+    follow() polls at a fixed interval instead.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        callback: Callable[[Record], None] = None,
+        check_crc: bool = True,
+        decode_mode: DecodeMode = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        self.path = path
+        self.callback = callback
+        self.check_crc = check_crc
+        self.decode_mode = decode_mode
+        self.poll_interval = poll_interval
+        self.reset()
+
+    def reset(self):
+        self.file_offset = 0
+        self.buffer = bytearray()
+        self.header = None
+        self.header_file_offset = 0
+        self.crc = 0
+        self.file_crc = None
+        self.records_bytes_count = 0
+        self.record_count = 0
+        # only used for its definition and developer field state
+        self.reader = FitFileReader(None, decode_mode=self.decode_mode)
+
+    def read_appended_bytes(self) -> int:
+        if not os.path.exists(self.path):
+            return 0
+
+        if os.path.getsize(self.path) < self.file_offset:
+            logger.warning(f"{self.path} was truncated, reading it from the start.")
+            self.reset()
+
+        with open(self.path, "rb") as file_object:
+            file_object.seek(self.file_offset)
+            bytes_buffer = file_object.read()
+
+        self.file_offset += len(bytes_buffer)
+        self.buffer.extend(bytes_buffer)
+        return len(bytes_buffer)
+
+    def update_records_size(self):
+        """Writers may leave the records size at 0 until the file is complete, so
+        re-read it from the header until it is known.
+
+        The CRC of such a file is only known to be seeded correctly if the final
+        header carries its own CRC (the CRC of the header is then 0), otherwise it
+        is recomputed once from the bytes read so far."""
+        consumed_size = self.file_offset - len(self.buffer) - self.header_file_offset
+
+        with open(self.path, "rb") as file_object:
+            file_object.seek(self.header_file_offset)
+            header_bytes = file_object.read(self.header.size)
+            if len(header_bytes) != self.header.size:
+                return
+
+            header = FitFileHeader.from_bytes(header_bytes)
+            if header.records_size == 0:
+                return
+
+            self.header = header
+            header_crc = crc16(header_bytes)
+            if header_crc != 0:
+                self.crc = crc16(
+                    file_object.read(consumed_size - len(header_bytes)), crc=header_crc
+                )
+
+    def poll(self) -> list[Record]:
+        """Decode the complete records appended since the last poll, pass them to
+        the callback and return them."""
+        self.read_appended_bytes()
+
+        # the header may be rewritten in place without appending anything
+        if self.header and self.header.records_size == 0:
+            self.update_records_size()
+
+        records = []
+        offset = 0
+        while True:
+            size = self.decode_next(offset, records)
+            if size is None:
+                break
+            offset += size
+
+        del self.buffer[:offset]
+
+        if self.reader.diagnostics:
+            self.reader.diagnostics.log_summary()
+            self.reader.diagnostics.clear()
+
+        if self.callback:
+            for record in records:
+                self.callback(record)
+
+        return records
+
+    def follow(self, stop: Callable[[], bool] = None) -> Iterator[Record]:
+        """Yield records as they are written, polling every poll_interval seconds
+        until stop() returns True."""
+        while stop is None or not stop():
+            records = self.poll()
+            for record in records:
+                yield record
+
+            if not records:
+                time.sleep(self.poll_interval)
+
+    def decode_next(self, offset: int, records: list[Record]) -> Optional[int]:
+        """Consume the header, a record or the CRC at offset in the buffer and
+        return its size, or None if the buffer does not hold all of it yet."""
+        available_size = len(self.buffer) - offset
+        if available_size <= 0:
+            return None
+
+        if self.header is None:
+            header_size = self.buffer[offset]
+            if available_size < header_size:
+                return None
+
+            header_bytes = bytes(self.buffer[offset : offset + header_size])
+            self.header = FitFileHeader.from_bytes(header_bytes)
+            self.header_file_offset = self.file_offset - len(self.buffer) + offset
+            # see update_records_size
+            self.crc = crc16(header_bytes) if self.header.records_size else 0
+            self.records_bytes_count = 0
+            self.reader.definition_messages = {}
+            self.reader.developer_fields_by_data_index = {}
+            return header_size
+
+        if 0 < self.header.records_size <= self.records_bytes_count:
+            if available_size < CRC_SIZE:
+                return None
+
+            (file_crc,) = struct.unpack_from("<H", self.buffer, offset)
+            self.check_file_crc(file_crc)
+            self.header = None
+            return CRC_SIZE
+
+        size = self.get_record_size(offset)
+        if size is None or available_size < size:
+            return None
+
+        record_bytes = bytes(self.buffer[offset : offset + size])
+        self.crc = crc16(record_bytes, crc=self.crc)
+        records.append(self.reader.decode_record(record_bytes, self.record_count))
+
+        self.records_bytes_count += size
+        self.record_count += 1
+        return size
+
+    def get_record_size(self, offset: int) -> Optional[int]:
+        header = RecordHeader.from_bytes(self.buffer, offset=offset)
+
+        if not header.is_definition:
+            # while the records size is unknown the last bytes may be the file CRC
+            if (
+                self.header.records_size == 0
+                and header.local_id not in self.reader.definition_messages
+            ):
+                return None
+
+            definition_message = self.reader.get_definition_message(header.local_id)
+            return RecordHeader.HEADER_SIZE + definition_message.defined_data_size
+
+        size = RecordHeader.HEADER_SIZE + DEFINITION_FIXED_SIZE
+        if len(self.buffer) < offset + size:
+            return None
+
+        field_count = self.buffer[offset + size - 1]
+        size += field_count * FieldDefinition.field_definition_size()
+
+        if header.has_developer_fields:
+            if len(self.buffer) < offset + size + 1:
+                return None
+
+            developer_field_count = self.buffer[offset + size]
+            size += 1 + developer_field_count * DeveloperFieldDefinition.field_definition_size()
+
+        return size
+
+    def check_file_crc(self, file_crc: int):
+        self.file_crc = file_crc
+
+        if self.crc != file_crc:
+            message = f"Calculated crc ({hex(self.crc)}) does match crc in file ({hex(file_crc)})."
+
+            if self.check_crc:
+                raise Exception(message)
+            else:
+                logger.warning(message)
@@ -0,0 +1,292 @@
+from typing import Callable, Optional
+
+from fit_tool.base_type import BaseType
+from fit_tool.data_message import DataMessage
+from fit_tool.definition_message import DefinitionMessage
+from fit_tool.field import DecodeMode, Field
+from fit_tool.fit_file_reader import FitFileReader
+from fit_tool.fit_file_writer import FitFileWriter
+from fit_tool.profile.messages.field_description_message import FieldDescriptionMessage
+from fit_tool.record import Record, RecordHeader
+from fit_tool.utils.crc import crc16
+
+FILTER = "filter"
+MAP = "map"
+
+
+class TransformDefinition:
+    """A definition record as read and as it is written after removing fields,
+    with the byte ranges of its data records that are kept."""
+
+    def __init__(
+        self, record_bytes: bytes, definition_message: DefinitionMessage, removed_field_ids: set
+    ):
+        self.record_bytes = record_bytes
+        self.definition_message = definition_message
+        self.has_developer_fields = RecordHeader.from_bytes(record_bytes).has_developer_fields
+        self.field_layouts = None
+
+        if not removed_field_ids.intersection(
+            x.field_id for x in definition_message.field_definitions
+        ):
+            self.output_record_bytes = record_bytes
+            self.keep_ranges = None
+            return
+
+        output_definition = self.copy_definition_message()
+        for field_id in removed_field_ids:
+            output_definition.remove_field(field_id)
+        self.output_record_bytes = (
+            record_bytes[: RecordHeader.HEADER_SIZE] + output_definition.to_bytes()
+        )
+
+        self.keep_ranges = []
+        offset = RecordHeader.HEADER_SIZE
+        start = 0
+        for field_definition in definition_message.field_definitions:
+            if field_definition.field_id in removed_field_ids:
+                self.keep_ranges.append((start, offset))
+                start = offset + field_definition.size
+            offset += field_definition.size
+        self.keep_ranges.append((start, None))
+
+    @property
+    def global_id(self) -> int:
+        return self.definition_message.global_id
+
+    def copy_definition_message(self) -> DefinitionMessage:
+        return DefinitionMessage.from_bytes(
+            self.record_bytes,
+            offset=RecordHeader.HEADER_SIZE,
+            has_developer_fields=self.has_developer_fields,
+        )
+
+    def get_field_layout(self, field_id: int) -> Optional[tuple]:
+        """Return the offset within the data record and a field instance used to read
+        the encoded value of a field, or None if it is not defined."""
+        if self.field_layouts is None:
+            self.field_layouts = {}
+            offset = RecordHeader.HEADER_SIZE
+            for field_definition in self.definition_message.field_definitions:
+                self.field_layouts[field_definition.field_id] = (
+                    offset,
+                    Field.from_field_definition(field_definition),
+                )
+                offset += field_definition.size
+
+        return self.field_layouts.get(field_id)
+
+    def to_output_bytes(self, record_bytes: bytes) -> bytes:
+        if self.keep_ranges is None:
+            return record_bytes
+
+        return b"".join(record_bytes[start:end] for start, end in self.keep_ranges)
+
+
+class TransformRecord:
+    """A data record passed through the steps of a FitFileTransformer.
+
+    The record is only decoded when its message is accessed. get_encoded_value()
+    reads a single field straight from the record bytes instead.
+    """
+
+    def __init__(
+        self, reader: FitFileReader, record_bytes: bytes, definition: TransformDefinition
+    ):
+        self.reader = reader
+        self.record_bytes = record_bytes
+        self.definition = definition
+        self.decoded_message = None
+        self.replaced_message = None
+
+    @property
+    def header(self) -> RecordHeader:
+        return RecordHeader.from_bytes(self.record_bytes)
+
+    @property
+    def global_id(self) -> int:
+        return self.definition.global_id
+
+    @property
+    def message(self) -> DataMessage:
+        if self.replaced_message is not None:
+            return self.replaced_message
+
+        if self.decoded_message is None:
+            # decoded with a copy of the definition so that removing fields from the
+            # message does not affect the records that follow
+            definition_message = self.definition.copy_definition_message()
+            record = Record.from_bytes(
+                definition_messages={self.header.local_id: definition_message},
+                bytes_buffer=self.record_bytes,
+                developer_fields_by_data_index=self.reader.developer_fields_by_data_index,
+                decode_mode=self.reader.decode_mode,
+                diagnostics=self.reader.diagnostics,
+            )
+            self.decoded_message = record.message
+
+        return self.decoded_message
+
+    def get_encoded_value(self, field_id: int):
+        """Return the first encoded value of a field as stored in the file, or None
+        if the field is not defined or invalid."""
+        layout = self.definition.get_field_layout(field_id)
+        if layout is None:
+            return None
+
+        offset, field = layout
+        value = field.get_encoded_value_from_bytes(
+            self.record_bytes, offset, self.definition.definition_message.endian
+        )
+        if field.base_type != BaseType.STRING and value == field.base_type.invalid_raw_value():
+            return None
+
+        return value
+
+
+class FitFileTransformer:
+    """Streams the records of a FIT file through filter and map steps into a new
+    FIT file.
+
+    Steps are applied to data records in the order they were added, optionally only
+    to one message type. A filter returning False drops the record. A map returning
+    a message replaces the record with it (return record.message after changing it),
+    returning None leaves the record untouched. Untouched records are copied as
+    their original bytes; only replaced records are encoded again. Fields removed
+    with remove_field() are cut from the definitions and the record bytes without
+    decoding.
+
+    Only the first file of a chained FIT file is transformed. Dropping the record a
+    compressed timestamp is relative to shifts the timestamps of the records after
+    it if they are more than 31 seconds apart.
+    """
+
+    def __init__(self, decode_mode: DecodeMode = None):
+        self.decode_mode = decode_mode
+        self.steps = []
+        self.removed_field_ids_by_global_id = {}
+
+        self.copied_count = 0
+        self.encoded_count = 0
+        self.dropped_count = 0
+
+    def filter(self, predicate: Callable[[TransformRecord], bool], global_id: int = None):
+        self.steps.append((FILTER, global_id, predicate))
+        return self
+
+    def map(
+        self,
+        function: Callable[[TransformRecord], Optional[DataMessage]],
+        global_id: int = None,
+    ):
+        self.steps.append((MAP, global_id, function))
+        return self
+
+    def remove_field(self, global_id: int, field_id: int):
+        self.removed_field_ids_by_global_id.setdefault(global_id, set()).add(field_id)
+        return self
+
+    def create_definition(
+        self, record_bytes: bytes, definition_message: DefinitionMessage
+    ) -> TransformDefinition:
+        return TransformDefinition(
+            record_bytes,
+            definition_message,
+            self.removed_field_ids_by_global_id.get(definition_message.global_id, set()),
+        )
+
+    def apply_steps(self, record: TransformRecord) -> bool:
+        for kind, global_id, function in self.steps:
+            if global_id is not None and global_id != record.global_id:
+                continue
+
+            if kind == FILTER:
+                if not function(record):
+                    return False
+            else:
+                message = function(record)
+                if message is not None:
+                    record.replaced_message = message
+
+        return True
+
+    def encode(self, record: TransformRecord) -> tuple:
+        """Return the definition record and data record bytes of a replaced
+        record."""
+        message = record.replaced_message
+        for field_id in self.removed_field_ids_by_global_id.get(message.global_id, []):
+            if message.get_field(field_id):
+                message.remove_field(field_id)
+
+        definition_message = DefinitionMessage.from_data_message(message)
+        if message.definition_message is None:
+            message.set_definition_message(definition_message)
+
+        definition_header = RecordHeader(
+            has_developer_fields=definition_message.has_developer_fields(),
+            local_id=record.header.local_id,
+        )
+        return (
+            definition_header.to_bytes() + definition_message.to_bytes(),
+            record.record_bytes[: RecordHeader.HEADER_SIZE] + message.to_bytes(),
+        )
+
+    def transform(self, reader: FitFileReader, writer: FitFileWriter):
+        self.copied_count = 0
+        self.encoded_count = 0
+        self.dropped_count = 0
+
+        definitions = {}
+        header = reader.read_header()
+
+        record_bytes_remaining_count = header.records_size
+        while record_bytes_remaining_count > 0:
+            record_bytes = reader.read_record_bytes()
+            reader.crc = crc16(record_bytes, crc=reader.crc)
+            record_bytes_remaining_count -= len(record_bytes)
+
+            record_header = RecordHeader.from_bytes(record_bytes)
+            if record_header.is_definition:
+                definition_message = reader.decode_record(record_bytes).message
+                definitions[record_header.local_id] = self.create_definition(
+                    record_bytes, definition_message
+                )
+                continue
+
+            definition = definitions.get(record_header.local_id)
+            if definition is None:
+                raise Exception(
+                    f"DefinitionMessage not defined for local_id: {record_header.local_id}"
+                )
+
+            record = TransformRecord(reader, record_bytes, definition)
+            if definition.global_id == FieldDescriptionMessage.ID:
+                reader.add_developer_field(record.message)
+
+            if not self.apply_steps(record):
+                self.dropped_count += 1
+                continue
+
+            if record.replaced_message is not None:
+                writer.write_data_record_bytes(*self.encode(record))
+                self.encoded_count += 1
+            else:
+                writer.write_data_record_bytes(
+                    definition.output_record_bytes, definition.to_output_bytes(record_bytes)
+                )
+                self.copied_count += 1
+
+        if reader.log_diagnostics:
+            reader.diagnostics.log_summary()
+
+        reader.check_file_crc()
+
+    def transform_file(self, input_path: str, output_path: str, check_crc: bool = True):
+        with FitFileReader.from_file(
+            input_path, check_crc=check_crc, decode_mode=self.decode_mode
+        ) as reader:
+            header = reader.read_header()
+            with FitFileWriter.from_file(
+                output_path, header.protocol_version, header.profile_version
+            ) as writer:
+                self.transform(reader, writer)
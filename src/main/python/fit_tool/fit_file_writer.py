@@ -0,0 +1,125 @@
+import struct
+
+from fit_tool.definition_message import DefinitionMessage
+from fit_tool.fit_file_header import FitFileHeader, ProfileVersion, ProtocolVersion
+from fit_tool.message import Message
+from fit_tool.record import Record, RecordHeader
+from fit_tool.utils.crc import crc16, crc16_combine
+
+HEADER_SIZE = 14
+
+# a normal (not time compressed) header with the definition bit set
+DEFINITION_HEADER_MASK = (
+    RecordHeader.IS_TIME_COMPRESSED_BIT_MASK | RecordHeader.IS_DEFINITION_BIT_MASK
+)
+
+
+class FitFileWriter:
+    """Writes the records of a FIT file one at a time to a binary stream.
+
+    Only the active definition of each local id is kept in memory. A placeholder
+    header is written first; close() writes the final header with the records size
+    and appends the file CRC, which is combined from the CRC of the records and that
+    of the header so the records are never read back. The stream must be seekable.
+
+    Data records are written together with the definition record they use, which is
+    only written out when it differs from the active definition of its local id.
+    """
+
+    def __init__(
+        self,
+        file_object,
+        protocol_version: ProtocolVersion = None,
+        profile_version: ProfileVersion = None,
+    ):
+        self.file_object = file_object
+        self.protocol_version = protocol_version
+        self.profile_version = profile_version
+
+        self.header_offset = file_object.tell()
+        self.records_size = 0
+        self.records_crc = 0
+        self.record_count = 0
+        self.definition_bytes_by_local_id = {}
+
+        self.file_object.write(b"\0" * HEADER_SIZE)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        protocol_version: ProtocolVersion = None,
+        profile_version: ProfileVersion = None,
+    ):
+        return cls(open(path, "wb"), protocol_version, profile_version)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_record_bytes(self, record_bytes: bytes):
+        """Write an encoded record as is. Definition records become the active
+        definition of their local id."""
+        header_byte = record_bytes[0]
+        if header_byte & DEFINITION_HEADER_MASK == RecordHeader.IS_DEFINITION_BIT_MASK:
+            local_id = header_byte & RecordHeader.NORMAL_LOCAL_ID_BIT_MASK
+            self.definition_bytes_by_local_id[local_id] = bytes(record_bytes)
+
+        self.file_object.write(record_bytes)
+        self.records_crc = crc16(record_bytes, crc=self.records_crc)
+        self.records_size += len(record_bytes)
+        self.record_count += 1
+
+    def write_data_record_bytes(self, definition_bytes: bytes, record_bytes: bytes):
+        """Write an encoded data record, preceded by its encoded definition record
+        unless that is already the active definition of the local id."""
+        local_id = definition_bytes[0] & RecordHeader.NORMAL_LOCAL_ID_BIT_MASK
+        if self.definition_bytes_by_local_id.get(local_id) != definition_bytes:
+            self.write_record_bytes(definition_bytes)
+
+        self.write_record_bytes(record_bytes)
+
+    def write_record(self, record: Record):
+        self.write_record_bytes(record.to_bytes())
+
+    def write_message(self, message: Message):
+        """Encode and write a message. Data messages are written with the definition
+        they were decoded with, or one derived from their valid fields."""
+        if isinstance(message, DefinitionMessage):
+            self.write_record(Record.from_message(message))
+            return
+
+        definition_message = DefinitionMessage.from_data_message(message)
+        if message.definition_message is None:
+            message.set_definition_message(definition_message)
+
+        definition_header = RecordHeader(
+            has_developer_fields=definition_message.has_developer_fields(),
+            local_id=message.local_id,
+        )
+        self.write_data_record_bytes(
+            definition_header.to_bytes() + definition_message.to_bytes(),
+            Record.from_message(message).to_bytes(),
+        )
+
+    def close(self):
+        if self.file_object.closed:
+            return
+
+        header = FitFileHeader(
+            records_size=self.records_size,
+            protocol_version=self.protocol_version,
+            profile_version=self.profile_version,
+            gen_crc=True,
+        )
+        header_bytes = header.to_bytes()
+        crc = crc16_combine(crc16(header_bytes), self.records_crc, self.records_size)
+
+        self.file_object.write(struct.pack("<H", crc))
+        end_offset = self.file_object.tell()
+        self.file_object.seek(self.header_offset)
+        self.file_object.write(header_bytes)
+        self.file_object.seek(end_offset)
+        self.file_object.close()
@@ -1,4 +1,5 @@
 import argparse
+import json
 import os
 from pathlib import Path
 
@@ -168,6 +169,63 @@ def get_field_property_type_name(profile: Profile, field: Field) -> str:
             return f"list[{type_name}]"
 
 
+def get_profile_schema(profile: Profile) -> dict:
+    """Describe all messages, fields, sub-fields and types of the profile for the
+    schema driven decoder, see fit_tool.profile_schema for the layout."""
+    messages = {}
+    for message in profile.messages_by_name.values():
+        fields = []
+        for field_name, field in message.fields_by_name.items():
+            sub_fields = []
+            for sub_field in field.sub_fields:
+                sub_fields.append(
+                    [
+                        sub_field.name,
+                        sub_field.base_type.name.upper(),
+                        sub_field.scale,
+                        sub_field.offset,
+                        sub_field.units or "",
+                        {
+                            str(message.fields_by_name[k].field_id): v
+                            for k, v in sub_field.ref_field_map.items()
+                        },
+                        field.subfield_property_name_by_name[sub_field.name],
+                        sub_field.ref_field.field_id,
+                        sub_field.ref_field_values,
+                    ]
+                )
+
+            fields.append(
+                [
+                    message.field_class_name_by_name[field_name],
+                    field.field_id,
+                    field_name,
+                    field.base_type.name.upper(),
+                    field.offset,
+                    field.scale,
+                    field.units or "",
+                    field.type_.name if field.units and field.type_ else "",
+                    sub_fields,
+                    message.field_property_name_by_name[field_name],
+                    field.type_name or "",
+                    bool(field.base_type.name != "STRING" and field.array_type),
+                ]
+            )
+
+        messages[str(message.id)] = [
+            message.name,
+            inflection.camelize(message.name + "_message"),
+            fields,
+        ]
+
+    types = {
+        name: {str(v): k for k, v in profile_type.values_by_name.items()}
+        for name, profile_type in profile.types_by_name.items()
+    }
+
+    return {"version": SDK_VERSION, "messages": messages, "types": types}
+
+
 def main():
     build_path = DEFAULT_BUILD_PATH
     profile_path = os.path.join(build_path, "profile")
@@ -292,6 +350,10 @@ def main():
     with open(filename, "w") as file_out:
         file_out.write(rendering)
 
+    filename = os.path.join(profile_path, "profile_schema.json")
+    with open(filename, "w") as file_out:
+        json.dump(get_profile_schema(profile), file_out, separators=(",", ":"))
+
     template = env.get_template("gen/templates/template_common_fields.jinja")
     rendering = template.render(profile=profile, sdk_version=SDK_VERSION)
     filename = os.path.join(messages_path, "common_fields.py")
@@ -28,6 +28,13 @@ class GenericMessage(DataMessage):
             developer_fields=developer_fields,
         )
 
+    def get_column_name(self, field: Field) -> str:
+        # the fields of messages missing from the profile are all named "field"
+        if isinstance(field, DeveloperField):
+            return super().get_column_name(field)
+
+        return f"field_{field.field_id}"
+
     #
     # final bool growable;
 
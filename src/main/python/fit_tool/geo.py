@@ -0,0 +1,224 @@
+import math
+from typing import List as list
+from typing import Optional
+
+EARTH_RADIUS = 6371008.8  # meters, mean radius
+
+# WGS 84 ellipsoid
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_B = WGS84_A * (1 - WGS84_F)
+
+# position_lat and position_long are encoded in semicircles, 2^31 per 180 degrees
+SEMICIRCLES_PER_DEGREE = 2147483648 / 180.0
+INVALID_SEMICIRCLES = 0x7FFFFFFF
+
+HAVERSINE = "haversine"
+VINCENTY = "vincenty"
+
+VINCENTY_MAX_ITERATIONS = 200
+VINCENTY_TOLERANCE = 1e-12
+
+
+def to_degrees_all(semicircles: list) -> list:
+    """Convert a column of encoded positions to degrees. Missing and invalid values
+    are None."""
+    scale = 1.0 / SEMICIRCLES_PER_DEGREE
+    return [
+        None if x is None or x == INVALID_SEMICIRCLES else x * scale for x in semicircles
+    ]
+
+
+def to_semicircles_all(degrees: list) -> list:
+    """Convert a column of positions in degrees to encoded semicircles. Missing
+    values are None."""
+    scale = SEMICIRCLES_PER_DEGREE
+    return [None if x is None else round(x * scale) for x in degrees]
+
+
+def haversine_distance(
+    latitude1: float, longitude1: float, latitude2: float, longitude2: float
+) -> float:
+    """Great-circle distance in meters between two positions in degrees."""
+    phi1 = math.radians(latitude1)
+    phi2 = math.radians(latitude2)
+    delta_phi = phi2 - phi1
+    delta_lambda = math.radians(longitude2 - longitude1)
+
+    a = (
+        math.sin(delta_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
+def vincenty_distance(
+    latitude1: float, longitude1: float, latitude2: float, longitude2: float
+) -> float:
+    """Distance in meters on the WGS 84 ellipsoid between two positions in degrees,
+    with Vincenty's inverse formula. Falls back to the haversine distance for
+    nearly antipodal positions where the iteration does not converge."""
+    if latitude1 == latitude2 and longitude1 == longitude2:
+        return 0.0
+
+    u1 = math.atan((1 - WGS84_F) * math.tan(math.radians(latitude1)))
+    u2 = math.atan((1 - WGS84_F) * math.tan(math.radians(latitude2)))
+    sin_u1, cos_u1 = math.sin(u1), math.cos(u1)
+    sin_u2, cos_u2 = math.sin(u2), math.cos(u2)
+
+    delta_lambda = math.radians(longitude2 - longitude1)
+    lambda_ = delta_lambda
+
+    for _ in range(VINCENTY_MAX_ITERATIONS):
+        sin_lambda, cos_lambda = math.sin(lambda_), math.cos(lambda_)
+        sin_sigma = math.hypot(
+            cos_u2 * sin_lambda, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lambda
+        )
+        if sin_sigma == 0.0:
+            return 0.0
+
+        cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lambda
+        sigma = math.atan2(sin_sigma, cos_sigma)
+        sin_alpha = cos_u1 * cos_u2 * sin_lambda / sin_sigma
+        cos_squared_alpha = 1 - sin_alpha * sin_alpha
+        # equatorial line: cos_squared_alpha is 0
+        cos_2_sigma_m = (
+            cos_sigma - 2 * sin_u1 * sin_u2 / cos_squared_alpha if cos_squared_alpha else 0.0
+        )
+        c = WGS84_F / 16 * cos_squared_alpha * (4 + WGS84_F * (4 - 3 * cos_squared_alpha))
+
+        previous_lambda = lambda_
+        lambda_ = delta_lambda + (1 - c) * WGS84_F * sin_alpha * (
+            sigma
+            + c
+            * sin_sigma
+            * (cos_2_sigma_m + c * cos_sigma * (-1 + 2 * cos_2_sigma_m * cos_2_sigma_m))
+        )
+        if abs(lambda_ - previous_lambda) < VINCENTY_TOLERANCE:
+            break
+    else:
+        return haversine_distance(latitude1, longitude1, latitude2, longitude2)
+
+    u_squared = cos_squared_alpha * (WGS84_A * WGS84_A - WGS84_B * WGS84_B) / (WGS84_B * WGS84_B)
+    a = 1 + u_squared / 16384 * (4096 + u_squared * (-768 + u_squared * (320 - 175 * u_squared)))
+    b = u_squared / 1024 * (256 + u_squared * (-128 + u_squared * (74 - 47 * u_squared)))
+    delta_sigma = (
+        b
+        * sin_sigma
+        * (
+            cos_2_sigma_m
+            + b
+            / 4
+            * (
+                cos_sigma * (-1 + 2 * cos_2_sigma_m * cos_2_sigma_m)
+                - b
+                / 6
+                * cos_2_sigma_m
+                * (-3 + 4 * sin_sigma * sin_sigma)
+                * (-3 + 4 * cos_2_sigma_m * cos_2_sigma_m)
+            )
+        )
+    )
+
+    return WGS84_B * a * (sigma - delta_sigma)
+
+
+def haversine_distances(latitudes: list[float], longitudes: list[float]) -> list[float]:
+    """Distances in meters between consecutive positions of two columns in degrees,
+    one fewer than the positions. Trigonometric terms of each position are
+    computed once instead of twice per segment."""
+    phis = [math.radians(x) for x in latitudes]
+    lambdas = [math.radians(x) for x in longitudes]
+    cos_phis = [math.cos(x) for x in phis]
+    asin, sin, sqrt = math.asin, math.sin, math.sqrt
+    diameter = 2 * EARTH_RADIUS
+
+    distances = []
+    for i in range(1, len(phis)):
+        a = (
+            sin((phis[i] - phis[i - 1]) / 2) ** 2
+            + cos_phis[i - 1] * cos_phis[i] * sin((lambdas[i] - lambdas[i - 1]) / 2) ** 2
+        )
+        distances.append(diameter * asin(min(1.0, sqrt(a))))
+
+    return distances
+
+
+def vincenty_distances(latitudes: list[float], longitudes: list[float]) -> list[float]:
+    """Distances in meters on the WGS 84 ellipsoid between consecutive positions of
+    two columns in degrees."""
+    return [
+        vincenty_distance(latitudes[i - 1], longitudes[i - 1], latitudes[i], longitudes[i])
+        for i in range(1, len(latitudes))
+    ]
+
+
+def cumulative_distances(
+    latitudes: list[Optional[float]],
+    longitudes: list[Optional[float]],
+    method: str = HAVERSINE,
+) -> list[Optional[float]]:
+    """Distance in meters from the first position to each position of two columns in
+    degrees. Rows without a position are None and are skipped, the distance
+    continues from the previous position."""
+    if method == HAVERSINE:
+        function = haversine_distances
+    elif method == VINCENTY:
+        function = vincenty_distances
+    else:
+        raise Exception(f"Unknown distance method: {method}")
+
+    indexes = [
+        i
+        for i in range(min(len(latitudes), len(longitudes)))
+        if latitudes[i] is not None and longitudes[i] is not None
+    ]
+    distances = [None] * len(latitudes)
+    if not indexes:
+        return distances
+
+    segments = function([latitudes[i] for i in indexes], [longitudes[i] for i in indexes])
+
+    distance = 0.0
+    distances[indexes[0]] = distance
+    for i, segment in zip(indexes[1:], segments):
+        distance += segment
+        distances[i] = distance
+
+    return distances
+
+
+def bearing(latitude1: float, longitude1: float, latitude2: float, longitude2: float) -> float:
+    """Initial bearing in degrees [0, 360) from the first to the second position."""
+    phi1 = math.radians(latitude1)
+    phi2 = math.radians(latitude2)
+    delta_lambda = math.radians(longitude2 - longitude1)
+
+    y = math.sin(delta_lambda) * math.cos(phi2)
+    x = math.cos(phi1) * math.sin(phi2) - math.sin(phi1) * math.cos(phi2) * math.cos(
+        delta_lambda
+    )
+    return math.degrees(math.atan2(y, x)) % 360.0
+
+
+def bearings(latitudes: list[float], longitudes: list[float]) -> list[float]:
+    """Initial bearings in degrees between consecutive positions of two columns,
+    one fewer than the positions."""
+    return [
+        bearing(latitudes[i - 1], longitudes[i - 1], latitudes[i], longitudes[i])
+        for i in range(1, len(latitudes))
+    ]
+
+
+def bounding_box(
+    latitudes: list[Optional[float]], longitudes: list[Optional[float]]
+) -> Optional[tuple]:
+    """Return (min latitude, min longitude, max latitude, max longitude) of two
+    columns, or None without any position. Missing values are ignored; a box
+    crossing the antimeridian is not detected."""
+    latitudes = [x for x in latitudes if x is not None]
+    longitudes = [x for x in longitudes if x is not None]
+    if not latitudes or not longitudes:
+        return None
+
+    return min(latitudes), min(longitudes), max(latitudes), max(longitudes)
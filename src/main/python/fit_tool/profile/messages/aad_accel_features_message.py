@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class AadAccelFeaturesMessage(DataMessage):
     ID = 289
     NAME = 'aad_accel_features'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=AadAccelFeaturesMessage.NAME,
@@ -37,28 +25,7 @@ class AadAccelFeaturesMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        AadAccelFeaturesTimeField(
-            size=self.__get_field_size(definition_message, AadAccelFeaturesTimeField.ID),
-            growable=definition_message is None), 
-        AadAccelFeaturesEnergyTotalField(
-            size=self.__get_field_size(definition_message, AadAccelFeaturesEnergyTotalField.ID),
-            growable=definition_message is None), 
-        AadAccelFeaturesZeroCrossCntField(
-            size=self.__get_field_size(definition_message, AadAccelFeaturesZeroCrossCntField.ID),
-            growable=definition_message is None), 
-        AadAccelFeaturesInstanceField(
-            size=self.__get_field_size(definition_message, AadAccelFeaturesInstanceField.ID),
-            growable=definition_message is None), 
-        AadAccelFeaturesTimeAboveThresholdField(
-            size=self.__get_field_size(definition_message, AadAccelFeaturesTimeAboveThresholdField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=AadAccelFeaturesMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -67,262 +34,32 @@ class AadAccelFeaturesMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def time(self) -> Optional[int]:
-        field = self.get_field(AadAccelFeaturesTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @time.setter
-    def time(self, value: int):
-        field = self.get_field(AadAccelFeaturesTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def energy_total(self) -> Optional[int]:
-        field = self.get_field(AadAccelFeaturesEnergyTotalField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @energy_total.setter
-    def energy_total(self, value: int):
-        field = self.get_field(AadAccelFeaturesEnergyTotalField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def zero_cross_cnt(self) -> Optional[int]:
-        field = self.get_field(AadAccelFeaturesZeroCrossCntField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @zero_cross_cnt.setter
-    def zero_cross_cnt(self, value: int):
-        field = self.get_field(AadAccelFeaturesZeroCrossCntField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def instance(self) -> Optional[int]:
-        field = self.get_field(AadAccelFeaturesInstanceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @instance.setter
-    def instance(self, value: int):
-        field = self.get_field(AadAccelFeaturesInstanceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def time_above_threshold(self) -> Optional[float]:
-        field = self.get_field(AadAccelFeaturesTimeAboveThresholdField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @time_above_threshold.setter
-    def time_above_threshold(self, value: float):
-        field = self.get_field(AadAccelFeaturesTimeAboveThresholdField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AadAccelFeaturesTimeField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AadAccelFeaturesEnergyTotalField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='energy_total',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AadAccelFeaturesZeroCrossCntField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='zero_cross_cnt',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AadAccelFeaturesInstanceField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='instance',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AadAccelFeaturesTimeAboveThresholdField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time_above_threshold',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 25,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    time: FieldProperty[int] = FieldProperty(0)
+    energy_total: FieldProperty[int] = FieldProperty(1)
+    zero_cross_cnt: FieldProperty[int] = FieldProperty(2)
+    instance: FieldProperty[int] = FieldProperty(3)
+    time_above_threshold: FieldProperty[float] = FieldProperty(4)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('AadAccelFeaturesTimeField', 0, 'time', BaseType.UINT16, 0, 1, 's', '', []),
+    ('AadAccelFeaturesEnergyTotalField', 1, 'energy_total', BaseType.UINT32, 0, 1, '', '', []),
+    ('AadAccelFeaturesZeroCrossCntField', 2, 'zero_cross_cnt', BaseType.UINT16, 0, 1, '', '', []),
+    ('AadAccelFeaturesInstanceField', 3, 'instance', BaseType.UINT8, 0, 1, '', '', []),
+    ('AadAccelFeaturesTimeAboveThresholdField', 4, 'time_above_threshold', BaseType.UINT16, 0, 25, 's', '', []),
+])
+
+(
+    TimestampField,
+    AadAccelFeaturesTimeField,
+    AadAccelFeaturesEnergyTotalField,
+    AadAccelFeaturesZeroCrossCntField,
+    AadAccelFeaturesInstanceField,
+    AadAccelFeaturesTimeAboveThresholdField,
+) = FIELD_TYPES
+
+AadAccelFeaturesMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class AccelerometerDataMessage(DataMessage):
     ID = 165
     NAME = 'accelerometer_data'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=AccelerometerDataMessage.NAME,
@@ -37,46 +25,7 @@ class AccelerometerDataMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        AccelerometerDataTimestampMsField(
-            size=self.__get_field_size(definition_message, AccelerometerDataTimestampMsField.ID),
-            growable=definition_message is None), 
-        AccelerometerDataSampleTimeOffsetField(
-            size=self.__get_field_size(definition_message, AccelerometerDataSampleTimeOffsetField.ID),
-            growable=definition_message is None), 
-        AccelerometerDataAccelXField(
-            size=self.__get_field_size(definition_message, AccelerometerDataAccelXField.ID),
-            growable=definition_message is None), 
-        AccelerometerDataAccelYField(
-            size=self.__get_field_size(definition_message, AccelerometerDataAccelYField.ID),
-            growable=definition_message is None), 
-        AccelerometerDataAccelZField(
-            size=self.__get_field_size(definition_message, AccelerometerDataAccelZField.ID),
-            growable=definition_message is None), 
-        AccelerometerDataCalibratedAccelXField(
-            size=self.__get_field_size(definition_message, AccelerometerDataCalibratedAccelXField.ID),
-            growable=definition_message is None), 
-        AccelerometerDataCalibratedAccelYField(
-            size=self.__get_field_size(definition_message, AccelerometerDataCalibratedAccelYField.ID),
-            growable=definition_message is None), 
-        AccelerometerDataCalibratedAccelZField(
-            size=self.__get_field_size(definition_message, AccelerometerDataCalibratedAccelZField.ID),
-            growable=definition_message is None), 
-        AccelerometerDataCompressedCalibratedAccelXField(
-            size=self.__get_field_size(definition_message, AccelerometerDataCompressedCalibratedAccelXField.ID),
-            growable=definition_message is None), 
-        AccelerometerDataCompressedCalibratedAccelYField(
-            size=self.__get_field_size(definition_message, AccelerometerDataCompressedCalibratedAccelYField.ID),
-            growable=definition_message is None), 
-        AccelerometerDataCompressedCalibratedAccelZField(
-            size=self.__get_field_size(definition_message, AccelerometerDataCompressedCalibratedAccelZField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=AccelerometerDataMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -85,506 +34,50 @@ class AccelerometerDataMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def timestamp_ms(self) -> Optional[int]:
-        field = self.get_field(AccelerometerDataTimestampMsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @timestamp_ms.setter
-    def timestamp_ms(self, value: int):
-        field = self.get_field(AccelerometerDataTimestampMsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sample_time_offset(self) -> Optional[list[int]]:
-        field = self.get_field(AccelerometerDataSampleTimeOffsetField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @sample_time_offset.setter
-    def sample_time_offset(self, value: list[int]):
-        field = self.get_field(AccelerometerDataSampleTimeOffsetField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def accel_x(self) -> Optional[list[int]]:
-        field = self.get_field(AccelerometerDataAccelXField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @accel_x.setter
-    def accel_x(self, value: list[int]):
-        field = self.get_field(AccelerometerDataAccelXField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def accel_y(self) -> Optional[list[int]]:
-        field = self.get_field(AccelerometerDataAccelYField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @accel_y.setter
-    def accel_y(self, value: list[int]):
-        field = self.get_field(AccelerometerDataAccelYField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def accel_z(self) -> Optional[list[int]]:
-        field = self.get_field(AccelerometerDataAccelZField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @accel_z.setter
-    def accel_z(self, value: list[int]):
-        field = self.get_field(AccelerometerDataAccelZField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def calibrated_accel_x(self) -> Optional[list[float]]:
-        field = self.get_field(AccelerometerDataCalibratedAccelXField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @calibrated_accel_x.setter
-    def calibrated_accel_x(self, value: list[float]):
-        field = self.get_field(AccelerometerDataCalibratedAccelXField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def calibrated_accel_y(self) -> Optional[list[float]]:
-        field = self.get_field(AccelerometerDataCalibratedAccelYField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @calibrated_accel_y.setter
-    def calibrated_accel_y(self, value: list[float]):
-        field = self.get_field(AccelerometerDataCalibratedAccelYField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def calibrated_accel_z(self) -> Optional[list[float]]:
-        field = self.get_field(AccelerometerDataCalibratedAccelZField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @calibrated_accel_z.setter
-    def calibrated_accel_z(self, value: list[float]):
-        field = self.get_field(AccelerometerDataCalibratedAccelZField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def compressed_calibrated_accel_x(self) -> Optional[list[int]]:
-        field = self.get_field(AccelerometerDataCompressedCalibratedAccelXField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @compressed_calibrated_accel_x.setter
-    def compressed_calibrated_accel_x(self, value: list[int]):
-        field = self.get_field(AccelerometerDataCompressedCalibratedAccelXField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def compressed_calibrated_accel_y(self) -> Optional[list[int]]:
-        field = self.get_field(AccelerometerDataCompressedCalibratedAccelYField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @compressed_calibrated_accel_y.setter
-    def compressed_calibrated_accel_y(self, value: list[int]):
-        field = self.get_field(AccelerometerDataCompressedCalibratedAccelYField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def compressed_calibrated_accel_z(self) -> Optional[list[int]]:
-        field = self.get_field(AccelerometerDataCompressedCalibratedAccelZField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @compressed_calibrated_accel_z.setter
-    def compressed_calibrated_accel_z(self, value: list[int]):
-        field = self.get_field(AccelerometerDataCompressedCalibratedAccelZField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AccelerometerDataTimestampMsField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp_ms',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AccelerometerDataSampleTimeOffsetField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sample_time_offset',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AccelerometerDataAccelXField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='accel_x',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'counts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AccelerometerDataAccelYField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='accel_y',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'counts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AccelerometerDataAccelZField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='accel_z',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'counts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AccelerometerDataCalibratedAccelXField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='calibrated_accel_x',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'g',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AccelerometerDataCalibratedAccelYField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='calibrated_accel_y',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'g',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AccelerometerDataCalibratedAccelZField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='calibrated_accel_z',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'g',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AccelerometerDataCompressedCalibratedAccelXField(Field):
-    ID = 8
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='compressed_calibrated_accel_x',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mG',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AccelerometerDataCompressedCalibratedAccelYField(Field):
-    ID = 9
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='compressed_calibrated_accel_y',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mG',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class AccelerometerDataCompressedCalibratedAccelZField(Field):
-    ID = 10
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='compressed_calibrated_accel_z',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mG',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    timestamp_ms: FieldProperty[int] = FieldProperty(0)
+    sample_time_offset: FieldProperty[list[int]] = FieldProperty(1, is_array=True)
+    accel_x: FieldProperty[list[int]] = FieldProperty(2, is_array=True)
+    accel_y: FieldProperty[list[int]] = FieldProperty(3, is_array=True)
+    accel_z: FieldProperty[list[int]] = FieldProperty(4, is_array=True)
+    calibrated_accel_x: FieldProperty[list[float]] = FieldProperty(5, is_array=True)
+    calibrated_accel_y: FieldProperty[list[float]] = FieldProperty(6, is_array=True)
+    calibrated_accel_z: FieldProperty[list[float]] = FieldProperty(7, is_array=True)
+    compressed_calibrated_accel_x: FieldProperty[list[int]] = FieldProperty(8, is_array=True)
+    compressed_calibrated_accel_y: FieldProperty[list[int]] = FieldProperty(9, is_array=True)
+    compressed_calibrated_accel_z: FieldProperty[list[int]] = FieldProperty(10, is_array=True)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('AccelerometerDataTimestampMsField', 0, 'timestamp_ms', BaseType.UINT16, 0, 1, 'ms', '', []),
+    ('AccelerometerDataSampleTimeOffsetField', 1, 'sample_time_offset', BaseType.UINT16, 0, 1, 'ms', '', []),
+    ('AccelerometerDataAccelXField', 2, 'accel_x', BaseType.UINT16, 0, 1, 'counts', '', []),
+    ('AccelerometerDataAccelYField', 3, 'accel_y', BaseType.UINT16, 0, 1, 'counts', '', []),
+    ('AccelerometerDataAccelZField', 4, 'accel_z', BaseType.UINT16, 0, 1, 'counts', '', []),
+    ('AccelerometerDataCalibratedAccelXField', 5, 'calibrated_accel_x', BaseType.FLOAT32, 0, 1, 'g', '', []),
+    ('AccelerometerDataCalibratedAccelYField', 6, 'calibrated_accel_y', BaseType.FLOAT32, 0, 1, 'g', '', []),
+    ('AccelerometerDataCalibratedAccelZField', 7, 'calibrated_accel_z', BaseType.FLOAT32, 0, 1, 'g', '', []),
+    ('AccelerometerDataCompressedCalibratedAccelXField', 8, 'compressed_calibrated_accel_x', BaseType.SINT16, 0, 1, 'mG', '', []),
+    ('AccelerometerDataCompressedCalibratedAccelYField', 9, 'compressed_calibrated_accel_y', BaseType.SINT16, 0, 1, 'mG', '', []),
+    ('AccelerometerDataCompressedCalibratedAccelZField', 10, 'compressed_calibrated_accel_z', BaseType.SINT16, 0, 1, 'mG', '', []),
+])
+
+(
+    TimestampField,
+    AccelerometerDataTimestampMsField,
+    AccelerometerDataSampleTimeOffsetField,
+    AccelerometerDataAccelXField,
+    AccelerometerDataAccelYField,
+    AccelerometerDataAccelZField,
+    AccelerometerDataCalibratedAccelXField,
+    AccelerometerDataCalibratedAccelYField,
+    AccelerometerDataCalibratedAccelZField,
+    AccelerometerDataCompressedCalibratedAccelXField,
+    AccelerometerDataCompressedCalibratedAccelYField,
+    AccelerometerDataCompressedCalibratedAccelZField,
+) = FIELD_TYPES
+
+AccelerometerDataMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class ActivityMessage(DataMessage):
     ID = 34
     NAME = 'activity'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=ActivityMessage.NAME,
@@ -37,34 +25,7 @@ class ActivityMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        ActivityTotalTimerTimeField(
-            size=self.__get_field_size(definition_message, ActivityTotalTimerTimeField.ID),
-            growable=definition_message is None), 
-        ActivityNumSessionsField(
-            size=self.__get_field_size(definition_message, ActivityNumSessionsField.ID),
-            growable=definition_message is None), 
-        ActivityTypeField(
-            size=self.__get_field_size(definition_message, ActivityTypeField.ID),
-            growable=definition_message is None), 
-        ActivityEventField(
-            size=self.__get_field_size(definition_message, ActivityEventField.ID),
-            growable=definition_message is None), 
-        ActivityEventTypeField(
-            size=self.__get_field_size(definition_message, ActivityEventTypeField.ID),
-            growable=definition_message is None), 
-        ActivityLocalTimestampField(
-            size=self.__get_field_size(definition_message, ActivityLocalTimestampField.ID),
-            growable=definition_message is None), 
-        ActivityEventGroupField(
-            size=self.__get_field_size(definition_message, ActivityEventGroupField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=ActivityMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -73,342 +34,38 @@ class ActivityMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_timer_time(self) -> Optional[float]:
-        field = self.get_field(ActivityTotalTimerTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_timer_time.setter
-    def total_timer_time(self, value: float):
-        field = self.get_field(ActivityTotalTimerTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def num_sessions(self) -> Optional[int]:
-        field = self.get_field(ActivityNumSessionsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @num_sessions.setter
-    def num_sessions(self, value: int):
-        field = self.get_field(ActivityNumSessionsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def type(self) -> Optional[Activity]:
-        field = self.get_field(ActivityTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @type.setter
-    def type(self, value: Activity):
-        field = self.get_field(ActivityTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def event(self) -> Optional[Event]:
-        field = self.get_field(ActivityEventField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @event.setter
-    def event(self, value: Event):
-        field = self.get_field(ActivityEventField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def event_type(self) -> Optional[EventType]:
-        field = self.get_field(ActivityEventTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @event_type.setter
-    def event_type(self, value: EventType):
-        field = self.get_field(ActivityEventTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def local_timestamp(self) -> Optional[int]:
-        field = self.get_field(ActivityLocalTimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @local_timestamp.setter
-    def local_timestamp(self, value: int):
-        field = self.get_field(ActivityLocalTimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def event_group(self) -> Optional[int]:
-        field = self.get_field(ActivityEventGroupField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @event_group.setter
-    def event_group(self, value: int):
-        field = self.get_field(ActivityEventGroupField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ActivityTotalTimerTimeField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_timer_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ActivityNumSessionsField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='num_sessions',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ActivityTypeField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ActivityEventField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='event',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ActivityEventTypeField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='event_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ActivityLocalTimestampField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='local_timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ActivityEventGroupField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='event_group',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    total_timer_time: FieldProperty[float] = FieldProperty(0)
+    num_sessions: FieldProperty[int] = FieldProperty(1)
+    type: FieldProperty[Activity] = FieldProperty(2)
+    event: FieldProperty[Event] = FieldProperty(3)
+    event_type: FieldProperty[EventType] = FieldProperty(4)
+    local_timestamp: FieldProperty[int] = FieldProperty(5)
+    event_group: FieldProperty[int] = FieldProperty(6)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('ActivityTotalTimerTimeField', 0, 'total_timer_time', BaseType.UINT32, 0, 1000, 's', '', []),
+    ('ActivityNumSessionsField', 1, 'num_sessions', BaseType.UINT16, 0, 1, '', '', []),
+    ('ActivityTypeField', 2, 'type', BaseType.ENUM, 0, 1, '', '', []),
+    ('ActivityEventField', 3, 'event', BaseType.ENUM, 0, 1, '', '', []),
+    ('ActivityEventTypeField', 4, 'event_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('ActivityLocalTimestampField', 5, 'local_timestamp', BaseType.UINT32, 0, 1, '', '', []),
+    ('ActivityEventGroupField', 6, 'event_group', BaseType.UINT8, 0, 1, '', '', []),
+])
+
+(
+    TimestampField,
+    ActivityTotalTimerTimeField,
+    ActivityNumSessionsField,
+    ActivityTypeField,
+    ActivityEventField,
+    ActivityEventTypeField,
+    ActivityLocalTimestampField,
+    ActivityEventGroupField,
+) = FIELD_TYPES
+
+ActivityMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class BeatIntervalsMessage(DataMessage):
     ID = 290
     NAME = 'beat_intervals'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=BeatIntervalsMessage.NAME,
@@ -37,19 +25,7 @@ class BeatIntervalsMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        BeatIntervalsTimestampMsField(
-            size=self.__get_field_size(definition_message, BeatIntervalsTimestampMsField.ID),
-            growable=definition_message is None), 
-        BeatIntervalsTimeField(
-            size=self.__get_field_size(definition_message, BeatIntervalsTimeField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=BeatIntervalsMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -58,137 +34,23 @@ class BeatIntervalsMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    timestamp_ms: FieldProperty[int] = FieldProperty(0)
+    time: FieldProperty[list[int]] = FieldProperty(1, is_array=True)
 
 
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def timestamp_ms(self) -> Optional[int]:
-        field = self.get_field(BeatIntervalsTimestampMsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @timestamp_ms.setter
-    def timestamp_ms(self, value: int):
-        field = self.get_field(BeatIntervalsTimestampMsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def time(self) -> Optional[list[int]]:
-        field = self.get_field(BeatIntervalsTimeField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @time.setter
-    def time(self, value: list[int]):
-        field = self.get_field(BeatIntervalsTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class BeatIntervalsTimestampMsField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp_ms',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('BeatIntervalsTimestampMsField', 0, 'timestamp_ms', BaseType.UINT16, 0, 1, 'ms', '', []),
+    ('BeatIntervalsTimeField', 1, 'time', BaseType.UINT16, 0, 1, 'ms', '', []),
+])
 
-class BeatIntervalsTimeField(Field):
-    ID = 1
+(
+    TimestampField,
+    BeatIntervalsTimestampMsField,
+    BeatIntervalsTimeField,
+) = FIELD_TYPES
 
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+BeatIntervalsMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
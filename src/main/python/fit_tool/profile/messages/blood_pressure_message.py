@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class BloodPressureMessage(DataMessage):
     ID = 51
     NAME = 'blood_pressure'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=BloodPressureMessage.NAME,
@@ -37,43 +25,7 @@ class BloodPressureMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        BloodPressureSystolicPressureField(
-            size=self.__get_field_size(definition_message, BloodPressureSystolicPressureField.ID),
-            growable=definition_message is None), 
-        BloodPressureDiastolicPressureField(
-            size=self.__get_field_size(definition_message, BloodPressureDiastolicPressureField.ID),
-            growable=definition_message is None), 
-        BloodPressureMeanArterialPressureField(
-            size=self.__get_field_size(definition_message, BloodPressureMeanArterialPressureField.ID),
-            growable=definition_message is None), 
-        BloodPressureMap3SampleMeanField(
-            size=self.__get_field_size(definition_message, BloodPressureMap3SampleMeanField.ID),
-            growable=definition_message is None), 
-        BloodPressureMapMorningValuesField(
-            size=self.__get_field_size(definition_message, BloodPressureMapMorningValuesField.ID),
-            growable=definition_message is None), 
-        BloodPressureMapEveningValuesField(
-            size=self.__get_field_size(definition_message, BloodPressureMapEveningValuesField.ID),
-            growable=definition_message is None), 
-        BloodPressureHeartRateField(
-            size=self.__get_field_size(definition_message, BloodPressureHeartRateField.ID),
-            growable=definition_message is None), 
-        BloodPressureHeartRateTypeField(
-            size=self.__get_field_size(definition_message, BloodPressureHeartRateTypeField.ID),
-            growable=definition_message is None), 
-        BloodPressureStatusField(
-            size=self.__get_field_size(definition_message, BloodPressureStatusField.ID),
-            growable=definition_message is None), 
-        BloodPressureUserProfileIndexField(
-            size=self.__get_field_size(definition_message, BloodPressureUserProfileIndexField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=BloodPressureMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -82,477 +34,47 @@ class BloodPressureMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def systolic_pressure(self) -> Optional[int]:
-        field = self.get_field(BloodPressureSystolicPressureField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @systolic_pressure.setter
-    def systolic_pressure(self, value: int):
-        field = self.get_field(BloodPressureSystolicPressureField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def diastolic_pressure(self) -> Optional[int]:
-        field = self.get_field(BloodPressureDiastolicPressureField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @diastolic_pressure.setter
-    def diastolic_pressure(self, value: int):
-        field = self.get_field(BloodPressureDiastolicPressureField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def mean_arterial_pressure(self) -> Optional[int]:
-        field = self.get_field(BloodPressureMeanArterialPressureField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @mean_arterial_pressure.setter
-    def mean_arterial_pressure(self, value: int):
-        field = self.get_field(BloodPressureMeanArterialPressureField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def map_3_sample_mean(self) -> Optional[int]:
-        field = self.get_field(BloodPressureMap3SampleMeanField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @map_3_sample_mean.setter
-    def map_3_sample_mean(self, value: int):
-        field = self.get_field(BloodPressureMap3SampleMeanField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def map_morning_values(self) -> Optional[int]:
-        field = self.get_field(BloodPressureMapMorningValuesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @map_morning_values.setter
-    def map_morning_values(self, value: int):
-        field = self.get_field(BloodPressureMapMorningValuesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def map_evening_values(self) -> Optional[int]:
-        field = self.get_field(BloodPressureMapEveningValuesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @map_evening_values.setter
-    def map_evening_values(self, value: int):
-        field = self.get_field(BloodPressureMapEveningValuesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def heart_rate(self) -> Optional[int]:
-        field = self.get_field(BloodPressureHeartRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @heart_rate.setter
-    def heart_rate(self, value: int):
-        field = self.get_field(BloodPressureHeartRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def heart_rate_type(self) -> Optional[HrType]:
-        field = self.get_field(BloodPressureHeartRateTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @heart_rate_type.setter
-    def heart_rate_type(self, value: HrType):
-        field = self.get_field(BloodPressureHeartRateTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def status(self) -> Optional[BpStatus]:
-        field = self.get_field(BloodPressureStatusField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @status.setter
-    def status(self, value: BpStatus):
-        field = self.get_field(BloodPressureStatusField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def user_profile_index(self) -> Optional[int]:
-        field = self.get_field(BloodPressureUserProfileIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @user_profile_index.setter
-    def user_profile_index(self, value: int):
-        field = self.get_field(BloodPressureUserProfileIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class BloodPressureSystolicPressureField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='systolic_pressure',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mmHg',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class BloodPressureDiastolicPressureField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='diastolic_pressure',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mmHg',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class BloodPressureMeanArterialPressureField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='mean_arterial_pressure',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mmHg',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class BloodPressureMap3SampleMeanField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='map_3_sample_mean',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mmHg',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class BloodPressureMapMorningValuesField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='map_morning_values',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mmHg',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class BloodPressureMapEveningValuesField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='map_evening_values',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mmHg',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class BloodPressureHeartRateField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='heart_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'bpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class BloodPressureHeartRateTypeField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='heart_rate_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class BloodPressureStatusField(Field):
-    ID = 8
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='status',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class BloodPressureUserProfileIndexField(Field):
-    ID = 9
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='user_profile_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    systolic_pressure: FieldProperty[int] = FieldProperty(0)
+    diastolic_pressure: FieldProperty[int] = FieldProperty(1)
+    mean_arterial_pressure: FieldProperty[int] = FieldProperty(2)
+    map_3_sample_mean: FieldProperty[int] = FieldProperty(3)
+    map_morning_values: FieldProperty[int] = FieldProperty(4)
+    map_evening_values: FieldProperty[int] = FieldProperty(5)
+    heart_rate: FieldProperty[int] = FieldProperty(6)
+    heart_rate_type: FieldProperty[HrType] = FieldProperty(7)
+    status: FieldProperty[BpStatus] = FieldProperty(8)
+    user_profile_index: FieldProperty[int] = FieldProperty(9)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('BloodPressureSystolicPressureField', 0, 'systolic_pressure', BaseType.UINT16, 0, 1, 'mmHg', '', []),
+    ('BloodPressureDiastolicPressureField', 1, 'diastolic_pressure', BaseType.UINT16, 0, 1, 'mmHg', '', []),
+    ('BloodPressureMeanArterialPressureField', 2, 'mean_arterial_pressure', BaseType.UINT16, 0, 1, 'mmHg', '', []),
+    ('BloodPressureMap3SampleMeanField', 3, 'map_3_sample_mean', BaseType.UINT16, 0, 1, 'mmHg', '', []),
+    ('BloodPressureMapMorningValuesField', 4, 'map_morning_values', BaseType.UINT16, 0, 1, 'mmHg', '', []),
+    ('BloodPressureMapEveningValuesField', 5, 'map_evening_values', BaseType.UINT16, 0, 1, 'mmHg', '', []),
+    ('BloodPressureHeartRateField', 6, 'heart_rate', BaseType.UINT8, 0, 1, 'bpm', '', []),
+    ('BloodPressureHeartRateTypeField', 7, 'heart_rate_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('BloodPressureStatusField', 8, 'status', BaseType.ENUM, 0, 1, '', '', []),
+    ('BloodPressureUserProfileIndexField', 9, 'user_profile_index', BaseType.UINT16, 0, 1, '', '', []),
+])
+
+(
+    TimestampField,
+    BloodPressureSystolicPressureField,
+    BloodPressureDiastolicPressureField,
+    BloodPressureMeanArterialPressureField,
+    BloodPressureMap3SampleMeanField,
+    BloodPressureMapMorningValuesField,
+    BloodPressureMapEveningValuesField,
+    BloodPressureHeartRateField,
+    BloodPressureHeartRateTypeField,
+    BloodPressureStatusField,
+    BloodPressureUserProfileIndexField,
+) = FIELD_TYPES
+
+BloodPressureMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
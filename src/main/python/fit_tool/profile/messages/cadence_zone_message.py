@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class CadenceZoneMessage(DataMessage):
     ID = 131
     NAME = 'cadence_zone'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=CadenceZoneMessage.NAME,
@@ -37,19 +25,7 @@ class CadenceZoneMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        CadenceZoneHighValueField(
-            size=self.__get_field_size(definition_message, CadenceZoneHighValueField.ID),
-            growable=definition_message is None), 
-        CadenceZoneNameField(
-            size=self.__get_field_size(definition_message, CadenceZoneNameField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=CadenceZoneMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -58,133 +34,23 @@ class CadenceZoneMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
+    message_index: FieldProperty[int] = FieldProperty(254)
+    high_value: FieldProperty[int] = FieldProperty(0)
+    cadence_zone_name: FieldProperty[str] = FieldProperty(1)
 
 
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('CadenceZoneHighValueField', 0, 'high_value', BaseType.UINT8, 0, 1, 'rpm', '', []),
+    ('CadenceZoneNameField', 1, 'name', BaseType.STRING, 0, 1, '', '', []),
+])
 
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def high_value(self) -> Optional[int]:
-        field = self.get_field(CadenceZoneHighValueField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @high_value.setter
-    def high_value(self, value: int):
-        field = self.get_field(CadenceZoneHighValueField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def cadence_zone_name(self) -> Optional[str]:
-        field = self.get_field(CadenceZoneNameField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @cadence_zone_name.setter
-    def cadence_zone_name(self, value: str):
-        field = self.get_field(CadenceZoneNameField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CadenceZoneHighValueField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='high_value',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'rpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CadenceZoneNameField(Field):
-    ID = 1
+(
+    MessageIndexField,
+    CadenceZoneHighValueField,
+    CadenceZoneNameField,
+) = FIELD_TYPES
 
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='name',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+CadenceZoneMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
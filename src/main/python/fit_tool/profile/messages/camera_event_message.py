@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class CameraEventMessage(DataMessage):
     ID = 161
     NAME = 'camera_event'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=CameraEventMessage.NAME,
@@ -37,25 +25,7 @@ class CameraEventMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        CameraEventTimestampMsField(
-            size=self.__get_field_size(definition_message, CameraEventTimestampMsField.ID),
-            growable=definition_message is None), 
-        CameraEventCameraEventTypeField(
-            size=self.__get_field_size(definition_message, CameraEventCameraEventTypeField.ID),
-            growable=definition_message is None), 
-        CameraEventCameraFileUuidField(
-            size=self.__get_field_size(definition_message, CameraEventCameraFileUuidField.ID),
-            growable=definition_message is None), 
-        CameraEventCameraOrientationField(
-            size=self.__get_field_size(definition_message, CameraEventCameraOrientationField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=CameraEventMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -64,219 +34,29 @@ class CameraEventMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def timestamp_ms(self) -> Optional[int]:
-        field = self.get_field(CameraEventTimestampMsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @timestamp_ms.setter
-    def timestamp_ms(self, value: int):
-        field = self.get_field(CameraEventTimestampMsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def camera_event_type(self) -> Optional[CameraEventType]:
-        field = self.get_field(CameraEventCameraEventTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @camera_event_type.setter
-    def camera_event_type(self, value: CameraEventType):
-        field = self.get_field(CameraEventCameraEventTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def camera_file_uuid(self) -> Optional[str]:
-        field = self.get_field(CameraEventCameraFileUuidField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @camera_file_uuid.setter
-    def camera_file_uuid(self, value: str):
-        field = self.get_field(CameraEventCameraFileUuidField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def camera_orientation(self) -> Optional[CameraOrientationType]:
-        field = self.get_field(CameraEventCameraOrientationField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @camera_orientation.setter
-    def camera_orientation(self, value: CameraOrientationType):
-        field = self.get_field(CameraEventCameraOrientationField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CameraEventTimestampMsField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp_ms',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CameraEventCameraEventTypeField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='camera_event_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CameraEventCameraFileUuidField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='camera_file_uuid',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CameraEventCameraOrientationField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='camera_orientation',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    timestamp_ms: FieldProperty[int] = FieldProperty(0)
+    camera_event_type: FieldProperty[CameraEventType] = FieldProperty(1)
+    camera_file_uuid: FieldProperty[str] = FieldProperty(2)
+    camera_orientation: FieldProperty[CameraOrientationType] = FieldProperty(3)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('CameraEventTimestampMsField', 0, 'timestamp_ms', BaseType.UINT16, 0, 1, 'ms', '', []),
+    ('CameraEventCameraEventTypeField', 1, 'camera_event_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('CameraEventCameraFileUuidField', 2, 'camera_file_uuid', BaseType.STRING, 0, 1, '', '', []),
+    ('CameraEventCameraOrientationField', 3, 'camera_orientation', BaseType.ENUM, 0, 1, '', '', []),
+])
+
+(
+    TimestampField,
+    CameraEventTimestampMsField,
+    CameraEventCameraEventTypeField,
+    CameraEventCameraFileUuidField,
+    CameraEventCameraOrientationField,
+) = FIELD_TYPES
+
+CameraEventMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
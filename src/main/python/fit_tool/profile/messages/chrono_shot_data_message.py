@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class ChronoShotDataMessage(DataMessage):
     ID = 388
     NAME = 'chrono_shot_data'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=ChronoShotDataMessage.NAME,
@@ -37,19 +25,7 @@ class ChronoShotDataMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        ChronoShotDataShotSpeedField(
-            size=self.__get_field_size(definition_message, ChronoShotDataShotSpeedField.ID),
-            growable=definition_message is None), 
-        ChronoShotDataShotNumField(
-            size=self.__get_field_size(definition_message, ChronoShotDataShotNumField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=ChronoShotDataMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -58,137 +34,23 @@ class ChronoShotDataMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    shot_speed: FieldProperty[float] = FieldProperty(0)
+    shot_num: FieldProperty[int] = FieldProperty(1)
 
 
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def shot_speed(self) -> Optional[float]:
-        field = self.get_field(ChronoShotDataShotSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @shot_speed.setter
-    def shot_speed(self, value: float):
-        field = self.get_field(ChronoShotDataShotSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def shot_num(self) -> Optional[int]:
-        field = self.get_field(ChronoShotDataShotNumField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @shot_num.setter
-    def shot_num(self, value: int):
-        field = self.get_field(ChronoShotDataShotNumField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ChronoShotDataShotSpeedField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='shot_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('ChronoShotDataShotSpeedField', 0, 'shot_speed', BaseType.UINT32, 0, 1000, 'm/s', '', []),
+    ('ChronoShotDataShotNumField', 1, 'shot_num', BaseType.UINT16, 0, 1, '', '', []),
+])
 
-class ChronoShotDataShotNumField(Field):
-    ID = 1
+(
+    TimestampField,
+    ChronoShotDataShotSpeedField,
+    ChronoShotDataShotNumField,
+) = FIELD_TYPES
 
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='shot_num',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+ChronoShotDataMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
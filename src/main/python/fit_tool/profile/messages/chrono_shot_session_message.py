@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class ChronoShotSessionMessage(DataMessage):
     ID = 387
     NAME = 'chrono_shot_session'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=ChronoShotSessionMessage.NAME,
@@ -37,34 +25,7 @@ class ChronoShotSessionMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        ChronoShotSessionMinSpeedField(
-            size=self.__get_field_size(definition_message, ChronoShotSessionMinSpeedField.ID),
-            growable=definition_message is None), 
-        ChronoShotSessionMaxSpeedField(
-            size=self.__get_field_size(definition_message, ChronoShotSessionMaxSpeedField.ID),
-            growable=definition_message is None), 
-        ChronoShotSessionAvgSpeedField(
-            size=self.__get_field_size(definition_message, ChronoShotSessionAvgSpeedField.ID),
-            growable=definition_message is None), 
-        ChronoShotSessionShotCountField(
-            size=self.__get_field_size(definition_message, ChronoShotSessionShotCountField.ID),
-            growable=definition_message is None), 
-        ChronoShotSessionProjectileTypeField(
-            size=self.__get_field_size(definition_message, ChronoShotSessionProjectileTypeField.ID),
-            growable=definition_message is None), 
-        ChronoShotSessionGrainWeightField(
-            size=self.__get_field_size(definition_message, ChronoShotSessionGrainWeightField.ID),
-            growable=definition_message is None), 
-        ChronoShotSessionStandardDeviationField(
-            size=self.__get_field_size(definition_message, ChronoShotSessionStandardDeviationField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=ChronoShotSessionMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -73,350 +34,38 @@ class ChronoShotSessionMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def min_speed(self) -> Optional[float]:
-        field = self.get_field(ChronoShotSessionMinSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @min_speed.setter
-    def min_speed(self, value: float):
-        field = self.get_field(ChronoShotSessionMinSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_speed(self) -> Optional[float]:
-        field = self.get_field(ChronoShotSessionMaxSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_speed.setter
-    def max_speed(self, value: float):
-        field = self.get_field(ChronoShotSessionMaxSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_speed(self) -> Optional[float]:
-        field = self.get_field(ChronoShotSessionAvgSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_speed.setter
-    def avg_speed(self, value: float):
-        field = self.get_field(ChronoShotSessionAvgSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def shot_count(self) -> Optional[int]:
-        field = self.get_field(ChronoShotSessionShotCountField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @shot_count.setter
-    def shot_count(self, value: int):
-        field = self.get_field(ChronoShotSessionShotCountField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def projectile_type(self) -> Optional[ProjectileType]:
-        field = self.get_field(ChronoShotSessionProjectileTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @projectile_type.setter
-    def projectile_type(self, value: ProjectileType):
-        field = self.get_field(ChronoShotSessionProjectileTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def grain_weight(self) -> Optional[float]:
-        field = self.get_field(ChronoShotSessionGrainWeightField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @grain_weight.setter
-    def grain_weight(self, value: float):
-        field = self.get_field(ChronoShotSessionGrainWeightField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def standard_deviation(self) -> Optional[float]:
-        field = self.get_field(ChronoShotSessionStandardDeviationField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @standard_deviation.setter
-    def standard_deviation(self, value: float):
-        field = self.get_field(ChronoShotSessionStandardDeviationField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ChronoShotSessionMinSpeedField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='min_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ChronoShotSessionMaxSpeedField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ChronoShotSessionAvgSpeedField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ChronoShotSessionShotCountField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='shot_count',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ChronoShotSessionProjectileTypeField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='projectile_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ChronoShotSessionGrainWeightField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='grain_weight',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = 'gr',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ChronoShotSessionStandardDeviationField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='standard_deviation',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    min_speed: FieldProperty[float] = FieldProperty(0)
+    max_speed: FieldProperty[float] = FieldProperty(1)
+    avg_speed: FieldProperty[float] = FieldProperty(2)
+    shot_count: FieldProperty[int] = FieldProperty(3)
+    projectile_type: FieldProperty[ProjectileType] = FieldProperty(4)
+    grain_weight: FieldProperty[float] = FieldProperty(5)
+    standard_deviation: FieldProperty[float] = FieldProperty(6)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('ChronoShotSessionMinSpeedField', 0, 'min_speed', BaseType.UINT32, 0, 1000, 'm/s', '', []),
+    ('ChronoShotSessionMaxSpeedField', 1, 'max_speed', BaseType.UINT32, 0, 1000, 'm/s', '', []),
+    ('ChronoShotSessionAvgSpeedField', 2, 'avg_speed', BaseType.UINT32, 0, 1000, 'm/s', '', []),
+    ('ChronoShotSessionShotCountField', 3, 'shot_count', BaseType.UINT16, 0, 1, '', '', []),
+    ('ChronoShotSessionProjectileTypeField', 4, 'projectile_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('ChronoShotSessionGrainWeightField', 5, 'grain_weight', BaseType.UINT32, 0, 10, 'gr', '', []),
+    ('ChronoShotSessionStandardDeviationField', 6, 'standard_deviation', BaseType.UINT32, 0, 1000, 'm/s', '', []),
+])
+
+(
+    TimestampField,
+    ChronoShotSessionMinSpeedField,
+    ChronoShotSessionMaxSpeedField,
+    ChronoShotSessionAvgSpeedField,
+    ChronoShotSessionShotCountField,
+    ChronoShotSessionProjectileTypeField,
+    ChronoShotSessionGrainWeightField,
+    ChronoShotSessionStandardDeviationField,
+) = FIELD_TYPES
+
+ChronoShotSessionMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
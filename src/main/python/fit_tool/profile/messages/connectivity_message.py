@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class ConnectivityMessage(DataMessage):
     ID = 127
     NAME = 'connectivity'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=ConnectivityMessage.NAME,
@@ -37,49 +25,7 @@ class ConnectivityMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        ConnectivityBluetoothEnabledField(
-            size=self.__get_field_size(definition_message, ConnectivityBluetoothEnabledField.ID),
-            growable=definition_message is None), 
-        ConnectivityBluetoothLeEnabledField(
-            size=self.__get_field_size(definition_message, ConnectivityBluetoothLeEnabledField.ID),
-            growable=definition_message is None), 
-        ConnectivityAntEnabledField(
-            size=self.__get_field_size(definition_message, ConnectivityAntEnabledField.ID),
-            growable=definition_message is None), 
-        ConnectivityNameField(
-            size=self.__get_field_size(definition_message, ConnectivityNameField.ID),
-            growable=definition_message is None), 
-        ConnectivityLiveTrackingEnabledField(
-            size=self.__get_field_size(definition_message, ConnectivityLiveTrackingEnabledField.ID),
-            growable=definition_message is None), 
-        ConnectivityWeatherConditionsEnabledField(
-            size=self.__get_field_size(definition_message, ConnectivityWeatherConditionsEnabledField.ID),
-            growable=definition_message is None), 
-        ConnectivityWeatherAlertsEnabledField(
-            size=self.__get_field_size(definition_message, ConnectivityWeatherAlertsEnabledField.ID),
-            growable=definition_message is None), 
-        ConnectivityAutoActivityUploadEnabledField(
-            size=self.__get_field_size(definition_message, ConnectivityAutoActivityUploadEnabledField.ID),
-            growable=definition_message is None), 
-        ConnectivityCourseDownloadEnabledField(
-            size=self.__get_field_size(definition_message, ConnectivityCourseDownloadEnabledField.ID),
-            growable=definition_message is None), 
-        ConnectivityWorkoutDownloadEnabledField(
-            size=self.__get_field_size(definition_message, ConnectivityWorkoutDownloadEnabledField.ID),
-            growable=definition_message is None), 
-        ConnectivityGpsEphemerisDownloadEnabledField(
-            size=self.__get_field_size(definition_message, ConnectivityGpsEphemerisDownloadEnabledField.ID),
-            growable=definition_message is None), 
-        ConnectivityIncidentDetectionEnabledField(
-            size=self.__get_field_size(definition_message, ConnectivityIncidentDetectionEnabledField.ID),
-            growable=definition_message is None), 
-        ConnectivityGrouptrackEnabledField(
-            size=self.__get_field_size(definition_message, ConnectivityGrouptrackEnabledField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=ConnectivityMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -88,541 +34,53 @@ class ConnectivityMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def bluetooth_enabled(self) -> Optional[bool]:
-        field = self.get_field(ConnectivityBluetoothEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @bluetooth_enabled.setter
-    def bluetooth_enabled(self, value: bool):
-        field = self.get_field(ConnectivityBluetoothEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def bluetooth_le_enabled(self) -> Optional[bool]:
-        field = self.get_field(ConnectivityBluetoothLeEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @bluetooth_le_enabled.setter
-    def bluetooth_le_enabled(self, value: bool):
-        field = self.get_field(ConnectivityBluetoothLeEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def ant_enabled(self) -> Optional[bool]:
-        field = self.get_field(ConnectivityAntEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @ant_enabled.setter
-    def ant_enabled(self, value: bool):
-        field = self.get_field(ConnectivityAntEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def connectivity_name(self) -> Optional[str]:
-        field = self.get_field(ConnectivityNameField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @connectivity_name.setter
-    def connectivity_name(self, value: str):
-        field = self.get_field(ConnectivityNameField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def live_tracking_enabled(self) -> Optional[bool]:
-        field = self.get_field(ConnectivityLiveTrackingEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @live_tracking_enabled.setter
-    def live_tracking_enabled(self, value: bool):
-        field = self.get_field(ConnectivityLiveTrackingEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def weather_conditions_enabled(self) -> Optional[bool]:
-        field = self.get_field(ConnectivityWeatherConditionsEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @weather_conditions_enabled.setter
-    def weather_conditions_enabled(self, value: bool):
-        field = self.get_field(ConnectivityWeatherConditionsEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def weather_alerts_enabled(self) -> Optional[bool]:
-        field = self.get_field(ConnectivityWeatherAlertsEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @weather_alerts_enabled.setter
-    def weather_alerts_enabled(self, value: bool):
-        field = self.get_field(ConnectivityWeatherAlertsEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def auto_activity_upload_enabled(self) -> Optional[bool]:
-        field = self.get_field(ConnectivityAutoActivityUploadEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @auto_activity_upload_enabled.setter
-    def auto_activity_upload_enabled(self, value: bool):
-        field = self.get_field(ConnectivityAutoActivityUploadEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def course_download_enabled(self) -> Optional[bool]:
-        field = self.get_field(ConnectivityCourseDownloadEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @course_download_enabled.setter
-    def course_download_enabled(self, value: bool):
-        field = self.get_field(ConnectivityCourseDownloadEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def workout_download_enabled(self) -> Optional[bool]:
-        field = self.get_field(ConnectivityWorkoutDownloadEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @workout_download_enabled.setter
-    def workout_download_enabled(self, value: bool):
-        field = self.get_field(ConnectivityWorkoutDownloadEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def gps_ephemeris_download_enabled(self) -> Optional[bool]:
-        field = self.get_field(ConnectivityGpsEphemerisDownloadEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @gps_ephemeris_download_enabled.setter
-    def gps_ephemeris_download_enabled(self, value: bool):
-        field = self.get_field(ConnectivityGpsEphemerisDownloadEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def incident_detection_enabled(self) -> Optional[bool]:
-        field = self.get_field(ConnectivityIncidentDetectionEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @incident_detection_enabled.setter
-    def incident_detection_enabled(self, value: bool):
-        field = self.get_field(ConnectivityIncidentDetectionEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def grouptrack_enabled(self) -> Optional[bool]:
-        field = self.get_field(ConnectivityGrouptrackEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @grouptrack_enabled.setter
-    def grouptrack_enabled(self, value: bool):
-        field = self.get_field(ConnectivityGrouptrackEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class ConnectivityBluetoothEnabledField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='bluetooth_enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ConnectivityBluetoothLeEnabledField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='bluetooth_le_enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ConnectivityAntEnabledField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='ant_enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ConnectivityNameField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='name',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ConnectivityLiveTrackingEnabledField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='live_tracking_enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ConnectivityWeatherConditionsEnabledField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='weather_conditions_enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ConnectivityWeatherAlertsEnabledField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='weather_alerts_enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ConnectivityAutoActivityUploadEnabledField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='auto_activity_upload_enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ConnectivityCourseDownloadEnabledField(Field):
-    ID = 8
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='course_download_enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ConnectivityWorkoutDownloadEnabledField(Field):
-    ID = 9
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='workout_download_enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ConnectivityGpsEphemerisDownloadEnabledField(Field):
-    ID = 10
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='gps_ephemeris_download_enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ConnectivityIncidentDetectionEnabledField(Field):
-    ID = 11
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='incident_detection_enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ConnectivityGrouptrackEnabledField(Field):
-    ID = 12
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='grouptrack_enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    bluetooth_enabled: FieldProperty[bool] = FieldProperty(0)
+    bluetooth_le_enabled: FieldProperty[bool] = FieldProperty(1)
+    ant_enabled: FieldProperty[bool] = FieldProperty(2)
+    connectivity_name: FieldProperty[str] = FieldProperty(3)
+    live_tracking_enabled: FieldProperty[bool] = FieldProperty(4)
+    weather_conditions_enabled: FieldProperty[bool] = FieldProperty(5)
+    weather_alerts_enabled: FieldProperty[bool] = FieldProperty(6)
+    auto_activity_upload_enabled: FieldProperty[bool] = FieldProperty(7)
+    course_download_enabled: FieldProperty[bool] = FieldProperty(8)
+    workout_download_enabled: FieldProperty[bool] = FieldProperty(9)
+    gps_ephemeris_download_enabled: FieldProperty[bool] = FieldProperty(10)
+    incident_detection_enabled: FieldProperty[bool] = FieldProperty(11)
+    grouptrack_enabled: FieldProperty[bool] = FieldProperty(12)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('ConnectivityBluetoothEnabledField', 0, 'bluetooth_enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('ConnectivityBluetoothLeEnabledField', 1, 'bluetooth_le_enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('ConnectivityAntEnabledField', 2, 'ant_enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('ConnectivityNameField', 3, 'name', BaseType.STRING, 0, 1, '', '', []),
+    ('ConnectivityLiveTrackingEnabledField', 4, 'live_tracking_enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('ConnectivityWeatherConditionsEnabledField', 5, 'weather_conditions_enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('ConnectivityWeatherAlertsEnabledField', 6, 'weather_alerts_enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('ConnectivityAutoActivityUploadEnabledField', 7, 'auto_activity_upload_enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('ConnectivityCourseDownloadEnabledField', 8, 'course_download_enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('ConnectivityWorkoutDownloadEnabledField', 9, 'workout_download_enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('ConnectivityGpsEphemerisDownloadEnabledField', 10, 'gps_ephemeris_download_enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('ConnectivityIncidentDetectionEnabledField', 11, 'incident_detection_enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('ConnectivityGrouptrackEnabledField', 12, 'grouptrack_enabled', BaseType.UINT8, 0, 1, '', '', []),
+])
+
+(
+    ConnectivityBluetoothEnabledField,
+    ConnectivityBluetoothLeEnabledField,
+    ConnectivityAntEnabledField,
+    ConnectivityNameField,
+    ConnectivityLiveTrackingEnabledField,
+    ConnectivityWeatherConditionsEnabledField,
+    ConnectivityWeatherAlertsEnabledField,
+    ConnectivityAutoActivityUploadEnabledField,
+    ConnectivityCourseDownloadEnabledField,
+    ConnectivityWorkoutDownloadEnabledField,
+    ConnectivityGpsEphemerisDownloadEnabledField,
+    ConnectivityIncidentDetectionEnabledField,
+    ConnectivityGrouptrackEnabledField,
+) = FIELD_TYPES
+
+ConnectivityMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class CourseMessage(DataMessage):
     ID = 31
     NAME = 'course'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=CourseMessage.NAME,
@@ -37,22 +25,7 @@ class CourseMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        CourseSportField(
-            size=self.__get_field_size(definition_message, CourseSportField.ID),
-            growable=definition_message is None), 
-        CourseNameField(
-            size=self.__get_field_size(definition_message, CourseNameField.ID),
-            growable=definition_message is None), 
-        CourseCapabilitiesField(
-            size=self.__get_field_size(definition_message, CourseCapabilitiesField.ID),
-            growable=definition_message is None), 
-        CourseSubSportField(
-            size=self.__get_field_size(definition_message, CourseSubSportField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=CourseMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -61,172 +34,26 @@ class CourseMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def sport(self) -> Optional[Sport]:
-        field = self.get_field(CourseSportField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sport.setter
-    def sport(self, value: Sport):
-        field = self.get_field(CourseSportField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def course_name(self) -> Optional[str]:
-        field = self.get_field(CourseNameField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @course_name.setter
-    def course_name(self, value: str):
-        field = self.get_field(CourseNameField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def capabilities(self) -> Optional[int]:
-        field = self.get_field(CourseCapabilitiesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @capabilities.setter
-    def capabilities(self, value: int):
-        field = self.get_field(CourseCapabilitiesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sub_sport(self) -> Optional[SubSport]:
-        field = self.get_field(CourseSubSportField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sub_sport.setter
-    def sub_sport(self, value: SubSport):
-        field = self.get_field(CourseSubSportField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class CourseSportField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sport',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CourseNameField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='name',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CourseCapabilitiesField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='capabilities',
-            field_id=self.ID,
-            base_type=BaseType.UINT32Z,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CourseSubSportField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sub_sport',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    sport: FieldProperty[Sport] = FieldProperty(4)
+    course_name: FieldProperty[str] = FieldProperty(5)
+    capabilities: FieldProperty[int] = FieldProperty(6)
+    sub_sport: FieldProperty[SubSport] = FieldProperty(7)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('CourseSportField', 4, 'sport', BaseType.ENUM, 0, 1, '', '', []),
+    ('CourseNameField', 5, 'name', BaseType.STRING, 0, 1, '', '', []),
+    ('CourseCapabilitiesField', 6, 'capabilities', BaseType.UINT32Z, 0, 1, '', '', []),
+    ('CourseSubSportField', 7, 'sub_sport', BaseType.ENUM, 0, 1, '', '', []),
+])
+
+(
+    CourseSportField,
+    CourseNameField,
+    CourseCapabilitiesField,
+    CourseSubSportField,
+) = FIELD_TYPES
+
+CourseMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class CoursePointMessage(DataMessage):
     ID = 32
     NAME = 'course_point'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=CoursePointMessage.NAME,
@@ -37,34 +25,7 @@ class CoursePointMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        CoursePointTimestampField(
-            size=self.__get_field_size(definition_message, CoursePointTimestampField.ID),
-            growable=definition_message is None), 
-        CoursePointPositionLatField(
-            size=self.__get_field_size(definition_message, CoursePointPositionLatField.ID),
-            growable=definition_message is None), 
-        CoursePointPositionLongField(
-            size=self.__get_field_size(definition_message, CoursePointPositionLongField.ID),
-            growable=definition_message is None), 
-        CoursePointDistanceField(
-            size=self.__get_field_size(definition_message, CoursePointDistanceField.ID),
-            growable=definition_message is None), 
-        CoursePointTypeField(
-            size=self.__get_field_size(definition_message, CoursePointTypeField.ID),
-            growable=definition_message is None), 
-        CoursePointNameField(
-            size=self.__get_field_size(definition_message, CoursePointNameField.ID),
-            growable=definition_message is None), 
-        CoursePointFavoriteField(
-            size=self.__get_field_size(definition_message, CoursePointFavoriteField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=CoursePointMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -73,346 +34,38 @@ class CoursePointMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(CoursePointTimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(CoursePointTimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def position_lat(self) -> Optional[float]:
-        field = self.get_field(CoursePointPositionLatField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @position_lat.setter
-    def position_lat(self, value: float):
-        field = self.get_field(CoursePointPositionLatField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def position_long(self) -> Optional[float]:
-        field = self.get_field(CoursePointPositionLongField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @position_long.setter
-    def position_long(self, value: float):
-        field = self.get_field(CoursePointPositionLongField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def distance(self) -> Optional[float]:
-        field = self.get_field(CoursePointDistanceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @distance.setter
-    def distance(self, value: float):
-        field = self.get_field(CoursePointDistanceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def type(self) -> Optional[CoursePoint]:
-        field = self.get_field(CoursePointTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @type.setter
-    def type(self, value: CoursePoint):
-        field = self.get_field(CoursePointTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def course_point_name(self) -> Optional[str]:
-        field = self.get_field(CoursePointNameField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @course_point_name.setter
-    def course_point_name(self, value: str):
-        field = self.get_field(CoursePointNameField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def favorite(self) -> Optional[bool]:
-        field = self.get_field(CoursePointFavoriteField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @favorite.setter
-    def favorite(self, value: bool):
-        field = self.get_field(CoursePointFavoriteField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CoursePointTimestampField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CoursePointPositionLatField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='position_lat',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CoursePointPositionLongField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='position_long',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CoursePointDistanceField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='distance',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CoursePointTypeField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CoursePointNameField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='name',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class CoursePointFavoriteField(Field):
-    ID = 8
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='favorite',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    message_index: FieldProperty[int] = FieldProperty(254)
+    timestamp: FieldProperty[int] = FieldProperty(1)
+    position_lat: FieldProperty[float] = FieldProperty(2)
+    position_long: FieldProperty[float] = FieldProperty(3)
+    distance: FieldProperty[float] = FieldProperty(4)
+    type: FieldProperty[CoursePoint] = FieldProperty(5)
+    course_point_name: FieldProperty[str] = FieldProperty(6)
+    favorite: FieldProperty[bool] = FieldProperty(8)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('CoursePointTimestampField', 1, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('CoursePointPositionLatField', 2, 'position_lat', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('CoursePointPositionLongField', 3, 'position_long', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('CoursePointDistanceField', 4, 'distance', BaseType.UINT32, 0, 100, 'm', '', []),
+    ('CoursePointTypeField', 5, 'type', BaseType.ENUM, 0, 1, '', '', []),
+    ('CoursePointNameField', 6, 'name', BaseType.STRING, 0, 1, '', '', []),
+    ('CoursePointFavoriteField', 8, 'favorite', BaseType.UINT8, 0, 1, '', '', []),
+])
+
+(
+    MessageIndexField,
+    CoursePointTimestampField,
+    CoursePointPositionLatField,
+    CoursePointPositionLongField,
+    CoursePointDistanceField,
+    CoursePointTypeField,
+    CoursePointNameField,
+    CoursePointFavoriteField,
+) = FIELD_TYPES
+
+CoursePointMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
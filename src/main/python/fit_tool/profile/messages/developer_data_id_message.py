@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class DeveloperDataIdMessage(DataMessage):
     ID = 207
     NAME = 'developer_data_id'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=DeveloperDataIdMessage.NAME,
@@ -37,25 +25,7 @@ class DeveloperDataIdMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        DeveloperDataIdDeveloperIdField(
-            size=self.__get_field_size(definition_message, DeveloperDataIdDeveloperIdField.ID),
-            growable=definition_message is None), 
-        DeveloperDataIdApplicationIdField(
-            size=self.__get_field_size(definition_message, DeveloperDataIdApplicationIdField.ID),
-            growable=definition_message is None), 
-        DeveloperDataIdManufacturerIdField(
-            size=self.__get_field_size(definition_message, DeveloperDataIdManufacturerIdField.ID),
-            growable=definition_message is None), 
-        DeveloperDataIdDeveloperDataIndexField(
-            size=self.__get_field_size(definition_message, DeveloperDataIdDeveloperDataIndexField.ID),
-            growable=definition_message is None), 
-        DeveloperDataIdApplicationVersionField(
-            size=self.__get_field_size(definition_message, DeveloperDataIdApplicationVersionField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=DeveloperDataIdMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -64,209 +34,29 @@ class DeveloperDataIdMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def developer_id(self) -> Optional[bytes]:
-        field = self.get_field(DeveloperDataIdDeveloperIdField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @developer_id.setter
-    def developer_id(self, value: bytes):
-        field = self.get_field(DeveloperDataIdDeveloperIdField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def application_id(self) -> Optional[bytes]:
-        field = self.get_field(DeveloperDataIdApplicationIdField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @application_id.setter
-    def application_id(self, value: bytes):
-        field = self.get_field(DeveloperDataIdApplicationIdField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def manufacturer_id(self) -> Optional[int]:
-        field = self.get_field(DeveloperDataIdManufacturerIdField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @manufacturer_id.setter
-    def manufacturer_id(self, value: int):
-        field = self.get_field(DeveloperDataIdManufacturerIdField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def developer_data_index(self) -> Optional[int]:
-        field = self.get_field(DeveloperDataIdDeveloperDataIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @developer_data_index.setter
-    def developer_data_index(self, value: int):
-        field = self.get_field(DeveloperDataIdDeveloperDataIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def application_version(self) -> Optional[int]:
-        field = self.get_field(DeveloperDataIdApplicationVersionField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @application_version.setter
-    def application_version(self, value: int):
-        field = self.get_field(DeveloperDataIdApplicationVersionField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class DeveloperDataIdDeveloperIdField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='developer_id',
-            field_id=self.ID,
-            base_type=BaseType.BYTE,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DeveloperDataIdApplicationIdField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='application_id',
-            field_id=self.ID,
-            base_type=BaseType.BYTE,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DeveloperDataIdManufacturerIdField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='manufacturer_id',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DeveloperDataIdDeveloperDataIndexField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='developer_data_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DeveloperDataIdApplicationVersionField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='application_version',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    developer_id: FieldProperty[bytes] = FieldProperty(0, is_array=True)
+    application_id: FieldProperty[bytes] = FieldProperty(1, is_array=True)
+    manufacturer_id: FieldProperty[int] = FieldProperty(2)
+    developer_data_index: FieldProperty[int] = FieldProperty(3)
+    application_version: FieldProperty[int] = FieldProperty(4)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('DeveloperDataIdDeveloperIdField', 0, 'developer_id', BaseType.BYTE, 0, 1, '', '', []),
+    ('DeveloperDataIdApplicationIdField', 1, 'application_id', BaseType.BYTE, 0, 1, '', '', []),
+    ('DeveloperDataIdManufacturerIdField', 2, 'manufacturer_id', BaseType.UINT16, 0, 1, '', '', []),
+    ('DeveloperDataIdDeveloperDataIndexField', 3, 'developer_data_index', BaseType.UINT8, 0, 1, '', '', []),
+    ('DeveloperDataIdApplicationVersionField', 4, 'application_version', BaseType.UINT32, 0, 1, '', '', []),
+])
+
+(
+    DeveloperDataIdDeveloperIdField,
+    DeveloperDataIdApplicationIdField,
+    DeveloperDataIdManufacturerIdField,
+    DeveloperDataIdDeveloperDataIndexField,
+    DeveloperDataIdApplicationVersionField,
+) = FIELD_TYPES
+
+DeveloperDataIdMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
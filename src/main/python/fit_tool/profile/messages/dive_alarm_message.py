@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class DiveAlarmMessage(DataMessage):
     ID = 262
     NAME = 'dive_alarm'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=DiveAlarmMessage.NAME,
@@ -37,49 +25,7 @@ class DiveAlarmMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        DiveAlarmDepthField(
-            size=self.__get_field_size(definition_message, DiveAlarmDepthField.ID),
-            growable=definition_message is None), 
-        DiveAlarmTimeField(
-            size=self.__get_field_size(definition_message, DiveAlarmTimeField.ID),
-            growable=definition_message is None), 
-        DiveAlarmEnabledField(
-            size=self.__get_field_size(definition_message, DiveAlarmEnabledField.ID),
-            growable=definition_message is None), 
-        DiveAlarmAlarmTypeField(
-            size=self.__get_field_size(definition_message, DiveAlarmAlarmTypeField.ID),
-            growable=definition_message is None), 
-        DiveAlarmSoundField(
-            size=self.__get_field_size(definition_message, DiveAlarmSoundField.ID),
-            growable=definition_message is None), 
-        DiveAlarmDiveTypesField(
-            size=self.__get_field_size(definition_message, DiveAlarmDiveTypesField.ID),
-            growable=definition_message is None), 
-        DiveAlarmIdField(
-            size=self.__get_field_size(definition_message, DiveAlarmIdField.ID),
-            growable=definition_message is None), 
-        DiveAlarmPopupEnabledField(
-            size=self.__get_field_size(definition_message, DiveAlarmPopupEnabledField.ID),
-            growable=definition_message is None), 
-        DiveAlarmTriggerOnDescentField(
-            size=self.__get_field_size(definition_message, DiveAlarmTriggerOnDescentField.ID),
-            growable=definition_message is None), 
-        DiveAlarmTriggerOnAscentField(
-            size=self.__get_field_size(definition_message, DiveAlarmTriggerOnAscentField.ID),
-            growable=definition_message is None), 
-        DiveAlarmRepeatingField(
-            size=self.__get_field_size(definition_message, DiveAlarmRepeatingField.ID),
-            growable=definition_message is None), 
-        DiveAlarmSpeedField(
-            size=self.__get_field_size(definition_message, DiveAlarmSpeedField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=DiveAlarmMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -88,545 +34,53 @@ class DiveAlarmMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def depth(self) -> Optional[float]:
-        field = self.get_field(DiveAlarmDepthField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @depth.setter
-    def depth(self, value: float):
-        field = self.get_field(DiveAlarmDepthField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def time(self) -> Optional[int]:
-        field = self.get_field(DiveAlarmTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @time.setter
-    def time(self, value: int):
-        field = self.get_field(DiveAlarmTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enabled(self) -> Optional[bool]:
-        field = self.get_field(DiveAlarmEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enabled.setter
-    def enabled(self, value: bool):
-        field = self.get_field(DiveAlarmEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def alarm_type(self) -> Optional[DiveAlarmType]:
-        field = self.get_field(DiveAlarmAlarmTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @alarm_type.setter
-    def alarm_type(self, value: DiveAlarmType):
-        field = self.get_field(DiveAlarmAlarmTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sound(self) -> Optional[Tone]:
-        field = self.get_field(DiveAlarmSoundField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sound.setter
-    def sound(self, value: Tone):
-        field = self.get_field(DiveAlarmSoundField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def dive_types(self) -> Optional[list[SubSport]]:
-        field = self.get_field(DiveAlarmDiveTypesField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @dive_types.setter
-    def dive_types(self, value: list[SubSport]):
-        field = self.get_field(DiveAlarmDiveTypesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def id(self) -> Optional[int]:
-        field = self.get_field(DiveAlarmIdField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @id.setter
-    def id(self, value: int):
-        field = self.get_field(DiveAlarmIdField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def popup_enabled(self) -> Optional[bool]:
-        field = self.get_field(DiveAlarmPopupEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @popup_enabled.setter
-    def popup_enabled(self, value: bool):
-        field = self.get_field(DiveAlarmPopupEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def trigger_on_descent(self) -> Optional[bool]:
-        field = self.get_field(DiveAlarmTriggerOnDescentField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @trigger_on_descent.setter
-    def trigger_on_descent(self, value: bool):
-        field = self.get_field(DiveAlarmTriggerOnDescentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def trigger_on_ascent(self) -> Optional[bool]:
-        field = self.get_field(DiveAlarmTriggerOnAscentField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @trigger_on_ascent.setter
-    def trigger_on_ascent(self, value: bool):
-        field = self.get_field(DiveAlarmTriggerOnAscentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def repeating(self) -> Optional[bool]:
-        field = self.get_field(DiveAlarmRepeatingField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @repeating.setter
-    def repeating(self, value: bool):
-        field = self.get_field(DiveAlarmRepeatingField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def speed(self) -> Optional[float]:
-        field = self.get_field(DiveAlarmSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @speed.setter
-    def speed(self, value: float):
-        field = self.get_field(DiveAlarmSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveAlarmDepthField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='depth',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveAlarmTimeField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveAlarmEnabledField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveAlarmAlarmTypeField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='alarm_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveAlarmSoundField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sound',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveAlarmDiveTypesField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='dive_types',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveAlarmIdField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='id',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveAlarmPopupEnabledField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='popup_enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveAlarmTriggerOnDescentField(Field):
-    ID = 8
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='trigger_on_descent',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveAlarmTriggerOnAscentField(Field):
-    ID = 9
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='trigger_on_ascent',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveAlarmRepeatingField(Field):
-    ID = 10
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='repeating',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveAlarmSpeedField(Field):
-    ID = 11
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='speed',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'mps',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    message_index: FieldProperty[int] = FieldProperty(254)
+    depth: FieldProperty[float] = FieldProperty(0)
+    time: FieldProperty[int] = FieldProperty(1)
+    enabled: FieldProperty[bool] = FieldProperty(2)
+    alarm_type: FieldProperty[DiveAlarmType] = FieldProperty(3)
+    sound: FieldProperty[Tone] = FieldProperty(4)
+    dive_types: FieldProperty[list[SubSport]] = FieldProperty(5, is_array=True)
+    id: FieldProperty[int] = FieldProperty(6)
+    popup_enabled: FieldProperty[bool] = FieldProperty(7)
+    trigger_on_descent: FieldProperty[bool] = FieldProperty(8)
+    trigger_on_ascent: FieldProperty[bool] = FieldProperty(9)
+    repeating: FieldProperty[bool] = FieldProperty(10)
+    speed: FieldProperty[float] = FieldProperty(11)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('DiveAlarmDepthField', 0, 'depth', BaseType.UINT32, 0, 1000, 'm', '', []),
+    ('DiveAlarmTimeField', 1, 'time', BaseType.SINT32, 0, 1, 's', '', []),
+    ('DiveAlarmEnabledField', 2, 'enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('DiveAlarmAlarmTypeField', 3, 'alarm_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('DiveAlarmSoundField', 4, 'sound', BaseType.ENUM, 0, 1, '', '', []),
+    ('DiveAlarmDiveTypesField', 5, 'dive_types', BaseType.ENUM, 0, 1, '', '', []),
+    ('DiveAlarmIdField', 6, 'id', BaseType.UINT32, 0, 1, '', '', []),
+    ('DiveAlarmPopupEnabledField', 7, 'popup_enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('DiveAlarmTriggerOnDescentField', 8, 'trigger_on_descent', BaseType.UINT8, 0, 1, '', '', []),
+    ('DiveAlarmTriggerOnAscentField', 9, 'trigger_on_ascent', BaseType.UINT8, 0, 1, '', '', []),
+    ('DiveAlarmRepeatingField', 10, 'repeating', BaseType.UINT8, 0, 1, '', '', []),
+    ('DiveAlarmSpeedField', 11, 'speed', BaseType.SINT32, 0, 1000, 'mps', '', []),
+])
+
+(
+    MessageIndexField,
+    DiveAlarmDepthField,
+    DiveAlarmTimeField,
+    DiveAlarmEnabledField,
+    DiveAlarmAlarmTypeField,
+    DiveAlarmSoundField,
+    DiveAlarmDiveTypesField,
+    DiveAlarmIdField,
+    DiveAlarmPopupEnabledField,
+    DiveAlarmTriggerOnDescentField,
+    DiveAlarmTriggerOnAscentField,
+    DiveAlarmRepeatingField,
+    DiveAlarmSpeedField,
+) = FIELD_TYPES
+
+DiveAlarmMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
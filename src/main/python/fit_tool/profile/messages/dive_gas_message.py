@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class DiveGasMessage(DataMessage):
     ID = 259
     NAME = 'dive_gas'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=DiveGasMessage.NAME,
@@ -37,25 +25,7 @@ class DiveGasMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        DiveGasHeliumContentField(
-            size=self.__get_field_size(definition_message, DiveGasHeliumContentField.ID),
-            growable=definition_message is None), 
-        DiveGasOxygenContentField(
-            size=self.__get_field_size(definition_message, DiveGasOxygenContentField.ID),
-            growable=definition_message is None), 
-        DiveGasStatusField(
-            size=self.__get_field_size(definition_message, DiveGasStatusField.ID),
-            growable=definition_message is None), 
-        DiveGasModeField(
-            size=self.__get_field_size(definition_message, DiveGasModeField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=DiveGasMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -64,217 +34,29 @@ class DiveGasMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def helium_content(self) -> Optional[int]:
-        field = self.get_field(DiveGasHeliumContentField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @helium_content.setter
-    def helium_content(self, value: int):
-        field = self.get_field(DiveGasHeliumContentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def oxygen_content(self) -> Optional[int]:
-        field = self.get_field(DiveGasOxygenContentField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @oxygen_content.setter
-    def oxygen_content(self, value: int):
-        field = self.get_field(DiveGasOxygenContentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def status(self) -> Optional[DiveGasStatus]:
-        field = self.get_field(DiveGasStatusField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @status.setter
-    def status(self, value: DiveGasStatus):
-        field = self.get_field(DiveGasStatusField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def mode(self) -> Optional[DiveGasMode]:
-        field = self.get_field(DiveGasModeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @mode.setter
-    def mode(self, value: DiveGasMode):
-        field = self.get_field(DiveGasModeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveGasHeliumContentField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='helium_content',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveGasOxygenContentField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='oxygen_content',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveGasStatusField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='status',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class DiveGasModeField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='mode',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    message_index: FieldProperty[int] = FieldProperty(254)
+    helium_content: FieldProperty[int] = FieldProperty(0)
+    oxygen_content: FieldProperty[int] = FieldProperty(1)
+    status: FieldProperty[DiveGasStatus] = FieldProperty(2)
+    mode: FieldProperty[DiveGasMode] = FieldProperty(3)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('DiveGasHeliumContentField', 0, 'helium_content', BaseType.UINT8, 0, 1, 'percent', '', []),
+    ('DiveGasOxygenContentField', 1, 'oxygen_content', BaseType.UINT8, 0, 1, 'percent', '', []),
+    ('DiveGasStatusField', 2, 'status', BaseType.ENUM, 0, 1, '', '', []),
+    ('DiveGasModeField', 3, 'mode', BaseType.ENUM, 0, 1, '', '', []),
+])
+
+(
+    MessageIndexField,
+    DiveGasHeliumContentField,
+    DiveGasOxygenContentField,
+    DiveGasStatusField,
+    DiveGasModeField,
+) = FIELD_TYPES
+
+DiveGasMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
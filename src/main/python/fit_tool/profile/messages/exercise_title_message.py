@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class ExerciseTitleMessage(DataMessage):
     ID = 264
     NAME = 'exercise_title'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=ExerciseTitleMessage.NAME,
@@ -37,22 +25,7 @@ class ExerciseTitleMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        ExerciseTitleExerciseCategoryField(
-            size=self.__get_field_size(definition_message, ExerciseTitleExerciseCategoryField.ID),
-            growable=definition_message is None), 
-        ExerciseTitleExerciseNameField(
-            size=self.__get_field_size(definition_message, ExerciseTitleExerciseNameField.ID),
-            growable=definition_message is None), 
-        ExerciseTitleWorkoutStepNameField(
-            size=self.__get_field_size(definition_message, ExerciseTitleWorkoutStepNameField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=ExerciseTitleMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -61,172 +34,26 @@ class ExerciseTitleMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def exercise_category(self) -> Optional[int]:
-        field = self.get_field(ExerciseTitleExerciseCategoryField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @exercise_category.setter
-    def exercise_category(self, value: int):
-        field = self.get_field(ExerciseTitleExerciseCategoryField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def exercise_name(self) -> Optional[int]:
-        field = self.get_field(ExerciseTitleExerciseNameField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @exercise_name.setter
-    def exercise_name(self, value: int):
-        field = self.get_field(ExerciseTitleExerciseNameField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def workout_step_name(self) -> Optional[str]:
-        field = self.get_field(ExerciseTitleWorkoutStepNameField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @workout_step_name.setter
-    def workout_step_name(self, value: str):
-        field = self.get_field(ExerciseTitleWorkoutStepNameField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ExerciseTitleExerciseCategoryField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='exercise_category',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ExerciseTitleExerciseNameField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='exercise_name',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ExerciseTitleWorkoutStepNameField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='wkt_step_name',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    message_index: FieldProperty[int] = FieldProperty(254)
+    exercise_category: FieldProperty[int] = FieldProperty(0)
+    exercise_name: FieldProperty[int] = FieldProperty(1)
+    workout_step_name: FieldProperty[str] = FieldProperty(2)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('ExerciseTitleExerciseCategoryField', 0, 'exercise_category', BaseType.UINT16, 0, 1, '', '', []),
+    ('ExerciseTitleExerciseNameField', 1, 'exercise_name', BaseType.UINT16, 0, 1, '', '', []),
+    ('ExerciseTitleWorkoutStepNameField', 2, 'wkt_step_name', BaseType.STRING, 0, 1, '', '', []),
+])
+
+(
+    MessageIndexField,
+    ExerciseTitleExerciseCategoryField,
+    ExerciseTitleExerciseNameField,
+    ExerciseTitleWorkoutStepNameField,
+) = FIELD_TYPES
+
+ExerciseTitleMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class FieldCapabilitiesMessage(DataMessage):
     ID = 39
     NAME = 'field_capabilities'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=FieldCapabilitiesMessage.NAME,
@@ -37,25 +25,7 @@ class FieldCapabilitiesMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        FieldCapabilitiesFileField(
-            size=self.__get_field_size(definition_message, FieldCapabilitiesFileField.ID),
-            growable=definition_message is None), 
-        FieldCapabilitiesMesgNumField(
-            size=self.__get_field_size(definition_message, FieldCapabilitiesMesgNumField.ID),
-            growable=definition_message is None), 
-        FieldCapabilitiesFieldNumField(
-            size=self.__get_field_size(definition_message, FieldCapabilitiesFieldNumField.ID),
-            growable=definition_message is None), 
-        FieldCapabilitiesCountField(
-            size=self.__get_field_size(definition_message, FieldCapabilitiesCountField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=FieldCapabilitiesMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -64,213 +34,29 @@ class FieldCapabilitiesMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def file(self) -> Optional[FileType]:
-        field = self.get_field(FieldCapabilitiesFileField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @file.setter
-    def file(self, value: FileType):
-        field = self.get_field(FieldCapabilitiesFileField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def mesg_num(self) -> Optional[int]:
-        field = self.get_field(FieldCapabilitiesMesgNumField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @mesg_num.setter
-    def mesg_num(self, value: int):
-        field = self.get_field(FieldCapabilitiesMesgNumField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def field_num(self) -> Optional[int]:
-        field = self.get_field(FieldCapabilitiesFieldNumField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @field_num.setter
-    def field_num(self, value: int):
-        field = self.get_field(FieldCapabilitiesFieldNumField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def count(self) -> Optional[int]:
-        field = self.get_field(FieldCapabilitiesCountField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @count.setter
-    def count(self, value: int):
-        field = self.get_field(FieldCapabilitiesCountField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class FieldCapabilitiesFileField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='file',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class FieldCapabilitiesMesgNumField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='mesg_num',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class FieldCapabilitiesFieldNumField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='field_num',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class FieldCapabilitiesCountField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='count',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    message_index: FieldProperty[int] = FieldProperty(254)
+    file: FieldProperty[FileType] = FieldProperty(0)
+    mesg_num: FieldProperty[int] = FieldProperty(1)
+    field_num: FieldProperty[int] = FieldProperty(2)
+    count: FieldProperty[int] = FieldProperty(3)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('FieldCapabilitiesFileField', 0, 'file', BaseType.ENUM, 0, 1, '', '', []),
+    ('FieldCapabilitiesMesgNumField', 1, 'mesg_num', BaseType.UINT16, 0, 1, '', '', []),
+    ('FieldCapabilitiesFieldNumField', 2, 'field_num', BaseType.UINT8, 0, 1, '', '', []),
+    ('FieldCapabilitiesCountField', 3, 'count', BaseType.UINT16, 0, 1, '', '', []),
+])
+
+(
+    MessageIndexField,
+    FieldCapabilitiesFileField,
+    FieldCapabilitiesMesgNumField,
+    FieldCapabilitiesFieldNumField,
+    FieldCapabilitiesCountField,
+) = FIELD_TYPES
+
+FieldCapabilitiesMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
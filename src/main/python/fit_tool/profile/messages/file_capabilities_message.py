@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class FileCapabilitiesMessage(DataMessage):
     ID = 37
     NAME = 'file_capabilities'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=FileCapabilitiesMessage.NAME,
@@ -37,28 +25,7 @@ class FileCapabilitiesMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        FileCapabilitiesTypeField(
-            size=self.__get_field_size(definition_message, FileCapabilitiesTypeField.ID),
-            growable=definition_message is None), 
-        FileCapabilitiesFlagsField(
-            size=self.__get_field_size(definition_message, FileCapabilitiesFlagsField.ID),
-            growable=definition_message is None), 
-        FileCapabilitiesDirectoryField(
-            size=self.__get_field_size(definition_message, FileCapabilitiesDirectoryField.ID),
-            growable=definition_message is None), 
-        FileCapabilitiesMaxCountField(
-            size=self.__get_field_size(definition_message, FileCapabilitiesMaxCountField.ID),
-            growable=definition_message is None), 
-        FileCapabilitiesMaxSizeField(
-            size=self.__get_field_size(definition_message, FileCapabilitiesMaxSizeField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=FileCapabilitiesMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -67,256 +34,32 @@ class FileCapabilitiesMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def type(self) -> Optional[FileType]:
-        field = self.get_field(FileCapabilitiesTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @type.setter
-    def type(self, value: FileType):
-        field = self.get_field(FileCapabilitiesTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def flags(self) -> Optional[int]:
-        field = self.get_field(FileCapabilitiesFlagsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @flags.setter
-    def flags(self, value: int):
-        field = self.get_field(FileCapabilitiesFlagsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def directory(self) -> Optional[str]:
-        field = self.get_field(FileCapabilitiesDirectoryField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @directory.setter
-    def directory(self, value: str):
-        field = self.get_field(FileCapabilitiesDirectoryField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_count(self) -> Optional[int]:
-        field = self.get_field(FileCapabilitiesMaxCountField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_count.setter
-    def max_count(self, value: int):
-        field = self.get_field(FileCapabilitiesMaxCountField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_size(self) -> Optional[int]:
-        field = self.get_field(FileCapabilitiesMaxSizeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_size.setter
-    def max_size(self, value: int):
-        field = self.get_field(FileCapabilitiesMaxSizeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class FileCapabilitiesTypeField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class FileCapabilitiesFlagsField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='flags',
-            field_id=self.ID,
-            base_type=BaseType.UINT8Z,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class FileCapabilitiesDirectoryField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='directory',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class FileCapabilitiesMaxCountField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_count',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class FileCapabilitiesMaxSizeField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_size',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'bytes',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    message_index: FieldProperty[int] = FieldProperty(254)
+    type: FieldProperty[FileType] = FieldProperty(0)
+    flags: FieldProperty[int] = FieldProperty(1)
+    directory: FieldProperty[str] = FieldProperty(2)
+    max_count: FieldProperty[int] = FieldProperty(3)
+    max_size: FieldProperty[int] = FieldProperty(4)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('FileCapabilitiesTypeField', 0, 'type', BaseType.ENUM, 0, 1, '', '', []),
+    ('FileCapabilitiesFlagsField', 1, 'flags', BaseType.UINT8Z, 0, 1, '', '', []),
+    ('FileCapabilitiesDirectoryField', 2, 'directory', BaseType.STRING, 0, 1, '', '', []),
+    ('FileCapabilitiesMaxCountField', 3, 'max_count', BaseType.UINT16, 0, 1, '', '', []),
+    ('FileCapabilitiesMaxSizeField', 4, 'max_size', BaseType.UINT32, 0, 1, 'bytes', '', []),
+])
+
+(
+    MessageIndexField,
+    FileCapabilitiesTypeField,
+    FileCapabilitiesFlagsField,
+    FileCapabilitiesDirectoryField,
+    FileCapabilitiesMaxCountField,
+    FileCapabilitiesMaxSizeField,
+) = FIELD_TYPES
+
+FileCapabilitiesMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class FileCreatorMessage(DataMessage):
     ID = 49
     NAME = 'file_creator'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=FileCreatorMessage.NAME,
@@ -37,16 +25,7 @@ class FileCreatorMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        FileCreatorSoftwareVersionField(
-            size=self.__get_field_size(definition_message, FileCreatorSoftwareVersionField.ID),
-            growable=definition_message is None), 
-        FileCreatorHardwareVersionField(
-            size=self.__get_field_size(definition_message, FileCreatorHardwareVersionField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=FileCreatorMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -55,90 +34,20 @@ class FileCreatorMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
+    software_version: FieldProperty[int] = FieldProperty(0)
+    hardware_version: FieldProperty[int] = FieldProperty(1)
 
 
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('FileCreatorSoftwareVersionField', 0, 'software_version', BaseType.UINT16, 0, 1, '', '', []),
+    ('FileCreatorHardwareVersionField', 1, 'hardware_version', BaseType.UINT8, 0, 1, '', '', []),
+])
 
-    @property
-    def software_version(self) -> Optional[int]:
-        field = self.get_field(FileCreatorSoftwareVersionField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @software_version.setter
-    def software_version(self, value: int):
-        field = self.get_field(FileCreatorSoftwareVersionField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def hardware_version(self) -> Optional[int]:
-        field = self.get_field(FileCreatorHardwareVersionField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @hardware_version.setter
-    def hardware_version(self, value: int):
-        field = self.get_field(FileCreatorHardwareVersionField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class FileCreatorSoftwareVersionField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='software_version',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class FileCreatorHardwareVersionField(Field):
-    ID = 1
+(
+    FileCreatorSoftwareVersionField,
+    FileCreatorHardwareVersionField,
+) = FIELD_TYPES
 
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='hardware_version',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+FileCreatorMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class GpsMetadataMessage(DataMessage):
     ID = 160
     NAME = 'gps_metadata'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=GpsMetadataMessage.NAME,
@@ -37,37 +25,7 @@ class GpsMetadataMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        GpsMetadataTimestampMsField(
-            size=self.__get_field_size(definition_message, GpsMetadataTimestampMsField.ID),
-            growable=definition_message is None), 
-        GpsMetadataPositionLatField(
-            size=self.__get_field_size(definition_message, GpsMetadataPositionLatField.ID),
-            growable=definition_message is None), 
-        GpsMetadataPositionLongField(
-            size=self.__get_field_size(definition_message, GpsMetadataPositionLongField.ID),
-            growable=definition_message is None), 
-        GpsMetadataEnhancedAltitudeField(
-            size=self.__get_field_size(definition_message, GpsMetadataEnhancedAltitudeField.ID),
-            growable=definition_message is None), 
-        GpsMetadataEnhancedSpeedField(
-            size=self.__get_field_size(definition_message, GpsMetadataEnhancedSpeedField.ID),
-            growable=definition_message is None), 
-        GpsMetadataHeadingField(
-            size=self.__get_field_size(definition_message, GpsMetadataHeadingField.ID),
-            growable=definition_message is None), 
-        GpsMetadataUtcTimestampField(
-            size=self.__get_field_size(definition_message, GpsMetadataUtcTimestampField.ID),
-            growable=definition_message is None), 
-        GpsMetadataVelocityField(
-            size=self.__get_field_size(definition_message, GpsMetadataVelocityField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=GpsMetadataMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -76,397 +34,41 @@ class GpsMetadataMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def timestamp_ms(self) -> Optional[int]:
-        field = self.get_field(GpsMetadataTimestampMsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @timestamp_ms.setter
-    def timestamp_ms(self, value: int):
-        field = self.get_field(GpsMetadataTimestampMsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def position_lat(self) -> Optional[float]:
-        field = self.get_field(GpsMetadataPositionLatField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @position_lat.setter
-    def position_lat(self, value: float):
-        field = self.get_field(GpsMetadataPositionLatField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def position_long(self) -> Optional[float]:
-        field = self.get_field(GpsMetadataPositionLongField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @position_long.setter
-    def position_long(self, value: float):
-        field = self.get_field(GpsMetadataPositionLongField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enhanced_altitude(self) -> Optional[float]:
-        field = self.get_field(GpsMetadataEnhancedAltitudeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_altitude.setter
-    def enhanced_altitude(self, value: float):
-        field = self.get_field(GpsMetadataEnhancedAltitudeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enhanced_speed(self) -> Optional[float]:
-        field = self.get_field(GpsMetadataEnhancedSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_speed.setter
-    def enhanced_speed(self, value: float):
-        field = self.get_field(GpsMetadataEnhancedSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def heading(self) -> Optional[float]:
-        field = self.get_field(GpsMetadataHeadingField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @heading.setter
-    def heading(self, value: float):
-        field = self.get_field(GpsMetadataHeadingField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def utc_timestamp(self) -> Optional[int]:
-        field = self.get_field(GpsMetadataUtcTimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @utc_timestamp.setter
-    def utc_timestamp(self, value: int):
-        field = self.get_field(GpsMetadataUtcTimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def velocity(self) -> Optional[list[float]]:
-        field = self.get_field(GpsMetadataVelocityField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @velocity.setter
-    def velocity(self, value: list[float]):
-        field = self.get_field(GpsMetadataVelocityField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class GpsMetadataTimestampMsField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp_ms',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class GpsMetadataPositionLatField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='position_lat',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class GpsMetadataPositionLongField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='position_long',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class GpsMetadataEnhancedAltitudeField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_altitude',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 500,
-                 scale = 5,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class GpsMetadataEnhancedSpeedField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class GpsMetadataHeadingField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='heading',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class GpsMetadataUtcTimestampField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='utc_timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class GpsMetadataVelocityField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='velocity',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    timestamp_ms: FieldProperty[int] = FieldProperty(0)
+    position_lat: FieldProperty[float] = FieldProperty(1)
+    position_long: FieldProperty[float] = FieldProperty(2)
+    enhanced_altitude: FieldProperty[float] = FieldProperty(3)
+    enhanced_speed: FieldProperty[float] = FieldProperty(4)
+    heading: FieldProperty[float] = FieldProperty(5)
+    utc_timestamp: FieldProperty[int] = FieldProperty(6)
+    velocity: FieldProperty[list[float]] = FieldProperty(7, is_array=True)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('GpsMetadataTimestampMsField', 0, 'timestamp_ms', BaseType.UINT16, 0, 1, 'ms', '', []),
+    ('GpsMetadataPositionLatField', 1, 'position_lat', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('GpsMetadataPositionLongField', 2, 'position_long', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('GpsMetadataEnhancedAltitudeField', 3, 'enhanced_altitude', BaseType.UINT32, 500, 5, 'm', '', []),
+    ('GpsMetadataEnhancedSpeedField', 4, 'enhanced_speed', BaseType.UINT32, 0, 1000, 'm/s', '', []),
+    ('GpsMetadataHeadingField', 5, 'heading', BaseType.UINT16, 0, 100, 'degrees', '', []),
+    ('GpsMetadataUtcTimestampField', 6, 'utc_timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('GpsMetadataVelocityField', 7, 'velocity', BaseType.SINT16, 0, 100, 'm/s', '', []),
+])
+
+(
+    TimestampField,
+    GpsMetadataTimestampMsField,
+    GpsMetadataPositionLatField,
+    GpsMetadataPositionLongField,
+    GpsMetadataEnhancedAltitudeField,
+    GpsMetadataEnhancedSpeedField,
+    GpsMetadataHeadingField,
+    GpsMetadataUtcTimestampField,
+    GpsMetadataVelocityField,
+) = FIELD_TYPES
+
+GpsMetadataMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class HrmProfileMessage(DataMessage):
     ID = 4
     NAME = 'hrm_profile'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=HrmProfileMessage.NAME,
@@ -37,25 +25,7 @@ class HrmProfileMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        HrmProfileEnabledField(
-            size=self.__get_field_size(definition_message, HrmProfileEnabledField.ID),
-            growable=definition_message is None), 
-        HrmProfileHrmAntIdField(
-            size=self.__get_field_size(definition_message, HrmProfileHrmAntIdField.ID),
-            growable=definition_message is None), 
-        HrmProfileLogHrvField(
-            size=self.__get_field_size(definition_message, HrmProfileLogHrvField.ID),
-            growable=definition_message is None), 
-        HrmProfileHrmAntIdTransTypeField(
-            size=self.__get_field_size(definition_message, HrmProfileHrmAntIdTransTypeField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=HrmProfileMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -64,213 +34,29 @@ class HrmProfileMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enabled(self) -> Optional[bool]:
-        field = self.get_field(HrmProfileEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enabled.setter
-    def enabled(self, value: bool):
-        field = self.get_field(HrmProfileEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def hrm_ant_id(self) -> Optional[int]:
-        field = self.get_field(HrmProfileHrmAntIdField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @hrm_ant_id.setter
-    def hrm_ant_id(self, value: int):
-        field = self.get_field(HrmProfileHrmAntIdField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def log_hrv(self) -> Optional[bool]:
-        field = self.get_field(HrmProfileLogHrvField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @log_hrv.setter
-    def log_hrv(self, value: bool):
-        field = self.get_field(HrmProfileLogHrvField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def hrm_ant_id_trans_type(self) -> Optional[int]:
-        field = self.get_field(HrmProfileHrmAntIdTransTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @hrm_ant_id_trans_type.setter
-    def hrm_ant_id_trans_type(self, value: int):
-        field = self.get_field(HrmProfileHrmAntIdTransTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HrmProfileEnabledField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HrmProfileHrmAntIdField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='hrm_ant_id',
-            field_id=self.ID,
-            base_type=BaseType.UINT16Z,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HrmProfileLogHrvField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='log_hrv',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HrmProfileHrmAntIdTransTypeField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='hrm_ant_id_trans_type',
-            field_id=self.ID,
-            base_type=BaseType.UINT8Z,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    message_index: FieldProperty[int] = FieldProperty(254)
+    enabled: FieldProperty[bool] = FieldProperty(0)
+    hrm_ant_id: FieldProperty[int] = FieldProperty(1)
+    log_hrv: FieldProperty[bool] = FieldProperty(2)
+    hrm_ant_id_trans_type: FieldProperty[int] = FieldProperty(3)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('HrmProfileEnabledField', 0, 'enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('HrmProfileHrmAntIdField', 1, 'hrm_ant_id', BaseType.UINT16Z, 0, 1, '', '', []),
+    ('HrmProfileLogHrvField', 2, 'log_hrv', BaseType.UINT8, 0, 1, '', '', []),
+    ('HrmProfileHrmAntIdTransTypeField', 3, 'hrm_ant_id_trans_type', BaseType.UINT8Z, 0, 1, '', '', []),
+])
+
+(
+    MessageIndexField,
+    HrmProfileEnabledField,
+    HrmProfileHrmAntIdField,
+    HrmProfileLogHrvField,
+    HrmProfileHrmAntIdTransTypeField,
+) = FIELD_TYPES
+
+HrmProfileMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
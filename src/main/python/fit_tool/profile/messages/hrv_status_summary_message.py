@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class HrvStatusSummaryMessage(DataMessage):
     ID = 370
     NAME = 'hrv_status_summary'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=HrvStatusSummaryMessage.NAME,
@@ -37,34 +25,7 @@ class HrvStatusSummaryMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        HrvStatusSummaryWeeklyAverageField(
-            size=self.__get_field_size(definition_message, HrvStatusSummaryWeeklyAverageField.ID),
-            growable=definition_message is None), 
-        HrvStatusSummaryLastNightAverageField(
-            size=self.__get_field_size(definition_message, HrvStatusSummaryLastNightAverageField.ID),
-            growable=definition_message is None), 
-        HrvStatusSummaryLastNight5MinHighField(
-            size=self.__get_field_size(definition_message, HrvStatusSummaryLastNight5MinHighField.ID),
-            growable=definition_message is None), 
-        HrvStatusSummaryBaselineLowUpperField(
-            size=self.__get_field_size(definition_message, HrvStatusSummaryBaselineLowUpperField.ID),
-            growable=definition_message is None), 
-        HrvStatusSummaryBaselineBalancedLowerField(
-            size=self.__get_field_size(definition_message, HrvStatusSummaryBaselineBalancedLowerField.ID),
-            growable=definition_message is None), 
-        HrvStatusSummaryBaselineBalancedUpperField(
-            size=self.__get_field_size(definition_message, HrvStatusSummaryBaselineBalancedUpperField.ID),
-            growable=definition_message is None), 
-        HrvStatusSummaryStatusField(
-            size=self.__get_field_size(definition_message, HrvStatusSummaryStatusField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=HrvStatusSummaryMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -73,352 +34,38 @@ class HrvStatusSummaryMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def weekly_average(self) -> Optional[float]:
-        field = self.get_field(HrvStatusSummaryWeeklyAverageField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @weekly_average.setter
-    def weekly_average(self, value: float):
-        field = self.get_field(HrvStatusSummaryWeeklyAverageField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def last_night_average(self) -> Optional[float]:
-        field = self.get_field(HrvStatusSummaryLastNightAverageField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @last_night_average.setter
-    def last_night_average(self, value: float):
-        field = self.get_field(HrvStatusSummaryLastNightAverageField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def last_night_5_min_high(self) -> Optional[float]:
-        field = self.get_field(HrvStatusSummaryLastNight5MinHighField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @last_night_5_min_high.setter
-    def last_night_5_min_high(self, value: float):
-        field = self.get_field(HrvStatusSummaryLastNight5MinHighField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def baseline_low_upper(self) -> Optional[float]:
-        field = self.get_field(HrvStatusSummaryBaselineLowUpperField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @baseline_low_upper.setter
-    def baseline_low_upper(self, value: float):
-        field = self.get_field(HrvStatusSummaryBaselineLowUpperField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def baseline_balanced_lower(self) -> Optional[float]:
-        field = self.get_field(HrvStatusSummaryBaselineBalancedLowerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @baseline_balanced_lower.setter
-    def baseline_balanced_lower(self, value: float):
-        field = self.get_field(HrvStatusSummaryBaselineBalancedLowerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def baseline_balanced_upper(self) -> Optional[float]:
-        field = self.get_field(HrvStatusSummaryBaselineBalancedUpperField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @baseline_balanced_upper.setter
-    def baseline_balanced_upper(self, value: float):
-        field = self.get_field(HrvStatusSummaryBaselineBalancedUpperField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def status(self) -> Optional[HrvStatus]:
-        field = self.get_field(HrvStatusSummaryStatusField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @status.setter
-    def status(self, value: HrvStatus):
-        field = self.get_field(HrvStatusSummaryStatusField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HrvStatusSummaryWeeklyAverageField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='weekly_average',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 128,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HrvStatusSummaryLastNightAverageField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='last_night_average',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 128,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HrvStatusSummaryLastNight5MinHighField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='last_night_5_min_high',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 128,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HrvStatusSummaryBaselineLowUpperField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='baseline_low_upper',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 128,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HrvStatusSummaryBaselineBalancedLowerField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='baseline_balanced_lower',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 128,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HrvStatusSummaryBaselineBalancedUpperField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='baseline_balanced_upper',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 128,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HrvStatusSummaryStatusField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='status',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    weekly_average: FieldProperty[float] = FieldProperty(0)
+    last_night_average: FieldProperty[float] = FieldProperty(1)
+    last_night_5_min_high: FieldProperty[float] = FieldProperty(2)
+    baseline_low_upper: FieldProperty[float] = FieldProperty(3)
+    baseline_balanced_lower: FieldProperty[float] = FieldProperty(4)
+    baseline_balanced_upper: FieldProperty[float] = FieldProperty(5)
+    status: FieldProperty[HrvStatus] = FieldProperty(6)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('HrvStatusSummaryWeeklyAverageField', 0, 'weekly_average', BaseType.UINT16, 0, 128, 'ms', '', []),
+    ('HrvStatusSummaryLastNightAverageField', 1, 'last_night_average', BaseType.UINT16, 0, 128, 'ms', '', []),
+    ('HrvStatusSummaryLastNight5MinHighField', 2, 'last_night_5_min_high', BaseType.UINT16, 0, 128, 'ms', '', []),
+    ('HrvStatusSummaryBaselineLowUpperField', 3, 'baseline_low_upper', BaseType.UINT16, 0, 128, 'ms', '', []),
+    ('HrvStatusSummaryBaselineBalancedLowerField', 4, 'baseline_balanced_lower', BaseType.UINT16, 0, 128, 'ms', '', []),
+    ('HrvStatusSummaryBaselineBalancedUpperField', 5, 'baseline_balanced_upper', BaseType.UINT16, 0, 128, 'ms', '', []),
+    ('HrvStatusSummaryStatusField', 6, 'status', BaseType.ENUM, 0, 1, '', '', []),
+])
+
+(
+    TimestampField,
+    HrvStatusSummaryWeeklyAverageField,
+    HrvStatusSummaryLastNightAverageField,
+    HrvStatusSummaryLastNight5MinHighField,
+    HrvStatusSummaryBaselineLowUpperField,
+    HrvStatusSummaryBaselineBalancedLowerField,
+    HrvStatusSummaryBaselineBalancedUpperField,
+    HrvStatusSummaryStatusField,
+) = FIELD_TYPES
+
+HrvStatusSummaryMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class HsaAccelerometerDataMessage(DataMessage):
     ID = 302
     NAME = 'hsa_accelerometer_data'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=HsaAccelerometerDataMessage.NAME,
@@ -37,31 +25,7 @@ class HsaAccelerometerDataMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        HsaAccelerometerDataTimestampMsField(
-            size=self.__get_field_size(definition_message, HsaAccelerometerDataTimestampMsField.ID),
-            growable=definition_message is None), 
-        HsaAccelerometerDataSamplingIntervalField(
-            size=self.__get_field_size(definition_message, HsaAccelerometerDataSamplingIntervalField.ID),
-            growable=definition_message is None), 
-        HsaAccelerometerDataAccelXField(
-            size=self.__get_field_size(definition_message, HsaAccelerometerDataAccelXField.ID),
-            growable=definition_message is None), 
-        HsaAccelerometerDataAccelYField(
-            size=self.__get_field_size(definition_message, HsaAccelerometerDataAccelYField.ID),
-            growable=definition_message is None), 
-        HsaAccelerometerDataAccelZField(
-            size=self.__get_field_size(definition_message, HsaAccelerometerDataAccelZField.ID),
-            growable=definition_message is None), 
-        HsaAccelerometerDataTimestamp32kField(
-            size=self.__get_field_size(definition_message, HsaAccelerometerDataTimestamp32kField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=HsaAccelerometerDataMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -70,303 +34,35 @@ class HsaAccelerometerDataMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def timestamp_ms(self) -> Optional[int]:
-        field = self.get_field(HsaAccelerometerDataTimestampMsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @timestamp_ms.setter
-    def timestamp_ms(self, value: int):
-        field = self.get_field(HsaAccelerometerDataTimestampMsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sampling_interval(self) -> Optional[int]:
-        field = self.get_field(HsaAccelerometerDataSamplingIntervalField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sampling_interval.setter
-    def sampling_interval(self, value: int):
-        field = self.get_field(HsaAccelerometerDataSamplingIntervalField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def accel_x(self) -> Optional[list[float]]:
-        field = self.get_field(HsaAccelerometerDataAccelXField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @accel_x.setter
-    def accel_x(self, value: list[float]):
-        field = self.get_field(HsaAccelerometerDataAccelXField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def accel_y(self) -> Optional[list[float]]:
-        field = self.get_field(HsaAccelerometerDataAccelYField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @accel_y.setter
-    def accel_y(self, value: list[float]):
-        field = self.get_field(HsaAccelerometerDataAccelYField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def accel_z(self) -> Optional[list[float]]:
-        field = self.get_field(HsaAccelerometerDataAccelZField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @accel_z.setter
-    def accel_z(self, value: list[float]):
-        field = self.get_field(HsaAccelerometerDataAccelZField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def timestamp_32k(self) -> Optional[int]:
-        field = self.get_field(HsaAccelerometerDataTimestamp32kField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @timestamp_32k.setter
-    def timestamp_32k(self, value: int):
-        field = self.get_field(HsaAccelerometerDataTimestamp32kField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaAccelerometerDataTimestampMsField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp_ms',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaAccelerometerDataSamplingIntervalField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sampling_interval',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaAccelerometerDataAccelXField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='accel_x',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1.024,
-                         size = size,
-        units = 'mG',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaAccelerometerDataAccelYField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='accel_y',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1.024,
-                         size = size,
-        units = 'mG',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaAccelerometerDataAccelZField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='accel_z',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1.024,
-                         size = size,
-        units = 'mG',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaAccelerometerDataTimestamp32kField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp_32k',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    timestamp_ms: FieldProperty[int] = FieldProperty(0)
+    sampling_interval: FieldProperty[int] = FieldProperty(1)
+    accel_x: FieldProperty[list[float]] = FieldProperty(2, is_array=True)
+    accel_y: FieldProperty[list[float]] = FieldProperty(3, is_array=True)
+    accel_z: FieldProperty[list[float]] = FieldProperty(4, is_array=True)
+    timestamp_32k: FieldProperty[int] = FieldProperty(5)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('HsaAccelerometerDataTimestampMsField', 0, 'timestamp_ms', BaseType.UINT16, 0, 1, 'ms', '', []),
+    ('HsaAccelerometerDataSamplingIntervalField', 1, 'sampling_interval', BaseType.UINT16, 0, 1, 'ms', '', []),
+    ('HsaAccelerometerDataAccelXField', 2, 'accel_x', BaseType.SINT16, 0, 1.024, 'mG', '', []),
+    ('HsaAccelerometerDataAccelYField', 3, 'accel_y', BaseType.SINT16, 0, 1.024, 'mG', '', []),
+    ('HsaAccelerometerDataAccelZField', 4, 'accel_z', BaseType.SINT16, 0, 1.024, 'mG', '', []),
+    ('HsaAccelerometerDataTimestamp32kField', 5, 'timestamp_32k', BaseType.UINT32, 0, 1, '', '', []),
+])
+
+(
+    TimestampField,
+    HsaAccelerometerDataTimestampMsField,
+    HsaAccelerometerDataSamplingIntervalField,
+    HsaAccelerometerDataAccelXField,
+    HsaAccelerometerDataAccelYField,
+    HsaAccelerometerDataAccelZField,
+    HsaAccelerometerDataTimestamp32kField,
+) = FIELD_TYPES
+
+HsaAccelerometerDataMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
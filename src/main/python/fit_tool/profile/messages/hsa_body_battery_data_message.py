@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class HsaBodyBatteryDataMessage(DataMessage):
     ID = 314
     NAME = 'hsa_body_battery_data'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=HsaBodyBatteryDataMessage.NAME,
@@ -37,25 +25,7 @@ class HsaBodyBatteryDataMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        HsaBodyBatteryDataProcessingIntervalField(
-            size=self.__get_field_size(definition_message, HsaBodyBatteryDataProcessingIntervalField.ID),
-            growable=definition_message is None), 
-        HsaBodyBatteryDataLevelField(
-            size=self.__get_field_size(definition_message, HsaBodyBatteryDataLevelField.ID),
-            growable=definition_message is None), 
-        HsaBodyBatteryDataChargedField(
-            size=self.__get_field_size(definition_message, HsaBodyBatteryDataChargedField.ID),
-            growable=definition_message is None), 
-        HsaBodyBatteryDataUnchargedField(
-            size=self.__get_field_size(definition_message, HsaBodyBatteryDataUnchargedField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=HsaBodyBatteryDataMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -64,215 +34,29 @@ class HsaBodyBatteryDataMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def processing_interval(self) -> Optional[int]:
-        field = self.get_field(HsaBodyBatteryDataProcessingIntervalField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @processing_interval.setter
-    def processing_interval(self, value: int):
-        field = self.get_field(HsaBodyBatteryDataProcessingIntervalField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def level(self) -> Optional[list[int]]:
-        field = self.get_field(HsaBodyBatteryDataLevelField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @level.setter
-    def level(self, value: list[int]):
-        field = self.get_field(HsaBodyBatteryDataLevelField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def charged(self) -> Optional[list[int]]:
-        field = self.get_field(HsaBodyBatteryDataChargedField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @charged.setter
-    def charged(self, value: list[int]):
-        field = self.get_field(HsaBodyBatteryDataChargedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def uncharged(self) -> Optional[list[int]]:
-        field = self.get_field(HsaBodyBatteryDataUnchargedField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @uncharged.setter
-    def uncharged(self, value: list[int]):
-        field = self.get_field(HsaBodyBatteryDataUnchargedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaBodyBatteryDataProcessingIntervalField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='processing_interval',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaBodyBatteryDataLevelField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='level',
-            field_id=self.ID,
-            base_type=BaseType.SINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaBodyBatteryDataChargedField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='charged',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaBodyBatteryDataUnchargedField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='uncharged',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    processing_interval: FieldProperty[int] = FieldProperty(0)
+    level: FieldProperty[list[int]] = FieldProperty(1, is_array=True)
+    charged: FieldProperty[list[int]] = FieldProperty(2, is_array=True)
+    uncharged: FieldProperty[list[int]] = FieldProperty(3, is_array=True)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('HsaBodyBatteryDataProcessingIntervalField', 0, 'processing_interval', BaseType.UINT16, 0, 1, 's', '', []),
+    ('HsaBodyBatteryDataLevelField', 1, 'level', BaseType.SINT8, 0, 1, 'percent', '', []),
+    ('HsaBodyBatteryDataChargedField', 2, 'charged', BaseType.SINT16, 0, 1, '', '', []),
+    ('HsaBodyBatteryDataUnchargedField', 3, 'uncharged', BaseType.SINT16, 0, 1, '', '', []),
+])
+
+(
+    TimestampField,
+    HsaBodyBatteryDataProcessingIntervalField,
+    HsaBodyBatteryDataLevelField,
+    HsaBodyBatteryDataChargedField,
+    HsaBodyBatteryDataUnchargedField,
+) = FIELD_TYPES
+
+HsaBodyBatteryDataMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
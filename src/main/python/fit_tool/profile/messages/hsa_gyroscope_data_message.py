@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class HsaGyroscopeDataMessage(DataMessage):
     ID = 376
     NAME = 'hsa_gyroscope_data'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=HsaGyroscopeDataMessage.NAME,
@@ -37,31 +25,7 @@ class HsaGyroscopeDataMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        HsaGyroscopeDataTimestampMsField(
-            size=self.__get_field_size(definition_message, HsaGyroscopeDataTimestampMsField.ID),
-            growable=definition_message is None), 
-        HsaGyroscopeDataSamplingIntervalField(
-            size=self.__get_field_size(definition_message, HsaGyroscopeDataSamplingIntervalField.ID),
-            growable=definition_message is None), 
-        HsaGyroscopeDataGyroXField(
-            size=self.__get_field_size(definition_message, HsaGyroscopeDataGyroXField.ID),
-            growable=definition_message is None), 
-        HsaGyroscopeDataGyroYField(
-            size=self.__get_field_size(definition_message, HsaGyroscopeDataGyroYField.ID),
-            growable=definition_message is None), 
-        HsaGyroscopeDataGyroZField(
-            size=self.__get_field_size(definition_message, HsaGyroscopeDataGyroZField.ID),
-            growable=definition_message is None), 
-        HsaGyroscopeDataTimestamp32kField(
-            size=self.__get_field_size(definition_message, HsaGyroscopeDataTimestamp32kField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=HsaGyroscopeDataMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -70,305 +34,35 @@ class HsaGyroscopeDataMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def timestamp_ms(self) -> Optional[int]:
-        field = self.get_field(HsaGyroscopeDataTimestampMsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @timestamp_ms.setter
-    def timestamp_ms(self, value: int):
-        field = self.get_field(HsaGyroscopeDataTimestampMsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sampling_interval(self) -> Optional[int]:
-        field = self.get_field(HsaGyroscopeDataSamplingIntervalField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sampling_interval.setter
-    def sampling_interval(self, value: int):
-        field = self.get_field(HsaGyroscopeDataSamplingIntervalField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def gyro_x(self) -> Optional[list[float]]:
-        field = self.get_field(HsaGyroscopeDataGyroXField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @gyro_x.setter
-    def gyro_x(self, value: list[float]):
-        field = self.get_field(HsaGyroscopeDataGyroXField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def gyro_y(self) -> Optional[list[float]]:
-        field = self.get_field(HsaGyroscopeDataGyroYField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @gyro_y.setter
-    def gyro_y(self, value: list[float]):
-        field = self.get_field(HsaGyroscopeDataGyroYField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def gyro_z(self) -> Optional[list[float]]:
-        field = self.get_field(HsaGyroscopeDataGyroZField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @gyro_z.setter
-    def gyro_z(self, value: list[float]):
-        field = self.get_field(HsaGyroscopeDataGyroZField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def timestamp_32k(self) -> Optional[int]:
-        field = self.get_field(HsaGyroscopeDataTimestamp32kField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @timestamp_32k.setter
-    def timestamp_32k(self, value: int):
-        field = self.get_field(HsaGyroscopeDataTimestamp32kField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaGyroscopeDataTimestampMsField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp_ms',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaGyroscopeDataSamplingIntervalField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sampling_interval',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = '1/32768 s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaGyroscopeDataGyroXField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='gyro_x',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 28.57143,
-                         size = size,
-        units = 'deg/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaGyroscopeDataGyroYField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='gyro_y',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 28.57143,
-                         size = size,
-        units = 'deg/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaGyroscopeDataGyroZField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='gyro_z',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 28.57143,
-                         size = size,
-        units = 'deg/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class HsaGyroscopeDataTimestamp32kField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp_32k',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = '1/32768 s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    timestamp_ms: FieldProperty[int] = FieldProperty(0)
+    sampling_interval: FieldProperty[int] = FieldProperty(1)
+    gyro_x: FieldProperty[list[float]] = FieldProperty(2, is_array=True)
+    gyro_y: FieldProperty[list[float]] = FieldProperty(3, is_array=True)
+    gyro_z: FieldProperty[list[float]] = FieldProperty(4, is_array=True)
+    timestamp_32k: FieldProperty[int] = FieldProperty(5)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('HsaGyroscopeDataTimestampMsField', 0, 'timestamp_ms', BaseType.UINT16, 0, 1, 'ms', '', []),
+    ('HsaGyroscopeDataSamplingIntervalField', 1, 'sampling_interval', BaseType.UINT16, 0, 1, '1/32768 s', '', []),
+    ('HsaGyroscopeDataGyroXField', 2, 'gyro_x', BaseType.SINT16, 0, 28.57143, 'deg/s', '', []),
+    ('HsaGyroscopeDataGyroYField', 3, 'gyro_y', BaseType.SINT16, 0, 28.57143, 'deg/s', '', []),
+    ('HsaGyroscopeDataGyroZField', 4, 'gyro_z', BaseType.SINT16, 0, 28.57143, 'deg/s', '', []),
+    ('HsaGyroscopeDataTimestamp32kField', 5, 'timestamp_32k', BaseType.UINT32, 0, 1, '1/32768 s', '', []),
+])
+
+(
+    TimestampField,
+    HsaGyroscopeDataTimestampMsField,
+    HsaGyroscopeDataSamplingIntervalField,
+    HsaGyroscopeDataGyroXField,
+    HsaGyroscopeDataGyroYField,
+    HsaGyroscopeDataGyroZField,
+    HsaGyroscopeDataTimestamp32kField,
+) = FIELD_TYPES
+
+HsaGyroscopeDataMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
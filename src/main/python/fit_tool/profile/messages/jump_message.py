@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class JumpMessage(DataMessage):
     ID = 285
     NAME = 'jump'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=JumpMessage.NAME,
@@ -37,40 +25,7 @@ class JumpMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        JumpDistanceField(
-            size=self.__get_field_size(definition_message, JumpDistanceField.ID),
-            growable=definition_message is None), 
-        JumpHeightField(
-            size=self.__get_field_size(definition_message, JumpHeightField.ID),
-            growable=definition_message is None), 
-        JumpRotationsField(
-            size=self.__get_field_size(definition_message, JumpRotationsField.ID),
-            growable=definition_message is None), 
-        JumpHangTimeField(
-            size=self.__get_field_size(definition_message, JumpHangTimeField.ID),
-            growable=definition_message is None), 
-        JumpScoreField(
-            size=self.__get_field_size(definition_message, JumpScoreField.ID),
-            growable=definition_message is None), 
-        JumpPositionLatField(
-            size=self.__get_field_size(definition_message, JumpPositionLatField.ID),
-            growable=definition_message is None), 
-        JumpPositionLongField(
-            size=self.__get_field_size(definition_message, JumpPositionLongField.ID),
-            growable=definition_message is None), 
-        JumpSpeedField(
-            size=self.__get_field_size(definition_message, JumpSpeedField.ID),
-            growable=definition_message is None), 
-        JumpEnhancedSpeedField(
-            size=self.__get_field_size(definition_message, JumpEnhancedSpeedField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=JumpMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -79,436 +34,44 @@ class JumpMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def distance(self) -> Optional[float]:
-        field = self.get_field(JumpDistanceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @distance.setter
-    def distance(self, value: float):
-        field = self.get_field(JumpDistanceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def height(self) -> Optional[float]:
-        field = self.get_field(JumpHeightField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @height.setter
-    def height(self, value: float):
-        field = self.get_field(JumpHeightField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def rotations(self) -> Optional[int]:
-        field = self.get_field(JumpRotationsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @rotations.setter
-    def rotations(self, value: int):
-        field = self.get_field(JumpRotationsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def hang_time(self) -> Optional[float]:
-        field = self.get_field(JumpHangTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @hang_time.setter
-    def hang_time(self, value: float):
-        field = self.get_field(JumpHangTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def score(self) -> Optional[float]:
-        field = self.get_field(JumpScoreField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @score.setter
-    def score(self, value: float):
-        field = self.get_field(JumpScoreField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def position_lat(self) -> Optional[float]:
-        field = self.get_field(JumpPositionLatField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @position_lat.setter
-    def position_lat(self, value: float):
-        field = self.get_field(JumpPositionLatField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def position_long(self) -> Optional[float]:
-        field = self.get_field(JumpPositionLongField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @position_long.setter
-    def position_long(self, value: float):
-        field = self.get_field(JumpPositionLongField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def speed(self) -> Optional[float]:
-        field = self.get_field(JumpSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @speed.setter
-    def speed(self, value: float):
-        field = self.get_field(JumpSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enhanced_speed(self) -> Optional[float]:
-        field = self.get_field(JumpEnhancedSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_speed.setter
-    def enhanced_speed(self, value: float):
-        field = self.get_field(JumpEnhancedSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class JumpDistanceField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='distance',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class JumpHeightField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='height',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class JumpRotationsField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='rotations',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class JumpHangTimeField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='hang_time',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class JumpScoreField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='score',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class JumpPositionLatField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='position_lat',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class JumpPositionLongField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='position_long',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class JumpSpeedField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class JumpEnhancedSpeedField(Field):
-    ID = 8
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    distance: FieldProperty[float] = FieldProperty(0)
+    height: FieldProperty[float] = FieldProperty(1)
+    rotations: FieldProperty[int] = FieldProperty(2)
+    hang_time: FieldProperty[float] = FieldProperty(3)
+    score: FieldProperty[float] = FieldProperty(4)
+    position_lat: FieldProperty[float] = FieldProperty(5)
+    position_long: FieldProperty[float] = FieldProperty(6)
+    speed: FieldProperty[float] = FieldProperty(7)
+    enhanced_speed: FieldProperty[float] = FieldProperty(8)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('JumpDistanceField', 0, 'distance', BaseType.FLOAT32, 0, 1, 'm', '', []),
+    ('JumpHeightField', 1, 'height', BaseType.FLOAT32, 0, 1, 'm', '', []),
+    ('JumpRotationsField', 2, 'rotations', BaseType.UINT8, 0, 1, '', '', []),
+    ('JumpHangTimeField', 3, 'hang_time', BaseType.FLOAT32, 0, 1, 's', '', []),
+    ('JumpScoreField', 4, 'score', BaseType.FLOAT32, 0, 1, '', '', []),
+    ('JumpPositionLatField', 5, 'position_lat', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('JumpPositionLongField', 6, 'position_long', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('JumpSpeedField', 7, 'speed', BaseType.UINT16, 0, 1000, 'm/s', '', []),
+    ('JumpEnhancedSpeedField', 8, 'enhanced_speed', BaseType.UINT32, 0, 1000, 'm/s', '', []),
+])
+
+(
+    TimestampField,
+    JumpDistanceField,
+    JumpHeightField,
+    JumpRotationsField,
+    JumpHangTimeField,
+    JumpScoreField,
+    JumpPositionLatField,
+    JumpPositionLongField,
+    JumpSpeedField,
+    JumpEnhancedSpeedField,
+) = FIELD_TYPES
+
+JumpMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
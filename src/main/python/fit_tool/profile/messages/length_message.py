@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class LengthMessage(DataMessage):
     ID = 101
     NAME = 'length'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=LengthMessage.NAME,
@@ -37,76 +25,7 @@ class LengthMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        LengthEventField(
-            size=self.__get_field_size(definition_message, LengthEventField.ID),
-            growable=definition_message is None), 
-        LengthEventTypeField(
-            size=self.__get_field_size(definition_message, LengthEventTypeField.ID),
-            growable=definition_message is None), 
-        LengthStartTimeField(
-            size=self.__get_field_size(definition_message, LengthStartTimeField.ID),
-            growable=definition_message is None), 
-        LengthTotalElapsedTimeField(
-            size=self.__get_field_size(definition_message, LengthTotalElapsedTimeField.ID),
-            growable=definition_message is None), 
-        LengthTotalTimerTimeField(
-            size=self.__get_field_size(definition_message, LengthTotalTimerTimeField.ID),
-            growable=definition_message is None), 
-        LengthTotalStrokesField(
-            size=self.__get_field_size(definition_message, LengthTotalStrokesField.ID),
-            growable=definition_message is None), 
-        LengthAvgSpeedField(
-            size=self.__get_field_size(definition_message, LengthAvgSpeedField.ID),
-            growable=definition_message is None), 
-        LengthSwimStrokeField(
-            size=self.__get_field_size(definition_message, LengthSwimStrokeField.ID),
-            growable=definition_message is None), 
-        LengthAvgSwimmingCadenceField(
-            size=self.__get_field_size(definition_message, LengthAvgSwimmingCadenceField.ID),
-            growable=definition_message is None), 
-        LengthEventGroupField(
-            size=self.__get_field_size(definition_message, LengthEventGroupField.ID),
-            growable=definition_message is None), 
-        LengthTotalCaloriesField(
-            size=self.__get_field_size(definition_message, LengthTotalCaloriesField.ID),
-            growable=definition_message is None), 
-        LengthLengthTypeField(
-            size=self.__get_field_size(definition_message, LengthLengthTypeField.ID),
-            growable=definition_message is None), 
-        LengthPlayerScoreField(
-            size=self.__get_field_size(definition_message, LengthPlayerScoreField.ID),
-            growable=definition_message is None), 
-        LengthOpponentScoreField(
-            size=self.__get_field_size(definition_message, LengthOpponentScoreField.ID),
-            growable=definition_message is None), 
-        LengthStrokeCountField(
-            size=self.__get_field_size(definition_message, LengthStrokeCountField.ID),
-            growable=definition_message is None), 
-        LengthZoneCountField(
-            size=self.__get_field_size(definition_message, LengthZoneCountField.ID),
-            growable=definition_message is None), 
-        LengthEnhancedAvgRespirationRateField(
-            size=self.__get_field_size(definition_message, LengthEnhancedAvgRespirationRateField.ID),
-            growable=definition_message is None), 
-        LengthEnhancedMaxRespirationRateField(
-            size=self.__get_field_size(definition_message, LengthEnhancedMaxRespirationRateField.ID),
-            growable=definition_message is None), 
-        LengthAvgRespirationRateField(
-            size=self.__get_field_size(definition_message, LengthAvgRespirationRateField.ID),
-            growable=definition_message is None), 
-        LengthMaxRespirationRateField(
-            size=self.__get_field_size(definition_message, LengthMaxRespirationRateField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=LengthMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -115,936 +34,80 @@ class LengthMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def event(self) -> Optional[Event]:
-        field = self.get_field(LengthEventField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @event.setter
-    def event(self, value: Event):
-        field = self.get_field(LengthEventField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def event_type(self) -> Optional[EventType]:
-        field = self.get_field(LengthEventTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @event_type.setter
-    def event_type(self, value: EventType):
-        field = self.get_field(LengthEventTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def start_time(self) -> Optional[int]:
-        field = self.get_field(LengthStartTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @start_time.setter
-    def start_time(self, value: int):
-        field = self.get_field(LengthStartTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_elapsed_time(self) -> Optional[float]:
-        field = self.get_field(LengthTotalElapsedTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_elapsed_time.setter
-    def total_elapsed_time(self, value: float):
-        field = self.get_field(LengthTotalElapsedTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_timer_time(self) -> Optional[float]:
-        field = self.get_field(LengthTotalTimerTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_timer_time.setter
-    def total_timer_time(self, value: float):
-        field = self.get_field(LengthTotalTimerTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_strokes(self) -> Optional[int]:
-        field = self.get_field(LengthTotalStrokesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_strokes.setter
-    def total_strokes(self, value: int):
-        field = self.get_field(LengthTotalStrokesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_speed(self) -> Optional[float]:
-        field = self.get_field(LengthAvgSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_speed.setter
-    def avg_speed(self, value: float):
-        field = self.get_field(LengthAvgSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def swim_stroke(self) -> Optional[SwimStroke]:
-        field = self.get_field(LengthSwimStrokeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @swim_stroke.setter
-    def swim_stroke(self, value: SwimStroke):
-        field = self.get_field(LengthSwimStrokeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_swimming_cadence(self) -> Optional[int]:
-        field = self.get_field(LengthAvgSwimmingCadenceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_swimming_cadence.setter
-    def avg_swimming_cadence(self, value: int):
-        field = self.get_field(LengthAvgSwimmingCadenceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def event_group(self) -> Optional[int]:
-        field = self.get_field(LengthEventGroupField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @event_group.setter
-    def event_group(self, value: int):
-        field = self.get_field(LengthEventGroupField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_calories(self) -> Optional[int]:
-        field = self.get_field(LengthTotalCaloriesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_calories.setter
-    def total_calories(self, value: int):
-        field = self.get_field(LengthTotalCaloriesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def length_type(self) -> Optional[LengthType]:
-        field = self.get_field(LengthLengthTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @length_type.setter
-    def length_type(self, value: LengthType):
-        field = self.get_field(LengthLengthTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def player_score(self) -> Optional[int]:
-        field = self.get_field(LengthPlayerScoreField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @player_score.setter
-    def player_score(self, value: int):
-        field = self.get_field(LengthPlayerScoreField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def opponent_score(self) -> Optional[int]:
-        field = self.get_field(LengthOpponentScoreField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @opponent_score.setter
-    def opponent_score(self, value: int):
-        field = self.get_field(LengthOpponentScoreField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def stroke_count(self) -> Optional[list[int]]:
-        field = self.get_field(LengthStrokeCountField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @stroke_count.setter
-    def stroke_count(self, value: list[int]):
-        field = self.get_field(LengthStrokeCountField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def zone_count(self) -> Optional[list[int]]:
-        field = self.get_field(LengthZoneCountField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @zone_count.setter
-    def zone_count(self, value: list[int]):
-        field = self.get_field(LengthZoneCountField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def enhanced_avg_respiration_rate(self) -> Optional[float]:
-        field = self.get_field(LengthEnhancedAvgRespirationRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_avg_respiration_rate.setter
-    def enhanced_avg_respiration_rate(self, value: float):
-        field = self.get_field(LengthEnhancedAvgRespirationRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enhanced_max_respiration_rate(self) -> Optional[float]:
-        field = self.get_field(LengthEnhancedMaxRespirationRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_max_respiration_rate.setter
-    def enhanced_max_respiration_rate(self, value: float):
-        field = self.get_field(LengthEnhancedMaxRespirationRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_respiration_rate(self) -> Optional[int]:
-        field = self.get_field(LengthAvgRespirationRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_respiration_rate.setter
-    def avg_respiration_rate(self, value: int):
-        field = self.get_field(LengthAvgRespirationRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_respiration_rate(self) -> Optional[int]:
-        field = self.get_field(LengthMaxRespirationRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_respiration_rate.setter
-    def max_respiration_rate(self, value: int):
-        field = self.get_field(LengthMaxRespirationRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthEventField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='event',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthEventTypeField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='event_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthStartTimeField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='start_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthTotalElapsedTimeField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_elapsed_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthTotalTimerTimeField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_timer_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthTotalStrokesField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_strokes',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'strokes',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthAvgSpeedField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthSwimStrokeField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='swim_stroke',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'swim_stroke',
-        type_name = 'swim_stroke',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthAvgSwimmingCadenceField(Field):
-    ID = 9
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_swimming_cadence',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'strokes/min',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthEventGroupField(Field):
-    ID = 10
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='event_group',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthTotalCaloriesField(Field):
-    ID = 11
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_calories',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'kcal',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthLengthTypeField(Field):
-    ID = 12
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='length_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthPlayerScoreField(Field):
-    ID = 18
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='player_score',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthOpponentScoreField(Field):
-    ID = 19
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='opponent_score',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthStrokeCountField(Field):
-    ID = 20
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='stroke_count',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'counts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthZoneCountField(Field):
-    ID = 21
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='zone_count',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'counts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthEnhancedAvgRespirationRateField(Field):
-    ID = 22
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_avg_respiration_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'Breaths/min',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthEnhancedMaxRespirationRateField(Field):
-    ID = 23
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_max_respiration_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'Breaths/min',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthAvgRespirationRateField(Field):
-    ID = 24
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_respiration_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class LengthMaxRespirationRateField(Field):
-    ID = 25
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_respiration_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    message_index: FieldProperty[int] = FieldProperty(254)
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    event: FieldProperty[Event] = FieldProperty(0)
+    event_type: FieldProperty[EventType] = FieldProperty(1)
+    start_time: FieldProperty[int] = FieldProperty(2)
+    total_elapsed_time: FieldProperty[float] = FieldProperty(3)
+    total_timer_time: FieldProperty[float] = FieldProperty(4)
+    total_strokes: FieldProperty[int] = FieldProperty(5)
+    avg_speed: FieldProperty[float] = FieldProperty(6)
+    swim_stroke: FieldProperty[SwimStroke] = FieldProperty(7)
+    avg_swimming_cadence: FieldProperty[int] = FieldProperty(9)
+    event_group: FieldProperty[int] = FieldProperty(10)
+    total_calories: FieldProperty[int] = FieldProperty(11)
+    length_type: FieldProperty[LengthType] = FieldProperty(12)
+    player_score: FieldProperty[int] = FieldProperty(18)
+    opponent_score: FieldProperty[int] = FieldProperty(19)
+    stroke_count: FieldProperty[list[int]] = FieldProperty(20, is_array=True)
+    zone_count: FieldProperty[list[int]] = FieldProperty(21, is_array=True)
+    enhanced_avg_respiration_rate: FieldProperty[float] = FieldProperty(22)
+    enhanced_max_respiration_rate: FieldProperty[float] = FieldProperty(23)
+    avg_respiration_rate: FieldProperty[int] = FieldProperty(24)
+    max_respiration_rate: FieldProperty[int] = FieldProperty(25)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('LengthEventField', 0, 'event', BaseType.ENUM, 0, 1, '', '', []),
+    ('LengthEventTypeField', 1, 'event_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('LengthStartTimeField', 2, 'start_time', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('LengthTotalElapsedTimeField', 3, 'total_elapsed_time', BaseType.UINT32, 0, 1000, 's', '', []),
+    ('LengthTotalTimerTimeField', 4, 'total_timer_time', BaseType.UINT32, 0, 1000, 's', '', []),
+    ('LengthTotalStrokesField', 5, 'total_strokes', BaseType.UINT16, 0, 1, 'strokes', '', []),
+    ('LengthAvgSpeedField', 6, 'avg_speed', BaseType.UINT16, 0, 1000, 'm/s', '', []),
+    ('LengthSwimStrokeField', 7, 'swim_stroke', BaseType.ENUM, 0, 1, 'swim_stroke', 'swim_stroke', []),
+    ('LengthAvgSwimmingCadenceField', 9, 'avg_swimming_cadence', BaseType.UINT8, 0, 1, 'strokes/min', '', []),
+    ('LengthEventGroupField', 10, 'event_group', BaseType.UINT8, 0, 1, '', '', []),
+    ('LengthTotalCaloriesField', 11, 'total_calories', BaseType.UINT16, 0, 1, 'kcal', '', []),
+    ('LengthLengthTypeField', 12, 'length_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('LengthPlayerScoreField', 18, 'player_score', BaseType.UINT16, 0, 1, '', '', []),
+    ('LengthOpponentScoreField', 19, 'opponent_score', BaseType.UINT16, 0, 1, '', '', []),
+    ('LengthStrokeCountField', 20, 'stroke_count', BaseType.UINT16, 0, 1, 'counts', '', []),
+    ('LengthZoneCountField', 21, 'zone_count', BaseType.UINT16, 0, 1, 'counts', '', []),
+    ('LengthEnhancedAvgRespirationRateField', 22, 'enhanced_avg_respiration_rate', BaseType.UINT16, 0, 100, 'Breaths/min', '', []),
+    ('LengthEnhancedMaxRespirationRateField', 23, 'enhanced_max_respiration_rate', BaseType.UINT16, 0, 100, 'Breaths/min', '', []),
+    ('LengthAvgRespirationRateField', 24, 'avg_respiration_rate', BaseType.UINT8, 0, 1, '', '', []),
+    ('LengthMaxRespirationRateField', 25, 'max_respiration_rate', BaseType.UINT8, 0, 1, '', '', []),
+])
+
+(
+    MessageIndexField,
+    TimestampField,
+    LengthEventField,
+    LengthEventTypeField,
+    LengthStartTimeField,
+    LengthTotalElapsedTimeField,
+    LengthTotalTimerTimeField,
+    LengthTotalStrokesField,
+    LengthAvgSpeedField,
+    LengthSwimStrokeField,
+    LengthAvgSwimmingCadenceField,
+    LengthEventGroupField,
+    LengthTotalCaloriesField,
+    LengthLengthTypeField,
+    LengthPlayerScoreField,
+    LengthOpponentScoreField,
+    LengthStrokeCountField,
+    LengthZoneCountField,
+    LengthEnhancedAvgRespirationRateField,
+    LengthEnhancedMaxRespirationRateField,
+    LengthAvgRespirationRateField,
+    LengthMaxRespirationRateField,
+) = FIELD_TYPES
+
+LengthMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class LocationSettingsMessage(DataMessage):
     ID = 189
     NAME = 'location_settings'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=LocationSettingsMessage.NAME,
@@ -37,13 +25,7 @@ class LocationSettingsMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        LocationSettingsLocationSettingsField(
-            size=self.__get_field_size(definition_message, LocationSettingsLocationSettingsField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=LocationSettingsMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -52,49 +34,17 @@ class LocationSettingsMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
+    location_settings: FieldProperty[LocationSettings] = FieldProperty(0)
 
 
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('LocationSettingsLocationSettingsField', 0, 'location_settings', BaseType.ENUM, 0, 1, '', '', []),
+])
 
-    @property
-    def location_settings(self) -> Optional[LocationSettings]:
-        field = self.get_field(LocationSettingsLocationSettingsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @location_settings.setter
-    def location_settings(self, value: LocationSettings):
-        field = self.get_field(LocationSettingsLocationSettingsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class LocationSettingsLocationSettingsField(Field):
-    ID = 0
+(
+    LocationSettingsLocationSettingsField,
+) = FIELD_TYPES
 
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='location_settings',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+LocationSettingsMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class MagnetometerDataMessage(DataMessage):
     ID = 208
     NAME = 'magnetometer_data'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=MagnetometerDataMessage.NAME,
@@ -37,37 +25,7 @@ class MagnetometerDataMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        MagnetometerDataTimestampMsField(
-            size=self.__get_field_size(definition_message, MagnetometerDataTimestampMsField.ID),
-            growable=definition_message is None), 
-        MagnetometerDataSampleTimeOffsetField(
-            size=self.__get_field_size(definition_message, MagnetometerDataSampleTimeOffsetField.ID),
-            growable=definition_message is None), 
-        MagnetometerDataMagXField(
-            size=self.__get_field_size(definition_message, MagnetometerDataMagXField.ID),
-            growable=definition_message is None), 
-        MagnetometerDataMagYField(
-            size=self.__get_field_size(definition_message, MagnetometerDataMagYField.ID),
-            growable=definition_message is None), 
-        MagnetometerDataMagZField(
-            size=self.__get_field_size(definition_message, MagnetometerDataMagZField.ID),
-            growable=definition_message is None), 
-        MagnetometerDataCalibratedMagXField(
-            size=self.__get_field_size(definition_message, MagnetometerDataCalibratedMagXField.ID),
-            growable=definition_message is None), 
-        MagnetometerDataCalibratedMagYField(
-            size=self.__get_field_size(definition_message, MagnetometerDataCalibratedMagYField.ID),
-            growable=definition_message is None), 
-        MagnetometerDataCalibratedMagZField(
-            size=self.__get_field_size(definition_message, MagnetometerDataCalibratedMagZField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=MagnetometerDataMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -76,383 +34,41 @@ class MagnetometerDataMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def timestamp_ms(self) -> Optional[int]:
-        field = self.get_field(MagnetometerDataTimestampMsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @timestamp_ms.setter
-    def timestamp_ms(self, value: int):
-        field = self.get_field(MagnetometerDataTimestampMsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sample_time_offset(self) -> Optional[list[int]]:
-        field = self.get_field(MagnetometerDataSampleTimeOffsetField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @sample_time_offset.setter
-    def sample_time_offset(self, value: list[int]):
-        field = self.get_field(MagnetometerDataSampleTimeOffsetField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def mag_x(self) -> Optional[list[int]]:
-        field = self.get_field(MagnetometerDataMagXField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @mag_x.setter
-    def mag_x(self, value: list[int]):
-        field = self.get_field(MagnetometerDataMagXField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def mag_y(self) -> Optional[list[int]]:
-        field = self.get_field(MagnetometerDataMagYField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @mag_y.setter
-    def mag_y(self, value: list[int]):
-        field = self.get_field(MagnetometerDataMagYField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def mag_z(self) -> Optional[list[int]]:
-        field = self.get_field(MagnetometerDataMagZField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @mag_z.setter
-    def mag_z(self, value: list[int]):
-        field = self.get_field(MagnetometerDataMagZField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def calibrated_mag_x(self) -> Optional[list[float]]:
-        field = self.get_field(MagnetometerDataCalibratedMagXField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @calibrated_mag_x.setter
-    def calibrated_mag_x(self, value: list[float]):
-        field = self.get_field(MagnetometerDataCalibratedMagXField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def calibrated_mag_y(self) -> Optional[list[float]]:
-        field = self.get_field(MagnetometerDataCalibratedMagYField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @calibrated_mag_y.setter
-    def calibrated_mag_y(self, value: list[float]):
-        field = self.get_field(MagnetometerDataCalibratedMagYField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def calibrated_mag_z(self) -> Optional[list[float]]:
-        field = self.get_field(MagnetometerDataCalibratedMagZField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @calibrated_mag_z.setter
-    def calibrated_mag_z(self, value: list[float]):
-        field = self.get_field(MagnetometerDataCalibratedMagZField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MagnetometerDataTimestampMsField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp_ms',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MagnetometerDataSampleTimeOffsetField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sample_time_offset',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MagnetometerDataMagXField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='mag_x',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'counts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MagnetometerDataMagYField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='mag_y',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'counts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MagnetometerDataMagZField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='mag_z',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'counts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MagnetometerDataCalibratedMagXField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='calibrated_mag_x',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'G',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MagnetometerDataCalibratedMagYField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='calibrated_mag_y',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'G',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MagnetometerDataCalibratedMagZField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='calibrated_mag_z',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'G',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    timestamp_ms: FieldProperty[int] = FieldProperty(0)
+    sample_time_offset: FieldProperty[list[int]] = FieldProperty(1, is_array=True)
+    mag_x: FieldProperty[list[int]] = FieldProperty(2, is_array=True)
+    mag_y: FieldProperty[list[int]] = FieldProperty(3, is_array=True)
+    mag_z: FieldProperty[list[int]] = FieldProperty(4, is_array=True)
+    calibrated_mag_x: FieldProperty[list[float]] = FieldProperty(5, is_array=True)
+    calibrated_mag_y: FieldProperty[list[float]] = FieldProperty(6, is_array=True)
+    calibrated_mag_z: FieldProperty[list[float]] = FieldProperty(7, is_array=True)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('MagnetometerDataTimestampMsField', 0, 'timestamp_ms', BaseType.UINT16, 0, 1, 'ms', '', []),
+    ('MagnetometerDataSampleTimeOffsetField', 1, 'sample_time_offset', BaseType.UINT16, 0, 1, 'ms', '', []),
+    ('MagnetometerDataMagXField', 2, 'mag_x', BaseType.UINT16, 0, 1, 'counts', '', []),
+    ('MagnetometerDataMagYField', 3, 'mag_y', BaseType.UINT16, 0, 1, 'counts', '', []),
+    ('MagnetometerDataMagZField', 4, 'mag_z', BaseType.UINT16, 0, 1, 'counts', '', []),
+    ('MagnetometerDataCalibratedMagXField', 5, 'calibrated_mag_x', BaseType.FLOAT32, 0, 1, 'G', '', []),
+    ('MagnetometerDataCalibratedMagYField', 6, 'calibrated_mag_y', BaseType.FLOAT32, 0, 1, 'G', '', []),
+    ('MagnetometerDataCalibratedMagZField', 7, 'calibrated_mag_z', BaseType.FLOAT32, 0, 1, 'G', '', []),
+])
+
+(
+    TimestampField,
+    MagnetometerDataTimestampMsField,
+    MagnetometerDataSampleTimeOffsetField,
+    MagnetometerDataMagXField,
+    MagnetometerDataMagYField,
+    MagnetometerDataMagZField,
+    MagnetometerDataCalibratedMagXField,
+    MagnetometerDataCalibratedMagYField,
+    MagnetometerDataCalibratedMagZField,
+) = FIELD_TYPES
+
+MagnetometerDataMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
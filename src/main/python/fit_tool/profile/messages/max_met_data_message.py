@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class MaxMetDataMessage(DataMessage):
     ID = 229
     NAME = 'max_met_data'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=MaxMetDataMessage.NAME,
@@ -37,34 +25,7 @@ class MaxMetDataMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MaxMetDataUpdateTimeField(
-            size=self.__get_field_size(definition_message, MaxMetDataUpdateTimeField.ID),
-            growable=definition_message is None), 
-        MaxMetDataVo2MaxField(
-            size=self.__get_field_size(definition_message, MaxMetDataVo2MaxField.ID),
-            growable=definition_message is None), 
-        MaxMetDataSportField(
-            size=self.__get_field_size(definition_message, MaxMetDataSportField.ID),
-            growable=definition_message is None), 
-        MaxMetDataSubSportField(
-            size=self.__get_field_size(definition_message, MaxMetDataSubSportField.ID),
-            growable=definition_message is None), 
-        MaxMetDataMaxMetCategoryField(
-            size=self.__get_field_size(definition_message, MaxMetDataMaxMetCategoryField.ID),
-            growable=definition_message is None), 
-        MaxMetDataCalibratedDataField(
-            size=self.__get_field_size(definition_message, MaxMetDataCalibratedDataField.ID),
-            growable=definition_message is None), 
-        MaxMetDataHrSourceField(
-            size=self.__get_field_size(definition_message, MaxMetDataHrSourceField.ID),
-            growable=definition_message is None), 
-        MaxMetDataSpeedSourceField(
-            size=self.__get_field_size(definition_message, MaxMetDataSpeedSourceField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=MaxMetDataMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -73,342 +34,38 @@ class MaxMetDataMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def update_time(self) -> Optional[int]:
-        field = self.get_field(MaxMetDataUpdateTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @update_time.setter
-    def update_time(self, value: int):
-        field = self.get_field(MaxMetDataUpdateTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def vo2_max(self) -> Optional[float]:
-        field = self.get_field(MaxMetDataVo2MaxField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @vo2_max.setter
-    def vo2_max(self, value: float):
-        field = self.get_field(MaxMetDataVo2MaxField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sport(self) -> Optional[Sport]:
-        field = self.get_field(MaxMetDataSportField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sport.setter
-    def sport(self, value: Sport):
-        field = self.get_field(MaxMetDataSportField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sub_sport(self) -> Optional[SubSport]:
-        field = self.get_field(MaxMetDataSubSportField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sub_sport.setter
-    def sub_sport(self, value: SubSport):
-        field = self.get_field(MaxMetDataSubSportField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_met_category(self) -> Optional[MaxMetCategory]:
-        field = self.get_field(MaxMetDataMaxMetCategoryField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_met_category.setter
-    def max_met_category(self, value: MaxMetCategory):
-        field = self.get_field(MaxMetDataMaxMetCategoryField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def calibrated_data(self) -> Optional[bool]:
-        field = self.get_field(MaxMetDataCalibratedDataField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @calibrated_data.setter
-    def calibrated_data(self, value: bool):
-        field = self.get_field(MaxMetDataCalibratedDataField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def hr_source(self) -> Optional[MaxMetHeartRateSource]:
-        field = self.get_field(MaxMetDataHrSourceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @hr_source.setter
-    def hr_source(self, value: MaxMetHeartRateSource):
-        field = self.get_field(MaxMetDataHrSourceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def speed_source(self) -> Optional[MaxMetSpeedSource]:
-        field = self.get_field(MaxMetDataSpeedSourceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @speed_source.setter
-    def speed_source(self, value: MaxMetSpeedSource):
-        field = self.get_field(MaxMetDataSpeedSourceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MaxMetDataUpdateTimeField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='update_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MaxMetDataVo2MaxField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='vo2_max',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = 'mL/kg/min',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MaxMetDataSportField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sport',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MaxMetDataSubSportField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sub_sport',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MaxMetDataMaxMetCategoryField(Field):
-    ID = 8
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_met_category',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MaxMetDataCalibratedDataField(Field):
-    ID = 9
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='calibrated_data',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MaxMetDataHrSourceField(Field):
-    ID = 12
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='hr_source',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MaxMetDataSpeedSourceField(Field):
-    ID = 13
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='speed_source',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    update_time: FieldProperty[int] = FieldProperty(0)
+    vo2_max: FieldProperty[float] = FieldProperty(2)
+    sport: FieldProperty[Sport] = FieldProperty(5)
+    sub_sport: FieldProperty[SubSport] = FieldProperty(6)
+    max_met_category: FieldProperty[MaxMetCategory] = FieldProperty(8)
+    calibrated_data: FieldProperty[bool] = FieldProperty(9)
+    hr_source: FieldProperty[MaxMetHeartRateSource] = FieldProperty(12)
+    speed_source: FieldProperty[MaxMetSpeedSource] = FieldProperty(13)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MaxMetDataUpdateTimeField', 0, 'update_time', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('MaxMetDataVo2MaxField', 2, 'vo2_max', BaseType.UINT16, 0, 10, 'mL/kg/min', '', []),
+    ('MaxMetDataSportField', 5, 'sport', BaseType.ENUM, 0, 1, '', '', []),
+    ('MaxMetDataSubSportField', 6, 'sub_sport', BaseType.ENUM, 0, 1, '', '', []),
+    ('MaxMetDataMaxMetCategoryField', 8, 'max_met_category', BaseType.ENUM, 0, 1, '', '', []),
+    ('MaxMetDataCalibratedDataField', 9, 'calibrated_data', BaseType.UINT8, 0, 1, '', '', []),
+    ('MaxMetDataHrSourceField', 12, 'hr_source', BaseType.ENUM, 0, 1, '', '', []),
+    ('MaxMetDataSpeedSourceField', 13, 'speed_source', BaseType.ENUM, 0, 1, '', '', []),
+])
+
+(
+    MaxMetDataUpdateTimeField,
+    MaxMetDataVo2MaxField,
+    MaxMetDataSportField,
+    MaxMetDataSubSportField,
+    MaxMetDataMaxMetCategoryField,
+    MaxMetDataCalibratedDataField,
+    MaxMetDataHrSourceField,
+    MaxMetDataSpeedSourceField,
+) = FIELD_TYPES
+
+MaxMetDataMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class MemoGlobMessage(DataMessage):
     ID = 145
     NAME = 'memo_glob'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=MemoGlobMessage.NAME,
@@ -37,28 +25,7 @@ class MemoGlobMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MemoGlobPartIndexField(
-            size=self.__get_field_size(definition_message, MemoGlobPartIndexField.ID),
-            growable=definition_message is None), 
-        MemoGlobMemoField(
-            size=self.__get_field_size(definition_message, MemoGlobMemoField.ID),
-            growable=definition_message is None), 
-        MemoGlobMesgNumField(
-            size=self.__get_field_size(definition_message, MemoGlobMesgNumField.ID),
-            growable=definition_message is None), 
-        MemoGlobParentIndexField(
-            size=self.__get_field_size(definition_message, MemoGlobParentIndexField.ID),
-            growable=definition_message is None), 
-        MemoGlobFieldNumField(
-            size=self.__get_field_size(definition_message, MemoGlobFieldNumField.ID),
-            growable=definition_message is None), 
-        MemoGlobDataField(
-            size=self.__get_field_size(definition_message, MemoGlobDataField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=MemoGlobMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -67,250 +34,32 @@ class MemoGlobMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def part_index(self) -> Optional[int]:
-        field = self.get_field(MemoGlobPartIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @part_index.setter
-    def part_index(self, value: int):
-        field = self.get_field(MemoGlobPartIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def memo(self) -> Optional[bytes]:
-        field = self.get_field(MemoGlobMemoField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @memo.setter
-    def memo(self, value: bytes):
-        field = self.get_field(MemoGlobMemoField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def mesg_num(self) -> Optional[int]:
-        field = self.get_field(MemoGlobMesgNumField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @mesg_num.setter
-    def mesg_num(self, value: int):
-        field = self.get_field(MemoGlobMesgNumField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def parent_index(self) -> Optional[int]:
-        field = self.get_field(MemoGlobParentIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @parent_index.setter
-    def parent_index(self, value: int):
-        field = self.get_field(MemoGlobParentIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def field_num(self) -> Optional[int]:
-        field = self.get_field(MemoGlobFieldNumField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @field_num.setter
-    def field_num(self, value: int):
-        field = self.get_field(MemoGlobFieldNumField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def data(self) -> Optional[list[int]]:
-        field = self.get_field(MemoGlobDataField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @data.setter
-    def data(self, value: list[int]):
-        field = self.get_field(MemoGlobDataField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-
-
-
-
-class MemoGlobPartIndexField(Field):
-    ID = 250
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='part_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MemoGlobMemoField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='memo',
-            field_id=self.ID,
-            base_type=BaseType.BYTE,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MemoGlobMesgNumField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='mesg_num',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MemoGlobParentIndexField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='parent_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MemoGlobFieldNumField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='field_num',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class MemoGlobDataField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='data',
-            field_id=self.ID,
-            base_type=BaseType.UINT8Z,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    part_index: FieldProperty[int] = FieldProperty(250)
+    memo: FieldProperty[bytes] = FieldProperty(0, is_array=True)
+    mesg_num: FieldProperty[int] = FieldProperty(1)
+    parent_index: FieldProperty[int] = FieldProperty(2)
+    field_num: FieldProperty[int] = FieldProperty(3)
+    data: FieldProperty[list[int]] = FieldProperty(4, is_array=True)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MemoGlobPartIndexField', 250, 'part_index', BaseType.UINT32, 0, 1, '', '', []),
+    ('MemoGlobMemoField', 0, 'memo', BaseType.BYTE, 0, 1, '', '', []),
+    ('MemoGlobMesgNumField', 1, 'mesg_num', BaseType.UINT16, 0, 1, '', '', []),
+    ('MemoGlobParentIndexField', 2, 'parent_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('MemoGlobFieldNumField', 3, 'field_num', BaseType.UINT8, 0, 1, '', '', []),
+    ('MemoGlobDataField', 4, 'data', BaseType.UINT8Z, 0, 1, '', '', []),
+])
+
+(
+    MemoGlobPartIndexField,
+    MemoGlobMemoField,
+    MemoGlobMesgNumField,
+    MemoGlobParentIndexField,
+    MemoGlobFieldNumField,
+    MemoGlobDataField,
+) = FIELD_TYPES
+
+MemoGlobMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
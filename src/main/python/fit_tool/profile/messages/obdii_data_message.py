@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class ObdiiDataMessage(DataMessage):
     ID = 174
     NAME = 'obdii_data'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=ObdiiDataMessage.NAME,
@@ -37,37 +25,7 @@ class ObdiiDataMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        ObdiiDataTimestampMsField(
-            size=self.__get_field_size(definition_message, ObdiiDataTimestampMsField.ID),
-            growable=definition_message is None), 
-        ObdiiDataTimeOffsetField(
-            size=self.__get_field_size(definition_message, ObdiiDataTimeOffsetField.ID),
-            growable=definition_message is None), 
-        ObdiiDataPidField(
-            size=self.__get_field_size(definition_message, ObdiiDataPidField.ID),
-            growable=definition_message is None), 
-        ObdiiDataRawDataField(
-            size=self.__get_field_size(definition_message, ObdiiDataRawDataField.ID),
-            growable=definition_message is None), 
-        ObdiiDataPidDataSizeField(
-            size=self.__get_field_size(definition_message, ObdiiDataPidDataSizeField.ID),
-            growable=definition_message is None), 
-        ObdiiDataSystemTimeField(
-            size=self.__get_field_size(definition_message, ObdiiDataSystemTimeField.ID),
-            growable=definition_message is None), 
-        ObdiiDataStartTimestampField(
-            size=self.__get_field_size(definition_message, ObdiiDataStartTimestampField.ID),
-            growable=definition_message is None), 
-        ObdiiDataStartTimestampMsField(
-            size=self.__get_field_size(definition_message, ObdiiDataStartTimestampMsField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=ObdiiDataMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -76,383 +34,41 @@ class ObdiiDataMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def timestamp_ms(self) -> Optional[int]:
-        field = self.get_field(ObdiiDataTimestampMsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @timestamp_ms.setter
-    def timestamp_ms(self, value: int):
-        field = self.get_field(ObdiiDataTimestampMsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def time_offset(self) -> Optional[list[int]]:
-        field = self.get_field(ObdiiDataTimeOffsetField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @time_offset.setter
-    def time_offset(self, value: list[int]):
-        field = self.get_field(ObdiiDataTimeOffsetField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def pid(self) -> Optional[int]:
-        field = self.get_field(ObdiiDataPidField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @pid.setter
-    def pid(self, value: int):
-        field = self.get_field(ObdiiDataPidField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def raw_data(self) -> Optional[bytes]:
-        field = self.get_field(ObdiiDataRawDataField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @raw_data.setter
-    def raw_data(self, value: bytes):
-        field = self.get_field(ObdiiDataRawDataField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def pid_data_size(self) -> Optional[list[int]]:
-        field = self.get_field(ObdiiDataPidDataSizeField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @pid_data_size.setter
-    def pid_data_size(self, value: list[int]):
-        field = self.get_field(ObdiiDataPidDataSizeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def system_time(self) -> Optional[list[int]]:
-        field = self.get_field(ObdiiDataSystemTimeField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @system_time.setter
-    def system_time(self, value: list[int]):
-        field = self.get_field(ObdiiDataSystemTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def start_timestamp(self) -> Optional[int]:
-        field = self.get_field(ObdiiDataStartTimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @start_timestamp.setter
-    def start_timestamp(self, value: int):
-        field = self.get_field(ObdiiDataStartTimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def start_timestamp_ms(self) -> Optional[int]:
-        field = self.get_field(ObdiiDataStartTimestampMsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @start_timestamp_ms.setter
-    def start_timestamp_ms(self, value: int):
-        field = self.get_field(ObdiiDataStartTimestampMsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ObdiiDataTimestampMsField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp_ms',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ObdiiDataTimeOffsetField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time_offset',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ObdiiDataPidField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='pid',
-            field_id=self.ID,
-            base_type=BaseType.BYTE,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ObdiiDataRawDataField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='raw_data',
-            field_id=self.ID,
-            base_type=BaseType.BYTE,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ObdiiDataPidDataSizeField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='pid_data_size',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ObdiiDataSystemTimeField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='system_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ObdiiDataStartTimestampField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='start_timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class ObdiiDataStartTimestampMsField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='start_timestamp_ms',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    timestamp_ms: FieldProperty[int] = FieldProperty(0)
+    time_offset: FieldProperty[list[int]] = FieldProperty(1, is_array=True)
+    pid: FieldProperty[int] = FieldProperty(2)
+    raw_data: FieldProperty[bytes] = FieldProperty(3, is_array=True)
+    pid_data_size: FieldProperty[list[int]] = FieldProperty(4, is_array=True)
+    system_time: FieldProperty[list[int]] = FieldProperty(5, is_array=True)
+    start_timestamp: FieldProperty[int] = FieldProperty(6)
+    start_timestamp_ms: FieldProperty[int] = FieldProperty(7)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('ObdiiDataTimestampMsField', 0, 'timestamp_ms', BaseType.UINT16, 0, 1, 'ms', '', []),
+    ('ObdiiDataTimeOffsetField', 1, 'time_offset', BaseType.UINT16, 0, 1, 'ms', '', []),
+    ('ObdiiDataPidField', 2, 'pid', BaseType.BYTE, 0, 1, '', '', []),
+    ('ObdiiDataRawDataField', 3, 'raw_data', BaseType.BYTE, 0, 1, '', '', []),
+    ('ObdiiDataPidDataSizeField', 4, 'pid_data_size', BaseType.UINT8, 0, 1, '', '', []),
+    ('ObdiiDataSystemTimeField', 5, 'system_time', BaseType.UINT32, 0, 1, '', '', []),
+    ('ObdiiDataStartTimestampField', 6, 'start_timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('ObdiiDataStartTimestampMsField', 7, 'start_timestamp_ms', BaseType.UINT16, 0, 1, 'ms', '', []),
+])
+
+(
+    TimestampField,
+    ObdiiDataTimestampMsField,
+    ObdiiDataTimeOffsetField,
+    ObdiiDataPidField,
+    ObdiiDataRawDataField,
+    ObdiiDataPidDataSizeField,
+    ObdiiDataSystemTimeField,
+    ObdiiDataStartTimestampField,
+    ObdiiDataStartTimestampMsField,
+) = FIELD_TYPES
+
+ObdiiDataMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class RecordMessage(DataMessage):
     ID = 20
     NAME = 'record'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=RecordMessage.NAME,
@@ -37,262 +25,7 @@ class RecordMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        RecordPositionLatField(
-            size=self.__get_field_size(definition_message, RecordPositionLatField.ID),
-            growable=definition_message is None), 
-        RecordPositionLongField(
-            size=self.__get_field_size(definition_message, RecordPositionLongField.ID),
-            growable=definition_message is None), 
-        RecordAltitudeField(
-            size=self.__get_field_size(definition_message, RecordAltitudeField.ID),
-            growable=definition_message is None), 
-        RecordHeartRateField(
-            size=self.__get_field_size(definition_message, RecordHeartRateField.ID),
-            growable=definition_message is None), 
-        RecordCadenceField(
-            size=self.__get_field_size(definition_message, RecordCadenceField.ID),
-            growable=definition_message is None), 
-        RecordDistanceField(
-            size=self.__get_field_size(definition_message, RecordDistanceField.ID),
-            growable=definition_message is None), 
-        RecordSpeedField(
-            size=self.__get_field_size(definition_message, RecordSpeedField.ID),
-            growable=definition_message is None), 
-        RecordPowerField(
-            size=self.__get_field_size(definition_message, RecordPowerField.ID),
-            growable=definition_message is None), 
-        RecordCompressedSpeedDistanceField(
-            size=self.__get_field_size(definition_message, RecordCompressedSpeedDistanceField.ID),
-            growable=definition_message is None), 
-        RecordGradeField(
-            size=self.__get_field_size(definition_message, RecordGradeField.ID),
-            growable=definition_message is None), 
-        RecordResistanceField(
-            size=self.__get_field_size(definition_message, RecordResistanceField.ID),
-            growable=definition_message is None), 
-        RecordTimeFromCourseField(
-            size=self.__get_field_size(definition_message, RecordTimeFromCourseField.ID),
-            growable=definition_message is None), 
-        RecordCycleLengthField(
-            size=self.__get_field_size(definition_message, RecordCycleLengthField.ID),
-            growable=definition_message is None), 
-        RecordTemperatureField(
-            size=self.__get_field_size(definition_message, RecordTemperatureField.ID),
-            growable=definition_message is None), 
-        RecordSpeed1sField(
-            size=self.__get_field_size(definition_message, RecordSpeed1sField.ID),
-            growable=definition_message is None), 
-        RecordCyclesField(
-            size=self.__get_field_size(definition_message, RecordCyclesField.ID),
-            growable=definition_message is None), 
-        RecordTotalCyclesField(
-            size=self.__get_field_size(definition_message, RecordTotalCyclesField.ID),
-            growable=definition_message is None), 
-        RecordCompressedAccumulatedPowerField(
-            size=self.__get_field_size(definition_message, RecordCompressedAccumulatedPowerField.ID),
-            growable=definition_message is None), 
-        RecordAccumulatedPowerField(
-            size=self.__get_field_size(definition_message, RecordAccumulatedPowerField.ID),
-            growable=definition_message is None), 
-        RecordLeftRightBalanceField(
-            size=self.__get_field_size(definition_message, RecordLeftRightBalanceField.ID),
-            growable=definition_message is None), 
-        RecordGpsAccuracyField(
-            size=self.__get_field_size(definition_message, RecordGpsAccuracyField.ID),
-            growable=definition_message is None), 
-        RecordVerticalSpeedField(
-            size=self.__get_field_size(definition_message, RecordVerticalSpeedField.ID),
-            growable=definition_message is None), 
-        RecordCaloriesField(
-            size=self.__get_field_size(definition_message, RecordCaloriesField.ID),
-            growable=definition_message is None), 
-        RecordVerticalOscillationField(
-            size=self.__get_field_size(definition_message, RecordVerticalOscillationField.ID),
-            growable=definition_message is None), 
-        RecordStanceTimePercentField(
-            size=self.__get_field_size(definition_message, RecordStanceTimePercentField.ID),
-            growable=definition_message is None), 
-        RecordStanceTimeField(
-            size=self.__get_field_size(definition_message, RecordStanceTimeField.ID),
-            growable=definition_message is None), 
-        RecordActivityTypeField(
-            size=self.__get_field_size(definition_message, RecordActivityTypeField.ID),
-            growable=definition_message is None), 
-        RecordLeftTorqueEffectivenessField(
-            size=self.__get_field_size(definition_message, RecordLeftTorqueEffectivenessField.ID),
-            growable=definition_message is None), 
-        RecordRightTorqueEffectivenessField(
-            size=self.__get_field_size(definition_message, RecordRightTorqueEffectivenessField.ID),
-            growable=definition_message is None), 
-        RecordLeftPedalSmoothnessField(
-            size=self.__get_field_size(definition_message, RecordLeftPedalSmoothnessField.ID),
-            growable=definition_message is None), 
-        RecordRightPedalSmoothnessField(
-            size=self.__get_field_size(definition_message, RecordRightPedalSmoothnessField.ID),
-            growable=definition_message is None), 
-        RecordCombinedPedalSmoothnessField(
-            size=self.__get_field_size(definition_message, RecordCombinedPedalSmoothnessField.ID),
-            growable=definition_message is None), 
-        RecordTime128Field(
-            size=self.__get_field_size(definition_message, RecordTime128Field.ID),
-            growable=definition_message is None), 
-        RecordStrokeTypeField(
-            size=self.__get_field_size(definition_message, RecordStrokeTypeField.ID),
-            growable=definition_message is None), 
-        RecordZoneField(
-            size=self.__get_field_size(definition_message, RecordZoneField.ID),
-            growable=definition_message is None), 
-        RecordBallSpeedField(
-            size=self.__get_field_size(definition_message, RecordBallSpeedField.ID),
-            growable=definition_message is None), 
-        RecordCadence256Field(
-            size=self.__get_field_size(definition_message, RecordCadence256Field.ID),
-            growable=definition_message is None), 
-        RecordFractionalCadenceField(
-            size=self.__get_field_size(definition_message, RecordFractionalCadenceField.ID),
-            growable=definition_message is None), 
-        RecordTotalHemoglobinConcField(
-            size=self.__get_field_size(definition_message, RecordTotalHemoglobinConcField.ID),
-            growable=definition_message is None), 
-        RecordTotalHemoglobinConcMinField(
-            size=self.__get_field_size(definition_message, RecordTotalHemoglobinConcMinField.ID),
-            growable=definition_message is None), 
-        RecordTotalHemoglobinConcMaxField(
-            size=self.__get_field_size(definition_message, RecordTotalHemoglobinConcMaxField.ID),
-            growable=definition_message is None), 
-        RecordSaturatedHemoglobinPercentField(
-            size=self.__get_field_size(definition_message, RecordSaturatedHemoglobinPercentField.ID),
-            growable=definition_message is None), 
-        RecordSaturatedHemoglobinPercentMinField(
-            size=self.__get_field_size(definition_message, RecordSaturatedHemoglobinPercentMinField.ID),
-            growable=definition_message is None), 
-        RecordSaturatedHemoglobinPercentMaxField(
-            size=self.__get_field_size(definition_message, RecordSaturatedHemoglobinPercentMaxField.ID),
-            growable=definition_message is None), 
-        RecordDeviceIndexField(
-            size=self.__get_field_size(definition_message, RecordDeviceIndexField.ID),
-            growable=definition_message is None), 
-        RecordLeftPcoField(
-            size=self.__get_field_size(definition_message, RecordLeftPcoField.ID),
-            growable=definition_message is None), 
-        RecordRightPcoField(
-            size=self.__get_field_size(definition_message, RecordRightPcoField.ID),
-            growable=definition_message is None), 
-        RecordLeftPowerPhaseField(
-            size=self.__get_field_size(definition_message, RecordLeftPowerPhaseField.ID),
-            growable=definition_message is None), 
-        RecordLeftPowerPhasePeakField(
-            size=self.__get_field_size(definition_message, RecordLeftPowerPhasePeakField.ID),
-            growable=definition_message is None), 
-        RecordRightPowerPhaseField(
-            size=self.__get_field_size(definition_message, RecordRightPowerPhaseField.ID),
-            growable=definition_message is None), 
-        RecordRightPowerPhasePeakField(
-            size=self.__get_field_size(definition_message, RecordRightPowerPhasePeakField.ID),
-            growable=definition_message is None), 
-        RecordEnhancedSpeedField(
-            size=self.__get_field_size(definition_message, RecordEnhancedSpeedField.ID),
-            growable=definition_message is None), 
-        RecordEnhancedAltitudeField(
-            size=self.__get_field_size(definition_message, RecordEnhancedAltitudeField.ID),
-            growable=definition_message is None), 
-        RecordBatterySocField(
-            size=self.__get_field_size(definition_message, RecordBatterySocField.ID),
-            growable=definition_message is None), 
-        RecordMotorPowerField(
-            size=self.__get_field_size(definition_message, RecordMotorPowerField.ID),
-            growable=definition_message is None), 
-        RecordVerticalRatioField(
-            size=self.__get_field_size(definition_message, RecordVerticalRatioField.ID),
-            growable=definition_message is None), 
-        RecordStanceTimeBalanceField(
-            size=self.__get_field_size(definition_message, RecordStanceTimeBalanceField.ID),
-            growable=definition_message is None), 
-        RecordStepLengthField(
-            size=self.__get_field_size(definition_message, RecordStepLengthField.ID),
-            growable=definition_message is None), 
-        RecordCycleLength16Field(
-            size=self.__get_field_size(definition_message, RecordCycleLength16Field.ID),
-            growable=definition_message is None), 
-        RecordAbsolutePressureField(
-            size=self.__get_field_size(definition_message, RecordAbsolutePressureField.ID),
-            growable=definition_message is None), 
-        RecordDepthField(
-            size=self.__get_field_size(definition_message, RecordDepthField.ID),
-            growable=definition_message is None), 
-        RecordNextStopDepthField(
-            size=self.__get_field_size(definition_message, RecordNextStopDepthField.ID),
-            growable=definition_message is None), 
-        RecordNextStopTimeField(
-            size=self.__get_field_size(definition_message, RecordNextStopTimeField.ID),
-            growable=definition_message is None), 
-        RecordTimeToSurfaceField(
-            size=self.__get_field_size(definition_message, RecordTimeToSurfaceField.ID),
-            growable=definition_message is None), 
-        RecordNdlTimeField(
-            size=self.__get_field_size(definition_message, RecordNdlTimeField.ID),
-            growable=definition_message is None), 
-        RecordCnsLoadField(
-            size=self.__get_field_size(definition_message, RecordCnsLoadField.ID),
-            growable=definition_message is None), 
-        RecordN2LoadField(
-            size=self.__get_field_size(definition_message, RecordN2LoadField.ID),
-            growable=definition_message is None), 
-        RecordRespirationRateField(
-            size=self.__get_field_size(definition_message, RecordRespirationRateField.ID),
-            growable=definition_message is None), 
-        RecordEnhancedRespirationRateField(
-            size=self.__get_field_size(definition_message, RecordEnhancedRespirationRateField.ID),
-            growable=definition_message is None), 
-        RecordGritField(
-            size=self.__get_field_size(definition_message, RecordGritField.ID),
-            growable=definition_message is None), 
-        RecordFlowField(
-            size=self.__get_field_size(definition_message, RecordFlowField.ID),
-            growable=definition_message is None), 
-        RecordCurrentStressField(
-            size=self.__get_field_size(definition_message, RecordCurrentStressField.ID),
-            growable=definition_message is None), 
-        RecordEbikeTravelRangeField(
-            size=self.__get_field_size(definition_message, RecordEbikeTravelRangeField.ID),
-            growable=definition_message is None), 
-        RecordEbikeBatteryLevelField(
-            size=self.__get_field_size(definition_message, RecordEbikeBatteryLevelField.ID),
-            growable=definition_message is None), 
-        RecordEbikeAssistModeField(
-            size=self.__get_field_size(definition_message, RecordEbikeAssistModeField.ID),
-            growable=definition_message is None), 
-        RecordEbikeAssistLevelPercentField(
-            size=self.__get_field_size(definition_message, RecordEbikeAssistLevelPercentField.ID),
-            growable=definition_message is None), 
-        RecordAirTimeRemainingField(
-            size=self.__get_field_size(definition_message, RecordAirTimeRemainingField.ID),
-            growable=definition_message is None), 
-        RecordPressureSacField(
-            size=self.__get_field_size(definition_message, RecordPressureSacField.ID),
-            growable=definition_message is None), 
-        RecordVolumeSacField(
-            size=self.__get_field_size(definition_message, RecordVolumeSacField.ID),
-            growable=definition_message is None), 
-        RecordRmvField(
-            size=self.__get_field_size(definition_message, RecordRmvField.ID),
-            growable=definition_message is None), 
-        RecordAscentRateField(
-            size=self.__get_field_size(definition_message, RecordAscentRateField.ID),
-            growable=definition_message is None), 
-        RecordPo2Field(
-            size=self.__get_field_size(definition_message, RecordPo2Field.ID),
-            growable=definition_message is None), 
-        RecordCoreTemperatureField(
-            size=self.__get_field_size(definition_message, RecordCoreTemperatureField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=RecordMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -301,3592 +34,266 @@ class RecordMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def position_lat(self) -> Optional[float]:
-        field = self.get_field(RecordPositionLatField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @position_lat.setter
-    def position_lat(self, value: float):
-        field = self.get_field(RecordPositionLatField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def position_long(self) -> Optional[float]:
-        field = self.get_field(RecordPositionLongField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @position_long.setter
-    def position_long(self, value: float):
-        field = self.get_field(RecordPositionLongField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def altitude(self) -> Optional[float]:
-        field = self.get_field(RecordAltitudeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @altitude.setter
-    def altitude(self, value: float):
-        field = self.get_field(RecordAltitudeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def heart_rate(self) -> Optional[int]:
-        field = self.get_field(RecordHeartRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @heart_rate.setter
-    def heart_rate(self, value: int):
-        field = self.get_field(RecordHeartRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def cadence(self) -> Optional[int]:
-        field = self.get_field(RecordCadenceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @cadence.setter
-    def cadence(self, value: int):
-        field = self.get_field(RecordCadenceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def distance(self) -> Optional[float]:
-        field = self.get_field(RecordDistanceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @distance.setter
-    def distance(self, value: float):
-        field = self.get_field(RecordDistanceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def speed(self) -> Optional[float]:
-        field = self.get_field(RecordSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @speed.setter
-    def speed(self, value: float):
-        field = self.get_field(RecordSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def power(self) -> Optional[int]:
-        field = self.get_field(RecordPowerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @power.setter
-    def power(self, value: int):
-        field = self.get_field(RecordPowerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def compressed_speed_distance(self) -> Optional[bytes]:
-        field = self.get_field(RecordCompressedSpeedDistanceField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @compressed_speed_distance.setter
-    def compressed_speed_distance(self, value: bytes):
-        field = self.get_field(RecordCompressedSpeedDistanceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def grade(self) -> Optional[float]:
-        field = self.get_field(RecordGradeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @grade.setter
-    def grade(self, value: float):
-        field = self.get_field(RecordGradeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def resistance(self) -> Optional[int]:
-        field = self.get_field(RecordResistanceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @resistance.setter
-    def resistance(self, value: int):
-        field = self.get_field(RecordResistanceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def time_from_course(self) -> Optional[float]:
-        field = self.get_field(RecordTimeFromCourseField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @time_from_course.setter
-    def time_from_course(self, value: float):
-        field = self.get_field(RecordTimeFromCourseField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def cycle_length(self) -> Optional[float]:
-        field = self.get_field(RecordCycleLengthField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @cycle_length.setter
-    def cycle_length(self, value: float):
-        field = self.get_field(RecordCycleLengthField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def temperature(self) -> Optional[int]:
-        field = self.get_field(RecordTemperatureField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @temperature.setter
-    def temperature(self, value: int):
-        field = self.get_field(RecordTemperatureField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def speed_1s(self) -> Optional[list[float]]:
-        field = self.get_field(RecordSpeed1sField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @speed_1s.setter
-    def speed_1s(self, value: list[float]):
-        field = self.get_field(RecordSpeed1sField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def cycles(self) -> Optional[int]:
-        field = self.get_field(RecordCyclesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @cycles.setter
-    def cycles(self, value: int):
-        field = self.get_field(RecordCyclesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_cycles(self) -> Optional[int]:
-        field = self.get_field(RecordTotalCyclesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_cycles.setter
-    def total_cycles(self, value: int):
-        field = self.get_field(RecordTotalCyclesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def compressed_accumulated_power(self) -> Optional[int]:
-        field = self.get_field(RecordCompressedAccumulatedPowerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @compressed_accumulated_power.setter
-    def compressed_accumulated_power(self, value: int):
-        field = self.get_field(RecordCompressedAccumulatedPowerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def accumulated_power(self) -> Optional[int]:
-        field = self.get_field(RecordAccumulatedPowerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @accumulated_power.setter
-    def accumulated_power(self, value: int):
-        field = self.get_field(RecordAccumulatedPowerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def left_right_balance(self) -> Optional[int]:
-        field = self.get_field(RecordLeftRightBalanceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @left_right_balance.setter
-    def left_right_balance(self, value: int):
-        field = self.get_field(RecordLeftRightBalanceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def gps_accuracy(self) -> Optional[int]:
-        field = self.get_field(RecordGpsAccuracyField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @gps_accuracy.setter
-    def gps_accuracy(self, value: int):
-        field = self.get_field(RecordGpsAccuracyField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def vertical_speed(self) -> Optional[float]:
-        field = self.get_field(RecordVerticalSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @vertical_speed.setter
-    def vertical_speed(self, value: float):
-        field = self.get_field(RecordVerticalSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def calories(self) -> Optional[int]:
-        field = self.get_field(RecordCaloriesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @calories.setter
-    def calories(self, value: int):
-        field = self.get_field(RecordCaloriesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def vertical_oscillation(self) -> Optional[float]:
-        field = self.get_field(RecordVerticalOscillationField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @vertical_oscillation.setter
-    def vertical_oscillation(self, value: float):
-        field = self.get_field(RecordVerticalOscillationField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def stance_time_percent(self) -> Optional[float]:
-        field = self.get_field(RecordStanceTimePercentField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @stance_time_percent.setter
-    def stance_time_percent(self, value: float):
-        field = self.get_field(RecordStanceTimePercentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def stance_time(self) -> Optional[float]:
-        field = self.get_field(RecordStanceTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @stance_time.setter
-    def stance_time(self, value: float):
-        field = self.get_field(RecordStanceTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def activity_type(self) -> Optional[ActivityType]:
-        field = self.get_field(RecordActivityTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @activity_type.setter
-    def activity_type(self, value: ActivityType):
-        field = self.get_field(RecordActivityTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def left_torque_effectiveness(self) -> Optional[float]:
-        field = self.get_field(RecordLeftTorqueEffectivenessField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @left_torque_effectiveness.setter
-    def left_torque_effectiveness(self, value: float):
-        field = self.get_field(RecordLeftTorqueEffectivenessField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def right_torque_effectiveness(self) -> Optional[float]:
-        field = self.get_field(RecordRightTorqueEffectivenessField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @right_torque_effectiveness.setter
-    def right_torque_effectiveness(self, value: float):
-        field = self.get_field(RecordRightTorqueEffectivenessField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def left_pedal_smoothness(self) -> Optional[float]:
-        field = self.get_field(RecordLeftPedalSmoothnessField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @left_pedal_smoothness.setter
-    def left_pedal_smoothness(self, value: float):
-        field = self.get_field(RecordLeftPedalSmoothnessField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def right_pedal_smoothness(self) -> Optional[float]:
-        field = self.get_field(RecordRightPedalSmoothnessField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @right_pedal_smoothness.setter
-    def right_pedal_smoothness(self, value: float):
-        field = self.get_field(RecordRightPedalSmoothnessField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def combined_pedal_smoothness(self) -> Optional[float]:
-        field = self.get_field(RecordCombinedPedalSmoothnessField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @combined_pedal_smoothness.setter
-    def combined_pedal_smoothness(self, value: float):
-        field = self.get_field(RecordCombinedPedalSmoothnessField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def time128(self) -> Optional[float]:
-        field = self.get_field(RecordTime128Field.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @time128.setter
-    def time128(self, value: float):
-        field = self.get_field(RecordTime128Field.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def stroke_type(self) -> Optional[StrokeType]:
-        field = self.get_field(RecordStrokeTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @stroke_type.setter
-    def stroke_type(self, value: StrokeType):
-        field = self.get_field(RecordStrokeTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def zone(self) -> Optional[int]:
-        field = self.get_field(RecordZoneField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @zone.setter
-    def zone(self, value: int):
-        field = self.get_field(RecordZoneField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def ball_speed(self) -> Optional[float]:
-        field = self.get_field(RecordBallSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @ball_speed.setter
-    def ball_speed(self, value: float):
-        field = self.get_field(RecordBallSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def cadence256(self) -> Optional[float]:
-        field = self.get_field(RecordCadence256Field.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @cadence256.setter
-    def cadence256(self, value: float):
-        field = self.get_field(RecordCadence256Field.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def fractional_cadence(self) -> Optional[float]:
-        field = self.get_field(RecordFractionalCadenceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @fractional_cadence.setter
-    def fractional_cadence(self, value: float):
-        field = self.get_field(RecordFractionalCadenceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_hemoglobin_conc(self) -> Optional[float]:
-        field = self.get_field(RecordTotalHemoglobinConcField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_hemoglobin_conc.setter
-    def total_hemoglobin_conc(self, value: float):
-        field = self.get_field(RecordTotalHemoglobinConcField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_hemoglobin_conc_min(self) -> Optional[float]:
-        field = self.get_field(RecordTotalHemoglobinConcMinField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_hemoglobin_conc_min.setter
-    def total_hemoglobin_conc_min(self, value: float):
-        field = self.get_field(RecordTotalHemoglobinConcMinField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_hemoglobin_conc_max(self) -> Optional[float]:
-        field = self.get_field(RecordTotalHemoglobinConcMaxField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_hemoglobin_conc_max.setter
-    def total_hemoglobin_conc_max(self, value: float):
-        field = self.get_field(RecordTotalHemoglobinConcMaxField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def saturated_hemoglobin_percent(self) -> Optional[float]:
-        field = self.get_field(RecordSaturatedHemoglobinPercentField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @saturated_hemoglobin_percent.setter
-    def saturated_hemoglobin_percent(self, value: float):
-        field = self.get_field(RecordSaturatedHemoglobinPercentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def saturated_hemoglobin_percent_min(self) -> Optional[float]:
-        field = self.get_field(RecordSaturatedHemoglobinPercentMinField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @saturated_hemoglobin_percent_min.setter
-    def saturated_hemoglobin_percent_min(self, value: float):
-        field = self.get_field(RecordSaturatedHemoglobinPercentMinField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def saturated_hemoglobin_percent_max(self) -> Optional[float]:
-        field = self.get_field(RecordSaturatedHemoglobinPercentMaxField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @saturated_hemoglobin_percent_max.setter
-    def saturated_hemoglobin_percent_max(self, value: float):
-        field = self.get_field(RecordSaturatedHemoglobinPercentMaxField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def device_index(self) -> Optional[int]:
-        field = self.get_field(RecordDeviceIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @device_index.setter
-    def device_index(self, value: int):
-        field = self.get_field(RecordDeviceIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def left_pco(self) -> Optional[int]:
-        field = self.get_field(RecordLeftPcoField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @left_pco.setter
-    def left_pco(self, value: int):
-        field = self.get_field(RecordLeftPcoField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def right_pco(self) -> Optional[int]:
-        field = self.get_field(RecordRightPcoField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @right_pco.setter
-    def right_pco(self, value: int):
-        field = self.get_field(RecordRightPcoField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def left_power_phase(self) -> Optional[list[float]]:
-        field = self.get_field(RecordLeftPowerPhaseField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @left_power_phase.setter
-    def left_power_phase(self, value: list[float]):
-        field = self.get_field(RecordLeftPowerPhaseField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def left_power_phase_peak(self) -> Optional[list[float]]:
-        field = self.get_field(RecordLeftPowerPhasePeakField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @left_power_phase_peak.setter
-    def left_power_phase_peak(self, value: list[float]):
-        field = self.get_field(RecordLeftPowerPhasePeakField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def right_power_phase(self) -> Optional[list[float]]:
-        field = self.get_field(RecordRightPowerPhaseField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @right_power_phase.setter
-    def right_power_phase(self, value: list[float]):
-        field = self.get_field(RecordRightPowerPhaseField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def right_power_phase_peak(self) -> Optional[list[float]]:
-        field = self.get_field(RecordRightPowerPhasePeakField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @right_power_phase_peak.setter
-    def right_power_phase_peak(self, value: list[float]):
-        field = self.get_field(RecordRightPowerPhasePeakField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def enhanced_speed(self) -> Optional[float]:
-        field = self.get_field(RecordEnhancedSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_speed.setter
-    def enhanced_speed(self, value: float):
-        field = self.get_field(RecordEnhancedSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enhanced_altitude(self) -> Optional[float]:
-        field = self.get_field(RecordEnhancedAltitudeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_altitude.setter
-    def enhanced_altitude(self, value: float):
-        field = self.get_field(RecordEnhancedAltitudeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def battery_soc(self) -> Optional[float]:
-        field = self.get_field(RecordBatterySocField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @battery_soc.setter
-    def battery_soc(self, value: float):
-        field = self.get_field(RecordBatterySocField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def motor_power(self) -> Optional[int]:
-        field = self.get_field(RecordMotorPowerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @motor_power.setter
-    def motor_power(self, value: int):
-        field = self.get_field(RecordMotorPowerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def vertical_ratio(self) -> Optional[float]:
-        field = self.get_field(RecordVerticalRatioField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @vertical_ratio.setter
-    def vertical_ratio(self, value: float):
-        field = self.get_field(RecordVerticalRatioField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def stance_time_balance(self) -> Optional[float]:
-        field = self.get_field(RecordStanceTimeBalanceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @stance_time_balance.setter
-    def stance_time_balance(self, value: float):
-        field = self.get_field(RecordStanceTimeBalanceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def step_length(self) -> Optional[float]:
-        field = self.get_field(RecordStepLengthField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @step_length.setter
-    def step_length(self, value: float):
-        field = self.get_field(RecordStepLengthField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def cycle_length16(self) -> Optional[float]:
-        field = self.get_field(RecordCycleLength16Field.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @cycle_length16.setter
-    def cycle_length16(self, value: float):
-        field = self.get_field(RecordCycleLength16Field.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def absolute_pressure(self) -> Optional[int]:
-        field = self.get_field(RecordAbsolutePressureField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @absolute_pressure.setter
-    def absolute_pressure(self, value: int):
-        field = self.get_field(RecordAbsolutePressureField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def depth(self) -> Optional[float]:
-        field = self.get_field(RecordDepthField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @depth.setter
-    def depth(self, value: float):
-        field = self.get_field(RecordDepthField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def next_stop_depth(self) -> Optional[float]:
-        field = self.get_field(RecordNextStopDepthField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @next_stop_depth.setter
-    def next_stop_depth(self, value: float):
-        field = self.get_field(RecordNextStopDepthField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def next_stop_time(self) -> Optional[int]:
-        field = self.get_field(RecordNextStopTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @next_stop_time.setter
-    def next_stop_time(self, value: int):
-        field = self.get_field(RecordNextStopTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def time_to_surface(self) -> Optional[int]:
-        field = self.get_field(RecordTimeToSurfaceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @time_to_surface.setter
-    def time_to_surface(self, value: int):
-        field = self.get_field(RecordTimeToSurfaceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def ndl_time(self) -> Optional[int]:
-        field = self.get_field(RecordNdlTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @ndl_time.setter
-    def ndl_time(self, value: int):
-        field = self.get_field(RecordNdlTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def cns_load(self) -> Optional[int]:
-        field = self.get_field(RecordCnsLoadField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @cns_load.setter
-    def cns_load(self, value: int):
-        field = self.get_field(RecordCnsLoadField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def n2_load(self) -> Optional[int]:
-        field = self.get_field(RecordN2LoadField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @n2_load.setter
-    def n2_load(self, value: int):
-        field = self.get_field(RecordN2LoadField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def respiration_rate(self) -> Optional[int]:
-        field = self.get_field(RecordRespirationRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @respiration_rate.setter
-    def respiration_rate(self, value: int):
-        field = self.get_field(RecordRespirationRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enhanced_respiration_rate(self) -> Optional[float]:
-        field = self.get_field(RecordEnhancedRespirationRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_respiration_rate.setter
-    def enhanced_respiration_rate(self, value: float):
-        field = self.get_field(RecordEnhancedRespirationRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def grit(self) -> Optional[float]:
-        field = self.get_field(RecordGritField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @grit.setter
-    def grit(self, value: float):
-        field = self.get_field(RecordGritField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def flow(self) -> Optional[float]:
-        field = self.get_field(RecordFlowField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @flow.setter
-    def flow(self, value: float):
-        field = self.get_field(RecordFlowField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def current_stress(self) -> Optional[float]:
-        field = self.get_field(RecordCurrentStressField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @current_stress.setter
-    def current_stress(self, value: float):
-        field = self.get_field(RecordCurrentStressField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def ebike_travel_range(self) -> Optional[int]:
-        field = self.get_field(RecordEbikeTravelRangeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @ebike_travel_range.setter
-    def ebike_travel_range(self, value: int):
-        field = self.get_field(RecordEbikeTravelRangeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def ebike_battery_level(self) -> Optional[int]:
-        field = self.get_field(RecordEbikeBatteryLevelField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @ebike_battery_level.setter
-    def ebike_battery_level(self, value: int):
-        field = self.get_field(RecordEbikeBatteryLevelField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def ebike_assist_mode(self) -> Optional[int]:
-        field = self.get_field(RecordEbikeAssistModeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @ebike_assist_mode.setter
-    def ebike_assist_mode(self, value: int):
-        field = self.get_field(RecordEbikeAssistModeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def ebike_assist_level_percent(self) -> Optional[int]:
-        field = self.get_field(RecordEbikeAssistLevelPercentField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @ebike_assist_level_percent.setter
-    def ebike_assist_level_percent(self, value: int):
-        field = self.get_field(RecordEbikeAssistLevelPercentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def air_time_remaining(self) -> Optional[int]:
-        field = self.get_field(RecordAirTimeRemainingField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @air_time_remaining.setter
-    def air_time_remaining(self, value: int):
-        field = self.get_field(RecordAirTimeRemainingField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def pressure_sac(self) -> Optional[float]:
-        field = self.get_field(RecordPressureSacField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @pressure_sac.setter
-    def pressure_sac(self, value: float):
-        field = self.get_field(RecordPressureSacField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def volume_sac(self) -> Optional[float]:
-        field = self.get_field(RecordVolumeSacField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @volume_sac.setter
-    def volume_sac(self, value: float):
-        field = self.get_field(RecordVolumeSacField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def rmv(self) -> Optional[float]:
-        field = self.get_field(RecordRmvField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @rmv.setter
-    def rmv(self, value: float):
-        field = self.get_field(RecordRmvField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def ascent_rate(self) -> Optional[float]:
-        field = self.get_field(RecordAscentRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @ascent_rate.setter
-    def ascent_rate(self, value: float):
-        field = self.get_field(RecordAscentRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def po2(self) -> Optional[float]:
-        field = self.get_field(RecordPo2Field.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @po2.setter
-    def po2(self, value: float):
-        field = self.get_field(RecordPo2Field.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def core_temperature(self) -> Optional[float]:
-        field = self.get_field(RecordCoreTemperatureField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @core_temperature.setter
-    def core_temperature(self, value: float):
-        field = self.get_field(RecordCoreTemperatureField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordPositionLatField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='position_lat',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordPositionLongField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='position_long',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordAltitudeField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='altitude',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 500,
-                 scale = 5,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordHeartRateField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='heart_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'bpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordCadenceField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='cadence',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'rpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordDistanceField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='distance',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordSpeedField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordPowerField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='power',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'watts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordCompressedSpeedDistanceField(Field):
-    ID = 8
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='compressed_speed_distance',
-            field_id=self.ID,
-            base_type=BaseType.BYTE,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'm/s,m',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordGradeField(Field):
-    ID = 9
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='grade',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = '%',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordResistanceField(Field):
-    ID = 10
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='resistance',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordTimeFromCourseField(Field):
-    ID = 11
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time_from_course',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordCycleLengthField(Field):
-    ID = 12
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='cycle_length',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordTemperatureField(Field):
-    ID = 13
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='temperature',
-            field_id=self.ID,
-            base_type=BaseType.SINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'C',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordSpeed1sField(Field):
-    ID = 17
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='speed_1s',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 16,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordCyclesField(Field):
-    ID = 18
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='cycles',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'cycles',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordTotalCyclesField(Field):
-    ID = 19
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_cycles',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'cycles',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordCompressedAccumulatedPowerField(Field):
-    ID = 28
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='compressed_accumulated_power',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'watts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordAccumulatedPowerField(Field):
-    ID = 29
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='accumulated_power',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'watts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordLeftRightBalanceField(Field):
-    ID = 30
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='left_right_balance',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordGpsAccuracyField(Field):
-    ID = 31
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='gps_accuracy',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordVerticalSpeedField(Field):
-    ID = 32
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='vertical_speed',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordCaloriesField(Field):
-    ID = 33
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='calories',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'kcal',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordVerticalOscillationField(Field):
-    ID = 39
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='vertical_oscillation',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = 'mm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordStanceTimePercentField(Field):
-    ID = 40
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='stance_time_percent',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordStanceTimeField(Field):
-    ID = 41
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='stance_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordActivityTypeField(Field):
-    ID = 42
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='activity_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordLeftTorqueEffectivenessField(Field):
-    ID = 43
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='left_torque_effectiveness',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 2,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordRightTorqueEffectivenessField(Field):
-    ID = 44
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='right_torque_effectiveness',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 2,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordLeftPedalSmoothnessField(Field):
-    ID = 45
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='left_pedal_smoothness',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 2,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordRightPedalSmoothnessField(Field):
-    ID = 46
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='right_pedal_smoothness',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 2,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordCombinedPedalSmoothnessField(Field):
-    ID = 47
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='combined_pedal_smoothness',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 2,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordTime128Field(Field):
-    ID = 48
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time128',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 128,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordStrokeTypeField(Field):
-    ID = 49
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='stroke_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordZoneField(Field):
-    ID = 50
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='zone',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordBallSpeedField(Field):
-    ID = 51
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='ball_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordCadence256Field(Field):
-    ID = 52
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='cadence256',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 256,
-                         size = size,
-        units = 'rpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordFractionalCadenceField(Field):
-    ID = 53
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='fractional_cadence',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 128,
-                         size = size,
-        units = 'rpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordTotalHemoglobinConcField(Field):
-    ID = 54
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_hemoglobin_conc',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'g/dL',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordTotalHemoglobinConcMinField(Field):
-    ID = 55
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_hemoglobin_conc_min',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'g/dL',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordTotalHemoglobinConcMaxField(Field):
-    ID = 56
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_hemoglobin_conc_max',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'g/dL',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordSaturatedHemoglobinPercentField(Field):
-    ID = 57
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='saturated_hemoglobin_percent',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = '%',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordSaturatedHemoglobinPercentMinField(Field):
-    ID = 58
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='saturated_hemoglobin_percent_min',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = '%',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordSaturatedHemoglobinPercentMaxField(Field):
-    ID = 59
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='saturated_hemoglobin_percent_max',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = '%',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordDeviceIndexField(Field):
-    ID = 62
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='device_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordLeftPcoField(Field):
-    ID = 67
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='left_pco',
-            field_id=self.ID,
-            base_type=BaseType.SINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordRightPcoField(Field):
-    ID = 68
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='right_pco',
-            field_id=self.ID,
-            base_type=BaseType.SINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordLeftPowerPhaseField(Field):
-    ID = 69
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='left_power_phase',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 0.7111111,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordLeftPowerPhasePeakField(Field):
-    ID = 70
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='left_power_phase_peak',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 0.7111111,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordRightPowerPhaseField(Field):
-    ID = 71
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='right_power_phase',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 0.7111111,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordRightPowerPhasePeakField(Field):
-    ID = 72
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='right_power_phase_peak',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 0.7111111,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordEnhancedSpeedField(Field):
-    ID = 73
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordEnhancedAltitudeField(Field):
-    ID = 78
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_altitude',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 500,
-                 scale = 5,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordBatterySocField(Field):
-    ID = 81
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='battery_soc',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 2,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordMotorPowerField(Field):
-    ID = 82
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='motor_power',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'watts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordVerticalRatioField(Field):
-    ID = 83
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='vertical_ratio',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordStanceTimeBalanceField(Field):
-    ID = 84
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='stance_time_balance',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordStepLengthField(Field):
-    ID = 85
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='step_length',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = 'mm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordCycleLength16Field(Field):
-    ID = 87
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='cycle_length16',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordAbsolutePressureField(Field):
-    ID = 91
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='absolute_pressure',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'Pa',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordDepthField(Field):
-    ID = 92
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='depth',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordNextStopDepthField(Field):
-    ID = 93
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='next_stop_depth',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordNextStopTimeField(Field):
-    ID = 94
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='next_stop_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordTimeToSurfaceField(Field):
-    ID = 95
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time_to_surface',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordNdlTimeField(Field):
-    ID = 96
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='ndl_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordCnsLoadField(Field):
-    ID = 97
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='cns_load',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordN2LoadField(Field):
-    ID = 98
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='n2_load',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordRespirationRateField(Field):
-    ID = 99
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='respiration_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordEnhancedRespirationRateField(Field):
-    ID = 108
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_respiration_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'Breaths/min',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordGritField(Field):
-    ID = 114
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='grit',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordFlowField(Field):
-    ID = 115
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='flow',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordCurrentStressField(Field):
-    ID = 116
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='current_stress',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordEbikeTravelRangeField(Field):
-    ID = 117
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='ebike_travel_range',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'km',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordEbikeBatteryLevelField(Field):
-    ID = 118
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='ebike_battery_level',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordEbikeAssistModeField(Field):
-    ID = 119
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='ebike_assist_mode',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'depends on sensor',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordEbikeAssistLevelPercentField(Field):
-    ID = 120
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='ebike_assist_level_percent',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordAirTimeRemainingField(Field):
-    ID = 123
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='air_time_remaining',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordPressureSacField(Field):
-    ID = 124
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='pressure_sac',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'bar/min',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordVolumeSacField(Field):
-    ID = 125
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='volume_sac',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'L/min',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordRmvField(Field):
-    ID = 126
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='rmv',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'L/min',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordAscentRateField(Field):
-    ID = 127
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='ascent_rate',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordPo2Field(Field):
-    ID = 129
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='po2',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class RecordCoreTemperatureField(Field):
-    ID = 139
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='core_temperature',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'C',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    position_lat: FieldProperty[float] = FieldProperty(0)
+    position_long: FieldProperty[float] = FieldProperty(1)
+    altitude: FieldProperty[float] = FieldProperty(2)
+    heart_rate: FieldProperty[int] = FieldProperty(3)
+    cadence: FieldProperty[int] = FieldProperty(4)
+    distance: FieldProperty[float] = FieldProperty(5)
+    speed: FieldProperty[float] = FieldProperty(6)
+    power: FieldProperty[int] = FieldProperty(7)
+    compressed_speed_distance: FieldProperty[bytes] = FieldProperty(8, is_array=True)
+    grade: FieldProperty[float] = FieldProperty(9)
+    resistance: FieldProperty[int] = FieldProperty(10)
+    time_from_course: FieldProperty[float] = FieldProperty(11)
+    cycle_length: FieldProperty[float] = FieldProperty(12)
+    temperature: FieldProperty[int] = FieldProperty(13)
+    speed_1s: FieldProperty[list[float]] = FieldProperty(17, is_array=True)
+    cycles: FieldProperty[int] = FieldProperty(18)
+    total_cycles: FieldProperty[int] = FieldProperty(19)
+    compressed_accumulated_power: FieldProperty[int] = FieldProperty(28)
+    accumulated_power: FieldProperty[int] = FieldProperty(29)
+    left_right_balance: FieldProperty[int] = FieldProperty(30)
+    gps_accuracy: FieldProperty[int] = FieldProperty(31)
+    vertical_speed: FieldProperty[float] = FieldProperty(32)
+    calories: FieldProperty[int] = FieldProperty(33)
+    vertical_oscillation: FieldProperty[float] = FieldProperty(39)
+    stance_time_percent: FieldProperty[float] = FieldProperty(40)
+    stance_time: FieldProperty[float] = FieldProperty(41)
+    activity_type: FieldProperty[ActivityType] = FieldProperty(42)
+    left_torque_effectiveness: FieldProperty[float] = FieldProperty(43)
+    right_torque_effectiveness: FieldProperty[float] = FieldProperty(44)
+    left_pedal_smoothness: FieldProperty[float] = FieldProperty(45)
+    right_pedal_smoothness: FieldProperty[float] = FieldProperty(46)
+    combined_pedal_smoothness: FieldProperty[float] = FieldProperty(47)
+    time128: FieldProperty[float] = FieldProperty(48)
+    stroke_type: FieldProperty[StrokeType] = FieldProperty(49)
+    zone: FieldProperty[int] = FieldProperty(50)
+    ball_speed: FieldProperty[float] = FieldProperty(51)
+    cadence256: FieldProperty[float] = FieldProperty(52)
+    fractional_cadence: FieldProperty[float] = FieldProperty(53)
+    total_hemoglobin_conc: FieldProperty[float] = FieldProperty(54)
+    total_hemoglobin_conc_min: FieldProperty[float] = FieldProperty(55)
+    total_hemoglobin_conc_max: FieldProperty[float] = FieldProperty(56)
+    saturated_hemoglobin_percent: FieldProperty[float] = FieldProperty(57)
+    saturated_hemoglobin_percent_min: FieldProperty[float] = FieldProperty(58)
+    saturated_hemoglobin_percent_max: FieldProperty[float] = FieldProperty(59)
+    device_index: FieldProperty[int] = FieldProperty(62)
+    left_pco: FieldProperty[int] = FieldProperty(67)
+    right_pco: FieldProperty[int] = FieldProperty(68)
+    left_power_phase: FieldProperty[list[float]] = FieldProperty(69, is_array=True)
+    left_power_phase_peak: FieldProperty[list[float]] = FieldProperty(70, is_array=True)
+    right_power_phase: FieldProperty[list[float]] = FieldProperty(71, is_array=True)
+    right_power_phase_peak: FieldProperty[list[float]] = FieldProperty(72, is_array=True)
+    enhanced_speed: FieldProperty[float] = FieldProperty(73)
+    enhanced_altitude: FieldProperty[float] = FieldProperty(78)
+    battery_soc: FieldProperty[float] = FieldProperty(81)
+    motor_power: FieldProperty[int] = FieldProperty(82)
+    vertical_ratio: FieldProperty[float] = FieldProperty(83)
+    stance_time_balance: FieldProperty[float] = FieldProperty(84)
+    step_length: FieldProperty[float] = FieldProperty(85)
+    cycle_length16: FieldProperty[float] = FieldProperty(87)
+    absolute_pressure: FieldProperty[int] = FieldProperty(91)
+    depth: FieldProperty[float] = FieldProperty(92)
+    next_stop_depth: FieldProperty[float] = FieldProperty(93)
+    next_stop_time: FieldProperty[int] = FieldProperty(94)
+    time_to_surface: FieldProperty[int] = FieldProperty(95)
+    ndl_time: FieldProperty[int] = FieldProperty(96)
+    cns_load: FieldProperty[int] = FieldProperty(97)
+    n2_load: FieldProperty[int] = FieldProperty(98)
+    respiration_rate: FieldProperty[int] = FieldProperty(99)
+    enhanced_respiration_rate: FieldProperty[float] = FieldProperty(108)
+    grit: FieldProperty[float] = FieldProperty(114)
+    flow: FieldProperty[float] = FieldProperty(115)
+    current_stress: FieldProperty[float] = FieldProperty(116)
+    ebike_travel_range: FieldProperty[int] = FieldProperty(117)
+    ebike_battery_level: FieldProperty[int] = FieldProperty(118)
+    ebike_assist_mode: FieldProperty[int] = FieldProperty(119)
+    ebike_assist_level_percent: FieldProperty[int] = FieldProperty(120)
+    air_time_remaining: FieldProperty[int] = FieldProperty(123)
+    pressure_sac: FieldProperty[float] = FieldProperty(124)
+    volume_sac: FieldProperty[float] = FieldProperty(125)
+    rmv: FieldProperty[float] = FieldProperty(126)
+    ascent_rate: FieldProperty[float] = FieldProperty(127)
+    po2: FieldProperty[float] = FieldProperty(129)
+    core_temperature: FieldProperty[float] = FieldProperty(139)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('RecordPositionLatField', 0, 'position_lat', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('RecordPositionLongField', 1, 'position_long', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('RecordAltitudeField', 2, 'altitude', BaseType.UINT16, 500, 5, 'm', '', []),
+    ('RecordHeartRateField', 3, 'heart_rate', BaseType.UINT8, 0, 1, 'bpm', '', []),
+    ('RecordCadenceField', 4, 'cadence', BaseType.UINT8, 0, 1, 'rpm', '', []),
+    ('RecordDistanceField', 5, 'distance', BaseType.UINT32, 0, 100, 'm', '', []),
+    ('RecordSpeedField', 6, 'speed', BaseType.UINT16, 0, 1000, 'm/s', '', []),
+    ('RecordPowerField', 7, 'power', BaseType.UINT16, 0, 1, 'watts', '', []),
+    ('RecordCompressedSpeedDistanceField', 8, 'compressed_speed_distance', BaseType.BYTE, 0, 1, 'm/s,m', '', []),
+    ('RecordGradeField', 9, 'grade', BaseType.SINT16, 0, 100, '%', '', []),
+    ('RecordResistanceField', 10, 'resistance', BaseType.UINT8, 0, 1, '', '', []),
+    ('RecordTimeFromCourseField', 11, 'time_from_course', BaseType.SINT32, 0, 1000, 's', '', []),
+    ('RecordCycleLengthField', 12, 'cycle_length', BaseType.UINT8, 0, 100, 'm', '', []),
+    ('RecordTemperatureField', 13, 'temperature', BaseType.SINT8, 0, 1, 'C', '', []),
+    ('RecordSpeed1sField', 17, 'speed_1s', BaseType.UINT8, 0, 16, 'm/s', '', []),
+    ('RecordCyclesField', 18, 'cycles', BaseType.UINT8, 0, 1, 'cycles', '', []),
+    ('RecordTotalCyclesField', 19, 'total_cycles', BaseType.UINT32, 0, 1, 'cycles', '', []),
+    ('RecordCompressedAccumulatedPowerField', 28, 'compressed_accumulated_power', BaseType.UINT16, 0, 1, 'watts', '', []),
+    ('RecordAccumulatedPowerField', 29, 'accumulated_power', BaseType.UINT32, 0, 1, 'watts', '', []),
+    ('RecordLeftRightBalanceField', 30, 'left_right_balance', BaseType.UINT8, 0, 1, '', '', []),
+    ('RecordGpsAccuracyField', 31, 'gps_accuracy', BaseType.UINT8, 0, 1, 'm', '', []),
+    ('RecordVerticalSpeedField', 32, 'vertical_speed', BaseType.SINT16, 0, 1000, 'm/s', '', []),
+    ('RecordCaloriesField', 33, 'calories', BaseType.UINT16, 0, 1, 'kcal', '', []),
+    ('RecordVerticalOscillationField', 39, 'vertical_oscillation', BaseType.UINT16, 0, 10, 'mm', '', []),
+    ('RecordStanceTimePercentField', 40, 'stance_time_percent', BaseType.UINT16, 0, 100, 'percent', '', []),
+    ('RecordStanceTimeField', 41, 'stance_time', BaseType.UINT16, 0, 10, 'ms', '', []),
+    ('RecordActivityTypeField', 42, 'activity_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('RecordLeftTorqueEffectivenessField', 43, 'left_torque_effectiveness', BaseType.UINT8, 0, 2, 'percent', '', []),
+    ('RecordRightTorqueEffectivenessField', 44, 'right_torque_effectiveness', BaseType.UINT8, 0, 2, 'percent', '', []),
+    ('RecordLeftPedalSmoothnessField', 45, 'left_pedal_smoothness', BaseType.UINT8, 0, 2, 'percent', '', []),
+    ('RecordRightPedalSmoothnessField', 46, 'right_pedal_smoothness', BaseType.UINT8, 0, 2, 'percent', '', []),
+    ('RecordCombinedPedalSmoothnessField', 47, 'combined_pedal_smoothness', BaseType.UINT8, 0, 2, 'percent', '', []),
+    ('RecordTime128Field', 48, 'time128', BaseType.UINT8, 0, 128, 's', '', []),
+    ('RecordStrokeTypeField', 49, 'stroke_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('RecordZoneField', 50, 'zone', BaseType.UINT8, 0, 1, '', '', []),
+    ('RecordBallSpeedField', 51, 'ball_speed', BaseType.UINT16, 0, 100, 'm/s', '', []),
+    ('RecordCadence256Field', 52, 'cadence256', BaseType.UINT16, 0, 256, 'rpm', '', []),
+    ('RecordFractionalCadenceField', 53, 'fractional_cadence', BaseType.UINT8, 0, 128, 'rpm', '', []),
+    ('RecordTotalHemoglobinConcField', 54, 'total_hemoglobin_conc', BaseType.UINT16, 0, 100, 'g/dL', '', []),
+    ('RecordTotalHemoglobinConcMinField', 55, 'total_hemoglobin_conc_min', BaseType.UINT16, 0, 100, 'g/dL', '', []),
+    ('RecordTotalHemoglobinConcMaxField', 56, 'total_hemoglobin_conc_max', BaseType.UINT16, 0, 100, 'g/dL', '', []),
+    ('RecordSaturatedHemoglobinPercentField', 57, 'saturated_hemoglobin_percent', BaseType.UINT16, 0, 10, '%', '', []),
+    ('RecordSaturatedHemoglobinPercentMinField', 58, 'saturated_hemoglobin_percent_min', BaseType.UINT16, 0, 10, '%', '', []),
+    ('RecordSaturatedHemoglobinPercentMaxField', 59, 'saturated_hemoglobin_percent_max', BaseType.UINT16, 0, 10, '%', '', []),
+    ('RecordDeviceIndexField', 62, 'device_index', BaseType.UINT8, 0, 1, '', '', []),
+    ('RecordLeftPcoField', 67, 'left_pco', BaseType.SINT8, 0, 1, 'mm', '', []),
+    ('RecordRightPcoField', 68, 'right_pco', BaseType.SINT8, 0, 1, 'mm', '', []),
+    ('RecordLeftPowerPhaseField', 69, 'left_power_phase', BaseType.UINT8, 0, 0.7111111, 'degrees', '', []),
+    ('RecordLeftPowerPhasePeakField', 70, 'left_power_phase_peak', BaseType.UINT8, 0, 0.7111111, 'degrees', '', []),
+    ('RecordRightPowerPhaseField', 71, 'right_power_phase', BaseType.UINT8, 0, 0.7111111, 'degrees', '', []),
+    ('RecordRightPowerPhasePeakField', 72, 'right_power_phase_peak', BaseType.UINT8, 0, 0.7111111, 'degrees', '', []),
+    ('RecordEnhancedSpeedField', 73, 'enhanced_speed', BaseType.UINT32, 0, 1000, 'm/s', '', []),
+    ('RecordEnhancedAltitudeField', 78, 'enhanced_altitude', BaseType.UINT32, 500, 5, 'm', '', []),
+    ('RecordBatterySocField', 81, 'battery_soc', BaseType.UINT8, 0, 2, 'percent', '', []),
+    ('RecordMotorPowerField', 82, 'motor_power', BaseType.UINT16, 0, 1, 'watts', '', []),
+    ('RecordVerticalRatioField', 83, 'vertical_ratio', BaseType.UINT16, 0, 100, 'percent', '', []),
+    ('RecordStanceTimeBalanceField', 84, 'stance_time_balance', BaseType.UINT16, 0, 100, 'percent', '', []),
+    ('RecordStepLengthField', 85, 'step_length', BaseType.UINT16, 0, 10, 'mm', '', []),
+    ('RecordCycleLength16Field', 87, 'cycle_length16', BaseType.UINT16, 0, 100, 'm', '', []),
+    ('RecordAbsolutePressureField', 91, 'absolute_pressure', BaseType.UINT32, 0, 1, 'Pa', '', []),
+    ('RecordDepthField', 92, 'depth', BaseType.UINT32, 0, 1000, 'm', '', []),
+    ('RecordNextStopDepthField', 93, 'next_stop_depth', BaseType.UINT32, 0, 1000, 'm', '', []),
+    ('RecordNextStopTimeField', 94, 'next_stop_time', BaseType.UINT32, 0, 1, 's', '', []),
+    ('RecordTimeToSurfaceField', 95, 'time_to_surface', BaseType.UINT32, 0, 1, 's', '', []),
+    ('RecordNdlTimeField', 96, 'ndl_time', BaseType.UINT32, 0, 1, 's', '', []),
+    ('RecordCnsLoadField', 97, 'cns_load', BaseType.UINT8, 0, 1, 'percent', '', []),
+    ('RecordN2LoadField', 98, 'n2_load', BaseType.UINT16, 0, 1, 'percent', '', []),
+    ('RecordRespirationRateField', 99, 'respiration_rate', BaseType.UINT8, 0, 1, 's', '', []),
+    ('RecordEnhancedRespirationRateField', 108, 'enhanced_respiration_rate', BaseType.UINT16, 0, 100, 'Breaths/min', '', []),
+    ('RecordGritField', 114, 'grit', BaseType.FLOAT32, 0, 1, '', '', []),
+    ('RecordFlowField', 115, 'flow', BaseType.FLOAT32, 0, 1, '', '', []),
+    ('RecordCurrentStressField', 116, 'current_stress', BaseType.UINT16, 0, 100, '', '', []),
+    ('RecordEbikeTravelRangeField', 117, 'ebike_travel_range', BaseType.UINT16, 0, 1, 'km', '', []),
+    ('RecordEbikeBatteryLevelField', 118, 'ebike_battery_level', BaseType.UINT8, 0, 1, 'percent', '', []),
+    ('RecordEbikeAssistModeField', 119, 'ebike_assist_mode', BaseType.UINT8, 0, 1, 'depends on sensor', '', []),
+    ('RecordEbikeAssistLevelPercentField', 120, 'ebike_assist_level_percent', BaseType.UINT8, 0, 1, 'percent', '', []),
+    ('RecordAirTimeRemainingField', 123, 'air_time_remaining', BaseType.UINT32, 0, 1, 's', '', []),
+    ('RecordPressureSacField', 124, 'pressure_sac', BaseType.UINT16, 0, 100, 'bar/min', '', []),
+    ('RecordVolumeSacField', 125, 'volume_sac', BaseType.UINT16, 0, 100, 'L/min', '', []),
+    ('RecordRmvField', 126, 'rmv', BaseType.UINT16, 0, 100, 'L/min', '', []),
+    ('RecordAscentRateField', 127, 'ascent_rate', BaseType.SINT32, 0, 1000, 'm/s', '', []),
+    ('RecordPo2Field', 129, 'po2', BaseType.UINT8, 0, 100, 'percent', '', []),
+    ('RecordCoreTemperatureField', 139, 'core_temperature', BaseType.UINT16, 0, 100, 'C', '', []),
+])
+
+(
+    TimestampField,
+    RecordPositionLatField,
+    RecordPositionLongField,
+    RecordAltitudeField,
+    RecordHeartRateField,
+    RecordCadenceField,
+    RecordDistanceField,
+    RecordSpeedField,
+    RecordPowerField,
+    RecordCompressedSpeedDistanceField,
+    RecordGradeField,
+    RecordResistanceField,
+    RecordTimeFromCourseField,
+    RecordCycleLengthField,
+    RecordTemperatureField,
+    RecordSpeed1sField,
+    RecordCyclesField,
+    RecordTotalCyclesField,
+    RecordCompressedAccumulatedPowerField,
+    RecordAccumulatedPowerField,
+    RecordLeftRightBalanceField,
+    RecordGpsAccuracyField,
+    RecordVerticalSpeedField,
+    RecordCaloriesField,
+    RecordVerticalOscillationField,
+    RecordStanceTimePercentField,
+    RecordStanceTimeField,
+    RecordActivityTypeField,
+    RecordLeftTorqueEffectivenessField,
+    RecordRightTorqueEffectivenessField,
+    RecordLeftPedalSmoothnessField,
+    RecordRightPedalSmoothnessField,
+    RecordCombinedPedalSmoothnessField,
+    RecordTime128Field,
+    RecordStrokeTypeField,
+    RecordZoneField,
+    RecordBallSpeedField,
+    RecordCadence256Field,
+    RecordFractionalCadenceField,
+    RecordTotalHemoglobinConcField,
+    RecordTotalHemoglobinConcMinField,
+    RecordTotalHemoglobinConcMaxField,
+    RecordSaturatedHemoglobinPercentField,
+    RecordSaturatedHemoglobinPercentMinField,
+    RecordSaturatedHemoglobinPercentMaxField,
+    RecordDeviceIndexField,
+    RecordLeftPcoField,
+    RecordRightPcoField,
+    RecordLeftPowerPhaseField,
+    RecordLeftPowerPhasePeakField,
+    RecordRightPowerPhaseField,
+    RecordRightPowerPhasePeakField,
+    RecordEnhancedSpeedField,
+    RecordEnhancedAltitudeField,
+    RecordBatterySocField,
+    RecordMotorPowerField,
+    RecordVerticalRatioField,
+    RecordStanceTimeBalanceField,
+    RecordStepLengthField,
+    RecordCycleLength16Field,
+    RecordAbsolutePressureField,
+    RecordDepthField,
+    RecordNextStopDepthField,
+    RecordNextStopTimeField,
+    RecordTimeToSurfaceField,
+    RecordNdlTimeField,
+    RecordCnsLoadField,
+    RecordN2LoadField,
+    RecordRespirationRateField,
+    RecordEnhancedRespirationRateField,
+    RecordGritField,
+    RecordFlowField,
+    RecordCurrentStressField,
+    RecordEbikeTravelRangeField,
+    RecordEbikeBatteryLevelField,
+    RecordEbikeAssistModeField,
+    RecordEbikeAssistLevelPercentField,
+    RecordAirTimeRemainingField,
+    RecordPressureSacField,
+    RecordVolumeSacField,
+    RecordRmvField,
+    RecordAscentRateField,
+    RecordPo2Field,
+    RecordCoreTemperatureField,
+) = FIELD_TYPES
+
+RecordMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
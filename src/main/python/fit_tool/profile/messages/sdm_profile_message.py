@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class SdmProfileMessage(DataMessage):
     ID = 5
     NAME = 'sdm_profile'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=SdmProfileMessage.NAME,
@@ -37,34 +25,7 @@ class SdmProfileMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        SdmProfileEnabledField(
-            size=self.__get_field_size(definition_message, SdmProfileEnabledField.ID),
-            growable=definition_message is None), 
-        SdmProfileSdmAntIdField(
-            size=self.__get_field_size(definition_message, SdmProfileSdmAntIdField.ID),
-            growable=definition_message is None), 
-        SdmProfileSdmCalFactorField(
-            size=self.__get_field_size(definition_message, SdmProfileSdmCalFactorField.ID),
-            growable=definition_message is None), 
-        SdmProfileOdometerField(
-            size=self.__get_field_size(definition_message, SdmProfileOdometerField.ID),
-            growable=definition_message is None), 
-        SdmProfileSpeedSourceField(
-            size=self.__get_field_size(definition_message, SdmProfileSpeedSourceField.ID),
-            growable=definition_message is None), 
-        SdmProfileSdmAntIdTransTypeField(
-            size=self.__get_field_size(definition_message, SdmProfileSdmAntIdTransTypeField.ID),
-            growable=definition_message is None), 
-        SdmProfileOdometerRolloverField(
-            size=self.__get_field_size(definition_message, SdmProfileOdometerRolloverField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=SdmProfileMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -73,340 +34,38 @@ class SdmProfileMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enabled(self) -> Optional[bool]:
-        field = self.get_field(SdmProfileEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enabled.setter
-    def enabled(self, value: bool):
-        field = self.get_field(SdmProfileEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sdm_ant_id(self) -> Optional[int]:
-        field = self.get_field(SdmProfileSdmAntIdField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sdm_ant_id.setter
-    def sdm_ant_id(self, value: int):
-        field = self.get_field(SdmProfileSdmAntIdField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sdm_cal_factor(self) -> Optional[float]:
-        field = self.get_field(SdmProfileSdmCalFactorField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sdm_cal_factor.setter
-    def sdm_cal_factor(self, value: float):
-        field = self.get_field(SdmProfileSdmCalFactorField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def odometer(self) -> Optional[float]:
-        field = self.get_field(SdmProfileOdometerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @odometer.setter
-    def odometer(self, value: float):
-        field = self.get_field(SdmProfileOdometerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def speed_source(self) -> Optional[bool]:
-        field = self.get_field(SdmProfileSpeedSourceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @speed_source.setter
-    def speed_source(self, value: bool):
-        field = self.get_field(SdmProfileSpeedSourceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sdm_ant_id_trans_type(self) -> Optional[int]:
-        field = self.get_field(SdmProfileSdmAntIdTransTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sdm_ant_id_trans_type.setter
-    def sdm_ant_id_trans_type(self, value: int):
-        field = self.get_field(SdmProfileSdmAntIdTransTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def odometer_rollover(self) -> Optional[int]:
-        field = self.get_field(SdmProfileOdometerRolloverField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @odometer_rollover.setter
-    def odometer_rollover(self, value: int):
-        field = self.get_field(SdmProfileOdometerRolloverField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SdmProfileEnabledField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SdmProfileSdmAntIdField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sdm_ant_id',
-            field_id=self.ID,
-            base_type=BaseType.UINT16Z,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SdmProfileSdmCalFactorField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sdm_cal_factor',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = '%',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SdmProfileOdometerField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='odometer',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SdmProfileSpeedSourceField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='speed_source',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SdmProfileSdmAntIdTransTypeField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sdm_ant_id_trans_type',
-            field_id=self.ID,
-            base_type=BaseType.UINT8Z,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SdmProfileOdometerRolloverField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='odometer_rollover',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    message_index: FieldProperty[int] = FieldProperty(254)
+    enabled: FieldProperty[bool] = FieldProperty(0)
+    sdm_ant_id: FieldProperty[int] = FieldProperty(1)
+    sdm_cal_factor: FieldProperty[float] = FieldProperty(2)
+    odometer: FieldProperty[float] = FieldProperty(3)
+    speed_source: FieldProperty[bool] = FieldProperty(4)
+    sdm_ant_id_trans_type: FieldProperty[int] = FieldProperty(5)
+    odometer_rollover: FieldProperty[int] = FieldProperty(7)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('SdmProfileEnabledField', 0, 'enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('SdmProfileSdmAntIdField', 1, 'sdm_ant_id', BaseType.UINT16Z, 0, 1, '', '', []),
+    ('SdmProfileSdmCalFactorField', 2, 'sdm_cal_factor', BaseType.UINT16, 0, 10, '%', '', []),
+    ('SdmProfileOdometerField', 3, 'odometer', BaseType.UINT32, 0, 100, 'm', '', []),
+    ('SdmProfileSpeedSourceField', 4, 'speed_source', BaseType.UINT8, 0, 1, '', '', []),
+    ('SdmProfileSdmAntIdTransTypeField', 5, 'sdm_ant_id_trans_type', BaseType.UINT8Z, 0, 1, '', '', []),
+    ('SdmProfileOdometerRolloverField', 7, 'odometer_rollover', BaseType.UINT8, 0, 1, '', '', []),
+])
+
+(
+    MessageIndexField,
+    SdmProfileEnabledField,
+    SdmProfileSdmAntIdField,
+    SdmProfileSdmCalFactorField,
+    SdmProfileOdometerField,
+    SdmProfileSpeedSourceField,
+    SdmProfileSdmAntIdTransTypeField,
+    SdmProfileOdometerRolloverField,
+) = FIELD_TYPES
+
+SdmProfileMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class SegmentFileMessage(DataMessage):
     ID = 151
     NAME = 'segment_file'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=SegmentFileMessage.NAME,
@@ -37,37 +25,7 @@ class SegmentFileMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        SegmentFileFileUuidField(
-            size=self.__get_field_size(definition_message, SegmentFileFileUuidField.ID),
-            growable=definition_message is None), 
-        SegmentFileEnabledField(
-            size=self.__get_field_size(definition_message, SegmentFileEnabledField.ID),
-            growable=definition_message is None), 
-        SegmentFileUserProfilePrimaryKeyField(
-            size=self.__get_field_size(definition_message, SegmentFileUserProfilePrimaryKeyField.ID),
-            growable=definition_message is None), 
-        SegmentFileLeaderTypeField(
-            size=self.__get_field_size(definition_message, SegmentFileLeaderTypeField.ID),
-            growable=definition_message is None), 
-        SegmentFileLeaderGroupPrimaryKeyField(
-            size=self.__get_field_size(definition_message, SegmentFileLeaderGroupPrimaryKeyField.ID),
-            growable=definition_message is None), 
-        SegmentFileLeaderActivityIdField(
-            size=self.__get_field_size(definition_message, SegmentFileLeaderActivityIdField.ID),
-            growable=definition_message is None), 
-        SegmentFileLeaderActivityIdStringField(
-            size=self.__get_field_size(definition_message, SegmentFileLeaderActivityIdStringField.ID),
-            growable=definition_message is None), 
-        SegmentFileDefaultRaceLeaderField(
-            size=self.__get_field_size(definition_message, SegmentFileDefaultRaceLeaderField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=SegmentFileMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -76,371 +34,41 @@ class SegmentFileMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def file_uuid(self) -> Optional[str]:
-        field = self.get_field(SegmentFileFileUuidField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @file_uuid.setter
-    def file_uuid(self, value: str):
-        field = self.get_field(SegmentFileFileUuidField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enabled(self) -> Optional[bool]:
-        field = self.get_field(SegmentFileEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enabled.setter
-    def enabled(self, value: bool):
-        field = self.get_field(SegmentFileEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def user_profile_primary_key(self) -> Optional[int]:
-        field = self.get_field(SegmentFileUserProfilePrimaryKeyField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @user_profile_primary_key.setter
-    def user_profile_primary_key(self, value: int):
-        field = self.get_field(SegmentFileUserProfilePrimaryKeyField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def leader_type(self) -> Optional[list[SegmentLeaderboardType]]:
-        field = self.get_field(SegmentFileLeaderTypeField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @leader_type.setter
-    def leader_type(self, value: list[SegmentLeaderboardType]):
-        field = self.get_field(SegmentFileLeaderTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def leader_group_primary_key(self) -> Optional[list[int]]:
-        field = self.get_field(SegmentFileLeaderGroupPrimaryKeyField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @leader_group_primary_key.setter
-    def leader_group_primary_key(self, value: list[int]):
-        field = self.get_field(SegmentFileLeaderGroupPrimaryKeyField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def leader_activity_id(self) -> Optional[list[int]]:
-        field = self.get_field(SegmentFileLeaderActivityIdField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @leader_activity_id.setter
-    def leader_activity_id(self, value: list[int]):
-        field = self.get_field(SegmentFileLeaderActivityIdField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def leader_activity_id_string(self) -> Optional[str]:
-        field = self.get_field(SegmentFileLeaderActivityIdStringField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @leader_activity_id_string.setter
-    def leader_activity_id_string(self, value: str):
-        field = self.get_field(SegmentFileLeaderActivityIdStringField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def default_race_leader(self) -> Optional[int]:
-        field = self.get_field(SegmentFileDefaultRaceLeaderField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @default_race_leader.setter
-    def default_race_leader(self, value: int):
-        field = self.get_field(SegmentFileDefaultRaceLeaderField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentFileFileUuidField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='file_uuid',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentFileEnabledField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentFileUserProfilePrimaryKeyField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='user_profile_primary_key',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentFileLeaderTypeField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='leader_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentFileLeaderGroupPrimaryKeyField(Field):
-    ID = 8
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='leader_group_primary_key',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentFileLeaderActivityIdField(Field):
-    ID = 9
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='leader_activity_id',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentFileLeaderActivityIdStringField(Field):
-    ID = 10
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='leader_activity_id_string',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentFileDefaultRaceLeaderField(Field):
-    ID = 11
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='default_race_leader',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    message_index: FieldProperty[int] = FieldProperty(254)
+    file_uuid: FieldProperty[str] = FieldProperty(1)
+    enabled: FieldProperty[bool] = FieldProperty(3)
+    user_profile_primary_key: FieldProperty[int] = FieldProperty(4)
+    leader_type: FieldProperty[list[SegmentLeaderboardType]] = FieldProperty(7, is_array=True)
+    leader_group_primary_key: FieldProperty[list[int]] = FieldProperty(8, is_array=True)
+    leader_activity_id: FieldProperty[list[int]] = FieldProperty(9, is_array=True)
+    leader_activity_id_string: FieldProperty[str] = FieldProperty(10)
+    default_race_leader: FieldProperty[int] = FieldProperty(11)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('SegmentFileFileUuidField', 1, 'file_uuid', BaseType.STRING, 0, 1, '', '', []),
+    ('SegmentFileEnabledField', 3, 'enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('SegmentFileUserProfilePrimaryKeyField', 4, 'user_profile_primary_key', BaseType.UINT32, 0, 1, '', '', []),
+    ('SegmentFileLeaderTypeField', 7, 'leader_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('SegmentFileLeaderGroupPrimaryKeyField', 8, 'leader_group_primary_key', BaseType.UINT32, 0, 1, '', '', []),
+    ('SegmentFileLeaderActivityIdField', 9, 'leader_activity_id', BaseType.UINT32, 0, 1, '', '', []),
+    ('SegmentFileLeaderActivityIdStringField', 10, 'leader_activity_id_string', BaseType.STRING, 0, 1, '', '', []),
+    ('SegmentFileDefaultRaceLeaderField', 11, 'default_race_leader', BaseType.UINT8, 0, 1, '', '', []),
+])
+
+(
+    MessageIndexField,
+    SegmentFileFileUuidField,
+    SegmentFileEnabledField,
+    SegmentFileUserProfilePrimaryKeyField,
+    SegmentFileLeaderTypeField,
+    SegmentFileLeaderGroupPrimaryKeyField,
+    SegmentFileLeaderActivityIdField,
+    SegmentFileLeaderActivityIdStringField,
+    SegmentFileDefaultRaceLeaderField,
+) = FIELD_TYPES
+
+SegmentFileMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class SegmentIdMessage(DataMessage):
     ID = 148
     NAME = 'segment_id'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=SegmentIdMessage.NAME,
@@ -37,37 +25,7 @@ class SegmentIdMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        SegmentIdNameField(
-            size=self.__get_field_size(definition_message, SegmentIdNameField.ID),
-            growable=definition_message is None), 
-        SegmentIdUuidField(
-            size=self.__get_field_size(definition_message, SegmentIdUuidField.ID),
-            growable=definition_message is None), 
-        SegmentIdSportField(
-            size=self.__get_field_size(definition_message, SegmentIdSportField.ID),
-            growable=definition_message is None), 
-        SegmentIdEnabledField(
-            size=self.__get_field_size(definition_message, SegmentIdEnabledField.ID),
-            growable=definition_message is None), 
-        SegmentIdUserProfilePrimaryKeyField(
-            size=self.__get_field_size(definition_message, SegmentIdUserProfilePrimaryKeyField.ID),
-            growable=definition_message is None), 
-        SegmentIdDeviceIdField(
-            size=self.__get_field_size(definition_message, SegmentIdDeviceIdField.ID),
-            growable=definition_message is None), 
-        SegmentIdDefaultRaceLeaderField(
-            size=self.__get_field_size(definition_message, SegmentIdDefaultRaceLeaderField.ID),
-            growable=definition_message is None), 
-        SegmentIdDeleteStatusField(
-            size=self.__get_field_size(definition_message, SegmentIdDeleteStatusField.ID),
-            growable=definition_message is None), 
-        SegmentIdSelectionTypeField(
-            size=self.__get_field_size(definition_message, SegmentIdSelectionTypeField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=SegmentIdMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -76,377 +34,41 @@ class SegmentIdMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def segment_id_name(self) -> Optional[str]:
-        field = self.get_field(SegmentIdNameField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @segment_id_name.setter
-    def segment_id_name(self, value: str):
-        field = self.get_field(SegmentIdNameField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def uuid(self) -> Optional[str]:
-        field = self.get_field(SegmentIdUuidField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @uuid.setter
-    def uuid(self, value: str):
-        field = self.get_field(SegmentIdUuidField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sport(self) -> Optional[Sport]:
-        field = self.get_field(SegmentIdSportField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sport.setter
-    def sport(self, value: Sport):
-        field = self.get_field(SegmentIdSportField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enabled(self) -> Optional[bool]:
-        field = self.get_field(SegmentIdEnabledField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enabled.setter
-    def enabled(self, value: bool):
-        field = self.get_field(SegmentIdEnabledField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def user_profile_primary_key(self) -> Optional[int]:
-        field = self.get_field(SegmentIdUserProfilePrimaryKeyField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @user_profile_primary_key.setter
-    def user_profile_primary_key(self, value: int):
-        field = self.get_field(SegmentIdUserProfilePrimaryKeyField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def device_id(self) -> Optional[int]:
-        field = self.get_field(SegmentIdDeviceIdField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @device_id.setter
-    def device_id(self, value: int):
-        field = self.get_field(SegmentIdDeviceIdField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def default_race_leader(self) -> Optional[int]:
-        field = self.get_field(SegmentIdDefaultRaceLeaderField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @default_race_leader.setter
-    def default_race_leader(self, value: int):
-        field = self.get_field(SegmentIdDefaultRaceLeaderField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def delete_status(self) -> Optional[SegmentDeleteStatus]:
-        field = self.get_field(SegmentIdDeleteStatusField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @delete_status.setter
-    def delete_status(self, value: SegmentDeleteStatus):
-        field = self.get_field(SegmentIdDeleteStatusField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def selection_type(self) -> Optional[SegmentSelectionType]:
-        field = self.get_field(SegmentIdSelectionTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @selection_type.setter
-    def selection_type(self, value: SegmentSelectionType):
-        field = self.get_field(SegmentIdSelectionTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class SegmentIdNameField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='name',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentIdUuidField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='uuid',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentIdSportField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sport',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentIdEnabledField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enabled',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentIdUserProfilePrimaryKeyField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='user_profile_primary_key',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentIdDeviceIdField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='device_id',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentIdDefaultRaceLeaderField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='default_race_leader',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentIdDeleteStatusField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='delete_status',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SegmentIdSelectionTypeField(Field):
-    ID = 8
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='selection_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    segment_id_name: FieldProperty[str] = FieldProperty(0)
+    uuid: FieldProperty[str] = FieldProperty(1)
+    sport: FieldProperty[Sport] = FieldProperty(2)
+    enabled: FieldProperty[bool] = FieldProperty(3)
+    user_profile_primary_key: FieldProperty[int] = FieldProperty(4)
+    device_id: FieldProperty[int] = FieldProperty(5)
+    default_race_leader: FieldProperty[int] = FieldProperty(6)
+    delete_status: FieldProperty[SegmentDeleteStatus] = FieldProperty(7)
+    selection_type: FieldProperty[SegmentSelectionType] = FieldProperty(8)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('SegmentIdNameField', 0, 'name', BaseType.STRING, 0, 1, '', '', []),
+    ('SegmentIdUuidField', 1, 'uuid', BaseType.STRING, 0, 1, '', '', []),
+    ('SegmentIdSportField', 2, 'sport', BaseType.ENUM, 0, 1, '', '', []),
+    ('SegmentIdEnabledField', 3, 'enabled', BaseType.UINT8, 0, 1, '', '', []),
+    ('SegmentIdUserProfilePrimaryKeyField', 4, 'user_profile_primary_key', BaseType.UINT32, 0, 1, '', '', []),
+    ('SegmentIdDeviceIdField', 5, 'device_id', BaseType.UINT32, 0, 1, '', '', []),
+    ('SegmentIdDefaultRaceLeaderField', 6, 'default_race_leader', BaseType.UINT8, 0, 1, '', '', []),
+    ('SegmentIdDeleteStatusField', 7, 'delete_status', BaseType.ENUM, 0, 1, '', '', []),
+    ('SegmentIdSelectionTypeField', 8, 'selection_type', BaseType.ENUM, 0, 1, '', '', []),
+])
+
+(
+    SegmentIdNameField,
+    SegmentIdUuidField,
+    SegmentIdSportField,
+    SegmentIdEnabledField,
+    SegmentIdUserProfilePrimaryKeyField,
+    SegmentIdDeviceIdField,
+    SegmentIdDefaultRaceLeaderField,
+    SegmentIdDeleteStatusField,
+    SegmentIdSelectionTypeField,
+) = FIELD_TYPES
+
+SegmentIdMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class SessionMessage(DataMessage):
     ID = 18
     NAME = 'session'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=SessionMessage.NAME,
@@ -37,478 +25,7 @@ class SessionMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        SessionEventField(
-            size=self.__get_field_size(definition_message, SessionEventField.ID),
-            growable=definition_message is None), 
-        SessionEventTypeField(
-            size=self.__get_field_size(definition_message, SessionEventTypeField.ID),
-            growable=definition_message is None), 
-        SessionStartTimeField(
-            size=self.__get_field_size(definition_message, SessionStartTimeField.ID),
-            growable=definition_message is None), 
-        SessionStartPositionLatField(
-            size=self.__get_field_size(definition_message, SessionStartPositionLatField.ID),
-            growable=definition_message is None), 
-        SessionStartPositionLongField(
-            size=self.__get_field_size(definition_message, SessionStartPositionLongField.ID),
-            growable=definition_message is None), 
-        SessionSportField(
-            size=self.__get_field_size(definition_message, SessionSportField.ID),
-            growable=definition_message is None), 
-        SessionSubSportField(
-            size=self.__get_field_size(definition_message, SessionSubSportField.ID),
-            growable=definition_message is None), 
-        SessionTotalElapsedTimeField(
-            size=self.__get_field_size(definition_message, SessionTotalElapsedTimeField.ID),
-            growable=definition_message is None), 
-        SessionTotalTimerTimeField(
-            size=self.__get_field_size(definition_message, SessionTotalTimerTimeField.ID),
-            growable=definition_message is None), 
-        SessionTotalDistanceField(
-            size=self.__get_field_size(definition_message, SessionTotalDistanceField.ID),
-            growable=definition_message is None), 
-        SessionTotalCyclesField(
-            size=self.__get_field_size(definition_message, SessionTotalCyclesField.ID),
-            growable=definition_message is None), 
-        SessionTotalCaloriesField(
-            size=self.__get_field_size(definition_message, SessionTotalCaloriesField.ID),
-            growable=definition_message is None), 
-        SessionTotalFatCaloriesField(
-            size=self.__get_field_size(definition_message, SessionTotalFatCaloriesField.ID),
-            growable=definition_message is None), 
-        SessionAvgSpeedField(
-            size=self.__get_field_size(definition_message, SessionAvgSpeedField.ID),
-            growable=definition_message is None), 
-        SessionMaxSpeedField(
-            size=self.__get_field_size(definition_message, SessionMaxSpeedField.ID),
-            growable=definition_message is None), 
-        SessionAvgHeartRateField(
-            size=self.__get_field_size(definition_message, SessionAvgHeartRateField.ID),
-            growable=definition_message is None), 
-        SessionMaxHeartRateField(
-            size=self.__get_field_size(definition_message, SessionMaxHeartRateField.ID),
-            growable=definition_message is None), 
-        SessionAvgCadenceField(
-            size=self.__get_field_size(definition_message, SessionAvgCadenceField.ID),
-            growable=definition_message is None), 
-        SessionMaxCadenceField(
-            size=self.__get_field_size(definition_message, SessionMaxCadenceField.ID),
-            growable=definition_message is None), 
-        SessionAvgPowerField(
-            size=self.__get_field_size(definition_message, SessionAvgPowerField.ID),
-            growable=definition_message is None), 
-        SessionMaxPowerField(
-            size=self.__get_field_size(definition_message, SessionMaxPowerField.ID),
-            growable=definition_message is None), 
-        SessionTotalAscentField(
-            size=self.__get_field_size(definition_message, SessionTotalAscentField.ID),
-            growable=definition_message is None), 
-        SessionTotalDescentField(
-            size=self.__get_field_size(definition_message, SessionTotalDescentField.ID),
-            growable=definition_message is None), 
-        SessionTotalTrainingEffectField(
-            size=self.__get_field_size(definition_message, SessionTotalTrainingEffectField.ID),
-            growable=definition_message is None), 
-        SessionFirstLapIndexField(
-            size=self.__get_field_size(definition_message, SessionFirstLapIndexField.ID),
-            growable=definition_message is None), 
-        SessionNumLapsField(
-            size=self.__get_field_size(definition_message, SessionNumLapsField.ID),
-            growable=definition_message is None), 
-        SessionEventGroupField(
-            size=self.__get_field_size(definition_message, SessionEventGroupField.ID),
-            growable=definition_message is None), 
-        SessionTriggerField(
-            size=self.__get_field_size(definition_message, SessionTriggerField.ID),
-            growable=definition_message is None), 
-        SessionNecLatField(
-            size=self.__get_field_size(definition_message, SessionNecLatField.ID),
-            growable=definition_message is None), 
-        SessionNecLongField(
-            size=self.__get_field_size(definition_message, SessionNecLongField.ID),
-            growable=definition_message is None), 
-        SessionSwcLatField(
-            size=self.__get_field_size(definition_message, SessionSwcLatField.ID),
-            growable=definition_message is None), 
-        SessionSwcLongField(
-            size=self.__get_field_size(definition_message, SessionSwcLongField.ID),
-            growable=definition_message is None), 
-        SessionNumLengthsField(
-            size=self.__get_field_size(definition_message, SessionNumLengthsField.ID),
-            growable=definition_message is None), 
-        SessionNormalizedPowerField(
-            size=self.__get_field_size(definition_message, SessionNormalizedPowerField.ID),
-            growable=definition_message is None), 
-        SessionTrainingStressScoreField(
-            size=self.__get_field_size(definition_message, SessionTrainingStressScoreField.ID),
-            growable=definition_message is None), 
-        SessionIntensityFactorField(
-            size=self.__get_field_size(definition_message, SessionIntensityFactorField.ID),
-            growable=definition_message is None), 
-        SessionLeftRightBalanceField(
-            size=self.__get_field_size(definition_message, SessionLeftRightBalanceField.ID),
-            growable=definition_message is None), 
-        SessionEndPositionLatField(
-            size=self.__get_field_size(definition_message, SessionEndPositionLatField.ID),
-            growable=definition_message is None), 
-        SessionEndPositionLongField(
-            size=self.__get_field_size(definition_message, SessionEndPositionLongField.ID),
-            growable=definition_message is None), 
-        SessionAvgStrokeCountField(
-            size=self.__get_field_size(definition_message, SessionAvgStrokeCountField.ID),
-            growable=definition_message is None), 
-        SessionAvgStrokeDistanceField(
-            size=self.__get_field_size(definition_message, SessionAvgStrokeDistanceField.ID),
-            growable=definition_message is None), 
-        SessionSwimStrokeField(
-            size=self.__get_field_size(definition_message, SessionSwimStrokeField.ID),
-            growable=definition_message is None), 
-        SessionPoolLengthField(
-            size=self.__get_field_size(definition_message, SessionPoolLengthField.ID),
-            growable=definition_message is None), 
-        SessionThresholdPowerField(
-            size=self.__get_field_size(definition_message, SessionThresholdPowerField.ID),
-            growable=definition_message is None), 
-        SessionPoolLengthUnitField(
-            size=self.__get_field_size(definition_message, SessionPoolLengthUnitField.ID),
-            growable=definition_message is None), 
-        SessionNumActiveLengthsField(
-            size=self.__get_field_size(definition_message, SessionNumActiveLengthsField.ID),
-            growable=definition_message is None), 
-        SessionTotalWorkField(
-            size=self.__get_field_size(definition_message, SessionTotalWorkField.ID),
-            growable=definition_message is None), 
-        SessionAvgAltitudeField(
-            size=self.__get_field_size(definition_message, SessionAvgAltitudeField.ID),
-            growable=definition_message is None), 
-        SessionMaxAltitudeField(
-            size=self.__get_field_size(definition_message, SessionMaxAltitudeField.ID),
-            growable=definition_message is None), 
-        SessionGpsAccuracyField(
-            size=self.__get_field_size(definition_message, SessionGpsAccuracyField.ID),
-            growable=definition_message is None), 
-        SessionAvgGradeField(
-            size=self.__get_field_size(definition_message, SessionAvgGradeField.ID),
-            growable=definition_message is None), 
-        SessionAvgPosGradeField(
-            size=self.__get_field_size(definition_message, SessionAvgPosGradeField.ID),
-            growable=definition_message is None), 
-        SessionAvgNegGradeField(
-            size=self.__get_field_size(definition_message, SessionAvgNegGradeField.ID),
-            growable=definition_message is None), 
-        SessionMaxPosGradeField(
-            size=self.__get_field_size(definition_message, SessionMaxPosGradeField.ID),
-            growable=definition_message is None), 
-        SessionMaxNegGradeField(
-            size=self.__get_field_size(definition_message, SessionMaxNegGradeField.ID),
-            growable=definition_message is None), 
-        SessionAvgTemperatureField(
-            size=self.__get_field_size(definition_message, SessionAvgTemperatureField.ID),
-            growable=definition_message is None), 
-        SessionMaxTemperatureField(
-            size=self.__get_field_size(definition_message, SessionMaxTemperatureField.ID),
-            growable=definition_message is None), 
-        SessionTotalMovingTimeField(
-            size=self.__get_field_size(definition_message, SessionTotalMovingTimeField.ID),
-            growable=definition_message is None), 
-        SessionAvgPosVerticalSpeedField(
-            size=self.__get_field_size(definition_message, SessionAvgPosVerticalSpeedField.ID),
-            growable=definition_message is None), 
-        SessionAvgNegVerticalSpeedField(
-            size=self.__get_field_size(definition_message, SessionAvgNegVerticalSpeedField.ID),
-            growable=definition_message is None), 
-        SessionMaxPosVerticalSpeedField(
-            size=self.__get_field_size(definition_message, SessionMaxPosVerticalSpeedField.ID),
-            growable=definition_message is None), 
-        SessionMaxNegVerticalSpeedField(
-            size=self.__get_field_size(definition_message, SessionMaxNegVerticalSpeedField.ID),
-            growable=definition_message is None), 
-        SessionMinHeartRateField(
-            size=self.__get_field_size(definition_message, SessionMinHeartRateField.ID),
-            growable=definition_message is None), 
-        SessionTimeInHrZoneField(
-            size=self.__get_field_size(definition_message, SessionTimeInHrZoneField.ID),
-            growable=definition_message is None), 
-        SessionTimeInSpeedZoneField(
-            size=self.__get_field_size(definition_message, SessionTimeInSpeedZoneField.ID),
-            growable=definition_message is None), 
-        SessionTimeInCadenceZoneField(
-            size=self.__get_field_size(definition_message, SessionTimeInCadenceZoneField.ID),
-            growable=definition_message is None), 
-        SessionTimeInPowerZoneField(
-            size=self.__get_field_size(definition_message, SessionTimeInPowerZoneField.ID),
-            growable=definition_message is None), 
-        SessionAvgLapTimeField(
-            size=self.__get_field_size(definition_message, SessionAvgLapTimeField.ID),
-            growable=definition_message is None), 
-        SessionBestLapIndexField(
-            size=self.__get_field_size(definition_message, SessionBestLapIndexField.ID),
-            growable=definition_message is None), 
-        SessionMinAltitudeField(
-            size=self.__get_field_size(definition_message, SessionMinAltitudeField.ID),
-            growable=definition_message is None), 
-        SessionPlayerScoreField(
-            size=self.__get_field_size(definition_message, SessionPlayerScoreField.ID),
-            growable=definition_message is None), 
-        SessionOpponentScoreField(
-            size=self.__get_field_size(definition_message, SessionOpponentScoreField.ID),
-            growable=definition_message is None), 
-        SessionOpponentNameField(
-            size=self.__get_field_size(definition_message, SessionOpponentNameField.ID),
-            growable=definition_message is None), 
-        SessionStrokeCountField(
-            size=self.__get_field_size(definition_message, SessionStrokeCountField.ID),
-            growable=definition_message is None), 
-        SessionZoneCountField(
-            size=self.__get_field_size(definition_message, SessionZoneCountField.ID),
-            growable=definition_message is None), 
-        SessionMaxBallSpeedField(
-            size=self.__get_field_size(definition_message, SessionMaxBallSpeedField.ID),
-            growable=definition_message is None), 
-        SessionAvgBallSpeedField(
-            size=self.__get_field_size(definition_message, SessionAvgBallSpeedField.ID),
-            growable=definition_message is None), 
-        SessionAvgVerticalOscillationField(
-            size=self.__get_field_size(definition_message, SessionAvgVerticalOscillationField.ID),
-            growable=definition_message is None), 
-        SessionAvgStanceTimePercentField(
-            size=self.__get_field_size(definition_message, SessionAvgStanceTimePercentField.ID),
-            growable=definition_message is None), 
-        SessionAvgStanceTimeField(
-            size=self.__get_field_size(definition_message, SessionAvgStanceTimeField.ID),
-            growable=definition_message is None), 
-        SessionAvgFractionalCadenceField(
-            size=self.__get_field_size(definition_message, SessionAvgFractionalCadenceField.ID),
-            growable=definition_message is None), 
-        SessionMaxFractionalCadenceField(
-            size=self.__get_field_size(definition_message, SessionMaxFractionalCadenceField.ID),
-            growable=definition_message is None), 
-        SessionTotalFractionalCyclesField(
-            size=self.__get_field_size(definition_message, SessionTotalFractionalCyclesField.ID),
-            growable=definition_message is None), 
-        SessionAvgTotalHemoglobinConcField(
-            size=self.__get_field_size(definition_message, SessionAvgTotalHemoglobinConcField.ID),
-            growable=definition_message is None), 
-        SessionMinTotalHemoglobinConcField(
-            size=self.__get_field_size(definition_message, SessionMinTotalHemoglobinConcField.ID),
-            growable=definition_message is None), 
-        SessionMaxTotalHemoglobinConcField(
-            size=self.__get_field_size(definition_message, SessionMaxTotalHemoglobinConcField.ID),
-            growable=definition_message is None), 
-        SessionAvgSaturatedHemoglobinPercentField(
-            size=self.__get_field_size(definition_message, SessionAvgSaturatedHemoglobinPercentField.ID),
-            growable=definition_message is None), 
-        SessionMinSaturatedHemoglobinPercentField(
-            size=self.__get_field_size(definition_message, SessionMinSaturatedHemoglobinPercentField.ID),
-            growable=definition_message is None), 
-        SessionMaxSaturatedHemoglobinPercentField(
-            size=self.__get_field_size(definition_message, SessionMaxSaturatedHemoglobinPercentField.ID),
-            growable=definition_message is None), 
-        SessionAvgLeftTorqueEffectivenessField(
-            size=self.__get_field_size(definition_message, SessionAvgLeftTorqueEffectivenessField.ID),
-            growable=definition_message is None), 
-        SessionAvgRightTorqueEffectivenessField(
-            size=self.__get_field_size(definition_message, SessionAvgRightTorqueEffectivenessField.ID),
-            growable=definition_message is None), 
-        SessionAvgLeftPedalSmoothnessField(
-            size=self.__get_field_size(definition_message, SessionAvgLeftPedalSmoothnessField.ID),
-            growable=definition_message is None), 
-        SessionAvgRightPedalSmoothnessField(
-            size=self.__get_field_size(definition_message, SessionAvgRightPedalSmoothnessField.ID),
-            growable=definition_message is None), 
-        SessionAvgCombinedPedalSmoothnessField(
-            size=self.__get_field_size(definition_message, SessionAvgCombinedPedalSmoothnessField.ID),
-            growable=definition_message is None), 
-        SessionSportProfileNameField(
-            size=self.__get_field_size(definition_message, SessionSportProfileNameField.ID),
-            growable=definition_message is None), 
-        SessionSportIndexField(
-            size=self.__get_field_size(definition_message, SessionSportIndexField.ID),
-            growable=definition_message is None), 
-        SessionTimeStandingField(
-            size=self.__get_field_size(definition_message, SessionTimeStandingField.ID),
-            growable=definition_message is None), 
-        SessionStandCountField(
-            size=self.__get_field_size(definition_message, SessionStandCountField.ID),
-            growable=definition_message is None), 
-        SessionAvgLeftPcoField(
-            size=self.__get_field_size(definition_message, SessionAvgLeftPcoField.ID),
-            growable=definition_message is None), 
-        SessionAvgRightPcoField(
-            size=self.__get_field_size(definition_message, SessionAvgRightPcoField.ID),
-            growable=definition_message is None), 
-        SessionAvgLeftPowerPhaseField(
-            size=self.__get_field_size(definition_message, SessionAvgLeftPowerPhaseField.ID),
-            growable=definition_message is None), 
-        SessionAvgLeftPowerPhasePeakField(
-            size=self.__get_field_size(definition_message, SessionAvgLeftPowerPhasePeakField.ID),
-            growable=definition_message is None), 
-        SessionAvgRightPowerPhaseField(
-            size=self.__get_field_size(definition_message, SessionAvgRightPowerPhaseField.ID),
-            growable=definition_message is None), 
-        SessionAvgRightPowerPhasePeakField(
-            size=self.__get_field_size(definition_message, SessionAvgRightPowerPhasePeakField.ID),
-            growable=definition_message is None), 
-        SessionAvgPowerPositionField(
-            size=self.__get_field_size(definition_message, SessionAvgPowerPositionField.ID),
-            growable=definition_message is None), 
-        SessionMaxPowerPositionField(
-            size=self.__get_field_size(definition_message, SessionMaxPowerPositionField.ID),
-            growable=definition_message is None), 
-        SessionAvgCadencePositionField(
-            size=self.__get_field_size(definition_message, SessionAvgCadencePositionField.ID),
-            growable=definition_message is None), 
-        SessionMaxCadencePositionField(
-            size=self.__get_field_size(definition_message, SessionMaxCadencePositionField.ID),
-            growable=definition_message is None), 
-        SessionEnhancedAvgSpeedField(
-            size=self.__get_field_size(definition_message, SessionEnhancedAvgSpeedField.ID),
-            growable=definition_message is None), 
-        SessionEnhancedMaxSpeedField(
-            size=self.__get_field_size(definition_message, SessionEnhancedMaxSpeedField.ID),
-            growable=definition_message is None), 
-        SessionEnhancedAvgAltitudeField(
-            size=self.__get_field_size(definition_message, SessionEnhancedAvgAltitudeField.ID),
-            growable=definition_message is None), 
-        SessionEnhancedMinAltitudeField(
-            size=self.__get_field_size(definition_message, SessionEnhancedMinAltitudeField.ID),
-            growable=definition_message is None), 
-        SessionEnhancedMaxAltitudeField(
-            size=self.__get_field_size(definition_message, SessionEnhancedMaxAltitudeField.ID),
-            growable=definition_message is None), 
-        SessionAvgLevMotorPowerField(
-            size=self.__get_field_size(definition_message, SessionAvgLevMotorPowerField.ID),
-            growable=definition_message is None), 
-        SessionMaxLevMotorPowerField(
-            size=self.__get_field_size(definition_message, SessionMaxLevMotorPowerField.ID),
-            growable=definition_message is None), 
-        SessionLevBatteryConsumptionField(
-            size=self.__get_field_size(definition_message, SessionLevBatteryConsumptionField.ID),
-            growable=definition_message is None), 
-        SessionAvgVerticalRatioField(
-            size=self.__get_field_size(definition_message, SessionAvgVerticalRatioField.ID),
-            growable=definition_message is None), 
-        SessionAvgStanceTimeBalanceField(
-            size=self.__get_field_size(definition_message, SessionAvgStanceTimeBalanceField.ID),
-            growable=definition_message is None), 
-        SessionAvgStepLengthField(
-            size=self.__get_field_size(definition_message, SessionAvgStepLengthField.ID),
-            growable=definition_message is None), 
-        SessionTotalAnaerobicTrainingEffectField(
-            size=self.__get_field_size(definition_message, SessionTotalAnaerobicTrainingEffectField.ID),
-            growable=definition_message is None), 
-        SessionAvgVamField(
-            size=self.__get_field_size(definition_message, SessionAvgVamField.ID),
-            growable=definition_message is None), 
-        SessionAvgDepthField(
-            size=self.__get_field_size(definition_message, SessionAvgDepthField.ID),
-            growable=definition_message is None), 
-        SessionMaxDepthField(
-            size=self.__get_field_size(definition_message, SessionMaxDepthField.ID),
-            growable=definition_message is None), 
-        SessionSurfaceIntervalField(
-            size=self.__get_field_size(definition_message, SessionSurfaceIntervalField.ID),
-            growable=definition_message is None), 
-        SessionStartCnsField(
-            size=self.__get_field_size(definition_message, SessionStartCnsField.ID),
-            growable=definition_message is None), 
-        SessionEndCnsField(
-            size=self.__get_field_size(definition_message, SessionEndCnsField.ID),
-            growable=definition_message is None), 
-        SessionStartN2Field(
-            size=self.__get_field_size(definition_message, SessionStartN2Field.ID),
-            growable=definition_message is None), 
-        SessionEndN2Field(
-            size=self.__get_field_size(definition_message, SessionEndN2Field.ID),
-            growable=definition_message is None), 
-        SessionAvgRespirationRateField(
-            size=self.__get_field_size(definition_message, SessionAvgRespirationRateField.ID),
-            growable=definition_message is None), 
-        SessionMaxRespirationRateField(
-            size=self.__get_field_size(definition_message, SessionMaxRespirationRateField.ID),
-            growable=definition_message is None), 
-        SessionMinRespirationRateField(
-            size=self.__get_field_size(definition_message, SessionMinRespirationRateField.ID),
-            growable=definition_message is None), 
-        SessionMinTemperatureField(
-            size=self.__get_field_size(definition_message, SessionMinTemperatureField.ID),
-            growable=definition_message is None), 
-        SessionO2ToxicityField(
-            size=self.__get_field_size(definition_message, SessionO2ToxicityField.ID),
-            growable=definition_message is None), 
-        SessionDiveNumberField(
-            size=self.__get_field_size(definition_message, SessionDiveNumberField.ID),
-            growable=definition_message is None), 
-        SessionTrainingLoadPeakField(
-            size=self.__get_field_size(definition_message, SessionTrainingLoadPeakField.ID),
-            growable=definition_message is None), 
-        SessionEnhancedAvgRespirationRateField(
-            size=self.__get_field_size(definition_message, SessionEnhancedAvgRespirationRateField.ID),
-            growable=definition_message is None), 
-        SessionEnhancedMaxRespirationRateField(
-            size=self.__get_field_size(definition_message, SessionEnhancedMaxRespirationRateField.ID),
-            growable=definition_message is None), 
-        SessionEnhancedMinRespirationRateField(
-            size=self.__get_field_size(definition_message, SessionEnhancedMinRespirationRateField.ID),
-            growable=definition_message is None), 
-        SessionTotalGritField(
-            size=self.__get_field_size(definition_message, SessionTotalGritField.ID),
-            growable=definition_message is None), 
-        SessionTotalFlowField(
-            size=self.__get_field_size(definition_message, SessionTotalFlowField.ID),
-            growable=definition_message is None), 
-        SessionJumpCountField(
-            size=self.__get_field_size(definition_message, SessionJumpCountField.ID),
-            growable=definition_message is None), 
-        SessionAvgGritField(
-            size=self.__get_field_size(definition_message, SessionAvgGritField.ID),
-            growable=definition_message is None), 
-        SessionAvgFlowField(
-            size=self.__get_field_size(definition_message, SessionAvgFlowField.ID),
-            growable=definition_message is None), 
-        SessionWorkoutFeelField(
-            size=self.__get_field_size(definition_message, SessionWorkoutFeelField.ID),
-            growable=definition_message is None), 
-        SessionWorkoutRpeField(
-            size=self.__get_field_size(definition_message, SessionWorkoutRpeField.ID),
-            growable=definition_message is None), 
-        SessionAvgSpo2Field(
-            size=self.__get_field_size(definition_message, SessionAvgSpo2Field.ID),
-            growable=definition_message is None), 
-        SessionAvgStressField(
-            size=self.__get_field_size(definition_message, SessionAvgStressField.ID),
-            growable=definition_message is None), 
-        SessionSdrrHrvField(
-            size=self.__get_field_size(definition_message, SessionSdrrHrvField.ID),
-            growable=definition_message is None), 
-        SessionRmssdHrvField(
-            size=self.__get_field_size(definition_message, SessionRmssdHrvField.ID),
-            growable=definition_message is None), 
-        SessionTotalFractionalAscentField(
-            size=self.__get_field_size(definition_message, SessionTotalFractionalAscentField.ID),
-            growable=definition_message is None), 
-        SessionTotalFractionalDescentField(
-            size=self.__get_field_size(definition_message, SessionTotalFractionalDescentField.ID),
-            growable=definition_message is None), 
-        SessionAvgCoreTemperatureField(
-            size=self.__get_field_size(definition_message, SessionAvgCoreTemperatureField.ID),
-            growable=definition_message is None), 
-        SessionMinCoreTemperatureField(
-            size=self.__get_field_size(definition_message, SessionMinCoreTemperatureField.ID),
-            growable=definition_message is None), 
-        SessionMaxCoreTemperatureField(
-            size=self.__get_field_size(definition_message, SessionMaxCoreTemperatureField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=SessionMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -517,6750 +34,493 @@ class SessionMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def event(self) -> Optional[Event]:
-        field = self.get_field(SessionEventField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @event.setter
-    def event(self, value: Event):
-        field = self.get_field(SessionEventField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def event_type(self) -> Optional[EventType]:
-        field = self.get_field(SessionEventTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @event_type.setter
-    def event_type(self, value: EventType):
-        field = self.get_field(SessionEventTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def start_time(self) -> Optional[int]:
-        field = self.get_field(SessionStartTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @start_time.setter
-    def start_time(self, value: int):
-        field = self.get_field(SessionStartTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def start_position_lat(self) -> Optional[float]:
-        field = self.get_field(SessionStartPositionLatField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @start_position_lat.setter
-    def start_position_lat(self, value: float):
-        field = self.get_field(SessionStartPositionLatField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def start_position_long(self) -> Optional[float]:
-        field = self.get_field(SessionStartPositionLongField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @start_position_long.setter
-    def start_position_long(self, value: float):
-        field = self.get_field(SessionStartPositionLongField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sport(self) -> Optional[Sport]:
-        field = self.get_field(SessionSportField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sport.setter
-    def sport(self, value: Sport):
-        field = self.get_field(SessionSportField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sub_sport(self) -> Optional[SubSport]:
-        field = self.get_field(SessionSubSportField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sub_sport.setter
-    def sub_sport(self, value: SubSport):
-        field = self.get_field(SessionSubSportField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_elapsed_time(self) -> Optional[float]:
-        field = self.get_field(SessionTotalElapsedTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_elapsed_time.setter
-    def total_elapsed_time(self, value: float):
-        field = self.get_field(SessionTotalElapsedTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_timer_time(self) -> Optional[float]:
-        field = self.get_field(SessionTotalTimerTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_timer_time.setter
-    def total_timer_time(self, value: float):
-        field = self.get_field(SessionTotalTimerTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_distance(self) -> Optional[float]:
-        field = self.get_field(SessionTotalDistanceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_distance.setter
-    def total_distance(self, value: float):
-        field = self.get_field(SessionTotalDistanceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_cycles(self) -> Optional[int]:
-        field = self.get_field(SessionTotalCyclesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_cycles.setter
-    def total_cycles(self, value: int):
-        field = self.get_field(SessionTotalCyclesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-    @property
-    def total_strides(self) -> Optional[int]:
-        field = self.get_field(SessionTotalCyclesField.ID)
-        type_field = self.get_field(SessionSportField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [1, 11]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @total_strides.setter
-    def total_strides(self, value: int):
-        field = self.get_field(SessionTotalCyclesField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def total_strokes(self) -> Optional[int]:
-        field = self.get_field(SessionTotalCyclesField.ID)
-        type_field = self.get_field(SessionSportField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [2, 5, 15, 37]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @total_strokes.setter
-    def total_strokes(self, value: int):
-        field = self.get_field(SessionTotalCyclesField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    @property
-    def total_calories(self) -> Optional[int]:
-        field = self.get_field(SessionTotalCaloriesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_calories.setter
-    def total_calories(self, value: int):
-        field = self.get_field(SessionTotalCaloriesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_fat_calories(self) -> Optional[int]:
-        field = self.get_field(SessionTotalFatCaloriesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_fat_calories.setter
-    def total_fat_calories(self, value: int):
-        field = self.get_field(SessionTotalFatCaloriesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_speed(self) -> Optional[float]:
-        field = self.get_field(SessionAvgSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_speed.setter
-    def avg_speed(self, value: float):
-        field = self.get_field(SessionAvgSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_speed(self) -> Optional[float]:
-        field = self.get_field(SessionMaxSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_speed.setter
-    def max_speed(self, value: float):
-        field = self.get_field(SessionMaxSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_heart_rate(self) -> Optional[int]:
-        field = self.get_field(SessionAvgHeartRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_heart_rate.setter
-    def avg_heart_rate(self, value: int):
-        field = self.get_field(SessionAvgHeartRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_heart_rate(self) -> Optional[int]:
-        field = self.get_field(SessionMaxHeartRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_heart_rate.setter
-    def max_heart_rate(self, value: int):
-        field = self.get_field(SessionMaxHeartRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_cadence(self) -> Optional[int]:
-        field = self.get_field(SessionAvgCadenceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_cadence.setter
-    def avg_cadence(self, value: int):
-        field = self.get_field(SessionAvgCadenceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-    @property
-    def avg_running_cadence(self) -> Optional[int]:
-        field = self.get_field(SessionAvgCadenceField.ID)
-        type_field = self.get_field(SessionSportField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [1]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @avg_running_cadence.setter
-    def avg_running_cadence(self, value: int):
-        field = self.get_field(SessionAvgCadenceField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    @property
-    def max_cadence(self) -> Optional[int]:
-        field = self.get_field(SessionMaxCadenceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_cadence.setter
-    def max_cadence(self, value: int):
-        field = self.get_field(SessionMaxCadenceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-    @property
-    def max_running_cadence(self) -> Optional[int]:
-        field = self.get_field(SessionMaxCadenceField.ID)
-        type_field = self.get_field(SessionSportField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [1]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @max_running_cadence.setter
-    def max_running_cadence(self, value: int):
-        field = self.get_field(SessionMaxCadenceField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    @property
-    def avg_power(self) -> Optional[int]:
-        field = self.get_field(SessionAvgPowerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_power.setter
-    def avg_power(self, value: int):
-        field = self.get_field(SessionAvgPowerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_power(self) -> Optional[int]:
-        field = self.get_field(SessionMaxPowerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_power.setter
-    def max_power(self, value: int):
-        field = self.get_field(SessionMaxPowerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_ascent(self) -> Optional[int]:
-        field = self.get_field(SessionTotalAscentField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_ascent.setter
-    def total_ascent(self, value: int):
-        field = self.get_field(SessionTotalAscentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_descent(self) -> Optional[int]:
-        field = self.get_field(SessionTotalDescentField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_descent.setter
-    def total_descent(self, value: int):
-        field = self.get_field(SessionTotalDescentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_training_effect(self) -> Optional[float]:
-        field = self.get_field(SessionTotalTrainingEffectField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_training_effect.setter
-    def total_training_effect(self, value: float):
-        field = self.get_field(SessionTotalTrainingEffectField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def first_lap_index(self) -> Optional[int]:
-        field = self.get_field(SessionFirstLapIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @first_lap_index.setter
-    def first_lap_index(self, value: int):
-        field = self.get_field(SessionFirstLapIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def num_laps(self) -> Optional[int]:
-        field = self.get_field(SessionNumLapsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @num_laps.setter
-    def num_laps(self, value: int):
-        field = self.get_field(SessionNumLapsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def event_group(self) -> Optional[int]:
-        field = self.get_field(SessionEventGroupField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @event_group.setter
-    def event_group(self, value: int):
-        field = self.get_field(SessionEventGroupField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def trigger(self) -> Optional[SessionTrigger]:
-        field = self.get_field(SessionTriggerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @trigger.setter
-    def trigger(self, value: SessionTrigger):
-        field = self.get_field(SessionTriggerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def nec_lat(self) -> Optional[float]:
-        field = self.get_field(SessionNecLatField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @nec_lat.setter
-    def nec_lat(self, value: float):
-        field = self.get_field(SessionNecLatField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def nec_long(self) -> Optional[float]:
-        field = self.get_field(SessionNecLongField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @nec_long.setter
-    def nec_long(self, value: float):
-        field = self.get_field(SessionNecLongField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def swc_lat(self) -> Optional[float]:
-        field = self.get_field(SessionSwcLatField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @swc_lat.setter
-    def swc_lat(self, value: float):
-        field = self.get_field(SessionSwcLatField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def swc_long(self) -> Optional[float]:
-        field = self.get_field(SessionSwcLongField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @swc_long.setter
-    def swc_long(self, value: float):
-        field = self.get_field(SessionSwcLongField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def num_lengths(self) -> Optional[int]:
-        field = self.get_field(SessionNumLengthsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @num_lengths.setter
-    def num_lengths(self, value: int):
-        field = self.get_field(SessionNumLengthsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def normalized_power(self) -> Optional[int]:
-        field = self.get_field(SessionNormalizedPowerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @normalized_power.setter
-    def normalized_power(self, value: int):
-        field = self.get_field(SessionNormalizedPowerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def training_stress_score(self) -> Optional[float]:
-        field = self.get_field(SessionTrainingStressScoreField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @training_stress_score.setter
-    def training_stress_score(self, value: float):
-        field = self.get_field(SessionTrainingStressScoreField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def intensity_factor(self) -> Optional[float]:
-        field = self.get_field(SessionIntensityFactorField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @intensity_factor.setter
-    def intensity_factor(self, value: float):
-        field = self.get_field(SessionIntensityFactorField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def left_right_balance(self) -> Optional[int]:
-        field = self.get_field(SessionLeftRightBalanceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @left_right_balance.setter
-    def left_right_balance(self, value: int):
-        field = self.get_field(SessionLeftRightBalanceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def end_position_lat(self) -> Optional[float]:
-        field = self.get_field(SessionEndPositionLatField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @end_position_lat.setter
-    def end_position_lat(self, value: float):
-        field = self.get_field(SessionEndPositionLatField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def end_position_long(self) -> Optional[float]:
-        field = self.get_field(SessionEndPositionLongField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @end_position_long.setter
-    def end_position_long(self, value: float):
-        field = self.get_field(SessionEndPositionLongField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_stroke_count(self) -> Optional[float]:
-        field = self.get_field(SessionAvgStrokeCountField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_stroke_count.setter
-    def avg_stroke_count(self, value: float):
-        field = self.get_field(SessionAvgStrokeCountField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_stroke_distance(self) -> Optional[float]:
-        field = self.get_field(SessionAvgStrokeDistanceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_stroke_distance.setter
-    def avg_stroke_distance(self, value: float):
-        field = self.get_field(SessionAvgStrokeDistanceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def swim_stroke(self) -> Optional[SwimStroke]:
-        field = self.get_field(SessionSwimStrokeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @swim_stroke.setter
-    def swim_stroke(self, value: SwimStroke):
-        field = self.get_field(SessionSwimStrokeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def pool_length(self) -> Optional[float]:
-        field = self.get_field(SessionPoolLengthField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @pool_length.setter
-    def pool_length(self, value: float):
-        field = self.get_field(SessionPoolLengthField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def threshold_power(self) -> Optional[int]:
-        field = self.get_field(SessionThresholdPowerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @threshold_power.setter
-    def threshold_power(self, value: int):
-        field = self.get_field(SessionThresholdPowerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def pool_length_unit(self) -> Optional[DisplayMeasure]:
-        field = self.get_field(SessionPoolLengthUnitField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @pool_length_unit.setter
-    def pool_length_unit(self, value: DisplayMeasure):
-        field = self.get_field(SessionPoolLengthUnitField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def num_active_lengths(self) -> Optional[int]:
-        field = self.get_field(SessionNumActiveLengthsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @num_active_lengths.setter
-    def num_active_lengths(self, value: int):
-        field = self.get_field(SessionNumActiveLengthsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_work(self) -> Optional[int]:
-        field = self.get_field(SessionTotalWorkField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_work.setter
-    def total_work(self, value: int):
-        field = self.get_field(SessionTotalWorkField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_altitude(self) -> Optional[float]:
-        field = self.get_field(SessionAvgAltitudeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_altitude.setter
-    def avg_altitude(self, value: float):
-        field = self.get_field(SessionAvgAltitudeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_altitude(self) -> Optional[float]:
-        field = self.get_field(SessionMaxAltitudeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_altitude.setter
-    def max_altitude(self, value: float):
-        field = self.get_field(SessionMaxAltitudeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def gps_accuracy(self) -> Optional[int]:
-        field = self.get_field(SessionGpsAccuracyField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @gps_accuracy.setter
-    def gps_accuracy(self, value: int):
-        field = self.get_field(SessionGpsAccuracyField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_grade(self) -> Optional[float]:
-        field = self.get_field(SessionAvgGradeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_grade.setter
-    def avg_grade(self, value: float):
-        field = self.get_field(SessionAvgGradeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_pos_grade(self) -> Optional[float]:
-        field = self.get_field(SessionAvgPosGradeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_pos_grade.setter
-    def avg_pos_grade(self, value: float):
-        field = self.get_field(SessionAvgPosGradeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_neg_grade(self) -> Optional[float]:
-        field = self.get_field(SessionAvgNegGradeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_neg_grade.setter
-    def avg_neg_grade(self, value: float):
-        field = self.get_field(SessionAvgNegGradeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_pos_grade(self) -> Optional[float]:
-        field = self.get_field(SessionMaxPosGradeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_pos_grade.setter
-    def max_pos_grade(self, value: float):
-        field = self.get_field(SessionMaxPosGradeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_neg_grade(self) -> Optional[float]:
-        field = self.get_field(SessionMaxNegGradeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_neg_grade.setter
-    def max_neg_grade(self, value: float):
-        field = self.get_field(SessionMaxNegGradeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_temperature(self) -> Optional[int]:
-        field = self.get_field(SessionAvgTemperatureField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_temperature.setter
-    def avg_temperature(self, value: int):
-        field = self.get_field(SessionAvgTemperatureField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_temperature(self) -> Optional[int]:
-        field = self.get_field(SessionMaxTemperatureField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_temperature.setter
-    def max_temperature(self, value: int):
-        field = self.get_field(SessionMaxTemperatureField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_moving_time(self) -> Optional[float]:
-        field = self.get_field(SessionTotalMovingTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_moving_time.setter
-    def total_moving_time(self, value: float):
-        field = self.get_field(SessionTotalMovingTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_pos_vertical_speed(self) -> Optional[float]:
-        field = self.get_field(SessionAvgPosVerticalSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_pos_vertical_speed.setter
-    def avg_pos_vertical_speed(self, value: float):
-        field = self.get_field(SessionAvgPosVerticalSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_neg_vertical_speed(self) -> Optional[float]:
-        field = self.get_field(SessionAvgNegVerticalSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_neg_vertical_speed.setter
-    def avg_neg_vertical_speed(self, value: float):
-        field = self.get_field(SessionAvgNegVerticalSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_pos_vertical_speed(self) -> Optional[float]:
-        field = self.get_field(SessionMaxPosVerticalSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_pos_vertical_speed.setter
-    def max_pos_vertical_speed(self, value: float):
-        field = self.get_field(SessionMaxPosVerticalSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_neg_vertical_speed(self) -> Optional[float]:
-        field = self.get_field(SessionMaxNegVerticalSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_neg_vertical_speed.setter
-    def max_neg_vertical_speed(self, value: float):
-        field = self.get_field(SessionMaxNegVerticalSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def min_heart_rate(self) -> Optional[int]:
-        field = self.get_field(SessionMinHeartRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @min_heart_rate.setter
-    def min_heart_rate(self, value: int):
-        field = self.get_field(SessionMinHeartRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def time_in_hr_zone(self) -> Optional[list[float]]:
-        field = self.get_field(SessionTimeInHrZoneField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @time_in_hr_zone.setter
-    def time_in_hr_zone(self, value: list[float]):
-        field = self.get_field(SessionTimeInHrZoneField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def time_in_speed_zone(self) -> Optional[list[float]]:
-        field = self.get_field(SessionTimeInSpeedZoneField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @time_in_speed_zone.setter
-    def time_in_speed_zone(self, value: list[float]):
-        field = self.get_field(SessionTimeInSpeedZoneField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def time_in_cadence_zone(self) -> Optional[list[float]]:
-        field = self.get_field(SessionTimeInCadenceZoneField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @time_in_cadence_zone.setter
-    def time_in_cadence_zone(self, value: list[float]):
-        field = self.get_field(SessionTimeInCadenceZoneField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def time_in_power_zone(self) -> Optional[list[float]]:
-        field = self.get_field(SessionTimeInPowerZoneField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @time_in_power_zone.setter
-    def time_in_power_zone(self, value: list[float]):
-        field = self.get_field(SessionTimeInPowerZoneField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def avg_lap_time(self) -> Optional[float]:
-        field = self.get_field(SessionAvgLapTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_lap_time.setter
-    def avg_lap_time(self, value: float):
-        field = self.get_field(SessionAvgLapTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def best_lap_index(self) -> Optional[int]:
-        field = self.get_field(SessionBestLapIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @best_lap_index.setter
-    def best_lap_index(self, value: int):
-        field = self.get_field(SessionBestLapIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def min_altitude(self) -> Optional[float]:
-        field = self.get_field(SessionMinAltitudeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @min_altitude.setter
-    def min_altitude(self, value: float):
-        field = self.get_field(SessionMinAltitudeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def player_score(self) -> Optional[int]:
-        field = self.get_field(SessionPlayerScoreField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @player_score.setter
-    def player_score(self, value: int):
-        field = self.get_field(SessionPlayerScoreField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def opponent_score(self) -> Optional[int]:
-        field = self.get_field(SessionOpponentScoreField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @opponent_score.setter
-    def opponent_score(self, value: int):
-        field = self.get_field(SessionOpponentScoreField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def opponent_name(self) -> Optional[str]:
-        field = self.get_field(SessionOpponentNameField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @opponent_name.setter
-    def opponent_name(self, value: str):
-        field = self.get_field(SessionOpponentNameField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def stroke_count(self) -> Optional[list[int]]:
-        field = self.get_field(SessionStrokeCountField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @stroke_count.setter
-    def stroke_count(self, value: list[int]):
-        field = self.get_field(SessionStrokeCountField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def zone_count(self) -> Optional[list[int]]:
-        field = self.get_field(SessionZoneCountField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @zone_count.setter
-    def zone_count(self, value: list[int]):
-        field = self.get_field(SessionZoneCountField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def max_ball_speed(self) -> Optional[float]:
-        field = self.get_field(SessionMaxBallSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_ball_speed.setter
-    def max_ball_speed(self, value: float):
-        field = self.get_field(SessionMaxBallSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_ball_speed(self) -> Optional[float]:
-        field = self.get_field(SessionAvgBallSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_ball_speed.setter
-    def avg_ball_speed(self, value: float):
-        field = self.get_field(SessionAvgBallSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_vertical_oscillation(self) -> Optional[float]:
-        field = self.get_field(SessionAvgVerticalOscillationField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_vertical_oscillation.setter
-    def avg_vertical_oscillation(self, value: float):
-        field = self.get_field(SessionAvgVerticalOscillationField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_stance_time_percent(self) -> Optional[float]:
-        field = self.get_field(SessionAvgStanceTimePercentField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_stance_time_percent.setter
-    def avg_stance_time_percent(self, value: float):
-        field = self.get_field(SessionAvgStanceTimePercentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_stance_time(self) -> Optional[float]:
-        field = self.get_field(SessionAvgStanceTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_stance_time.setter
-    def avg_stance_time(self, value: float):
-        field = self.get_field(SessionAvgStanceTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_fractional_cadence(self) -> Optional[float]:
-        field = self.get_field(SessionAvgFractionalCadenceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_fractional_cadence.setter
-    def avg_fractional_cadence(self, value: float):
-        field = self.get_field(SessionAvgFractionalCadenceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_fractional_cadence(self) -> Optional[float]:
-        field = self.get_field(SessionMaxFractionalCadenceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_fractional_cadence.setter
-    def max_fractional_cadence(self, value: float):
-        field = self.get_field(SessionMaxFractionalCadenceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_fractional_cycles(self) -> Optional[float]:
-        field = self.get_field(SessionTotalFractionalCyclesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_fractional_cycles.setter
-    def total_fractional_cycles(self, value: float):
-        field = self.get_field(SessionTotalFractionalCyclesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_total_hemoglobin_conc(self) -> Optional[list[float]]:
-        field = self.get_field(SessionAvgTotalHemoglobinConcField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @avg_total_hemoglobin_conc.setter
-    def avg_total_hemoglobin_conc(self, value: list[float]):
-        field = self.get_field(SessionAvgTotalHemoglobinConcField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def min_total_hemoglobin_conc(self) -> Optional[list[float]]:
-        field = self.get_field(SessionMinTotalHemoglobinConcField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @min_total_hemoglobin_conc.setter
-    def min_total_hemoglobin_conc(self, value: list[float]):
-        field = self.get_field(SessionMinTotalHemoglobinConcField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def max_total_hemoglobin_conc(self) -> Optional[list[float]]:
-        field = self.get_field(SessionMaxTotalHemoglobinConcField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @max_total_hemoglobin_conc.setter
-    def max_total_hemoglobin_conc(self, value: list[float]):
-        field = self.get_field(SessionMaxTotalHemoglobinConcField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def avg_saturated_hemoglobin_percent(self) -> Optional[list[float]]:
-        field = self.get_field(SessionAvgSaturatedHemoglobinPercentField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @avg_saturated_hemoglobin_percent.setter
-    def avg_saturated_hemoglobin_percent(self, value: list[float]):
-        field = self.get_field(SessionAvgSaturatedHemoglobinPercentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def min_saturated_hemoglobin_percent(self) -> Optional[list[float]]:
-        field = self.get_field(SessionMinSaturatedHemoglobinPercentField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @min_saturated_hemoglobin_percent.setter
-    def min_saturated_hemoglobin_percent(self, value: list[float]):
-        field = self.get_field(SessionMinSaturatedHemoglobinPercentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def max_saturated_hemoglobin_percent(self) -> Optional[list[float]]:
-        field = self.get_field(SessionMaxSaturatedHemoglobinPercentField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @max_saturated_hemoglobin_percent.setter
-    def max_saturated_hemoglobin_percent(self, value: list[float]):
-        field = self.get_field(SessionMaxSaturatedHemoglobinPercentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def avg_left_torque_effectiveness(self) -> Optional[float]:
-        field = self.get_field(SessionAvgLeftTorqueEffectivenessField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_left_torque_effectiveness.setter
-    def avg_left_torque_effectiveness(self, value: float):
-        field = self.get_field(SessionAvgLeftTorqueEffectivenessField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_right_torque_effectiveness(self) -> Optional[float]:
-        field = self.get_field(SessionAvgRightTorqueEffectivenessField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_right_torque_effectiveness.setter
-    def avg_right_torque_effectiveness(self, value: float):
-        field = self.get_field(SessionAvgRightTorqueEffectivenessField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_left_pedal_smoothness(self) -> Optional[float]:
-        field = self.get_field(SessionAvgLeftPedalSmoothnessField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_left_pedal_smoothness.setter
-    def avg_left_pedal_smoothness(self, value: float):
-        field = self.get_field(SessionAvgLeftPedalSmoothnessField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_right_pedal_smoothness(self) -> Optional[float]:
-        field = self.get_field(SessionAvgRightPedalSmoothnessField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_right_pedal_smoothness.setter
-    def avg_right_pedal_smoothness(self, value: float):
-        field = self.get_field(SessionAvgRightPedalSmoothnessField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_combined_pedal_smoothness(self) -> Optional[float]:
-        field = self.get_field(SessionAvgCombinedPedalSmoothnessField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_combined_pedal_smoothness.setter
-    def avg_combined_pedal_smoothness(self, value: float):
-        field = self.get_field(SessionAvgCombinedPedalSmoothnessField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sport_profile_name(self) -> Optional[str]:
-        field = self.get_field(SessionSportProfileNameField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sport_profile_name.setter
-    def sport_profile_name(self, value: str):
-        field = self.get_field(SessionSportProfileNameField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sport_index(self) -> Optional[int]:
-        field = self.get_field(SessionSportIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sport_index.setter
-    def sport_index(self, value: int):
-        field = self.get_field(SessionSportIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def time_standing(self) -> Optional[float]:
-        field = self.get_field(SessionTimeStandingField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @time_standing.setter
-    def time_standing(self, value: float):
-        field = self.get_field(SessionTimeStandingField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def stand_count(self) -> Optional[int]:
-        field = self.get_field(SessionStandCountField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @stand_count.setter
-    def stand_count(self, value: int):
-        field = self.get_field(SessionStandCountField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_left_pco(self) -> Optional[int]:
-        field = self.get_field(SessionAvgLeftPcoField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_left_pco.setter
-    def avg_left_pco(self, value: int):
-        field = self.get_field(SessionAvgLeftPcoField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_right_pco(self) -> Optional[int]:
-        field = self.get_field(SessionAvgRightPcoField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_right_pco.setter
-    def avg_right_pco(self, value: int):
-        field = self.get_field(SessionAvgRightPcoField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_left_power_phase(self) -> Optional[list[float]]:
-        field = self.get_field(SessionAvgLeftPowerPhaseField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @avg_left_power_phase.setter
-    def avg_left_power_phase(self, value: list[float]):
-        field = self.get_field(SessionAvgLeftPowerPhaseField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def avg_left_power_phase_peak(self) -> Optional[list[float]]:
-        field = self.get_field(SessionAvgLeftPowerPhasePeakField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @avg_left_power_phase_peak.setter
-    def avg_left_power_phase_peak(self, value: list[float]):
-        field = self.get_field(SessionAvgLeftPowerPhasePeakField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def avg_right_power_phase(self) -> Optional[list[float]]:
-        field = self.get_field(SessionAvgRightPowerPhaseField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @avg_right_power_phase.setter
-    def avg_right_power_phase(self, value: list[float]):
-        field = self.get_field(SessionAvgRightPowerPhaseField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def avg_right_power_phase_peak(self) -> Optional[list[float]]:
-        field = self.get_field(SessionAvgRightPowerPhasePeakField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @avg_right_power_phase_peak.setter
-    def avg_right_power_phase_peak(self, value: list[float]):
-        field = self.get_field(SessionAvgRightPowerPhasePeakField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def avg_power_position(self) -> Optional[list[int]]:
-        field = self.get_field(SessionAvgPowerPositionField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @avg_power_position.setter
-    def avg_power_position(self, value: list[int]):
-        field = self.get_field(SessionAvgPowerPositionField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def max_power_position(self) -> Optional[list[int]]:
-        field = self.get_field(SessionMaxPowerPositionField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @max_power_position.setter
-    def max_power_position(self, value: list[int]):
-        field = self.get_field(SessionMaxPowerPositionField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def avg_cadence_position(self) -> Optional[list[int]]:
-        field = self.get_field(SessionAvgCadencePositionField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @avg_cadence_position.setter
-    def avg_cadence_position(self, value: list[int]):
-        field = self.get_field(SessionAvgCadencePositionField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def max_cadence_position(self) -> Optional[list[int]]:
-        field = self.get_field(SessionMaxCadencePositionField.ID)
-        if field and field.is_valid():
-            return field.get_values()
-        else:
-            return None
-
-
-
-    @max_cadence_position.setter
-    def max_cadence_position(self, value: list[int]):
-        field = self.get_field(SessionMaxCadencePositionField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                field.set_values(value)
-
-    
-
-    @property
-    def enhanced_avg_speed(self) -> Optional[float]:
-        field = self.get_field(SessionEnhancedAvgSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_avg_speed.setter
-    def enhanced_avg_speed(self, value: float):
-        field = self.get_field(SessionEnhancedAvgSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enhanced_max_speed(self) -> Optional[float]:
-        field = self.get_field(SessionEnhancedMaxSpeedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_max_speed.setter
-    def enhanced_max_speed(self, value: float):
-        field = self.get_field(SessionEnhancedMaxSpeedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enhanced_avg_altitude(self) -> Optional[float]:
-        field = self.get_field(SessionEnhancedAvgAltitudeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_avg_altitude.setter
-    def enhanced_avg_altitude(self, value: float):
-        field = self.get_field(SessionEnhancedAvgAltitudeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enhanced_min_altitude(self) -> Optional[float]:
-        field = self.get_field(SessionEnhancedMinAltitudeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_min_altitude.setter
-    def enhanced_min_altitude(self, value: float):
-        field = self.get_field(SessionEnhancedMinAltitudeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enhanced_max_altitude(self) -> Optional[float]:
-        field = self.get_field(SessionEnhancedMaxAltitudeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_max_altitude.setter
-    def enhanced_max_altitude(self, value: float):
-        field = self.get_field(SessionEnhancedMaxAltitudeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_lev_motor_power(self) -> Optional[int]:
-        field = self.get_field(SessionAvgLevMotorPowerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_lev_motor_power.setter
-    def avg_lev_motor_power(self, value: int):
-        field = self.get_field(SessionAvgLevMotorPowerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_lev_motor_power(self) -> Optional[int]:
-        field = self.get_field(SessionMaxLevMotorPowerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_lev_motor_power.setter
-    def max_lev_motor_power(self, value: int):
-        field = self.get_field(SessionMaxLevMotorPowerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def lev_battery_consumption(self) -> Optional[float]:
-        field = self.get_field(SessionLevBatteryConsumptionField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @lev_battery_consumption.setter
-    def lev_battery_consumption(self, value: float):
-        field = self.get_field(SessionLevBatteryConsumptionField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_vertical_ratio(self) -> Optional[float]:
-        field = self.get_field(SessionAvgVerticalRatioField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_vertical_ratio.setter
-    def avg_vertical_ratio(self, value: float):
-        field = self.get_field(SessionAvgVerticalRatioField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_stance_time_balance(self) -> Optional[float]:
-        field = self.get_field(SessionAvgStanceTimeBalanceField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_stance_time_balance.setter
-    def avg_stance_time_balance(self, value: float):
-        field = self.get_field(SessionAvgStanceTimeBalanceField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_step_length(self) -> Optional[float]:
-        field = self.get_field(SessionAvgStepLengthField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_step_length.setter
-    def avg_step_length(self, value: float):
-        field = self.get_field(SessionAvgStepLengthField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_anaerobic_training_effect(self) -> Optional[float]:
-        field = self.get_field(SessionTotalAnaerobicTrainingEffectField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_anaerobic_training_effect.setter
-    def total_anaerobic_training_effect(self, value: float):
-        field = self.get_field(SessionTotalAnaerobicTrainingEffectField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_vam(self) -> Optional[float]:
-        field = self.get_field(SessionAvgVamField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_vam.setter
-    def avg_vam(self, value: float):
-        field = self.get_field(SessionAvgVamField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_depth(self) -> Optional[float]:
-        field = self.get_field(SessionAvgDepthField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_depth.setter
-    def avg_depth(self, value: float):
-        field = self.get_field(SessionAvgDepthField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_depth(self) -> Optional[float]:
-        field = self.get_field(SessionMaxDepthField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_depth.setter
-    def max_depth(self, value: float):
-        field = self.get_field(SessionMaxDepthField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def surface_interval(self) -> Optional[int]:
-        field = self.get_field(SessionSurfaceIntervalField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @surface_interval.setter
-    def surface_interval(self, value: int):
-        field = self.get_field(SessionSurfaceIntervalField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def start_cns(self) -> Optional[int]:
-        field = self.get_field(SessionStartCnsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @start_cns.setter
-    def start_cns(self, value: int):
-        field = self.get_field(SessionStartCnsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def end_cns(self) -> Optional[int]:
-        field = self.get_field(SessionEndCnsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @end_cns.setter
-    def end_cns(self, value: int):
-        field = self.get_field(SessionEndCnsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def start_n2(self) -> Optional[int]:
-        field = self.get_field(SessionStartN2Field.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @start_n2.setter
-    def start_n2(self, value: int):
-        field = self.get_field(SessionStartN2Field.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def end_n2(self) -> Optional[int]:
-        field = self.get_field(SessionEndN2Field.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @end_n2.setter
-    def end_n2(self, value: int):
-        field = self.get_field(SessionEndN2Field.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_respiration_rate(self) -> Optional[int]:
-        field = self.get_field(SessionAvgRespirationRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_respiration_rate.setter
-    def avg_respiration_rate(self, value: int):
-        field = self.get_field(SessionAvgRespirationRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_respiration_rate(self) -> Optional[int]:
-        field = self.get_field(SessionMaxRespirationRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_respiration_rate.setter
-    def max_respiration_rate(self, value: int):
-        field = self.get_field(SessionMaxRespirationRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def min_respiration_rate(self) -> Optional[int]:
-        field = self.get_field(SessionMinRespirationRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @min_respiration_rate.setter
-    def min_respiration_rate(self, value: int):
-        field = self.get_field(SessionMinRespirationRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def min_temperature(self) -> Optional[int]:
-        field = self.get_field(SessionMinTemperatureField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @min_temperature.setter
-    def min_temperature(self, value: int):
-        field = self.get_field(SessionMinTemperatureField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def o2_toxicity(self) -> Optional[int]:
-        field = self.get_field(SessionO2ToxicityField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @o2_toxicity.setter
-    def o2_toxicity(self, value: int):
-        field = self.get_field(SessionO2ToxicityField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def dive_number(self) -> Optional[int]:
-        field = self.get_field(SessionDiveNumberField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @dive_number.setter
-    def dive_number(self, value: int):
-        field = self.get_field(SessionDiveNumberField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def training_load_peak(self) -> Optional[float]:
-        field = self.get_field(SessionTrainingLoadPeakField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @training_load_peak.setter
-    def training_load_peak(self, value: float):
-        field = self.get_field(SessionTrainingLoadPeakField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enhanced_avg_respiration_rate(self) -> Optional[float]:
-        field = self.get_field(SessionEnhancedAvgRespirationRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_avg_respiration_rate.setter
-    def enhanced_avg_respiration_rate(self, value: float):
-        field = self.get_field(SessionEnhancedAvgRespirationRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enhanced_max_respiration_rate(self) -> Optional[float]:
-        field = self.get_field(SessionEnhancedMaxRespirationRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_max_respiration_rate.setter
-    def enhanced_max_respiration_rate(self, value: float):
-        field = self.get_field(SessionEnhancedMaxRespirationRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def enhanced_min_respiration_rate(self) -> Optional[float]:
-        field = self.get_field(SessionEnhancedMinRespirationRateField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @enhanced_min_respiration_rate.setter
-    def enhanced_min_respiration_rate(self, value: float):
-        field = self.get_field(SessionEnhancedMinRespirationRateField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_grit(self) -> Optional[float]:
-        field = self.get_field(SessionTotalGritField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_grit.setter
-    def total_grit(self, value: float):
-        field = self.get_field(SessionTotalGritField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_flow(self) -> Optional[float]:
-        field = self.get_field(SessionTotalFlowField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_flow.setter
-    def total_flow(self, value: float):
-        field = self.get_field(SessionTotalFlowField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def jump_count(self) -> Optional[int]:
-        field = self.get_field(SessionJumpCountField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @jump_count.setter
-    def jump_count(self, value: int):
-        field = self.get_field(SessionJumpCountField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_grit(self) -> Optional[float]:
-        field = self.get_field(SessionAvgGritField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_grit.setter
-    def avg_grit(self, value: float):
-        field = self.get_field(SessionAvgGritField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_flow(self) -> Optional[float]:
-        field = self.get_field(SessionAvgFlowField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_flow.setter
-    def avg_flow(self, value: float):
-        field = self.get_field(SessionAvgFlowField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def workout_feel(self) -> Optional[int]:
-        field = self.get_field(SessionWorkoutFeelField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @workout_feel.setter
-    def workout_feel(self, value: int):
-        field = self.get_field(SessionWorkoutFeelField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def workout_rpe(self) -> Optional[int]:
-        field = self.get_field(SessionWorkoutRpeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @workout_rpe.setter
-    def workout_rpe(self, value: int):
-        field = self.get_field(SessionWorkoutRpeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_spo2(self) -> Optional[int]:
-        field = self.get_field(SessionAvgSpo2Field.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_spo2.setter
-    def avg_spo2(self, value: int):
-        field = self.get_field(SessionAvgSpo2Field.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_stress(self) -> Optional[int]:
-        field = self.get_field(SessionAvgStressField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_stress.setter
-    def avg_stress(self, value: int):
-        field = self.get_field(SessionAvgStressField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sdrr_hrv(self) -> Optional[int]:
-        field = self.get_field(SessionSdrrHrvField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sdrr_hrv.setter
-    def sdrr_hrv(self, value: int):
-        field = self.get_field(SessionSdrrHrvField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def rmssd_hrv(self) -> Optional[int]:
-        field = self.get_field(SessionRmssdHrvField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @rmssd_hrv.setter
-    def rmssd_hrv(self, value: int):
-        field = self.get_field(SessionRmssdHrvField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_fractional_ascent(self) -> Optional[float]:
-        field = self.get_field(SessionTotalFractionalAscentField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_fractional_ascent.setter
-    def total_fractional_ascent(self, value: float):
-        field = self.get_field(SessionTotalFractionalAscentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def total_fractional_descent(self) -> Optional[float]:
-        field = self.get_field(SessionTotalFractionalDescentField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @total_fractional_descent.setter
-    def total_fractional_descent(self, value: float):
-        field = self.get_field(SessionTotalFractionalDescentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def avg_core_temperature(self) -> Optional[float]:
-        field = self.get_field(SessionAvgCoreTemperatureField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @avg_core_temperature.setter
-    def avg_core_temperature(self, value: float):
-        field = self.get_field(SessionAvgCoreTemperatureField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def min_core_temperature(self) -> Optional[float]:
-        field = self.get_field(SessionMinCoreTemperatureField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @min_core_temperature.setter
-    def min_core_temperature(self, value: float):
-        field = self.get_field(SessionMinCoreTemperatureField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def max_core_temperature(self) -> Optional[float]:
-        field = self.get_field(SessionMaxCoreTemperatureField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @max_core_temperature.setter
-    def max_core_temperature(self, value: float):
-        field = self.get_field(SessionMaxCoreTemperatureField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEventField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='event',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEventTypeField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='event_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionStartTimeField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='start_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionStartPositionLatField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='start_position_lat',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionStartPositionLongField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='start_position_long',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionSportField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sport',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionSubSportField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sub_sport',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalElapsedTimeField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_elapsed_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalTimerTimeField(Field):
-    ID = 8
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_timer_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalDistanceField(Field):
-    ID = 9
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_distance',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalCyclesField(Field):
-    ID = 10
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_cycles',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'cycles',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        SubField(
-            name='total_strides',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = 'strides',
-        reference_map = {
-        SessionSportField.ID: [1, 11]
-        }), 
-        SubField(
-            name='total_strokes',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = 'strokes',
-        reference_map = {
-        SessionSportField.ID: [2, 5, 15, 37]
-        })
-        ]
-        )
-
-
-class SessionTotalCaloriesField(Field):
-    ID = 11
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_calories',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'kcal',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalFatCaloriesField(Field):
-    ID = 13
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_fat_calories',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'kcal',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgSpeedField(Field):
-    ID = 14
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxSpeedField(Field):
-    ID = 15
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgHeartRateField(Field):
-    ID = 16
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_heart_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'bpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxHeartRateField(Field):
-    ID = 17
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_heart_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'bpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgCadenceField(Field):
-    ID = 18
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_cadence',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'rpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        SubField(
-            name='avg_running_cadence',
-            base_type=BaseType.UINT8,
-        scale = 1,
-                offset = 0,
-        units = 'strides/min',
-        reference_map = {
-        SessionSportField.ID: [1]
-        })
-        ]
-        )
-
-
-class SessionMaxCadenceField(Field):
-    ID = 19
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_cadence',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'rpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        SubField(
-            name='max_running_cadence',
-            base_type=BaseType.UINT8,
-        scale = 1,
-                offset = 0,
-        units = 'strides/min',
-        reference_map = {
-        SessionSportField.ID: [1]
-        })
-        ]
-        )
-
-
-class SessionAvgPowerField(Field):
-    ID = 20
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_power',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'watts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxPowerField(Field):
-    ID = 21
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_power',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'watts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalAscentField(Field):
-    ID = 22
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_ascent',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalDescentField(Field):
-    ID = 23
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_descent',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalTrainingEffectField(Field):
-    ID = 24
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_training_effect',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionFirstLapIndexField(Field):
-    ID = 25
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='first_lap_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionNumLapsField(Field):
-    ID = 26
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='num_laps',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEventGroupField(Field):
-    ID = 27
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='event_group',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTriggerField(Field):
-    ID = 28
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='trigger',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionNecLatField(Field):
-    ID = 29
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='nec_lat',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionNecLongField(Field):
-    ID = 30
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='nec_long',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionSwcLatField(Field):
-    ID = 31
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='swc_lat',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionSwcLongField(Field):
-    ID = 32
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='swc_long',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionNumLengthsField(Field):
-    ID = 33
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='num_lengths',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'lengths',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionNormalizedPowerField(Field):
-    ID = 34
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='normalized_power',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'watts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTrainingStressScoreField(Field):
-    ID = 35
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='training_stress_score',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = 'tss',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionIntensityFactorField(Field):
-    ID = 36
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='intensity_factor',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'if',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionLeftRightBalanceField(Field):
-    ID = 37
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='left_right_balance',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEndPositionLatField(Field):
-    ID = 38
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='end_position_lat',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEndPositionLongField(Field):
-    ID = 39
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='end_position_long',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 11930464.711111112,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgStrokeCountField(Field):
-    ID = 41
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_stroke_count',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = 'strokes/lap',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgStrokeDistanceField(Field):
-    ID = 42
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_stroke_distance',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionSwimStrokeField(Field):
-    ID = 43
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='swim_stroke',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'swim_stroke',
-        type_name = 'swim_stroke',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionPoolLengthField(Field):
-    ID = 44
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='pool_length',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionThresholdPowerField(Field):
-    ID = 45
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='threshold_power',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'watts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionPoolLengthUnitField(Field):
-    ID = 46
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='pool_length_unit',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionNumActiveLengthsField(Field):
-    ID = 47
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='num_active_lengths',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'lengths',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalWorkField(Field):
-    ID = 48
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_work',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'J',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgAltitudeField(Field):
-    ID = 49
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_altitude',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 500,
-                 scale = 5,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxAltitudeField(Field):
-    ID = 50
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_altitude',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 500,
-                 scale = 5,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionGpsAccuracyField(Field):
-    ID = 51
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='gps_accuracy',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgGradeField(Field):
-    ID = 52
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_grade',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = '%',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgPosGradeField(Field):
-    ID = 53
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_pos_grade',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = '%',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgNegGradeField(Field):
-    ID = 54
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_neg_grade',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = '%',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxPosGradeField(Field):
-    ID = 55
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_pos_grade',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = '%',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxNegGradeField(Field):
-    ID = 56
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_neg_grade',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = '%',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgTemperatureField(Field):
-    ID = 57
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_temperature',
-            field_id=self.ID,
-            base_type=BaseType.SINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'C',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxTemperatureField(Field):
-    ID = 58
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_temperature',
-            field_id=self.ID,
-            base_type=BaseType.SINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'C',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalMovingTimeField(Field):
-    ID = 59
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_moving_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgPosVerticalSpeedField(Field):
-    ID = 60
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_pos_vertical_speed',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgNegVerticalSpeedField(Field):
-    ID = 61
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_neg_vertical_speed',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxPosVerticalSpeedField(Field):
-    ID = 62
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_pos_vertical_speed',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxNegVerticalSpeedField(Field):
-    ID = 63
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_neg_vertical_speed',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMinHeartRateField(Field):
-    ID = 64
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='min_heart_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'bpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTimeInHrZoneField(Field):
-    ID = 65
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time_in_hr_zone',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTimeInSpeedZoneField(Field):
-    ID = 66
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time_in_speed_zone',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTimeInCadenceZoneField(Field):
-    ID = 67
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time_in_cadence_zone',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTimeInPowerZoneField(Field):
-    ID = 68
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time_in_power_zone',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgLapTimeField(Field):
-    ID = 69
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_lap_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionBestLapIndexField(Field):
-    ID = 70
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='best_lap_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMinAltitudeField(Field):
-    ID = 71
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='min_altitude',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 500,
-                 scale = 5,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionPlayerScoreField(Field):
-    ID = 82
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='player_score',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionOpponentScoreField(Field):
-    ID = 83
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='opponent_score',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionOpponentNameField(Field):
-    ID = 84
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='opponent_name',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionStrokeCountField(Field):
-    ID = 85
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='stroke_count',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'counts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionZoneCountField(Field):
-    ID = 86
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='zone_count',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'counts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxBallSpeedField(Field):
-    ID = 87
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_ball_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgBallSpeedField(Field):
-    ID = 88
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_ball_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgVerticalOscillationField(Field):
-    ID = 89
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_vertical_oscillation',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = 'mm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgStanceTimePercentField(Field):
-    ID = 90
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_stance_time_percent',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgStanceTimeField(Field):
-    ID = 91
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_stance_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgFractionalCadenceField(Field):
-    ID = 92
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_fractional_cadence',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 128,
-                         size = size,
-        units = 'rpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxFractionalCadenceField(Field):
-    ID = 93
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_fractional_cadence',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 128,
-                         size = size,
-        units = 'rpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalFractionalCyclesField(Field):
-    ID = 94
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_fractional_cycles',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 128,
-                         size = size,
-        units = 'cycles',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgTotalHemoglobinConcField(Field):
-    ID = 95
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_total_hemoglobin_conc',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'g/dL',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMinTotalHemoglobinConcField(Field):
-    ID = 96
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='min_total_hemoglobin_conc',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'g/dL',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxTotalHemoglobinConcField(Field):
-    ID = 97
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_total_hemoglobin_conc',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'g/dL',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgSaturatedHemoglobinPercentField(Field):
-    ID = 98
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_saturated_hemoglobin_percent',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = '%',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMinSaturatedHemoglobinPercentField(Field):
-    ID = 99
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='min_saturated_hemoglobin_percent',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = '%',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxSaturatedHemoglobinPercentField(Field):
-    ID = 100
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_saturated_hemoglobin_percent',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = '%',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgLeftTorqueEffectivenessField(Field):
-    ID = 101
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_left_torque_effectiveness',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 2,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgRightTorqueEffectivenessField(Field):
-    ID = 102
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_right_torque_effectiveness',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 2,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgLeftPedalSmoothnessField(Field):
-    ID = 103
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_left_pedal_smoothness',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 2,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgRightPedalSmoothnessField(Field):
-    ID = 104
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_right_pedal_smoothness',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 2,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgCombinedPedalSmoothnessField(Field):
-    ID = 105
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_combined_pedal_smoothness',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 2,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionSportProfileNameField(Field):
-    ID = 110
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sport_profile_name',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionSportIndexField(Field):
-    ID = 111
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sport_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTimeStandingField(Field):
-    ID = 112
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time_standing',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionStandCountField(Field):
-    ID = 113
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='stand_count',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgLeftPcoField(Field):
-    ID = 114
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_left_pco',
-            field_id=self.ID,
-            base_type=BaseType.SINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgRightPcoField(Field):
-    ID = 115
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_right_pco',
-            field_id=self.ID,
-            base_type=BaseType.SINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgLeftPowerPhaseField(Field):
-    ID = 116
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_left_power_phase',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 0.7111111,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgLeftPowerPhasePeakField(Field):
-    ID = 117
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_left_power_phase_peak',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 0.7111111,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgRightPowerPhaseField(Field):
-    ID = 118
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_right_power_phase',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 0.7111111,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgRightPowerPhasePeakField(Field):
-    ID = 119
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_right_power_phase_peak',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 0.7111111,
-                         size = size,
-        units = 'degrees',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgPowerPositionField(Field):
-    ID = 120
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_power_position',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'watts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxPowerPositionField(Field):
-    ID = 121
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_power_position',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'watts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgCadencePositionField(Field):
-    ID = 122
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_cadence_position',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'rpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxCadencePositionField(Field):
-    ID = 123
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_cadence_position',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'rpm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEnhancedAvgSpeedField(Field):
-    ID = 124
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_avg_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEnhancedMaxSpeedField(Field):
-    ID = 125
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_max_speed',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEnhancedAvgAltitudeField(Field):
-    ID = 126
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_avg_altitude',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 500,
-                 scale = 5,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEnhancedMinAltitudeField(Field):
-    ID = 127
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_min_altitude',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 500,
-                 scale = 5,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEnhancedMaxAltitudeField(Field):
-    ID = 128
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_max_altitude',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 500,
-                 scale = 5,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgLevMotorPowerField(Field):
-    ID = 129
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_lev_motor_power',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'watts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxLevMotorPowerField(Field):
-    ID = 130
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_lev_motor_power',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'watts',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionLevBatteryConsumptionField(Field):
-    ID = 131
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='lev_battery_consumption',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 2,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgVerticalRatioField(Field):
-    ID = 132
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_vertical_ratio',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgStanceTimeBalanceField(Field):
-    ID = 133
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_stance_time_balance',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgStepLengthField(Field):
-    ID = 134
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_step_length',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        units = 'mm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalAnaerobicTrainingEffectField(Field):
-    ID = 137
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_anaerobic_training_effect',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 10,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgVamField(Field):
-    ID = 139
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_vam',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm/s',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgDepthField(Field):
-    ID = 140
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_depth',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxDepthField(Field):
-    ID = 141
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_depth',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1000,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionSurfaceIntervalField(Field):
-    ID = 142
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='surface_interval',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionStartCnsField(Field):
-    ID = 143
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='start_cns',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEndCnsField(Field):
-    ID = 144
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='end_cns',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionStartN2Field(Field):
-    ID = 145
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='start_n2',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEndN2Field(Field):
-    ID = 146
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='end_n2',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgRespirationRateField(Field):
-    ID = 147
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_respiration_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxRespirationRateField(Field):
-    ID = 148
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_respiration_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMinRespirationRateField(Field):
-    ID = 149
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='min_respiration_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMinTemperatureField(Field):
-    ID = 150
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='min_temperature',
-            field_id=self.ID,
-            base_type=BaseType.SINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'C',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionO2ToxicityField(Field):
-    ID = 155
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='o2_toxicity',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'OTUs',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionDiveNumberField(Field):
-    ID = 156
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='dive_number',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTrainingLoadPeakField(Field):
-    ID = 168
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='training_load_peak',
-            field_id=self.ID,
-            base_type=BaseType.SINT32,
-        offset = 0,
-                 scale = 65536,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEnhancedAvgRespirationRateField(Field):
-    ID = 169
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_avg_respiration_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'Breaths/min',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEnhancedMaxRespirationRateField(Field):
-    ID = 170
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_max_respiration_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'Breaths/min',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionEnhancedMinRespirationRateField(Field):
-    ID = 180
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='enhanced_min_respiration_rate',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalGritField(Field):
-    ID = 181
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_grit',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'kGrit',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalFlowField(Field):
-    ID = 182
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_flow',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'Flow',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionJumpCountField(Field):
-    ID = 183
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='jump_count',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgGritField(Field):
-    ID = 186
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_grit',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'kGrit',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgFlowField(Field):
-    ID = 187
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_flow',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'Flow',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionWorkoutFeelField(Field):
-    ID = 192
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='workout_feel',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionWorkoutRpeField(Field):
-    ID = 193
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='workout_rpe',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgSpo2Field(Field):
-    ID = 194
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_spo2',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgStressField(Field):
-    ID = 195
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_stress',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'percent',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionSdrrHrvField(Field):
-    ID = 197
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sdrr_hrv',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mS',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionRmssdHrvField(Field):
-    ID = 198
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='rmssd_hrv',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'mS',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalFractionalAscentField(Field):
-    ID = 199
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_fractional_ascent',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionTotalFractionalDescentField(Field):
-    ID = 200
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='total_fractional_descent',
-            field_id=self.ID,
-            base_type=BaseType.UINT8,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionAvgCoreTemperatureField(Field):
-    ID = 208
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='avg_core_temperature',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'C',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMinCoreTemperatureField(Field):
-    ID = 209
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='min_core_temperature',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'C',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SessionMaxCoreTemperatureField(Field):
-    ID = 210
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='max_core_temperature',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'C',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    message_index: FieldProperty[int] = FieldProperty(254)
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    event: FieldProperty[Event] = FieldProperty(0)
+    event_type: FieldProperty[EventType] = FieldProperty(1)
+    start_time: FieldProperty[int] = FieldProperty(2)
+    start_position_lat: FieldProperty[float] = FieldProperty(3)
+    start_position_long: FieldProperty[float] = FieldProperty(4)
+    sport: FieldProperty[Sport] = FieldProperty(5)
+    sub_sport: FieldProperty[SubSport] = FieldProperty(6)
+    total_elapsed_time: FieldProperty[float] = FieldProperty(7)
+    total_timer_time: FieldProperty[float] = FieldProperty(8)
+    total_distance: FieldProperty[float] = FieldProperty(9)
+    total_cycles: FieldProperty[int] = FieldProperty(10)
+    total_strides: SubFieldProperty[int] = SubFieldProperty(10, 5, [1, 11])
+    total_strokes: SubFieldProperty[int] = SubFieldProperty(10, 5, [2, 5, 15, 37])
+    total_calories: FieldProperty[int] = FieldProperty(11)
+    total_fat_calories: FieldProperty[int] = FieldProperty(13)
+    avg_speed: FieldProperty[float] = FieldProperty(14)
+    max_speed: FieldProperty[float] = FieldProperty(15)
+    avg_heart_rate: FieldProperty[int] = FieldProperty(16)
+    max_heart_rate: FieldProperty[int] = FieldProperty(17)
+    avg_cadence: FieldProperty[int] = FieldProperty(18)
+    avg_running_cadence: SubFieldProperty[int] = SubFieldProperty(18, 5, [1])
+    max_cadence: FieldProperty[int] = FieldProperty(19)
+    max_running_cadence: SubFieldProperty[int] = SubFieldProperty(19, 5, [1])
+    avg_power: FieldProperty[int] = FieldProperty(20)
+    max_power: FieldProperty[int] = FieldProperty(21)
+    total_ascent: FieldProperty[int] = FieldProperty(22)
+    total_descent: FieldProperty[int] = FieldProperty(23)
+    total_training_effect: FieldProperty[float] = FieldProperty(24)
+    first_lap_index: FieldProperty[int] = FieldProperty(25)
+    num_laps: FieldProperty[int] = FieldProperty(26)
+    event_group: FieldProperty[int] = FieldProperty(27)
+    trigger: FieldProperty[SessionTrigger] = FieldProperty(28)
+    nec_lat: FieldProperty[float] = FieldProperty(29)
+    nec_long: FieldProperty[float] = FieldProperty(30)
+    swc_lat: FieldProperty[float] = FieldProperty(31)
+    swc_long: FieldProperty[float] = FieldProperty(32)
+    num_lengths: FieldProperty[int] = FieldProperty(33)
+    normalized_power: FieldProperty[int] = FieldProperty(34)
+    training_stress_score: FieldProperty[float] = FieldProperty(35)
+    intensity_factor: FieldProperty[float] = FieldProperty(36)
+    left_right_balance: FieldProperty[int] = FieldProperty(37)
+    end_position_lat: FieldProperty[float] = FieldProperty(38)
+    end_position_long: FieldProperty[float] = FieldProperty(39)
+    avg_stroke_count: FieldProperty[float] = FieldProperty(41)
+    avg_stroke_distance: FieldProperty[float] = FieldProperty(42)
+    swim_stroke: FieldProperty[SwimStroke] = FieldProperty(43)
+    pool_length: FieldProperty[float] = FieldProperty(44)
+    threshold_power: FieldProperty[int] = FieldProperty(45)
+    pool_length_unit: FieldProperty[DisplayMeasure] = FieldProperty(46)
+    num_active_lengths: FieldProperty[int] = FieldProperty(47)
+    total_work: FieldProperty[int] = FieldProperty(48)
+    avg_altitude: FieldProperty[float] = FieldProperty(49)
+    max_altitude: FieldProperty[float] = FieldProperty(50)
+    gps_accuracy: FieldProperty[int] = FieldProperty(51)
+    avg_grade: FieldProperty[float] = FieldProperty(52)
+    avg_pos_grade: FieldProperty[float] = FieldProperty(53)
+    avg_neg_grade: FieldProperty[float] = FieldProperty(54)
+    max_pos_grade: FieldProperty[float] = FieldProperty(55)
+    max_neg_grade: FieldProperty[float] = FieldProperty(56)
+    avg_temperature: FieldProperty[int] = FieldProperty(57)
+    max_temperature: FieldProperty[int] = FieldProperty(58)
+    total_moving_time: FieldProperty[float] = FieldProperty(59)
+    avg_pos_vertical_speed: FieldProperty[float] = FieldProperty(60)
+    avg_neg_vertical_speed: FieldProperty[float] = FieldProperty(61)
+    max_pos_vertical_speed: FieldProperty[float] = FieldProperty(62)
+    max_neg_vertical_speed: FieldProperty[float] = FieldProperty(63)
+    min_heart_rate: FieldProperty[int] = FieldProperty(64)
+    time_in_hr_zone: FieldProperty[list[float]] = FieldProperty(65, is_array=True)
+    time_in_speed_zone: FieldProperty[list[float]] = FieldProperty(66, is_array=True)
+    time_in_cadence_zone: FieldProperty[list[float]] = FieldProperty(67, is_array=True)
+    time_in_power_zone: FieldProperty[list[float]] = FieldProperty(68, is_array=True)
+    avg_lap_time: FieldProperty[float] = FieldProperty(69)
+    best_lap_index: FieldProperty[int] = FieldProperty(70)
+    min_altitude: FieldProperty[float] = FieldProperty(71)
+    player_score: FieldProperty[int] = FieldProperty(82)
+    opponent_score: FieldProperty[int] = FieldProperty(83)
+    opponent_name: FieldProperty[str] = FieldProperty(84)
+    stroke_count: FieldProperty[list[int]] = FieldProperty(85, is_array=True)
+    zone_count: FieldProperty[list[int]] = FieldProperty(86, is_array=True)
+    max_ball_speed: FieldProperty[float] = FieldProperty(87)
+    avg_ball_speed: FieldProperty[float] = FieldProperty(88)
+    avg_vertical_oscillation: FieldProperty[float] = FieldProperty(89)
+    avg_stance_time_percent: FieldProperty[float] = FieldProperty(90)
+    avg_stance_time: FieldProperty[float] = FieldProperty(91)
+    avg_fractional_cadence: FieldProperty[float] = FieldProperty(92)
+    max_fractional_cadence: FieldProperty[float] = FieldProperty(93)
+    total_fractional_cycles: FieldProperty[float] = FieldProperty(94)
+    avg_total_hemoglobin_conc: FieldProperty[list[float]] = FieldProperty(95, is_array=True)
+    min_total_hemoglobin_conc: FieldProperty[list[float]] = FieldProperty(96, is_array=True)
+    max_total_hemoglobin_conc: FieldProperty[list[float]] = FieldProperty(97, is_array=True)
+    avg_saturated_hemoglobin_percent: FieldProperty[list[float]] = FieldProperty(98, is_array=True)
+    min_saturated_hemoglobin_percent: FieldProperty[list[float]] = FieldProperty(99, is_array=True)
+    max_saturated_hemoglobin_percent: FieldProperty[list[float]] = FieldProperty(100, is_array=True)
+    avg_left_torque_effectiveness: FieldProperty[float] = FieldProperty(101)
+    avg_right_torque_effectiveness: FieldProperty[float] = FieldProperty(102)
+    avg_left_pedal_smoothness: FieldProperty[float] = FieldProperty(103)
+    avg_right_pedal_smoothness: FieldProperty[float] = FieldProperty(104)
+    avg_combined_pedal_smoothness: FieldProperty[float] = FieldProperty(105)
+    sport_profile_name: FieldProperty[str] = FieldProperty(110)
+    sport_index: FieldProperty[int] = FieldProperty(111)
+    time_standing: FieldProperty[float] = FieldProperty(112)
+    stand_count: FieldProperty[int] = FieldProperty(113)
+    avg_left_pco: FieldProperty[int] = FieldProperty(114)
+    avg_right_pco: FieldProperty[int] = FieldProperty(115)
+    avg_left_power_phase: FieldProperty[list[float]] = FieldProperty(116, is_array=True)
+    avg_left_power_phase_peak: FieldProperty[list[float]] = FieldProperty(117, is_array=True)
+    avg_right_power_phase: FieldProperty[list[float]] = FieldProperty(118, is_array=True)
+    avg_right_power_phase_peak: FieldProperty[list[float]] = FieldProperty(119, is_array=True)
+    avg_power_position: FieldProperty[list[int]] = FieldProperty(120, is_array=True)
+    max_power_position: FieldProperty[list[int]] = FieldProperty(121, is_array=True)
+    avg_cadence_position: FieldProperty[list[int]] = FieldProperty(122, is_array=True)
+    max_cadence_position: FieldProperty[list[int]] = FieldProperty(123, is_array=True)
+    enhanced_avg_speed: FieldProperty[float] = FieldProperty(124)
+    enhanced_max_speed: FieldProperty[float] = FieldProperty(125)
+    enhanced_avg_altitude: FieldProperty[float] = FieldProperty(126)
+    enhanced_min_altitude: FieldProperty[float] = FieldProperty(127)
+    enhanced_max_altitude: FieldProperty[float] = FieldProperty(128)
+    avg_lev_motor_power: FieldProperty[int] = FieldProperty(129)
+    max_lev_motor_power: FieldProperty[int] = FieldProperty(130)
+    lev_battery_consumption: FieldProperty[float] = FieldProperty(131)
+    avg_vertical_ratio: FieldProperty[float] = FieldProperty(132)
+    avg_stance_time_balance: FieldProperty[float] = FieldProperty(133)
+    avg_step_length: FieldProperty[float] = FieldProperty(134)
+    total_anaerobic_training_effect: FieldProperty[float] = FieldProperty(137)
+    avg_vam: FieldProperty[float] = FieldProperty(139)
+    avg_depth: FieldProperty[float] = FieldProperty(140)
+    max_depth: FieldProperty[float] = FieldProperty(141)
+    surface_interval: FieldProperty[int] = FieldProperty(142)
+    start_cns: FieldProperty[int] = FieldProperty(143)
+    end_cns: FieldProperty[int] = FieldProperty(144)
+    start_n2: FieldProperty[int] = FieldProperty(145)
+    end_n2: FieldProperty[int] = FieldProperty(146)
+    avg_respiration_rate: FieldProperty[int] = FieldProperty(147)
+    max_respiration_rate: FieldProperty[int] = FieldProperty(148)
+    min_respiration_rate: FieldProperty[int] = FieldProperty(149)
+    min_temperature: FieldProperty[int] = FieldProperty(150)
+    o2_toxicity: FieldProperty[int] = FieldProperty(155)
+    dive_number: FieldProperty[int] = FieldProperty(156)
+    training_load_peak: FieldProperty[float] = FieldProperty(168)
+    enhanced_avg_respiration_rate: FieldProperty[float] = FieldProperty(169)
+    enhanced_max_respiration_rate: FieldProperty[float] = FieldProperty(170)
+    enhanced_min_respiration_rate: FieldProperty[float] = FieldProperty(180)
+    total_grit: FieldProperty[float] = FieldProperty(181)
+    total_flow: FieldProperty[float] = FieldProperty(182)
+    jump_count: FieldProperty[int] = FieldProperty(183)
+    avg_grit: FieldProperty[float] = FieldProperty(186)
+    avg_flow: FieldProperty[float] = FieldProperty(187)
+    workout_feel: FieldProperty[int] = FieldProperty(192)
+    workout_rpe: FieldProperty[int] = FieldProperty(193)
+    avg_spo2: FieldProperty[int] = FieldProperty(194)
+    avg_stress: FieldProperty[int] = FieldProperty(195)
+    sdrr_hrv: FieldProperty[int] = FieldProperty(197)
+    rmssd_hrv: FieldProperty[int] = FieldProperty(198)
+    total_fractional_ascent: FieldProperty[float] = FieldProperty(199)
+    total_fractional_descent: FieldProperty[float] = FieldProperty(200)
+    avg_core_temperature: FieldProperty[float] = FieldProperty(208)
+    min_core_temperature: FieldProperty[float] = FieldProperty(209)
+    max_core_temperature: FieldProperty[float] = FieldProperty(210)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('SessionEventField', 0, 'event', BaseType.ENUM, 0, 1, '', '', []),
+    ('SessionEventTypeField', 1, 'event_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('SessionStartTimeField', 2, 'start_time', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('SessionStartPositionLatField', 3, 'start_position_lat', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('SessionStartPositionLongField', 4, 'start_position_long', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('SessionSportField', 5, 'sport', BaseType.ENUM, 0, 1, '', '', []),
+    ('SessionSubSportField', 6, 'sub_sport', BaseType.ENUM, 0, 1, '', '', []),
+    ('SessionTotalElapsedTimeField', 7, 'total_elapsed_time', BaseType.UINT32, 0, 1000, 's', '', []),
+    ('SessionTotalTimerTimeField', 8, 'total_timer_time', BaseType.UINT32, 0, 1000, 's', '', []),
+    ('SessionTotalDistanceField', 9, 'total_distance', BaseType.UINT32, 0, 100, 'm', '', []),
+    ('SessionTotalCyclesField', 10, 'total_cycles', BaseType.UINT32, 0, 1, 'cycles', '', [
+        ('total_strides', BaseType.UINT32, 1, 0, 'strides', {5: [1, 11]}),
+        ('total_strokes', BaseType.UINT32, 1, 0, 'strokes', {5: [2, 5, 15, 37]}),
+    ]),
+    ('SessionTotalCaloriesField', 11, 'total_calories', BaseType.UINT16, 0, 1, 'kcal', '', []),
+    ('SessionTotalFatCaloriesField', 13, 'total_fat_calories', BaseType.UINT16, 0, 1, 'kcal', '', []),
+    ('SessionAvgSpeedField', 14, 'avg_speed', BaseType.UINT16, 0, 1000, 'm/s', '', []),
+    ('SessionMaxSpeedField', 15, 'max_speed', BaseType.UINT16, 0, 1000, 'm/s', '', []),
+    ('SessionAvgHeartRateField', 16, 'avg_heart_rate', BaseType.UINT8, 0, 1, 'bpm', '', []),
+    ('SessionMaxHeartRateField', 17, 'max_heart_rate', BaseType.UINT8, 0, 1, 'bpm', '', []),
+    ('SessionAvgCadenceField', 18, 'avg_cadence', BaseType.UINT8, 0, 1, 'rpm', '', [
+        ('avg_running_cadence', BaseType.UINT8, 1, 0, 'strides/min', {5: [1]}),
+    ]),
+    ('SessionMaxCadenceField', 19, 'max_cadence', BaseType.UINT8, 0, 1, 'rpm', '', [
+        ('max_running_cadence', BaseType.UINT8, 1, 0, 'strides/min', {5: [1]}),
+    ]),
+    ('SessionAvgPowerField', 20, 'avg_power', BaseType.UINT16, 0, 1, 'watts', '', []),
+    ('SessionMaxPowerField', 21, 'max_power', BaseType.UINT16, 0, 1, 'watts', '', []),
+    ('SessionTotalAscentField', 22, 'total_ascent', BaseType.UINT16, 0, 1, 'm', '', []),
+    ('SessionTotalDescentField', 23, 'total_descent', BaseType.UINT16, 0, 1, 'm', '', []),
+    ('SessionTotalTrainingEffectField', 24, 'total_training_effect', BaseType.UINT8, 0, 10, '', '', []),
+    ('SessionFirstLapIndexField', 25, 'first_lap_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('SessionNumLapsField', 26, 'num_laps', BaseType.UINT16, 0, 1, '', '', []),
+    ('SessionEventGroupField', 27, 'event_group', BaseType.UINT8, 0, 1, '', '', []),
+    ('SessionTriggerField', 28, 'trigger', BaseType.ENUM, 0, 1, '', '', []),
+    ('SessionNecLatField', 29, 'nec_lat', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('SessionNecLongField', 30, 'nec_long', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('SessionSwcLatField', 31, 'swc_lat', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('SessionSwcLongField', 32, 'swc_long', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('SessionNumLengthsField', 33, 'num_lengths', BaseType.UINT16, 0, 1, 'lengths', '', []),
+    ('SessionNormalizedPowerField', 34, 'normalized_power', BaseType.UINT16, 0, 1, 'watts', '', []),
+    ('SessionTrainingStressScoreField', 35, 'training_stress_score', BaseType.UINT16, 0, 10, 'tss', '', []),
+    ('SessionIntensityFactorField', 36, 'intensity_factor', BaseType.UINT16, 0, 1000, 'if', '', []),
+    ('SessionLeftRightBalanceField', 37, 'left_right_balance', BaseType.UINT16, 0, 1, '', '', []),
+    ('SessionEndPositionLatField', 38, 'end_position_lat', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('SessionEndPositionLongField', 39, 'end_position_long', BaseType.SINT32, 0, 11930464.711111112, 'degrees', '', []),
+    ('SessionAvgStrokeCountField', 41, 'avg_stroke_count', BaseType.UINT32, 0, 10, 'strokes/lap', '', []),
+    ('SessionAvgStrokeDistanceField', 42, 'avg_stroke_distance', BaseType.UINT16, 0, 100, 'm', '', []),
+    ('SessionSwimStrokeField', 43, 'swim_stroke', BaseType.ENUM, 0, 1, 'swim_stroke', 'swim_stroke', []),
+    ('SessionPoolLengthField', 44, 'pool_length', BaseType.UINT16, 0, 100, 'm', '', []),
+    ('SessionThresholdPowerField', 45, 'threshold_power', BaseType.UINT16, 0, 1, 'watts', '', []),
+    ('SessionPoolLengthUnitField', 46, 'pool_length_unit', BaseType.ENUM, 0, 1, '', '', []),
+    ('SessionNumActiveLengthsField', 47, 'num_active_lengths', BaseType.UINT16, 0, 1, 'lengths', '', []),
+    ('SessionTotalWorkField', 48, 'total_work', BaseType.UINT32, 0, 1, 'J', '', []),
+    ('SessionAvgAltitudeField', 49, 'avg_altitude', BaseType.UINT16, 500, 5, 'm', '', []),
+    ('SessionMaxAltitudeField', 50, 'max_altitude', BaseType.UINT16, 500, 5, 'm', '', []),
+    ('SessionGpsAccuracyField', 51, 'gps_accuracy', BaseType.UINT8, 0, 1, 'm', '', []),
+    ('SessionAvgGradeField', 52, 'avg_grade', BaseType.SINT16, 0, 100, '%', '', []),
+    ('SessionAvgPosGradeField', 53, 'avg_pos_grade', BaseType.SINT16, 0, 100, '%', '', []),
+    ('SessionAvgNegGradeField', 54, 'avg_neg_grade', BaseType.SINT16, 0, 100, '%', '', []),
+    ('SessionMaxPosGradeField', 55, 'max_pos_grade', BaseType.SINT16, 0, 100, '%', '', []),
+    ('SessionMaxNegGradeField', 56, 'max_neg_grade', BaseType.SINT16, 0, 100, '%', '', []),
+    ('SessionAvgTemperatureField', 57, 'avg_temperature', BaseType.SINT8, 0, 1, 'C', '', []),
+    ('SessionMaxTemperatureField', 58, 'max_temperature', BaseType.SINT8, 0, 1, 'C', '', []),
+    ('SessionTotalMovingTimeField', 59, 'total_moving_time', BaseType.UINT32, 0, 1000, 's', '', []),
+    ('SessionAvgPosVerticalSpeedField', 60, 'avg_pos_vertical_speed', BaseType.SINT16, 0, 1000, 'm/s', '', []),
+    ('SessionAvgNegVerticalSpeedField', 61, 'avg_neg_vertical_speed', BaseType.SINT16, 0, 1000, 'm/s', '', []),
+    ('SessionMaxPosVerticalSpeedField', 62, 'max_pos_vertical_speed', BaseType.SINT16, 0, 1000, 'm/s', '', []),
+    ('SessionMaxNegVerticalSpeedField', 63, 'max_neg_vertical_speed', BaseType.SINT16, 0, 1000, 'm/s', '', []),
+    ('SessionMinHeartRateField', 64, 'min_heart_rate', BaseType.UINT8, 0, 1, 'bpm', '', []),
+    ('SessionTimeInHrZoneField', 65, 'time_in_hr_zone', BaseType.UINT32, 0, 1000, 's', '', []),
+    ('SessionTimeInSpeedZoneField', 66, 'time_in_speed_zone', BaseType.UINT32, 0, 1000, 's', '', []),
+    ('SessionTimeInCadenceZoneField', 67, 'time_in_cadence_zone', BaseType.UINT32, 0, 1000, 's', '', []),
+    ('SessionTimeInPowerZoneField', 68, 'time_in_power_zone', BaseType.UINT32, 0, 1000, 's', '', []),
+    ('SessionAvgLapTimeField', 69, 'avg_lap_time', BaseType.UINT32, 0, 1000, 's', '', []),
+    ('SessionBestLapIndexField', 70, 'best_lap_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('SessionMinAltitudeField', 71, 'min_altitude', BaseType.UINT16, 500, 5, 'm', '', []),
+    ('SessionPlayerScoreField', 82, 'player_score', BaseType.UINT16, 0, 1, '', '', []),
+    ('SessionOpponentScoreField', 83, 'opponent_score', BaseType.UINT16, 0, 1, '', '', []),
+    ('SessionOpponentNameField', 84, 'opponent_name', BaseType.STRING, 0, 1, '', '', []),
+    ('SessionStrokeCountField', 85, 'stroke_count', BaseType.UINT16, 0, 1, 'counts', '', []),
+    ('SessionZoneCountField', 86, 'zone_count', BaseType.UINT16, 0, 1, 'counts', '', []),
+    ('SessionMaxBallSpeedField', 87, 'max_ball_speed', BaseType.UINT16, 0, 100, 'm/s', '', []),
+    ('SessionAvgBallSpeedField', 88, 'avg_ball_speed', BaseType.UINT16, 0, 100, 'm/s', '', []),
+    ('SessionAvgVerticalOscillationField', 89, 'avg_vertical_oscillation', BaseType.UINT16, 0, 10, 'mm', '', []),
+    ('SessionAvgStanceTimePercentField', 90, 'avg_stance_time_percent', BaseType.UINT16, 0, 100, 'percent', '', []),
+    ('SessionAvgStanceTimeField', 91, 'avg_stance_time', BaseType.UINT16, 0, 10, 'ms', '', []),
+    ('SessionAvgFractionalCadenceField', 92, 'avg_fractional_cadence', BaseType.UINT8, 0, 128, 'rpm', '', []),
+    ('SessionMaxFractionalCadenceField', 93, 'max_fractional_cadence', BaseType.UINT8, 0, 128, 'rpm', '', []),
+    ('SessionTotalFractionalCyclesField', 94, 'total_fractional_cycles', BaseType.UINT8, 0, 128, 'cycles', '', []),
+    ('SessionAvgTotalHemoglobinConcField', 95, 'avg_total_hemoglobin_conc', BaseType.UINT16, 0, 100, 'g/dL', '', []),
+    ('SessionMinTotalHemoglobinConcField', 96, 'min_total_hemoglobin_conc', BaseType.UINT16, 0, 100, 'g/dL', '', []),
+    ('SessionMaxTotalHemoglobinConcField', 97, 'max_total_hemoglobin_conc', BaseType.UINT16, 0, 100, 'g/dL', '', []),
+    ('SessionAvgSaturatedHemoglobinPercentField', 98, 'avg_saturated_hemoglobin_percent', BaseType.UINT16, 0, 10, '%', '', []),
+    ('SessionMinSaturatedHemoglobinPercentField', 99, 'min_saturated_hemoglobin_percent', BaseType.UINT16, 0, 10, '%', '', []),
+    ('SessionMaxSaturatedHemoglobinPercentField', 100, 'max_saturated_hemoglobin_percent', BaseType.UINT16, 0, 10, '%', '', []),
+    ('SessionAvgLeftTorqueEffectivenessField', 101, 'avg_left_torque_effectiveness', BaseType.UINT8, 0, 2, 'percent', '', []),
+    ('SessionAvgRightTorqueEffectivenessField', 102, 'avg_right_torque_effectiveness', BaseType.UINT8, 0, 2, 'percent', '', []),
+    ('SessionAvgLeftPedalSmoothnessField', 103, 'avg_left_pedal_smoothness', BaseType.UINT8, 0, 2, 'percent', '', []),
+    ('SessionAvgRightPedalSmoothnessField', 104, 'avg_right_pedal_smoothness', BaseType.UINT8, 0, 2, 'percent', '', []),
+    ('SessionAvgCombinedPedalSmoothnessField', 105, 'avg_combined_pedal_smoothness', BaseType.UINT8, 0, 2, 'percent', '', []),
+    ('SessionSportProfileNameField', 110, 'sport_profile_name', BaseType.STRING, 0, 1, '', '', []),
+    ('SessionSportIndexField', 111, 'sport_index', BaseType.UINT8, 0, 1, '', '', []),
+    ('SessionTimeStandingField', 112, 'time_standing', BaseType.UINT32, 0, 1000, 's', '', []),
+    ('SessionStandCountField', 113, 'stand_count', BaseType.UINT16, 0, 1, '', '', []),
+    ('SessionAvgLeftPcoField', 114, 'avg_left_pco', BaseType.SINT8, 0, 1, 'mm', '', []),
+    ('SessionAvgRightPcoField', 115, 'avg_right_pco', BaseType.SINT8, 0, 1, 'mm', '', []),
+    ('SessionAvgLeftPowerPhaseField', 116, 'avg_left_power_phase', BaseType.UINT8, 0, 0.7111111, 'degrees', '', []),
+    ('SessionAvgLeftPowerPhasePeakField', 117, 'avg_left_power_phase_peak', BaseType.UINT8, 0, 0.7111111, 'degrees', '', []),
+    ('SessionAvgRightPowerPhaseField', 118, 'avg_right_power_phase', BaseType.UINT8, 0, 0.7111111, 'degrees', '', []),
+    ('SessionAvgRightPowerPhasePeakField', 119, 'avg_right_power_phase_peak', BaseType.UINT8, 0, 0.7111111, 'degrees', '', []),
+    ('SessionAvgPowerPositionField', 120, 'avg_power_position', BaseType.UINT16, 0, 1, 'watts', '', []),
+    ('SessionMaxPowerPositionField', 121, 'max_power_position', BaseType.UINT16, 0, 1, 'watts', '', []),
+    ('SessionAvgCadencePositionField', 122, 'avg_cadence_position', BaseType.UINT8, 0, 1, 'rpm', '', []),
+    ('SessionMaxCadencePositionField', 123, 'max_cadence_position', BaseType.UINT8, 0, 1, 'rpm', '', []),
+    ('SessionEnhancedAvgSpeedField', 124, 'enhanced_avg_speed', BaseType.UINT32, 0, 1000, 'm/s', '', []),
+    ('SessionEnhancedMaxSpeedField', 125, 'enhanced_max_speed', BaseType.UINT32, 0, 1000, 'm/s', '', []),
+    ('SessionEnhancedAvgAltitudeField', 126, 'enhanced_avg_altitude', BaseType.UINT32, 500, 5, 'm', '', []),
+    ('SessionEnhancedMinAltitudeField', 127, 'enhanced_min_altitude', BaseType.UINT32, 500, 5, 'm', '', []),
+    ('SessionEnhancedMaxAltitudeField', 128, 'enhanced_max_altitude', BaseType.UINT32, 500, 5, 'm', '', []),
+    ('SessionAvgLevMotorPowerField', 129, 'avg_lev_motor_power', BaseType.UINT16, 0, 1, 'watts', '', []),
+    ('SessionMaxLevMotorPowerField', 130, 'max_lev_motor_power', BaseType.UINT16, 0, 1, 'watts', '', []),
+    ('SessionLevBatteryConsumptionField', 131, 'lev_battery_consumption', BaseType.UINT8, 0, 2, 'percent', '', []),
+    ('SessionAvgVerticalRatioField', 132, 'avg_vertical_ratio', BaseType.UINT16, 0, 100, 'percent', '', []),
+    ('SessionAvgStanceTimeBalanceField', 133, 'avg_stance_time_balance', BaseType.UINT16, 0, 100, 'percent', '', []),
+    ('SessionAvgStepLengthField', 134, 'avg_step_length', BaseType.UINT16, 0, 10, 'mm', '', []),
+    ('SessionTotalAnaerobicTrainingEffectField', 137, 'total_anaerobic_training_effect', BaseType.UINT8, 0, 10, '', '', []),
+    ('SessionAvgVamField', 139, 'avg_vam', BaseType.UINT16, 0, 1000, 'm/s', '', []),
+    ('SessionAvgDepthField', 140, 'avg_depth', BaseType.UINT32, 0, 1000, 'm', '', []),
+    ('SessionMaxDepthField', 141, 'max_depth', BaseType.UINT32, 0, 1000, 'm', '', []),
+    ('SessionSurfaceIntervalField', 142, 'surface_interval', BaseType.UINT32, 0, 1, 's', '', []),
+    ('SessionStartCnsField', 143, 'start_cns', BaseType.UINT8, 0, 1, 'percent', '', []),
+    ('SessionEndCnsField', 144, 'end_cns', BaseType.UINT8, 0, 1, 'percent', '', []),
+    ('SessionStartN2Field', 145, 'start_n2', BaseType.UINT16, 0, 1, 'percent', '', []),
+    ('SessionEndN2Field', 146, 'end_n2', BaseType.UINT16, 0, 1, 'percent', '', []),
+    ('SessionAvgRespirationRateField', 147, 'avg_respiration_rate', BaseType.UINT8, 0, 1, '', '', []),
+    ('SessionMaxRespirationRateField', 148, 'max_respiration_rate', BaseType.UINT8, 0, 1, '', '', []),
+    ('SessionMinRespirationRateField', 149, 'min_respiration_rate', BaseType.UINT8, 0, 1, '', '', []),
+    ('SessionMinTemperatureField', 150, 'min_temperature', BaseType.SINT8, 0, 1, 'C', '', []),
+    ('SessionO2ToxicityField', 155, 'o2_toxicity', BaseType.UINT16, 0, 1, 'OTUs', '', []),
+    ('SessionDiveNumberField', 156, 'dive_number', BaseType.UINT32, 0, 1, '', '', []),
+    ('SessionTrainingLoadPeakField', 168, 'training_load_peak', BaseType.SINT32, 0, 65536, '', '', []),
+    ('SessionEnhancedAvgRespirationRateField', 169, 'enhanced_avg_respiration_rate', BaseType.UINT16, 0, 100, 'Breaths/min', '', []),
+    ('SessionEnhancedMaxRespirationRateField', 170, 'enhanced_max_respiration_rate', BaseType.UINT16, 0, 100, 'Breaths/min', '', []),
+    ('SessionEnhancedMinRespirationRateField', 180, 'enhanced_min_respiration_rate', BaseType.UINT16, 0, 100, '', '', []),
+    ('SessionTotalGritField', 181, 'total_grit', BaseType.FLOAT32, 0, 1, 'kGrit', '', []),
+    ('SessionTotalFlowField', 182, 'total_flow', BaseType.FLOAT32, 0, 1, 'Flow', '', []),
+    ('SessionJumpCountField', 183, 'jump_count', BaseType.UINT16, 0, 1, '', '', []),
+    ('SessionAvgGritField', 186, 'avg_grit', BaseType.FLOAT32, 0, 1, 'kGrit', '', []),
+    ('SessionAvgFlowField', 187, 'avg_flow', BaseType.FLOAT32, 0, 1, 'Flow', '', []),
+    ('SessionWorkoutFeelField', 192, 'workout_feel', BaseType.UINT8, 0, 1, '', '', []),
+    ('SessionWorkoutRpeField', 193, 'workout_rpe', BaseType.UINT8, 0, 1, '', '', []),
+    ('SessionAvgSpo2Field', 194, 'avg_spo2', BaseType.UINT8, 0, 1, 'percent', '', []),
+    ('SessionAvgStressField', 195, 'avg_stress', BaseType.UINT8, 0, 1, 'percent', '', []),
+    ('SessionSdrrHrvField', 197, 'sdrr_hrv', BaseType.UINT8, 0, 1, 'mS', '', []),
+    ('SessionRmssdHrvField', 198, 'rmssd_hrv', BaseType.UINT8, 0, 1, 'mS', '', []),
+    ('SessionTotalFractionalAscentField', 199, 'total_fractional_ascent', BaseType.UINT8, 0, 100, 'm', '', []),
+    ('SessionTotalFractionalDescentField', 200, 'total_fractional_descent', BaseType.UINT8, 0, 100, 'm', '', []),
+    ('SessionAvgCoreTemperatureField', 208, 'avg_core_temperature', BaseType.UINT16, 0, 100, 'C', '', []),
+    ('SessionMinCoreTemperatureField', 209, 'min_core_temperature', BaseType.UINT16, 0, 100, 'C', '', []),
+    ('SessionMaxCoreTemperatureField', 210, 'max_core_temperature', BaseType.UINT16, 0, 100, 'C', '', []),
+])
+
+(
+    MessageIndexField,
+    TimestampField,
+    SessionEventField,
+    SessionEventTypeField,
+    SessionStartTimeField,
+    SessionStartPositionLatField,
+    SessionStartPositionLongField,
+    SessionSportField,
+    SessionSubSportField,
+    SessionTotalElapsedTimeField,
+    SessionTotalTimerTimeField,
+    SessionTotalDistanceField,
+    SessionTotalCyclesField,
+    SessionTotalCaloriesField,
+    SessionTotalFatCaloriesField,
+    SessionAvgSpeedField,
+    SessionMaxSpeedField,
+    SessionAvgHeartRateField,
+    SessionMaxHeartRateField,
+    SessionAvgCadenceField,
+    SessionMaxCadenceField,
+    SessionAvgPowerField,
+    SessionMaxPowerField,
+    SessionTotalAscentField,
+    SessionTotalDescentField,
+    SessionTotalTrainingEffectField,
+    SessionFirstLapIndexField,
+    SessionNumLapsField,
+    SessionEventGroupField,
+    SessionTriggerField,
+    SessionNecLatField,
+    SessionNecLongField,
+    SessionSwcLatField,
+    SessionSwcLongField,
+    SessionNumLengthsField,
+    SessionNormalizedPowerField,
+    SessionTrainingStressScoreField,
+    SessionIntensityFactorField,
+    SessionLeftRightBalanceField,
+    SessionEndPositionLatField,
+    SessionEndPositionLongField,
+    SessionAvgStrokeCountField,
+    SessionAvgStrokeDistanceField,
+    SessionSwimStrokeField,
+    SessionPoolLengthField,
+    SessionThresholdPowerField,
+    SessionPoolLengthUnitField,
+    SessionNumActiveLengthsField,
+    SessionTotalWorkField,
+    SessionAvgAltitudeField,
+    SessionMaxAltitudeField,
+    SessionGpsAccuracyField,
+    SessionAvgGradeField,
+    SessionAvgPosGradeField,
+    SessionAvgNegGradeField,
+    SessionMaxPosGradeField,
+    SessionMaxNegGradeField,
+    SessionAvgTemperatureField,
+    SessionMaxTemperatureField,
+    SessionTotalMovingTimeField,
+    SessionAvgPosVerticalSpeedField,
+    SessionAvgNegVerticalSpeedField,
+    SessionMaxPosVerticalSpeedField,
+    SessionMaxNegVerticalSpeedField,
+    SessionMinHeartRateField,
+    SessionTimeInHrZoneField,
+    SessionTimeInSpeedZoneField,
+    SessionTimeInCadenceZoneField,
+    SessionTimeInPowerZoneField,
+    SessionAvgLapTimeField,
+    SessionBestLapIndexField,
+    SessionMinAltitudeField,
+    SessionPlayerScoreField,
+    SessionOpponentScoreField,
+    SessionOpponentNameField,
+    SessionStrokeCountField,
+    SessionZoneCountField,
+    SessionMaxBallSpeedField,
+    SessionAvgBallSpeedField,
+    SessionAvgVerticalOscillationField,
+    SessionAvgStanceTimePercentField,
+    SessionAvgStanceTimeField,
+    SessionAvgFractionalCadenceField,
+    SessionMaxFractionalCadenceField,
+    SessionTotalFractionalCyclesField,
+    SessionAvgTotalHemoglobinConcField,
+    SessionMinTotalHemoglobinConcField,
+    SessionMaxTotalHemoglobinConcField,
+    SessionAvgSaturatedHemoglobinPercentField,
+    SessionMinSaturatedHemoglobinPercentField,
+    SessionMaxSaturatedHemoglobinPercentField,
+    SessionAvgLeftTorqueEffectivenessField,
+    SessionAvgRightTorqueEffectivenessField,
+    SessionAvgLeftPedalSmoothnessField,
+    SessionAvgRightPedalSmoothnessField,
+    SessionAvgCombinedPedalSmoothnessField,
+    SessionSportProfileNameField,
+    SessionSportIndexField,
+    SessionTimeStandingField,
+    SessionStandCountField,
+    SessionAvgLeftPcoField,
+    SessionAvgRightPcoField,
+    SessionAvgLeftPowerPhaseField,
+    SessionAvgLeftPowerPhasePeakField,
+    SessionAvgRightPowerPhaseField,
+    SessionAvgRightPowerPhasePeakField,
+    SessionAvgPowerPositionField,
+    SessionMaxPowerPositionField,
+    SessionAvgCadencePositionField,
+    SessionMaxCadencePositionField,
+    SessionEnhancedAvgSpeedField,
+    SessionEnhancedMaxSpeedField,
+    SessionEnhancedAvgAltitudeField,
+    SessionEnhancedMinAltitudeField,
+    SessionEnhancedMaxAltitudeField,
+    SessionAvgLevMotorPowerField,
+    SessionMaxLevMotorPowerField,
+    SessionLevBatteryConsumptionField,
+    SessionAvgVerticalRatioField,
+    SessionAvgStanceTimeBalanceField,
+    SessionAvgStepLengthField,
+    SessionTotalAnaerobicTrainingEffectField,
+    SessionAvgVamField,
+    SessionAvgDepthField,
+    SessionMaxDepthField,
+    SessionSurfaceIntervalField,
+    SessionStartCnsField,
+    SessionEndCnsField,
+    SessionStartN2Field,
+    SessionEndN2Field,
+    SessionAvgRespirationRateField,
+    SessionMaxRespirationRateField,
+    SessionMinRespirationRateField,
+    SessionMinTemperatureField,
+    SessionO2ToxicityField,
+    SessionDiveNumberField,
+    SessionTrainingLoadPeakField,
+    SessionEnhancedAvgRespirationRateField,
+    SessionEnhancedMaxRespirationRateField,
+    SessionEnhancedMinRespirationRateField,
+    SessionTotalGritField,
+    SessionTotalFlowField,
+    SessionJumpCountField,
+    SessionAvgGritField,
+    SessionAvgFlowField,
+    SessionWorkoutFeelField,
+    SessionWorkoutRpeField,
+    SessionAvgSpo2Field,
+    SessionAvgStressField,
+    SessionSdrrHrvField,
+    SessionRmssdHrvField,
+    SessionTotalFractionalAscentField,
+    SessionTotalFractionalDescentField,
+    SessionAvgCoreTemperatureField,
+    SessionMinCoreTemperatureField,
+    SessionMaxCoreTemperatureField,
+) = FIELD_TYPES
+
+SessionMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class SkinTempOvernightMessage(DataMessage):
     ID = 398
     NAME = 'skin_temp_overnight'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=SkinTempOvernightMessage.NAME,
@@ -37,25 +25,7 @@ class SkinTempOvernightMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        SkinTempOvernightLocalTimestampField(
-            size=self.__get_field_size(definition_message, SkinTempOvernightLocalTimestampField.ID),
-            growable=definition_message is None), 
-        SkinTempOvernightAverageDeviationField(
-            size=self.__get_field_size(definition_message, SkinTempOvernightAverageDeviationField.ID),
-            growable=definition_message is None), 
-        SkinTempOvernightAverage7DayDeviationField(
-            size=self.__get_field_size(definition_message, SkinTempOvernightAverage7DayDeviationField.ID),
-            growable=definition_message is None), 
-        SkinTempOvernightNightlyValueField(
-            size=self.__get_field_size(definition_message, SkinTempOvernightNightlyValueField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=SkinTempOvernightMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -64,217 +34,29 @@ class SkinTempOvernightMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def local_timestamp(self) -> Optional[int]:
-        field = self.get_field(SkinTempOvernightLocalTimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @local_timestamp.setter
-    def local_timestamp(self, value: int):
-        field = self.get_field(SkinTempOvernightLocalTimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def average_deviation(self) -> Optional[float]:
-        field = self.get_field(SkinTempOvernightAverageDeviationField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @average_deviation.setter
-    def average_deviation(self, value: float):
-        field = self.get_field(SkinTempOvernightAverageDeviationField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def average_7_day_deviation(self) -> Optional[float]:
-        field = self.get_field(SkinTempOvernightAverage7DayDeviationField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @average_7_day_deviation.setter
-    def average_7_day_deviation(self, value: float):
-        field = self.get_field(SkinTempOvernightAverage7DayDeviationField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def nightly_value(self) -> Optional[float]:
-        field = self.get_field(SkinTempOvernightNightlyValueField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @nightly_value.setter
-    def nightly_value(self, value: float):
-        field = self.get_field(SkinTempOvernightNightlyValueField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SkinTempOvernightLocalTimestampField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='local_timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SkinTempOvernightAverageDeviationField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='average_deviation',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SkinTempOvernightAverage7DayDeviationField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='average_7_day_deviation',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class SkinTempOvernightNightlyValueField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='nightly_value',
-            field_id=self.ID,
-            base_type=BaseType.FLOAT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    local_timestamp: FieldProperty[int] = FieldProperty(0)
+    average_deviation: FieldProperty[float] = FieldProperty(1)
+    average_7_day_deviation: FieldProperty[float] = FieldProperty(2)
+    nightly_value: FieldProperty[float] = FieldProperty(4)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('SkinTempOvernightLocalTimestampField', 0, 'local_timestamp', BaseType.UINT32, 0, 1, '', '', []),
+    ('SkinTempOvernightAverageDeviationField', 1, 'average_deviation', BaseType.FLOAT32, 0, 1, '', '', []),
+    ('SkinTempOvernightAverage7DayDeviationField', 2, 'average_7_day_deviation', BaseType.FLOAT32, 0, 1, '', '', []),
+    ('SkinTempOvernightNightlyValueField', 4, 'nightly_value', BaseType.FLOAT32, 0, 1, '', '', []),
+])
+
+(
+    TimestampField,
+    SkinTempOvernightLocalTimestampField,
+    SkinTempOvernightAverageDeviationField,
+    SkinTempOvernightAverage7DayDeviationField,
+    SkinTempOvernightNightlyValueField,
+) = FIELD_TYPES
+
+SkinTempOvernightMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class StressLevelMessage(DataMessage):
     ID = 227
     NAME = 'stress_level'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=StressLevelMessage.NAME,
@@ -37,16 +25,7 @@ class StressLevelMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        StressLevelStressLevelValueField(
-            size=self.__get_field_size(definition_message, StressLevelStressLevelValueField.ID),
-            growable=definition_message is None), 
-        StressLevelStressLevelTimeField(
-            size=self.__get_field_size(definition_message, StressLevelStressLevelTimeField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=StressLevelMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -55,94 +34,20 @@ class StressLevelMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
+    stress_level_value: FieldProperty[int] = FieldProperty(0)
+    stress_level_time: FieldProperty[int] = FieldProperty(1)
 
 
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('StressLevelStressLevelValueField', 0, 'stress_level_value', BaseType.SINT16, 0, 1, '', '', []),
+    ('StressLevelStressLevelTimeField', 1, 'stress_level_time', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+])
 
-    @property
-    def stress_level_value(self) -> Optional[int]:
-        field = self.get_field(StressLevelStressLevelValueField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @stress_level_value.setter
-    def stress_level_value(self, value: int):
-        field = self.get_field(StressLevelStressLevelValueField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def stress_level_time(self) -> Optional[int]:
-        field = self.get_field(StressLevelStressLevelTimeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @stress_level_time.setter
-    def stress_level_time(self, value: int):
-        field = self.get_field(StressLevelStressLevelTimeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class StressLevelStressLevelValueField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='stress_level_value',
-            field_id=self.ID,
-            base_type=BaseType.SINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class StressLevelStressLevelTimeField(Field):
-    ID = 1
+(
+    StressLevelStressLevelValueField,
+    StressLevelStressLevelTimeField,
+) = FIELD_TYPES
 
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='stress_level_time',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+StressLevelMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
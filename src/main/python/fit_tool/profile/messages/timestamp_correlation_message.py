@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class TimestampCorrelationMessage(DataMessage):
     ID = 162
     NAME = 'timestamp_correlation'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=TimestampCorrelationMessage.NAME,
@@ -37,31 +25,7 @@ class TimestampCorrelationMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        TimestampCorrelationFractionalTimestampField(
-            size=self.__get_field_size(definition_message, TimestampCorrelationFractionalTimestampField.ID),
-            growable=definition_message is None), 
-        TimestampCorrelationSystemTimestampField(
-            size=self.__get_field_size(definition_message, TimestampCorrelationSystemTimestampField.ID),
-            growable=definition_message is None), 
-        TimestampCorrelationFractionalSystemTimestampField(
-            size=self.__get_field_size(definition_message, TimestampCorrelationFractionalSystemTimestampField.ID),
-            growable=definition_message is None), 
-        TimestampCorrelationLocalTimestampField(
-            size=self.__get_field_size(definition_message, TimestampCorrelationLocalTimestampField.ID),
-            growable=definition_message is None), 
-        TimestampCorrelationTimestampMsField(
-            size=self.__get_field_size(definition_message, TimestampCorrelationTimestampMsField.ID),
-            growable=definition_message is None), 
-        TimestampCorrelationSystemTimestampMsField(
-            size=self.__get_field_size(definition_message, TimestampCorrelationSystemTimestampMsField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=TimestampCorrelationMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -70,313 +34,35 @@ class TimestampCorrelationMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def fractional_timestamp(self) -> Optional[float]:
-        field = self.get_field(TimestampCorrelationFractionalTimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @fractional_timestamp.setter
-    def fractional_timestamp(self, value: float):
-        field = self.get_field(TimestampCorrelationFractionalTimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def system_timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampCorrelationSystemTimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @system_timestamp.setter
-    def system_timestamp(self, value: int):
-        field = self.get_field(TimestampCorrelationSystemTimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def fractional_system_timestamp(self) -> Optional[float]:
-        field = self.get_field(TimestampCorrelationFractionalSystemTimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @fractional_system_timestamp.setter
-    def fractional_system_timestamp(self, value: float):
-        field = self.get_field(TimestampCorrelationFractionalSystemTimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def local_timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampCorrelationLocalTimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @local_timestamp.setter
-    def local_timestamp(self, value: int):
-        field = self.get_field(TimestampCorrelationLocalTimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def timestamp_ms(self) -> Optional[int]:
-        field = self.get_field(TimestampCorrelationTimestampMsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @timestamp_ms.setter
-    def timestamp_ms(self, value: int):
-        field = self.get_field(TimestampCorrelationTimestampMsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def system_timestamp_ms(self) -> Optional[int]:
-        field = self.get_field(TimestampCorrelationSystemTimestampMsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @system_timestamp_ms.setter
-    def system_timestamp_ms(self, value: int):
-        field = self.get_field(TimestampCorrelationSystemTimestampMsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class TimestampCorrelationFractionalTimestampField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='fractional_timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 32768,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class TimestampCorrelationSystemTimestampField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='system_timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class TimestampCorrelationFractionalSystemTimestampField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='fractional_system_timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 32768,
-                         size = size,
-        units = 's',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class TimestampCorrelationLocalTimestampField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='local_timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 's',
-        type_name = 'local_date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class TimestampCorrelationTimestampMsField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp_ms',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class TimestampCorrelationSystemTimestampMsField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='system_timestamp_ms',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    fractional_timestamp: FieldProperty[float] = FieldProperty(0)
+    system_timestamp: FieldProperty[int] = FieldProperty(1)
+    fractional_system_timestamp: FieldProperty[float] = FieldProperty(2)
+    local_timestamp: FieldProperty[int] = FieldProperty(3)
+    timestamp_ms: FieldProperty[int] = FieldProperty(4)
+    system_timestamp_ms: FieldProperty[int] = FieldProperty(5)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('TimestampCorrelationFractionalTimestampField', 0, 'fractional_timestamp', BaseType.UINT16, 0, 32768, 's', '', []),
+    ('TimestampCorrelationSystemTimestampField', 1, 'system_timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('TimestampCorrelationFractionalSystemTimestampField', 2, 'fractional_system_timestamp', BaseType.UINT16, 0, 32768, 's', '', []),
+    ('TimestampCorrelationLocalTimestampField', 3, 'local_timestamp', BaseType.UINT32, 0, 1, 's', 'local_date_time', []),
+    ('TimestampCorrelationTimestampMsField', 4, 'timestamp_ms', BaseType.UINT16, 0, 1, 'ms', '', []),
+    ('TimestampCorrelationSystemTimestampMsField', 5, 'system_timestamp_ms', BaseType.UINT16, 0, 1, 'ms', '', []),
+])
+
+(
+    TimestampField,
+    TimestampCorrelationFractionalTimestampField,
+    TimestampCorrelationSystemTimestampField,
+    TimestampCorrelationFractionalSystemTimestampField,
+    TimestampCorrelationLocalTimestampField,
+    TimestampCorrelationTimestampMsField,
+    TimestampCorrelationSystemTimestampMsField,
+) = FIELD_TYPES
+
+TimestampCorrelationMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class TrainingFileMessage(DataMessage):
     ID = 72
     NAME = 'training_file'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=TrainingFileMessage.NAME,
@@ -37,28 +25,7 @@ class TrainingFileMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        TimestampField(
-            size=self.__get_field_size(definition_message, TimestampField.ID),
-            growable=definition_message is None), 
-        TrainingFileTypeField(
-            size=self.__get_field_size(definition_message, TrainingFileTypeField.ID),
-            growable=definition_message is None), 
-        TrainingFileManufacturerField(
-            size=self.__get_field_size(definition_message, TrainingFileManufacturerField.ID),
-            growable=definition_message is None), 
-        TrainingFileProductField(
-            size=self.__get_field_size(definition_message, TrainingFileProductField.ID),
-            growable=definition_message is None), 
-        TrainingFileSerialNumberField(
-            size=self.__get_field_size(definition_message, TrainingFileSerialNumberField.ID),
-            growable=definition_message is None), 
-        TrainingFileTimeCreatedField(
-            size=self.__get_field_size(definition_message, TrainingFileTimeCreatedField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=TrainingFileMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -67,324 +34,37 @@ class TrainingFileMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def timestamp(self) -> Optional[int]:
-        field = self.get_field(TimestampField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @timestamp.setter
-    def timestamp(self, value: int):
-        field = self.get_field(TimestampField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def type(self) -> Optional[FileType]:
-        field = self.get_field(TrainingFileTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @type.setter
-    def type(self, value: FileType):
-        field = self.get_field(TrainingFileTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def manufacturer(self) -> Optional[int]:
-        field = self.get_field(TrainingFileManufacturerField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @manufacturer.setter
-    def manufacturer(self, value: int):
-        field = self.get_field(TrainingFileManufacturerField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def product(self) -> Optional[int]:
-        field = self.get_field(TrainingFileProductField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @product.setter
-    def product(self, value: int):
-        field = self.get_field(TrainingFileProductField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-    @property
-    def favero_product(self) -> Optional[int]:
-        field = self.get_field(TrainingFileProductField.ID)
-        type_field = self.get_field(TrainingFileManufacturerField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [263]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @favero_product.setter
-    def favero_product(self, value: int):
-        field = self.get_field(TrainingFileProductField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def garmin_product(self) -> Optional[int]:
-        field = self.get_field(TrainingFileProductField.ID)
-        type_field = self.get_field(TrainingFileManufacturerField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [1, 15, 13, 89]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @garmin_product.setter
-    def garmin_product(self, value: int):
-        field = self.get_field(TrainingFileProductField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    @property
-    def serial_number(self) -> Optional[int]:
-        field = self.get_field(TrainingFileSerialNumberField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @serial_number.setter
-    def serial_number(self, value: int):
-        field = self.get_field(TrainingFileSerialNumberField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-# timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @property
-    def time_created(self) -> Optional[int]:
-        field = self.get_field(TrainingFileTimeCreatedField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-    # timestamp : milliseconds from January 1st, 1970 at 00:00:00 UTC
-
-    @time_created.setter
-    def time_created(self, value: int):
-        field = self.get_field(TrainingFileTimeCreatedField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class TimestampField(Field):
-    ID = 253
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='timestamp',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class TrainingFileTypeField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class TrainingFileManufacturerField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='manufacturer',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class TrainingFileProductField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='product',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        SubField(
-            name='favero_product',
-            base_type=BaseType.UINT16,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        TrainingFileManufacturerField.ID: [263]
-        }), 
-        SubField(
-            name='garmin_product',
-            base_type=BaseType.UINT16,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        TrainingFileManufacturerField.ID: [1, 15, 13, 89]
-        })
-        ]
-        )
-
-
-class TrainingFileSerialNumberField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='serial_number',
-            field_id=self.ID,
-            base_type=BaseType.UINT32Z,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class TrainingFileTimeCreatedField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='time_created',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = -631065600000,
-                 scale = 0.001,
-                         size = size,
-        units = 'ms',
-        type_name = 'date_time',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    timestamp: FieldProperty[int] = FieldProperty(253)
+    type: FieldProperty[FileType] = FieldProperty(0)
+    manufacturer: FieldProperty[int] = FieldProperty(1)
+    product: FieldProperty[int] = FieldProperty(2)
+    favero_product: SubFieldProperty[int] = SubFieldProperty(2, 1, [263])
+    garmin_product: SubFieldProperty[int] = SubFieldProperty(2, 1, [1, 15, 13, 89])
+    serial_number: FieldProperty[int] = FieldProperty(3)
+    time_created: FieldProperty[int] = FieldProperty(4)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('TimestampField', 253, 'timestamp', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+    ('TrainingFileTypeField', 0, 'type', BaseType.ENUM, 0, 1, '', '', []),
+    ('TrainingFileManufacturerField', 1, 'manufacturer', BaseType.UINT16, 0, 1, '', '', []),
+    ('TrainingFileProductField', 2, 'product', BaseType.UINT16, 0, 1, '', '', [
+        ('favero_product', BaseType.UINT16, 1, 0, '', {1: [263]}),
+        ('garmin_product', BaseType.UINT16, 1, 0, '', {1: [1, 15, 13, 89]}),
+    ]),
+    ('TrainingFileSerialNumberField', 3, 'serial_number', BaseType.UINT32Z, 0, 1, '', '', []),
+    ('TrainingFileTimeCreatedField', 4, 'time_created', BaseType.UINT32, -631065600000, 0.001, 'ms', 'date_time', []),
+])
+
+(
+    TimestampField,
+    TrainingFileTypeField,
+    TrainingFileManufacturerField,
+    TrainingFileProductField,
+    TrainingFileSerialNumberField,
+    TrainingFileTimeCreatedField,
+) = FIELD_TYPES
+
+TrainingFileMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class VideoMessage(DataMessage):
     ID = 184
     NAME = 'video'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=VideoMessage.NAME,
@@ -37,19 +25,7 @@ class VideoMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        VideoUrlField(
-            size=self.__get_field_size(definition_message, VideoUrlField.ID),
-            growable=definition_message is None), 
-        VideoHostingProviderField(
-            size=self.__get_field_size(definition_message, VideoHostingProviderField.ID),
-            growable=definition_message is None), 
-        VideoDurationField(
-            size=self.__get_field_size(definition_message, VideoDurationField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=VideoMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -58,133 +34,23 @@ class VideoMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
+    url: FieldProperty[str] = FieldProperty(0)
+    hosting_provider: FieldProperty[str] = FieldProperty(1)
+    duration: FieldProperty[int] = FieldProperty(2)
 
 
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('VideoUrlField', 0, 'url', BaseType.STRING, 0, 1, '', '', []),
+    ('VideoHostingProviderField', 1, 'hosting_provider', BaseType.STRING, 0, 1, '', '', []),
+    ('VideoDurationField', 2, 'duration', BaseType.UINT32, 0, 1, 'ms', '', []),
+])
 
-    @property
-    def url(self) -> Optional[str]:
-        field = self.get_field(VideoUrlField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @url.setter
-    def url(self, value: str):
-        field = self.get_field(VideoUrlField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def hosting_provider(self) -> Optional[str]:
-        field = self.get_field(VideoHostingProviderField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @hosting_provider.setter
-    def hosting_provider(self, value: str):
-        field = self.get_field(VideoHostingProviderField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def duration(self) -> Optional[int]:
-        field = self.get_field(VideoDurationField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @duration.setter
-    def duration(self, value: int):
-        field = self.get_field(VideoDurationField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class VideoUrlField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='url',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class VideoHostingProviderField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='hosting_provider',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class VideoDurationField(Field):
-    ID = 2
+(
+    VideoUrlField,
+    VideoHostingProviderField,
+    VideoDurationField,
+) = FIELD_TYPES
 
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='duration',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        units = 'ms',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+VideoMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
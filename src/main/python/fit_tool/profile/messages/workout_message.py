@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class WorkoutMessage(DataMessage):
     ID = 26
     NAME = 'workout'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=WorkoutMessage.NAME,
@@ -37,37 +25,7 @@ class WorkoutMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        WorkoutSportField(
-            size=self.__get_field_size(definition_message, WorkoutSportField.ID),
-            growable=definition_message is None), 
-        WorkoutCapabilitiesField(
-            size=self.__get_field_size(definition_message, WorkoutCapabilitiesField.ID),
-            growable=definition_message is None), 
-        WorkoutNumValidStepsField(
-            size=self.__get_field_size(definition_message, WorkoutNumValidStepsField.ID),
-            growable=definition_message is None), 
-        WorkoutWorkoutNameField(
-            size=self.__get_field_size(definition_message, WorkoutWorkoutNameField.ID),
-            growable=definition_message is None), 
-        WorkoutSubSportField(
-            size=self.__get_field_size(definition_message, WorkoutSubSportField.ID),
-            growable=definition_message is None), 
-        WorkoutPoolLengthField(
-            size=self.__get_field_size(definition_message, WorkoutPoolLengthField.ID),
-            growable=definition_message is None), 
-        WorkoutPoolLengthUnitField(
-            size=self.__get_field_size(definition_message, WorkoutPoolLengthUnitField.ID),
-            growable=definition_message is None), 
-        WorkoutWorkoutDescriptionField(
-            size=self.__get_field_size(definition_message, WorkoutWorkoutDescriptionField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=WorkoutMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -76,379 +34,41 @@ class WorkoutMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sport(self) -> Optional[Sport]:
-        field = self.get_field(WorkoutSportField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sport.setter
-    def sport(self, value: Sport):
-        field = self.get_field(WorkoutSportField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def capabilities(self) -> Optional[int]:
-        field = self.get_field(WorkoutCapabilitiesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @capabilities.setter
-    def capabilities(self, value: int):
-        field = self.get_field(WorkoutCapabilitiesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def num_valid_steps(self) -> Optional[int]:
-        field = self.get_field(WorkoutNumValidStepsField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @num_valid_steps.setter
-    def num_valid_steps(self, value: int):
-        field = self.get_field(WorkoutNumValidStepsField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def workout_name(self) -> Optional[str]:
-        field = self.get_field(WorkoutWorkoutNameField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @workout_name.setter
-    def workout_name(self, value: str):
-        field = self.get_field(WorkoutWorkoutNameField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def sub_sport(self) -> Optional[SubSport]:
-        field = self.get_field(WorkoutSubSportField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @sub_sport.setter
-    def sub_sport(self, value: SubSport):
-        field = self.get_field(WorkoutSubSportField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def pool_length(self) -> Optional[float]:
-        field = self.get_field(WorkoutPoolLengthField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @pool_length.setter
-    def pool_length(self, value: float):
-        field = self.get_field(WorkoutPoolLengthField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def pool_length_unit(self) -> Optional[DisplayMeasure]:
-        field = self.get_field(WorkoutPoolLengthUnitField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @pool_length_unit.setter
-    def pool_length_unit(self, value: DisplayMeasure):
-        field = self.get_field(WorkoutPoolLengthUnitField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def workout_description(self) -> Optional[str]:
-        field = self.get_field(WorkoutWorkoutDescriptionField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @workout_description.setter
-    def workout_description(self, value: str):
-        field = self.get_field(WorkoutWorkoutDescriptionField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutSportField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sport',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutCapabilitiesField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='capabilities',
-            field_id=self.ID,
-            base_type=BaseType.UINT32Z,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutNumValidStepsField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='num_valid_steps',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutWorkoutNameField(Field):
-    ID = 8
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='wkt_name',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutSubSportField(Field):
-    ID = 11
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='sub_sport',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutPoolLengthField(Field):
-    ID = 14
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='pool_length',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'm',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutPoolLengthUnitField(Field):
-    ID = 15
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='pool_length_unit',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutWorkoutDescriptionField(Field):
-    ID = 17
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='wkt_description',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
\ No newline at end of file
+    message_index: FieldProperty[int] = FieldProperty(254)
+    sport: FieldProperty[Sport] = FieldProperty(4)
+    capabilities: FieldProperty[int] = FieldProperty(5)
+    num_valid_steps: FieldProperty[int] = FieldProperty(6)
+    workout_name: FieldProperty[str] = FieldProperty(8)
+    sub_sport: FieldProperty[SubSport] = FieldProperty(11)
+    pool_length: FieldProperty[float] = FieldProperty(14)
+    pool_length_unit: FieldProperty[DisplayMeasure] = FieldProperty(15)
+    workout_description: FieldProperty[str] = FieldProperty(17)
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('WorkoutSportField', 4, 'sport', BaseType.ENUM, 0, 1, '', '', []),
+    ('WorkoutCapabilitiesField', 5, 'capabilities', BaseType.UINT32Z, 0, 1, '', '', []),
+    ('WorkoutNumValidStepsField', 6, 'num_valid_steps', BaseType.UINT16, 0, 1, '', '', []),
+    ('WorkoutWorkoutNameField', 8, 'wkt_name', BaseType.STRING, 0, 1, '', '', []),
+    ('WorkoutSubSportField', 11, 'sub_sport', BaseType.ENUM, 0, 1, '', '', []),
+    ('WorkoutPoolLengthField', 14, 'pool_length', BaseType.UINT16, 0, 100, 'm', '', []),
+    ('WorkoutPoolLengthUnitField', 15, 'pool_length_unit', BaseType.ENUM, 0, 1, '', '', []),
+    ('WorkoutWorkoutDescriptionField', 17, 'wkt_description', BaseType.STRING, 0, 1, '', '', []),
+])
+
+(
+    MessageIndexField,
+    WorkoutSportField,
+    WorkoutCapabilitiesField,
+    WorkoutNumValidStepsField,
+    WorkoutWorkoutNameField,
+    WorkoutSubSportField,
+    WorkoutPoolLengthField,
+    WorkoutPoolLengthUnitField,
+    WorkoutWorkoutDescriptionField,
+) = FIELD_TYPES
+
+WorkoutMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -1,34 +1,22 @@
 # Autogenerated. Do not modify.
 #
 # Profile: 21.158
-from typing import Optional
+from __future__ import annotations
 
 from fit_tool.base_type import BaseType
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
 from fit_tool.endian import Endian
-from fit_tool.field import Field
-from fit_tool.sub_field import SubField
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_types
 from fit_tool.profile.profile_type import *
 from typing import List as list
-from typing import Dict as dict
 
 
 class WorkoutStepMessage(DataMessage):
     ID = 27
     NAME = 'workout_step'
 
-    @staticmethod
-    def __get_field_size(definition_message: DefinitionMessage, field_id: int) -> int:
-        size = 0
-        if definition_message:
-            field_definition = definition_message.get_field_definition(field_id)
-            if field_definition:
-                size = field_definition.size
-
-        return size
-
     def __init__(self, definition_message=None, developer_fields=None, local_id: int = 0,
                  endian: Endian = Endian.LITTLE):
         super().__init__(name=WorkoutStepMessage.NAME,
@@ -37,67 +25,7 @@ class WorkoutStepMessage(DataMessage):
                          endian=definition_message.endian if definition_message else endian,
                          definition_message=definition_message,
                          developer_fields=developer_fields,
-                         fields=[
-        MessageIndexField(
-            size=self.__get_field_size(definition_message, MessageIndexField.ID),
-            growable=definition_message is None), 
-        WorkoutStepWorkoutStepNameField(
-            size=self.__get_field_size(definition_message, WorkoutStepWorkoutStepNameField.ID),
-            growable=definition_message is None), 
-        WorkoutStepDurationTypeField(
-            size=self.__get_field_size(definition_message, WorkoutStepDurationTypeField.ID),
-            growable=definition_message is None), 
-        WorkoutStepDurationValueField(
-            size=self.__get_field_size(definition_message, WorkoutStepDurationValueField.ID),
-            growable=definition_message is None), 
-        WorkoutStepTargetTypeField(
-            size=self.__get_field_size(definition_message, WorkoutStepTargetTypeField.ID),
-            growable=definition_message is None), 
-        WorkoutStepTargetValueField(
-            size=self.__get_field_size(definition_message, WorkoutStepTargetValueField.ID),
-            growable=definition_message is None), 
-        WorkoutStepCustomTargetValueLowField(
-            size=self.__get_field_size(definition_message, WorkoutStepCustomTargetValueLowField.ID),
-            growable=definition_message is None), 
-        WorkoutStepCustomTargetValueHighField(
-            size=self.__get_field_size(definition_message, WorkoutStepCustomTargetValueHighField.ID),
-            growable=definition_message is None), 
-        WorkoutStepIntensityField(
-            size=self.__get_field_size(definition_message, WorkoutStepIntensityField.ID),
-            growable=definition_message is None), 
-        WorkoutStepNotesField(
-            size=self.__get_field_size(definition_message, WorkoutStepNotesField.ID),
-            growable=definition_message is None), 
-        WorkoutStepEquipmentField(
-            size=self.__get_field_size(definition_message, WorkoutStepEquipmentField.ID),
-            growable=definition_message is None), 
-        WorkoutStepExerciseCategoryField(
-            size=self.__get_field_size(definition_message, WorkoutStepExerciseCategoryField.ID),
-            growable=definition_message is None), 
-        WorkoutStepExerciseNameField(
-            size=self.__get_field_size(definition_message, WorkoutStepExerciseNameField.ID),
-            growable=definition_message is None), 
-        WorkoutStepExerciseWeightField(
-            size=self.__get_field_size(definition_message, WorkoutStepExerciseWeightField.ID),
-            growable=definition_message is None), 
-        WorkoutStepWeightDisplayUnitField(
-            size=self.__get_field_size(definition_message, WorkoutStepWeightDisplayUnitField.ID),
-            growable=definition_message is None), 
-        WorkoutStepSecondaryTargetTypeField(
-            size=self.__get_field_size(definition_message, WorkoutStepSecondaryTargetTypeField.ID),
-            growable=definition_message is None), 
-        WorkoutStepSecondaryTargetValueField(
-            size=self.__get_field_size(definition_message, WorkoutStepSecondaryTargetValueField.ID),
-            growable=definition_message is None), 
-        WorkoutStepSecondaryCustomTargetValueLowField(
-            size=self.__get_field_size(definition_message, WorkoutStepSecondaryCustomTargetValueLowField.ID),
-            growable=definition_message is None), 
-        WorkoutStepSecondaryCustomTargetValueHighField(
-            size=self.__get_field_size(definition_message, WorkoutStepSecondaryCustomTargetValueHighField.ID),
-            growable=definition_message is None)
-        ])
-
-        self.growable = self.definition_message is None
+                         field_types=WorkoutStepMessage.FIELD_TYPES)
 
     @classmethod
     def from_bytes(cls, definition_message: DefinitionMessage, developer_fields: list[DeveloperField],
@@ -106,2024 +34,156 @@ class WorkoutStepMessage(DataMessage):
         message.read_from_bytes(bytes_buffer, offset)
         return message
 
-
-
-
-    @property
-    def message_index(self) -> Optional[int]:
-        field = self.get_field(MessageIndexField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @message_index.setter
-    def message_index(self, value: int):
-        field = self.get_field(MessageIndexField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def workout_step_name(self) -> Optional[str]:
-        field = self.get_field(WorkoutStepWorkoutStepNameField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @workout_step_name.setter
-    def workout_step_name(self, value: str):
-        field = self.get_field(WorkoutStepWorkoutStepNameField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def duration_type(self) -> Optional[WorkoutStepDuration]:
-        field = self.get_field(WorkoutStepDurationTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @duration_type.setter
-    def duration_type(self, value: WorkoutStepDuration):
-        field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def duration_value(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @duration_value.setter
-    def duration_value(self, value: int):
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-    @property
-    def duration_time(self) -> Optional[float]:
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        type_field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [0, 28]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @duration_time.setter
-    def duration_time(self, value: float):
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def duration_distance(self) -> Optional[float]:
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        type_field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [1]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @duration_distance.setter
-    def duration_distance(self, value: float):
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def duration_hr(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        type_field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [2, 3]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @duration_hr.setter
-    def duration_hr(self, value: int):
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def duration_calories(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        type_field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [4]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @duration_calories.setter
-    def duration_calories(self, value: int):
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def duration_step(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        type_field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [6, 7, 8, 9, 10, 11, 12, 13]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @duration_step.setter
-    def duration_step(self, value: int):
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def duration_power(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        type_field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [14, 15]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @duration_power.setter
-    def duration_power(self, value: int):
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def duration_reps(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        type_field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [29]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @duration_reps.setter
-    def duration_reps(self, value: int):
-        field = self.get_field(WorkoutStepDurationValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    @property
-    def target_type(self) -> Optional[WorkoutStepTarget]:
-        field = self.get_field(WorkoutStepTargetTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @target_type.setter
-    def target_type(self, value: WorkoutStepTarget):
-        field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def target_value(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @target_value.setter
-    def target_value(self, value: int):
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-    @property
-    def target_speed_zone(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [0]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @target_speed_zone.setter
-    def target_speed_zone(self, value: int):
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def target_hr_zone(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [1]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @target_hr_zone.setter
-    def target_hr_zone(self, value: int):
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def target_cadence_zone(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [3]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @target_cadence_zone.setter
-    def target_cadence_zone(self, value: int):
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def target_power_zone(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [4]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @target_power_zone.setter
-    def target_power_zone(self, value: int):
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def target_repeat_steps(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [6]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @target_repeat_steps.setter
-    def target_repeat_steps(self, value: int):
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def target_repeat_time(self) -> Optional[float]:
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [7]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @target_repeat_time.setter
-    def target_repeat_time(self, value: float):
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def target_repeat_distance(self) -> Optional[float]:
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [8]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @target_repeat_distance.setter
-    def target_repeat_distance(self, value: float):
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def target_repeat_calories(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [9]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @target_repeat_calories.setter
-    def target_repeat_calories(self, value: int):
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def target_repeat_hr(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [10, 11]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @target_repeat_hr.setter
-    def target_repeat_hr(self, value: int):
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def target_repeat_power(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepDurationTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [12, 13]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @target_repeat_power.setter
-    def target_repeat_power(self, value: int):
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def target_stroke_type(self) -> Optional[SwimStroke]:
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [11]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @target_stroke_type.setter
-    def target_stroke_type(self, value: SwimStroke):
-        field = self.get_field(WorkoutStepTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    @property
-    def custom_target_value_low(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepCustomTargetValueLowField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @custom_target_value_low.setter
-    def custom_target_value_low(self, value: int):
-        field = self.get_field(WorkoutStepCustomTargetValueLowField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-    @property
-    def custom_target_speed_low(self) -> Optional[float]:
-        field = self.get_field(WorkoutStepCustomTargetValueLowField.ID)
-        type_field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [0, 12]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @custom_target_speed_low.setter
-    def custom_target_speed_low(self, value: float):
-        field = self.get_field(WorkoutStepCustomTargetValueLowField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def custom_target_heart_rate_low(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepCustomTargetValueLowField.ID)
-        type_field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [1, 13]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @custom_target_heart_rate_low.setter
-    def custom_target_heart_rate_low(self, value: int):
-        field = self.get_field(WorkoutStepCustomTargetValueLowField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def custom_target_cadence_low(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepCustomTargetValueLowField.ID)
-        type_field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [3]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @custom_target_cadence_low.setter
-    def custom_target_cadence_low(self, value: int):
-        field = self.get_field(WorkoutStepCustomTargetValueLowField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def custom_target_power_low(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepCustomTargetValueLowField.ID)
-        type_field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [4, 7, 8, 9, 10]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @custom_target_power_low.setter
-    def custom_target_power_low(self, value: int):
-        field = self.get_field(WorkoutStepCustomTargetValueLowField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    @property
-    def custom_target_value_high(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepCustomTargetValueHighField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @custom_target_value_high.setter
-    def custom_target_value_high(self, value: int):
-        field = self.get_field(WorkoutStepCustomTargetValueHighField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-    @property
-    def custom_target_speed_high(self) -> Optional[float]:
-        field = self.get_field(WorkoutStepCustomTargetValueHighField.ID)
-        type_field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [0, 12]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @custom_target_speed_high.setter
-    def custom_target_speed_high(self, value: float):
-        field = self.get_field(WorkoutStepCustomTargetValueHighField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def custom_target_heart_rate_high(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepCustomTargetValueHighField.ID)
-        type_field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [1, 13]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @custom_target_heart_rate_high.setter
-    def custom_target_heart_rate_high(self, value: int):
-        field = self.get_field(WorkoutStepCustomTargetValueHighField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def custom_target_cadence_high(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepCustomTargetValueHighField.ID)
-        type_field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [3]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @custom_target_cadence_high.setter
-    def custom_target_cadence_high(self, value: int):
-        field = self.get_field(WorkoutStepCustomTargetValueHighField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def custom_target_power_high(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepCustomTargetValueHighField.ID)
-        type_field = self.get_field(WorkoutStepTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [4, 7, 8, 9, 10]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @custom_target_power_high.setter
-    def custom_target_power_high(self, value: int):
-        field = self.get_field(WorkoutStepCustomTargetValueHighField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    @property
-    def intensity(self) -> Optional[Intensity]:
-        field = self.get_field(WorkoutStepIntensityField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @intensity.setter
-    def intensity(self, value: Intensity):
-        field = self.get_field(WorkoutStepIntensityField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def notes(self) -> Optional[str]:
-        field = self.get_field(WorkoutStepNotesField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @notes.setter
-    def notes(self, value: str):
-        field = self.get_field(WorkoutStepNotesField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def equipment(self) -> Optional[WorkoutEquipment]:
-        field = self.get_field(WorkoutStepEquipmentField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @equipment.setter
-    def equipment(self, value: WorkoutEquipment):
-        field = self.get_field(WorkoutStepEquipmentField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def exercise_category(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepExerciseCategoryField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @exercise_category.setter
-    def exercise_category(self, value: int):
-        field = self.get_field(WorkoutStepExerciseCategoryField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def exercise_name(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepExerciseNameField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @exercise_name.setter
-    def exercise_name(self, value: int):
-        field = self.get_field(WorkoutStepExerciseNameField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def exercise_weight(self) -> Optional[float]:
-        field = self.get_field(WorkoutStepExerciseWeightField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @exercise_weight.setter
-    def exercise_weight(self, value: float):
-        field = self.get_field(WorkoutStepExerciseWeightField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def weight_display_unit(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepWeightDisplayUnitField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @weight_display_unit.setter
-    def weight_display_unit(self, value: int):
-        field = self.get_field(WorkoutStepWeightDisplayUnitField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def secondary_target_type(self) -> Optional[WorkoutStepTarget]:
-        field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @secondary_target_type.setter
-    def secondary_target_type(self, value: WorkoutStepTarget):
-        field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-    @property
-    def secondary_target_value(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepSecondaryTargetValueField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @secondary_target_value.setter
-    def secondary_target_value(self, value: int):
-        field = self.get_field(WorkoutStepSecondaryTargetValueField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-    @property
-    def secondary_target_speed_zone(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepSecondaryTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [0]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @secondary_target_speed_zone.setter
-    def secondary_target_speed_zone(self, value: int):
-        field = self.get_field(WorkoutStepSecondaryTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def secondary_target_hr_zone(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepSecondaryTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [1]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @secondary_target_hr_zone.setter
-    def secondary_target_hr_zone(self, value: int):
-        field = self.get_field(WorkoutStepSecondaryTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def secondary_target_cadence_zone(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepSecondaryTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [3]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @secondary_target_cadence_zone.setter
-    def secondary_target_cadence_zone(self, value: int):
-        field = self.get_field(WorkoutStepSecondaryTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def secondary_target_power_zone(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepSecondaryTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [4]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @secondary_target_power_zone.setter
-    def secondary_target_power_zone(self, value: int):
-        field = self.get_field(WorkoutStepSecondaryTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def secondary_target_stroke_type(self) -> Optional[SwimStroke]:
-        field = self.get_field(WorkoutStepSecondaryTargetValueField.ID)
-        type_field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [11]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @secondary_target_stroke_type.setter
-    def secondary_target_stroke_type(self, value: SwimStroke):
-        field = self.get_field(WorkoutStepSecondaryTargetValueField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    @property
-    def secondary_custom_target_value_low(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueLowField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @secondary_custom_target_value_low.setter
-    def secondary_custom_target_value_low(self, value: int):
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueLowField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-    @property
-    def secondary_custom_target_speed_low(self) -> Optional[float]:
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueLowField.ID)
-        type_field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [0]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @secondary_custom_target_speed_low.setter
-    def secondary_custom_target_speed_low(self, value: float):
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueLowField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def secondary_custom_target_heart_rate_low(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueLowField.ID)
-        type_field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [1]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @secondary_custom_target_heart_rate_low.setter
-    def secondary_custom_target_heart_rate_low(self, value: int):
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueLowField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def secondary_custom_target_cadence_low(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueLowField.ID)
-        type_field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [3]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @secondary_custom_target_cadence_low.setter
-    def secondary_custom_target_cadence_low(self, value: int):
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueLowField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def secondary_custom_target_power_low(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueLowField.ID)
-        type_field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [4]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @secondary_custom_target_power_low.setter
-    def secondary_custom_target_power_low(self, value: int):
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueLowField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    @property
-    def secondary_custom_target_value_high(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueHighField.ID)
-        if field and field.is_valid():
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-
-
-    @secondary_custom_target_value_high.setter
-    def secondary_custom_target_value_high(self, value: int):
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueHighField.ID)
-
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-    
-
-
-    @property
-    def secondary_custom_target_speed_high(self) -> Optional[float]:
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueHighField.ID)
-        type_field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [0]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @secondary_custom_target_speed_high.setter
-    def secondary_custom_target_speed_high(self, value: float):
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueHighField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def secondary_custom_target_heart_rate_high(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueHighField.ID)
-        type_field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [1]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @secondary_custom_target_heart_rate_high.setter
-    def secondary_custom_target_heart_rate_high(self, value: int):
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueHighField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def secondary_custom_target_cadence_high(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueHighField.ID)
-        type_field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [3]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @secondary_custom_target_cadence_high.setter
-    def secondary_custom_target_cadence_high(self, value: int):
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueHighField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-    @property
-    def secondary_custom_target_power_high(self) -> Optional[int]:
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueHighField.ID)
-        type_field = self.get_field(WorkoutStepSecondaryTargetTypeField.ID)
-
-        is_sub_field_valid = type_field and type_field.get_value() in [4]
-        if field and field.is_valid() and is_sub_field_valid:
-            sub_field = field.get_valid_sub_field(self.fields)
-            return field.get_value(sub_field=sub_field)
-        else:
-            return None
-
-    @secondary_custom_target_power_high.setter
-    def secondary_custom_target_power_high(self, value: int):
-        field = self.get_field(WorkoutStepSecondaryCustomTargetValueHighField.ID)
-        if field:
-            if value is None:
-                field.clear()
-            else:
-                sub_field = field.get_valid_sub_field(self.fields)
-                field.set_value(0, value, sub_field)
-
-
-
-
-
-class MessageIndexField(Field):
-    ID = 254
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='message_index',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutStepWorkoutStepNameField(Field):
-    ID = 0
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='wkt_step_name',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutStepDurationTypeField(Field):
-    ID = 1
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='duration_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutStepDurationValueField(Field):
-    ID = 2
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='duration_value',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        SubField(
-            name='duration_time',
-            base_type=BaseType.UINT32,
-        scale = 1000,
-                offset = 0,
-        units = 's',
-        reference_map = {
-        WorkoutStepDurationTypeField.ID: [0, 28]
-        }), 
-        SubField(
-            name='duration_distance',
-            base_type=BaseType.UINT32,
-        scale = 100,
-                offset = 0,
-        units = 'm',
-        reference_map = {
-        WorkoutStepDurationTypeField.ID: [1]
-        }), 
-        SubField(
-            name='duration_hr',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = '% or bpm',
-        reference_map = {
-        WorkoutStepDurationTypeField.ID: [2, 3]
-        }), 
-        SubField(
-            name='duration_calories',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = 'calories',
-        reference_map = {
-        WorkoutStepDurationTypeField.ID: [4]
-        }), 
-        SubField(
-            name='duration_step',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        WorkoutStepDurationTypeField.ID: [6, 7, 8, 9, 10, 11, 12, 13]
-        }), 
-        SubField(
-            name='duration_power',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = '% or watts',
-        reference_map = {
-        WorkoutStepDurationTypeField.ID: [14, 15]
-        }), 
-        SubField(
-            name='duration_reps',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        WorkoutStepDurationTypeField.ID: [29]
-        })
-        ]
-        )
-
-
-class WorkoutStepTargetTypeField(Field):
-    ID = 3
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='target_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutStepTargetValueField(Field):
-    ID = 4
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='target_value',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        SubField(
-            name='target_speed_zone',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        WorkoutStepTargetTypeField.ID: [0]
-        }), 
-        SubField(
-            name='target_hr_zone',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        WorkoutStepTargetTypeField.ID: [1]
-        }), 
-        SubField(
-            name='target_cadence_zone',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        WorkoutStepTargetTypeField.ID: [3]
-        }), 
-        SubField(
-            name='target_power_zone',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        WorkoutStepTargetTypeField.ID: [4]
-        }), 
-        SubField(
-            name='repeat_steps',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        WorkoutStepDurationTypeField.ID: [6]
-        }), 
-        SubField(
-            name='repeat_time',
-            base_type=BaseType.UINT32,
-        scale = 1000,
-                offset = 0,
-        units = 's',
-        reference_map = {
-        WorkoutStepDurationTypeField.ID: [7]
-        }), 
-        SubField(
-            name='repeat_distance',
-            base_type=BaseType.UINT32,
-        scale = 100,
-                offset = 0,
-        units = 'm',
-        reference_map = {
-        WorkoutStepDurationTypeField.ID: [8]
-        }), 
-        SubField(
-            name='repeat_calories',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = 'calories',
-        reference_map = {
-        WorkoutStepDurationTypeField.ID: [9]
-        }), 
-        SubField(
-            name='repeat_hr',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = '% or bpm',
-        reference_map = {
-        WorkoutStepDurationTypeField.ID: [10, 11]
-        }), 
-        SubField(
-            name='repeat_power',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = '% or watts',
-        reference_map = {
-        WorkoutStepDurationTypeField.ID: [12, 13]
-        }), 
-        SubField(
-            name='target_stroke_type',
-            base_type=BaseType.ENUM,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        WorkoutStepTargetTypeField.ID: [11]
-        })
-        ]
-        )
-
-
-class WorkoutStepCustomTargetValueLowField(Field):
-    ID = 5
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='custom_target_value_low',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        SubField(
-            name='custom_target_speed_low',
-            base_type=BaseType.UINT32,
-        scale = 1000,
-                offset = 0,
-        units = 'm/s',
-        reference_map = {
-        WorkoutStepTargetTypeField.ID: [0, 12]
-        }), 
-        SubField(
-            name='custom_target_heart_rate_low',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = '% or bpm',
-        reference_map = {
-        WorkoutStepTargetTypeField.ID: [1, 13]
-        }), 
-        SubField(
-            name='custom_target_cadence_low',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = 'rpm',
-        reference_map = {
-        WorkoutStepTargetTypeField.ID: [3]
-        }), 
-        SubField(
-            name='custom_target_power_low',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = '% or watts',
-        reference_map = {
-        WorkoutStepTargetTypeField.ID: [4, 7, 8, 9, 10]
-        })
-        ]
-        )
-
-
-class WorkoutStepCustomTargetValueHighField(Field):
-    ID = 6
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='custom_target_value_high',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        SubField(
-            name='custom_target_speed_high',
-            base_type=BaseType.UINT32,
-        scale = 1000,
-                offset = 0,
-        units = 'm/s',
-        reference_map = {
-        WorkoutStepTargetTypeField.ID: [0, 12]
-        }), 
-        SubField(
-            name='custom_target_heart_rate_high',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = '% or bpm',
-        reference_map = {
-        WorkoutStepTargetTypeField.ID: [1, 13]
-        }), 
-        SubField(
-            name='custom_target_cadence_high',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = 'rpm',
-        reference_map = {
-        WorkoutStepTargetTypeField.ID: [3]
-        }), 
-        SubField(
-            name='custom_target_power_high',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = '% or watts',
-        reference_map = {
-        WorkoutStepTargetTypeField.ID: [4, 7, 8, 9, 10]
-        })
-        ]
-        )
-
-
-class WorkoutStepIntensityField(Field):
-    ID = 7
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='intensity',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutStepNotesField(Field):
-    ID = 8
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='notes',
-            field_id=self.ID,
-            base_type=BaseType.STRING,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutStepEquipmentField(Field):
-    ID = 9
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='equipment',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutStepExerciseCategoryField(Field):
-    ID = 10
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='exercise_category',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutStepExerciseNameField(Field):
-    ID = 11
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='exercise_name',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutStepExerciseWeightField(Field):
-    ID = 12
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='exercise_weight',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 100,
-                         size = size,
-        units = 'kg',
-        type_name = '',
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutStepWeightDisplayUnitField(Field):
-    ID = 13
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='weight_display_unit',
-            field_id=self.ID,
-            base_type=BaseType.UINT16,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutStepSecondaryTargetTypeField(Field):
-    ID = 19
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='secondary_target_type',
-            field_id=self.ID,
-            base_type=BaseType.ENUM,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        ]
-        )
-
-
-class WorkoutStepSecondaryTargetValueField(Field):
-    ID = 20
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='secondary_target_value',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        SubField(
-            name='secondary_target_speed_zone',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        WorkoutStepSecondaryTargetTypeField.ID: [0]
-        }), 
-        SubField(
-            name='secondary_target_hr_zone',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        WorkoutStepSecondaryTargetTypeField.ID: [1]
-        }), 
-        SubField(
-            name='secondary_target_cadence_zone',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        WorkoutStepSecondaryTargetTypeField.ID: [3]
-        }), 
-        SubField(
-            name='secondary_target_power_zone',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        WorkoutStepSecondaryTargetTypeField.ID: [4]
-        }), 
-        SubField(
-            name='secondary_target_stroke_type',
-            base_type=BaseType.ENUM,
-        scale = 1,
-                offset = 0,
-        reference_map = {
-        WorkoutStepSecondaryTargetTypeField.ID: [11]
-        })
-        ]
-        )
-
-
-class WorkoutStepSecondaryCustomTargetValueLowField(Field):
-    ID = 21
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='secondary_custom_target_value_low',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        SubField(
-            name='secondary_custom_target_speed_low',
-            base_type=BaseType.UINT32,
-        scale = 1000,
-                offset = 0,
-        units = 'm/s',
-        reference_map = {
-        WorkoutStepSecondaryTargetTypeField.ID: [0]
-        }), 
-        SubField(
-            name='secondary_custom_target_heart_rate_low',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = '% or bpm',
-        reference_map = {
-        WorkoutStepSecondaryTargetTypeField.ID: [1]
-        }), 
-        SubField(
-            name='secondary_custom_target_cadence_low',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = 'rpm',
-        reference_map = {
-        WorkoutStepSecondaryTargetTypeField.ID: [3]
-        }), 
-        SubField(
-            name='secondary_custom_target_power_low',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = '% or watts',
-        reference_map = {
-        WorkoutStepSecondaryTargetTypeField.ID: [4]
-        })
-        ]
-        )
-
-
-class WorkoutStepSecondaryCustomTargetValueHighField(Field):
-    ID = 22
-
-    def __init__(self, size: int = 0, growable: bool = True):
-        super().__init__(
-            name='secondary_custom_target_value_high',
-            field_id=self.ID,
-            base_type=BaseType.UINT32,
-        offset = 0,
-                 scale = 1,
-                         size = size,
-        growable = growable,
-                   sub_fields = [
-        SubField(
-            name='secondary_custom_target_speed_high',
-            base_type=BaseType.UINT32,
-        scale = 1000,
-                offset = 0,
-        units = 'm/s',
-        reference_map = {
-        WorkoutStepSecondaryTargetTypeField.ID: [0]
-        }), 
-        SubField(
-            name='secondary_custom_target_heart_rate_high',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = '% or bpm',
-        reference_map = {
-        WorkoutStepSecondaryTargetTypeField.ID: [1]
-        }), 
-        SubField(
-            name='secondary_custom_target_cadence_high',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = 'rpm',
-        reference_map = {
-        WorkoutStepSecondaryTargetTypeField.ID: [3]
-        }), 
-        SubField(
-            name='secondary_custom_target_power_high',
-            base_type=BaseType.UINT32,
-        scale = 1,
-                offset = 0,
-        units = '% or watts',
-        reference_map = {
-        WorkoutStepSecondaryTargetTypeField.ID: [4]
-        })
-        ]
-        )
\ No newline at end of file
+    message_index: FieldProperty[int] = FieldProperty(254)
+    workout_step_name: FieldProperty[str] = FieldProperty(0)
+    duration_type: FieldProperty[WorkoutStepDuration] = FieldProperty(1)
+    duration_value: FieldProperty[int] = FieldProperty(2)
+    duration_time: SubFieldProperty[float] = SubFieldProperty(2, 1, [0, 28])
+    duration_distance: SubFieldProperty[float] = SubFieldProperty(2, 1, [1])
+    duration_hr: SubFieldProperty[int] = SubFieldProperty(2, 1, [2, 3])
+    duration_calories: SubFieldProperty[int] = SubFieldProperty(2, 1, [4])
+    duration_step: SubFieldProperty[int] = SubFieldProperty(2, 1, [6, 7, 8, 9, 10, 11, 12, 13])
+    duration_power: SubFieldProperty[int] = SubFieldProperty(2, 1, [14, 15])
+    duration_reps: SubFieldProperty[int] = SubFieldProperty(2, 1, [29])
+    target_type: FieldProperty[WorkoutStepTarget] = FieldProperty(3)
+    target_value: FieldProperty[int] = FieldProperty(4)
+    target_speed_zone: SubFieldProperty[int] = SubFieldProperty(4, 3, [0])
+    target_hr_zone: SubFieldProperty[int] = SubFieldProperty(4, 3, [1])
+    target_cadence_zone: SubFieldProperty[int] = SubFieldProperty(4, 3, [3])
+    target_power_zone: SubFieldProperty[int] = SubFieldProperty(4, 3, [4])
+    target_repeat_steps: SubFieldProperty[int] = SubFieldProperty(4, 1, [6])
+    target_repeat_time: SubFieldProperty[float] = SubFieldProperty(4, 1, [7])
+    target_repeat_distance: SubFieldProperty[float] = SubFieldProperty(4, 1, [8])
+    target_repeat_calories: SubFieldProperty[int] = SubFieldProperty(4, 1, [9])
+    target_repeat_hr: SubFieldProperty[int] = SubFieldProperty(4, 1, [10, 11])
+    target_repeat_power: SubFieldProperty[int] = SubFieldProperty(4, 1, [12, 13])
+    target_stroke_type: SubFieldProperty[SwimStroke] = SubFieldProperty(4, 3, [11])
+    custom_target_value_low: FieldProperty[int] = FieldProperty(5)
+    custom_target_speed_low: SubFieldProperty[float] = SubFieldProperty(5, 3, [0, 12])
+    custom_target_heart_rate_low: SubFieldProperty[int] = SubFieldProperty(5, 3, [1, 13])
+    custom_target_cadence_low: SubFieldProperty[int] = SubFieldProperty(5, 3, [3])
+    custom_target_power_low: SubFieldProperty[int] = SubFieldProperty(5, 3, [4, 7, 8, 9, 10])
+    custom_target_value_high: FieldProperty[int] = FieldProperty(6)
+    custom_target_speed_high: SubFieldProperty[float] = SubFieldProperty(6, 3, [0, 12])
+    custom_target_heart_rate_high: SubFieldProperty[int] = SubFieldProperty(6, 3, [1, 13])
+    custom_target_cadence_high: SubFieldProperty[int] = SubFieldProperty(6, 3, [3])
+    custom_target_power_high: SubFieldProperty[int] = SubFieldProperty(6, 3, [4, 7, 8, 9, 10])
+    intensity: FieldProperty[Intensity] = FieldProperty(7)
+    notes: FieldProperty[str] = FieldProperty(8)
+    equipment: FieldProperty[WorkoutEquipment] = FieldProperty(9)
+    exercise_category: FieldProperty[int] = FieldProperty(10)
+    exercise_name: FieldProperty[int] = FieldProperty(11)
+    exercise_weight: FieldProperty[float] = FieldProperty(12)
+    weight_display_unit: FieldProperty[int] = FieldProperty(13)
+    secondary_target_type: FieldProperty[WorkoutStepTarget] = FieldProperty(19)
+    secondary_target_value: FieldProperty[int] = FieldProperty(20)
+    secondary_target_speed_zone: SubFieldProperty[int] = SubFieldProperty(20, 19, [0])
+    secondary_target_hr_zone: SubFieldProperty[int] = SubFieldProperty(20, 19, [1])
+    secondary_target_cadence_zone: SubFieldProperty[int] = SubFieldProperty(20, 19, [3])
+    secondary_target_power_zone: SubFieldProperty[int] = SubFieldProperty(20, 19, [4])
+    secondary_target_stroke_type: SubFieldProperty[SwimStroke] = SubFieldProperty(20, 19, [11])
+    secondary_custom_target_value_low: FieldProperty[int] = FieldProperty(21)
+    secondary_custom_target_speed_low: SubFieldProperty[float] = SubFieldProperty(21, 19, [0])
+    secondary_custom_target_heart_rate_low: SubFieldProperty[int] = SubFieldProperty(21, 19, [1])
+    secondary_custom_target_cadence_low: SubFieldProperty[int] = SubFieldProperty(21, 19, [3])
+    secondary_custom_target_power_low: SubFieldProperty[int] = SubFieldProperty(21, 19, [4])
+    secondary_custom_target_value_high: FieldProperty[int] = FieldProperty(22)
+    secondary_custom_target_speed_high: SubFieldProperty[float] = SubFieldProperty(22, 19, [0])
+    secondary_custom_target_heart_rate_high: SubFieldProperty[int] = SubFieldProperty(22, 19, [1])
+    secondary_custom_target_cadence_high: SubFieldProperty[int] = SubFieldProperty(22, 19, [3])
+    secondary_custom_target_power_high: SubFieldProperty[int] = SubFieldProperty(22, 19, [4])
+
+
+# class name, field id, name, base type, offset, scale, units, type name, sub fields
+# sub field: name, base type, scale, offset, units, reference map
+FIELD_TYPES = create_field_types(__name__, [
+    ('MessageIndexField', 254, 'message_index', BaseType.UINT16, 0, 1, '', '', []),
+    ('WorkoutStepWorkoutStepNameField', 0, 'wkt_step_name', BaseType.STRING, 0, 1, '', '', []),
+    ('WorkoutStepDurationTypeField', 1, 'duration_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('WorkoutStepDurationValueField', 2, 'duration_value', BaseType.UINT32, 0, 1, '', '', [
+        ('duration_time', BaseType.UINT32, 1000, 0, 's', {1: [0, 28]}),
+        ('duration_distance', BaseType.UINT32, 100, 0, 'm', {1: [1]}),
+        ('duration_hr', BaseType.UINT32, 1, 0, '% or bpm', {1: [2, 3]}),
+        ('duration_calories', BaseType.UINT32, 1, 0, 'calories', {1: [4]}),
+        ('duration_step', BaseType.UINT32, 1, 0, '', {1: [6, 7, 8, 9, 10, 11, 12, 13]}),
+        ('duration_power', BaseType.UINT32, 1, 0, '% or watts', {1: [14, 15]}),
+        ('duration_reps', BaseType.UINT32, 1, 0, '', {1: [29]}),
+    ]),
+    ('WorkoutStepTargetTypeField', 3, 'target_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('WorkoutStepTargetValueField', 4, 'target_value', BaseType.UINT32, 0, 1, '', '', [
+        ('target_speed_zone', BaseType.UINT32, 1, 0, '', {3: [0]}),
+        ('target_hr_zone', BaseType.UINT32, 1, 0, '', {3: [1]}),
+        ('target_cadence_zone', BaseType.UINT32, 1, 0, '', {3: [3]}),
+        ('target_power_zone', BaseType.UINT32, 1, 0, '', {3: [4]}),
+        ('repeat_steps', BaseType.UINT32, 1, 0, '', {1: [6]}),
+        ('repeat_time', BaseType.UINT32, 1000, 0, 's', {1: [7]}),
+        ('repeat_distance', BaseType.UINT32, 100, 0, 'm', {1: [8]}),
+        ('repeat_calories', BaseType.UINT32, 1, 0, 'calories', {1: [9]}),
+        ('repeat_hr', BaseType.UINT32, 1, 0, '% or bpm', {1: [10, 11]}),
+        ('repeat_power', BaseType.UINT32, 1, 0, '% or watts', {1: [12, 13]}),
+        ('target_stroke_type', BaseType.ENUM, 1, 0, '', {3: [11]}),
+    ]),
+    ('WorkoutStepCustomTargetValueLowField', 5, 'custom_target_value_low', BaseType.UINT32, 0, 1, '', '', [
+        ('custom_target_speed_low', BaseType.UINT32, 1000, 0, 'm/s', {3: [0, 12]}),
+        ('custom_target_heart_rate_low', BaseType.UINT32, 1, 0, '% or bpm', {3: [1, 13]}),
+        ('custom_target_cadence_low', BaseType.UINT32, 1, 0, 'rpm', {3: [3]}),
+        ('custom_target_power_low', BaseType.UINT32, 1, 0, '% or watts', {3: [4, 7, 8, 9, 10]}),
+    ]),
+    ('WorkoutStepCustomTargetValueHighField', 6, 'custom_target_value_high', BaseType.UINT32, 0, 1, '', '', [
+        ('custom_target_speed_high', BaseType.UINT32, 1000, 0, 'm/s', {3: [0, 12]}),
+        ('custom_target_heart_rate_high', BaseType.UINT32, 1, 0, '% or bpm', {3: [1, 13]}),
+        ('custom_target_cadence_high', BaseType.UINT32, 1, 0, 'rpm', {3: [3]}),
+        ('custom_target_power_high', BaseType.UINT32, 1, 0, '% or watts', {3: [4, 7, 8, 9, 10]}),
+    ]),
+    ('WorkoutStepIntensityField', 7, 'intensity', BaseType.ENUM, 0, 1, '', '', []),
+    ('WorkoutStepNotesField', 8, 'notes', BaseType.STRING, 0, 1, '', '', []),
+    ('WorkoutStepEquipmentField', 9, 'equipment', BaseType.ENUM, 0, 1, '', '', []),
+    ('WorkoutStepExerciseCategoryField', 10, 'exercise_category', BaseType.UINT16, 0, 1, '', '', []),
+    ('WorkoutStepExerciseNameField', 11, 'exercise_name', BaseType.UINT16, 0, 1, '', '', []),
+    ('WorkoutStepExerciseWeightField', 12, 'exercise_weight', BaseType.UINT16, 0, 100, 'kg', '', []),
+    ('WorkoutStepWeightDisplayUnitField', 13, 'weight_display_unit', BaseType.UINT16, 0, 1, '', '', []),
+    ('WorkoutStepSecondaryTargetTypeField', 19, 'secondary_target_type', BaseType.ENUM, 0, 1, '', '', []),
+    ('WorkoutStepSecondaryTargetValueField', 20, 'secondary_target_value', BaseType.UINT32, 0, 1, '', '', [
+        ('secondary_target_speed_zone', BaseType.UINT32, 1, 0, '', {19: [0]}),
+        ('secondary_target_hr_zone', BaseType.UINT32, 1, 0, '', {19: [1]}),
+        ('secondary_target_cadence_zone', BaseType.UINT32, 1, 0, '', {19: [3]}),
+        ('secondary_target_power_zone', BaseType.UINT32, 1, 0, '', {19: [4]}),
+        ('secondary_target_stroke_type', BaseType.ENUM, 1, 0, '', {19: [11]}),
+    ]),
+    ('WorkoutStepSecondaryCustomTargetValueLowField', 21, 'secondary_custom_target_value_low', BaseType.UINT32, 0, 1, '', '', [
+        ('secondary_custom_target_speed_low', BaseType.UINT32, 1000, 0, 'm/s', {19: [0]}),
+        ('secondary_custom_target_heart_rate_low', BaseType.UINT32, 1, 0, '% or bpm', {19: [1]}),
+        ('secondary_custom_target_cadence_low', BaseType.UINT32, 1, 0, 'rpm', {19: [3]}),
+        ('secondary_custom_target_power_low', BaseType.UINT32, 1, 0, '% or watts', {19: [4]}),
+    ]),
+    ('WorkoutStepSecondaryCustomTargetValueHighField', 22, 'secondary_custom_target_value_high', BaseType.UINT32, 0, 1, '', '', [
+        ('secondary_custom_target_speed_high', BaseType.UINT32, 1000, 0, 'm/s', {19: [0]}),
+        ('secondary_custom_target_heart_rate_high', BaseType.UINT32, 1, 0, '% or bpm', {19: [1]}),
+        ('secondary_custom_target_cadence_high', BaseType.UINT32, 1, 0, 'rpm', {19: [3]}),
+        ('secondary_custom_target_power_high', BaseType.UINT32, 1, 0, '% or watts', {19: [4]}),
+    ]),
+])
+
+(
+    MessageIndexField,
+    WorkoutStepWorkoutStepNameField,
+    WorkoutStepDurationTypeField,
+    WorkoutStepDurationValueField,
+    WorkoutStepTargetTypeField,
+    WorkoutStepTargetValueField,
+    WorkoutStepCustomTargetValueLowField,
+    WorkoutStepCustomTargetValueHighField,
+    WorkoutStepIntensityField,
+    WorkoutStepNotesField,
+    WorkoutStepEquipmentField,
+    WorkoutStepExerciseCategoryField,
+    WorkoutStepExerciseNameField,
+    WorkoutStepExerciseWeightField,
+    WorkoutStepWeightDisplayUnitField,
+    WorkoutStepSecondaryTargetTypeField,
+    WorkoutStepSecondaryTargetValueField,
+    WorkoutStepSecondaryCustomTargetValueLowField,
+    WorkoutStepSecondaryCustomTargetValueHighField,
+) = FIELD_TYPES
+
+WorkoutStepMessage.FIELD_TYPES = {x.ID: x for x in FIELD_TYPES}
\ No newline at end of file
@@ -0,0 +1,208 @@
+import json
+import os
+import threading
+from typing import Dict as dict
+from typing import List as list
+from typing import Optional
+
+from fit_tool.base_type import BaseType
+from fit_tool.data_message import DataMessage
+from fit_tool.definition_message import DefinitionMessage
+from fit_tool.developer_field import DeveloperField
+from fit_tool.endian import Endian
+from fit_tool.field_spec import FieldProperty, SubFieldProperty, create_field_type
+from fit_tool.generic_message import GenericMessage
+
+# Written by gen/gen_profile.py next to the generated messages:
+#
+#   messages: {global id: [name, class name, field specs]}
+#   field spec: [class name, field id, name, base type, offset, scale, units,
+#                type name, sub field specs, property name, profile type, is array]
+#   sub field spec: [name, base type, scale, offset, units, reference map,
+#                    property name, reference field id, reference values]
+#   types: {profile type: {value: name}}
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "profile", "profile_schema.json")
+
+
+class SchemaMessage(DataMessage):
+    """Base class of the message classes built from the profile schema. They have
+    the name, fields and properties of the generated message classes."""
+
+    ID = 0
+    NAME = ""
+    FIELD_TYPES = {}
+
+    def __init__(
+        self,
+        definition_message: DefinitionMessage = None,
+        developer_fields: list[DeveloperField] = None,
+        local_id: int = 0,
+        endian: Endian = Endian.LITTLE,
+    ):
+        super().__init__(
+            name=self.NAME,
+            global_id=self.ID,
+            local_id=definition_message.local_id if definition_message else local_id,
+            endian=definition_message.endian if definition_message else endian,
+            definition_message=definition_message,
+            developer_fields=developer_fields,
+            field_types=self.FIELD_TYPES,
+        )
+
+
+class ProfileSchema:
+    """The messages, fields and types of the profile, loaded from the JSON schema
+    written by gen_profile instead of importing the generated message modules.
+
+    Message classes are built on first use of each global message number. When
+    two threads build the same class at once, both get the one stored first.
+
+    The message classes of the default schema are attributes of this module, and
+    their field classes attributes of the message class, so that their messages
+    and fields can be pickled, e.g. to pass them between processes.
+    """
+
+    def __init__(self, schema: dict):
+        self.version = schema["version"]
+        self.message_specs = schema["messages"]
+        self.types = schema["types"]
+        self.message_types = {}
+        self.global_ids_by_class_name = {x[1]: int(k) for k, x in self.message_specs.items()}
+
+    @classmethod
+    def from_file(cls, path: str = SCHEMA_PATH):
+        with open(path, "r") as file_object:
+            return cls(json.load(file_object))
+
+    def get_message_name(self, global_id: int) -> Optional[str]:
+        message_spec = self.message_specs.get(str(global_id))
+        return message_spec[0] if message_spec else None
+
+    def get_message_type(self, global_id: int) -> Optional[type]:
+        message_type = self.message_types.get(global_id)
+        if message_type is None:
+            message_spec = self.message_specs.get(str(global_id))
+            if message_spec is None:
+                return None
+
+            message_type = self.message_types.setdefault(
+                global_id, self.create_message_type(global_id, *message_spec)
+            )
+
+        return message_type
+
+    @staticmethod
+    def create_message_type(global_id: int, name: str, class_name: str, field_specs: list) -> type:
+        attributes = {"ID": global_id, "NAME": name, "__module__": __name__}
+        field_types = {}
+
+        for field_spec in field_specs:
+            (
+                field_class_name,
+                field_id,
+                field_name,
+                base_type,
+                offset,
+                scale,
+                units,
+                type_name,
+                sub_field_specs,
+                property_name,
+                _,
+                is_array,
+            ) = field_spec
+
+            field_types[field_id] = create_field_type(
+                __name__,
+                field_class_name,
+                field_id,
+                field_name,
+                BaseType[base_type],
+                offset,
+                scale,
+                units,
+                type_name,
+                [
+                    (x[0], BaseType[x[1]], x[2], x[3], x[4], {int(k): v for k, v in x[5].items()})
+                    for x in sub_field_specs
+                ],
+            )
+            attributes[property_name] = FieldProperty(field_id, is_array=is_array)
+            for x in sub_field_specs:
+                attributes[x[6]] = SubFieldProperty(field_id, x[7], x[8])
+
+        attributes["FIELD_TYPES"] = field_types
+        message_type = type(class_name, (SchemaMessage,), attributes)
+
+        # field class names repeat across messages, so they are nested in theirs
+        for field_type in field_types.values():
+            field_type.__qualname__ = f"{class_name}.{field_type.__name__}"
+            setattr(message_type, field_type.__name__, field_type)
+
+        return message_type
+
+    def get_value_name(self, profile_type: str, value: int) -> Optional[str]:
+        """Return the name of a value of a profile type, e.g. CYCLING for 2 of sport."""
+        values = self.types.get(profile_type)
+        return values.get(str(value)) if values else None
+
+    def get_field_value_name(self, global_id: int, field_id: int, value: int) -> Optional[str]:
+        message_spec = self.message_specs.get(str(global_id))
+        if message_spec is None:
+            return None
+
+        for field_spec in message_spec[2]:
+            if field_spec[1] == field_id:
+                return self.get_value_name(field_spec[10], value)
+
+        return None
+
+    def from_definition(
+        self, definition_message: DefinitionMessage, developer_fields: list[DeveloperField]
+    ) -> DataMessage:
+        message_type = self.get_message_type(definition_message.global_id)
+        if message_type is None:
+            return GenericMessage(
+                definition_message=definition_message, developer_fields=developer_fields
+            )
+
+        return message_type(
+            definition_message=definition_message, developer_fields=developer_fields
+        )
+
+
+_default_schema = None
+_default_schema_lock = threading.Lock()
+
+
+def get_default_schema() -> ProfileSchema:
+    """Return the schema of the profile shipped with fit_tool, loaded on first use."""
+    global _default_schema
+    if _default_schema is None:
+        with _default_schema_lock:
+            if _default_schema is None:
+                _default_schema = ProfileSchema.from_file()
+
+    return _default_schema
+
+
+def __getattr__(name: str):
+    """Return the message class of the default schema named name, built if needed,
+    so that pickled schema messages load in any process."""
+    if name.endswith("Message") and not name.startswith("_"):
+        global_id = get_default_schema().global_ids_by_class_name.get(name)
+        if global_id is not None:
+            return get_default_schema().get_message_type(global_id)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class SchemaMessageFactory:
+    """Drop-in for MessageFactory that builds messages from the default profile
+    schema without importing the generated message modules."""
+
+    @staticmethod
+    def from_definition(
+        definition_message: DefinitionMessage, developer_fields: list[DeveloperField]
+    ) -> DataMessage:
+        return get_default_schema().from_definition(definition_message, developer_fields)
@@ -4,13 +4,16 @@ from typing import List as list
 from fit_tool.data_message import DataMessage
 from fit_tool.definition_message import DefinitionMessage
 from fit_tool.developer_field import DeveloperField
+from fit_tool.diagnostics import Diagnostics
+from fit_tool.field import DecodeMode
 from fit_tool.message import Message
 
 
 class RecordHeader:
-    """The record header indicates whether the record content contains a definition message, a normal data message or a
-    compressed timestamp data message. The record header also has a Local Message Type field that references the local
-    message in the data record to its global FIT message."""
+    """The record header indicates whether the record content contains a definition
+    message, a normal data message or a compressed timestamp data message. The record
+    header also has a Local Message Type field that references the local message in
+    the data record to its global FIT message."""
 
     HEADER_SIZE = 1
     IS_TIME_COMPRESSED_BIT_MASK = 0x80  # bits 7
@@ -72,6 +75,7 @@ class RecordHeader:
 
             return cls(
                 is_time_compressed=True,
+                is_definition=False,
                 local_id=local_id,
                 time_offset_seconds=time_offset_seconds,
             )
@@ -147,6 +151,9 @@ class Record:
         bytes_buffer: bytes,
         offset: int = 0,
         developer_fields_by_data_index: dict[int, dict[int, DeveloperField]] = None,
+        decode_mode: DecodeMode = None,
+        diagnostics: Diagnostics = None,
+        message_factory=None,
     ):
         header = RecordHeader.from_bytes(bytes_buffer, offset=offset)
         offset += header.size
@@ -172,7 +179,13 @@ class Record:
             else:
                 developer_fields = []
             message = DataMessage.from_bytes(
-                definition_message, developer_fields, bytes_buffer, offset=offset
+                definition_message,
+                developer_fields,
+                bytes_buffer,
+                offset=offset,
+                decode_mode=decode_mode,
+                diagnostics=diagnostics,
+                message_factory=message_factory,
             )
 
         return cls(header, message)
@@ -186,6 +199,27 @@ class Record:
         row.extend(self.message.to_row())
         return row
 
+    @staticmethod
+    def header_row(max_fields: int) -> list:
+        header_row = ["Type", "Local ID", "Message"]
+
+        for i in range(max_fields):
+            header_row.extend([f"Field {i}", f"Value {i}", f"Units {i}"])
+
+        return header_row
+
+    @staticmethod
+    def max_field_count(definition_messages) -> int:
+        max_fields = 0
+        for definition_message in definition_messages:
+            max_fields = max(
+                max_fields,
+                len(definition_message.field_definitions)
+                + len(definition_message.developer_field_definitions),
+            )
+
+        return max_fields
+
     def defined_size(self, definition_message: DefinitionMessage = None) -> int:
         if self.header.is_definition:
             return self.size
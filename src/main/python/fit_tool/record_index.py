@@ -0,0 +1,380 @@
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Iterator
+from typing import List as list
+from typing import Union
+
+from fit_tool.definition_message import DefinitionMessage
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_builder import FitFileBuilder
+from fit_tool.fit_file_reader import FitFileReader
+from fit_tool.profile.messages.developer_data_id_message import DeveloperDataIdMessage
+from fit_tool.profile.messages.field_description_message import FieldDescriptionMessage
+from fit_tool.profile.messages.file_id_message import FileIdMessage
+from fit_tool.record import Record, RecordHeader
+from fit_tool.record_layout import (
+    COMPRESSED_TIMESTAMP_MASK,
+    INVALID_TIMESTAMP,
+    get_timestamp_layout,
+)
+from fit_tool.utils.conversions import to_seconds_since_1989_epoch
+
+INDEX_FILE_EXTENSION = ".idx"
+INDEX_MAGIC = b"FITI"
+INDEX_VERSION = 1
+
+# magic, version, file size, file crc, record count
+INDEX_HEADER_FORMAT = "<4sBQHI"
+
+# messages copied ahead of a time slice so that it stands on its own
+HEADER_GLOBAL_IDS = {FileIdMessage.ID, DeveloperDataIdMessage.ID, FieldDescriptionMessage.ID}
+
+
+def get_index_path(path: str) -> str:
+    return path + INDEX_FILE_EXTENSION
+
+
+def read_file_crc(path: str) -> int:
+    with open(path, "rb") as file_object:
+        file_object.seek(-2, os.SEEK_END)
+        (crc,) = struct.unpack("<H", file_object.read(2))
+    return crc
+
+
+def to_fit_timestamp(value: Union[datetime, int]) -> int:
+    """Convert a datetime or milliseconds since the Unix epoch to FIT epoch seconds."""
+    if isinstance(value, datetime):
+        value = round(value.timestamp() * 1000)
+
+    return to_seconds_since_1989_epoch(value)
+
+
+class RecordIndex:
+    """Byte offset, local id, global id, timestamp and active definition of every
+    record of a FIT file, stored column-wise in arrays.
+
+    Timestamps are seconds since the FIT epoch, INVALID_TIMESTAMP for records without
+    one. For definition records the definition index is the record's own index.
+    """
+
+    def __init__(
+        self,
+        file_size: int = 0,
+        file_crc: int = 0,
+        offsets: array = None,
+        local_ids: array = None,
+        global_ids: array = None,
+        timestamps: array = None,
+        definition_indexes: array = None,
+    ):
+        self.file_size = file_size
+        self.file_crc = file_crc
+        self.offsets = offsets if offsets is not None else array("I")
+        self.local_ids = local_ids if local_ids is not None else array("B")
+        self.global_ids = global_ids if global_ids is not None else array("H")
+        self.timestamps = timestamps if timestamps is not None else array("I")
+        self.definition_indexes = (
+            definition_indexes if definition_indexes is not None else array("I")
+        )
+        self.timed_timestamps = None
+        self.timed_record_indexes = None
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def columns(self) -> list[array]:
+        return [
+            self.offsets,
+            self.local_ids,
+            self.global_ids,
+            self.timestamps,
+            self.definition_indexes,
+        ]
+
+    def is_definition(self, record_index: int) -> bool:
+        return self.definition_indexes[record_index] == record_index
+
+    def get_record_indexes(self, global_id: int) -> list[int]:
+        return [
+            i
+            for i, x in enumerate(self.global_ids)
+            if x == global_id and self.definition_indexes[i] != i
+        ]
+
+    def get_header_record_indexes(self, end: int) -> list[int]:
+        return [
+            i
+            for i in range(end)
+            if self.global_ids[i] in HEADER_GLOBAL_IDS and self.definition_indexes[i] != i
+        ]
+
+    def find_time_range(self, start: int, end: int) -> range:
+        """Return the indexes of the records from the first to the last data record
+        with a timestamp in [start, end], in FIT epoch seconds. Timestamps are
+        expected to be non-decreasing in file order, so both bounds are located by
+        binary search."""
+        if self.timed_timestamps is None:
+            self.timed_timestamps = array("I")
+            self.timed_record_indexes = array("I")
+            for i, timestamp in enumerate(self.timestamps):
+                if timestamp != INVALID_TIMESTAMP and self.definition_indexes[i] != i:
+                    self.timed_timestamps.append(timestamp)
+                    self.timed_record_indexes.append(i)
+
+        first = bisect_left(self.timed_timestamps, start)
+        last = bisect_right(self.timed_timestamps, end) - 1
+        if first > last:
+            return range(0)
+
+        return range(self.timed_record_indexes[first], self.timed_record_indexes[last] + 1)
+
+    @classmethod
+    def build(cls, path: str):
+        index = cls(file_size=os.path.getsize(path))
+
+        with FitFileReader.from_file(path) as reader:
+            header = reader.read_header()
+
+            offset = reader.records_offset
+            timestamp_layouts = {}
+            definition_indexes = {}
+            last_timestamp = INVALID_TIMESTAMP
+
+            record_bytes_remaining_count = header.records_size
+            while record_bytes_remaining_count > 0:
+                record_bytes = reader.read_record_bytes()
+                record_header = RecordHeader.from_bytes(record_bytes)
+                local_id = record_header.local_id
+                record_index = len(index)
+                timestamp = INVALID_TIMESTAMP
+
+                if record_header.is_definition:
+                    definition_message = DefinitionMessage.from_bytes(
+                        record_bytes,
+                        offset=RecordHeader.HEADER_SIZE,
+                        has_developer_fields=record_header.has_developer_fields,
+                    )
+                    reader.definition_messages[local_id] = definition_message
+                    timestamp_layouts[local_id] = get_timestamp_layout(definition_message)
+                    definition_indexes[local_id] = record_index
+                    global_id = definition_message.global_id
+                else:
+                    global_id = reader.definition_messages[local_id].global_id
+                    timestamp_layout = timestamp_layouts[local_id]
+
+                    if record_header.is_time_compressed and last_timestamp != INVALID_TIMESTAMP:
+                        time_offset = record_header.time_offset_seconds
+                        timestamp = last_timestamp + (
+                            (time_offset - last_timestamp) & COMPRESSED_TIMESTAMP_MASK
+                        )
+                    elif timestamp_layout:
+                        (timestamp,) = struct.unpack_from(
+                            timestamp_layout[0], record_bytes, timestamp_layout[1]
+                        )
+
+                    if timestamp != INVALID_TIMESTAMP:
+                        last_timestamp = timestamp
+
+                index.offsets.append(offset)
+                index.local_ids.append(local_id)
+                index.global_ids.append(global_id)
+                index.timestamps.append(timestamp)
+                index.definition_indexes.append(definition_indexes[local_id])
+
+                offset += len(record_bytes)
+                record_bytes_remaining_count -= len(record_bytes)
+
+            (index.file_crc,) = struct.unpack("<H", reader.read_bytes(2))
+
+        return index
+
+    def to_bytes(self) -> bytes:
+        bytes_buffer = bytearray(
+            struct.pack(
+                INDEX_HEADER_FORMAT,
+                INDEX_MAGIC,
+                INDEX_VERSION,
+                self.file_size,
+                self.file_crc,
+                len(self),
+            )
+        )
+
+        for column in self.columns():
+            if sys.byteorder == "big":
+                column = array(column.typecode, column)
+                column.byteswap()
+            bytes_buffer.extend(column.tobytes())
+
+        return bytes(bytes_buffer)
+
+    @classmethod
+    def from_bytes(cls, bytes_buffer: bytes):
+        magic, version, file_size, file_crc, count = struct.unpack_from(
+            INDEX_HEADER_FORMAT, bytes_buffer
+        )
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise Exception("Not a FIT record index or unsupported index version.")
+
+        index = cls(file_size=file_size, file_crc=file_crc)
+        offset = struct.calcsize(INDEX_HEADER_FORMAT)
+
+        for column in index.columns():
+            size = count * column.itemsize
+            column.frombytes(bytes_buffer[offset : offset + size])
+            if sys.byteorder == "big":
+                column.byteswap()
+            offset += size
+
+        if offset != len(bytes_buffer):
+            raise Exception("Record index size does not match its record count.")
+
+        return index
+
+    def save(self, path: str):
+        with open(path, "wb") as file_object:
+            file_object.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path, "rb") as file_object:
+            return cls.from_bytes(file_object.read())
+
+    def is_valid_for(self, path: str) -> bool:
+        return (
+            os.path.getsize(path) == self.file_size
+            and read_file_crc(path) == self.file_crc
+        )
+
+    @classmethod
+    def open(cls, path: str, save: bool = True):
+        """Load the sidecar index of the FIT file at path if it is still valid,
+        otherwise build it and (optionally) save it next to the file."""
+        index_path = get_index_path(path)
+
+        if os.path.exists(index_path):
+            try:
+                index = cls.load(index_path)
+                if index.is_valid_for(path):
+                    return index
+            except Exception:
+                pass
+
+        index = cls.build(path)
+        if save:
+            index.save(index_path)
+
+        return index
+
+
+class IndexedFitFile:
+    """Random access to the records of a FIT file using its RecordIndex."""
+
+    def __init__(self, path: str, index: RecordIndex = None):
+        self.index = index if index is not None else RecordIndex.open(path)
+        self.reader = FitFileReader.from_file(path)
+        self.definition_records_by_index = {}
+        self.developer_fields_loaded = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.reader.close()
+
+    def get_definition_record(self, record_index: int) -> Record:
+        definition_index = self.index.definition_indexes[record_index]
+        definition_record = self.definition_records_by_index.get(definition_index)
+
+        if definition_record is None:
+            self.reader.file_object.seek(self.index.offsets[definition_index])
+            definition_record = self.reader.decode_record(self.reader.read_record_bytes())
+            self.definition_records_by_index[definition_index] = definition_record
+
+        return definition_record
+
+    def load_developer_fields(self):
+        self.developer_fields_loaded = True
+        for record_index in self.index.get_record_indexes(FieldDescriptionMessage.ID):
+            self.read_record(record_index)
+
+    def read_record(self, record_index: int) -> Record:
+        definition_record = self.get_definition_record(record_index)
+        if self.index.is_definition(record_index):
+            return definition_record
+
+        definition_message = definition_record.message
+
+        if definition_message.has_developer_fields() and not self.developer_fields_loaded:
+            self.load_developer_fields()
+
+        self.reader.definition_messages[self.index.local_ids[record_index]] = (
+            definition_message
+        )
+        self.reader.file_object.seek(self.index.offsets[record_index])
+        record_bytes = self.reader.read_record_bytes()
+        return self.reader.decode_record(record_bytes, record_index)
+
+    def records(self, global_id: int = None) -> Iterator[Record]:
+        if global_id is None:
+            record_indexes = range(len(self.index))
+        else:
+            record_indexes = self.index.get_record_indexes(global_id)
+
+        for record_index in record_indexes:
+            yield self.read_record(record_index)
+
+    def slice(
+        self,
+        start: Union[datetime, int],
+        end: Union[datetime, int],
+        include_header_messages: bool = True,
+    ) -> Iterator[Record]:
+        """Yield the records between start and end (inclusive, datetimes or
+        milliseconds since the Unix epoch) preceded by the definitions they use.
+        Only these records are read from the file. With include_header_messages the
+        file id and developer field description messages before the range are
+        yielded first."""
+        record_indexes = self.index.find_time_range(
+            to_fit_timestamp(start), to_fit_timestamp(end)
+        )
+        if not record_indexes:
+            return
+
+        data_record_indexes = [
+            i for i in record_indexes if not self.index.is_definition(i)
+        ]
+        if include_header_messages:
+            data_record_indexes = (
+                self.index.get_header_record_indexes(record_indexes.start)
+                + data_record_indexes
+            )
+
+        definition_indexes_by_local_id = {}
+        for record_index in data_record_indexes:
+            local_id = self.index.local_ids[record_index]
+            definition_index = self.index.definition_indexes[record_index]
+
+            if definition_indexes_by_local_id.get(local_id) != definition_index:
+                definition_indexes_by_local_id[local_id] = definition_index
+                yield self.get_definition_record(record_index)
+
+            yield self.read_record(record_index)
+
+    def slice_to_fit_file(
+        self, start: Union[datetime, int], end: Union[datetime, int]
+    ) -> FitFile:
+        """Build a new, valid FIT file from the records between start and end."""
+        builder = FitFileBuilder(auto_define=True)
+        for record in self.slice(start, end):
+            if not record.is_definition:
+                builder.add(record.message)
+
+        return builder.build()
@@ -0,0 +1,49 @@
+from typing import Optional
+
+from fit_tool.definition_message import DefinitionMessage
+from fit_tool.developer_field_definition import DeveloperFieldDefinition
+from fit_tool.endian import Endian
+from fit_tool.field_definition import FieldDefinition
+from fit_tool.record import RecordHeader
+
+# Byte-level layout of FIT records, shared by the readers that walk a file without
+# decoding its data messages. Only the core record and definition classes are
+# imported, so the skim scanner can use it without loading the profile.
+
+# reserved, architecture, global id (2 bytes) and field count
+DEFINITION_FIXED_SIZE = 5
+
+TIMESTAMP_FIELD_ID = 253
+INVALID_TIMESTAMP = 0xFFFFFFFF
+
+# date_time values below this are seconds since a device power up, not since the
+# FIT epoch
+MIN_DATE_TIME = 0x10000000
+
+COMPRESSED_TIMESTAMP_MASK = 0x1F
+
+
+def get_definition_size(bytes_buffer: bytes, offset: int, header: RecordHeader) -> int:
+    """Return the size of the definition record at offset, header included."""
+    size = RecordHeader.HEADER_SIZE + DEFINITION_FIXED_SIZE
+    size += bytes_buffer[offset + size - 1] * FieldDefinition.field_definition_size()
+
+    if header.has_developer_fields:
+        count = bytes_buffer[offset + size]
+        size += 1 + count * DeveloperFieldDefinition.field_definition_size()
+
+    return size
+
+
+def get_timestamp_layout(definition_message: DefinitionMessage) -> Optional[tuple]:
+    """Return the struct format and the offset of the timestamp field within the data
+    of messages using this definition, or None if there is no timestamp field."""
+    offset = RecordHeader.HEADER_SIZE
+    for field_definition in definition_message.field_definitions:
+        if field_definition.field_id == TIMESTAMP_FIELD_ID and field_definition.size == 4:
+            endian_symbol = "<" if definition_message.endian == Endian.LITTLE else ">"
+            return f"{endian_symbol}I", offset
+
+        offset += field_definition.size
+
+    return None
@@ -0,0 +1,276 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict as dict
+from typing import Iterable
+from typing import List as list
+
+from fit_tool.base_type import BaseType
+from fit_tool.fit_file_reader import FitFileReader
+from fit_tool.record import Record
+from fit_tool.utils.logging import logger
+
+# array type codes of the encoded values of each base type; strings are not stored
+TYPECODES = {
+    BaseType.ENUM: "B",
+    BaseType.SINT8: "b",
+    BaseType.UINT8: "B",
+    BaseType.SINT16: "h",
+    BaseType.UINT16: "H",
+    BaseType.SINT32: "i",
+    BaseType.UINT32: "I",
+    BaseType.FLOAT32: "f",
+    BaseType.FLOAT64: "d",
+    BaseType.UINT8Z: "B",
+    BaseType.UINT16Z: "H",
+    BaseType.UINT32Z: "I",
+    BaseType.BYTE: "B",
+    BaseType.SINT64: "q",
+    BaseType.UINT64: "Q",
+    BaseType.UINT64Z: "Q",
+}
+
+# columns start at multiples of the largest item size
+COLUMN_ALIGNMENT = 8
+
+
+class ColumnDescriptor:
+    """Location of one column in a shared memory block: the array type code of
+    its items, its shape, (rows,) or (rows, values per row) for array fields, and
+    its byte offset. Missing values are the invalid value of the base type, NaN
+    for floats."""
+
+    def __init__(self, name: str, dtype: str, shape: tuple, offset: int, invalid_value):
+        self.name = name
+        self.dtype = dtype
+        self.shape = shape
+        self.offset = offset
+        self.invalid_value = invalid_value
+
+    @property
+    def nbytes(self) -> int:
+        count = 1
+        for x in self.shape:
+            count *= x
+        return count * array(self.dtype).itemsize
+
+
+class SharedColumns:
+    """The columns of one decoded file in a shared memory block, described by the
+    block name and a descriptor per column. It is small to pickle, so worker
+    processes return it instead of the decoded records.
+
+    The block belongs to whoever holds the descriptor: attach and close it with
+    unlink=True once done, or call unlink, otherwise it lives on until the
+    process exits.
+    """
+
+    def __init__(self, name: str, row_count: int, descriptors: list[ColumnDescriptor]):
+        self.name = name
+        self.row_count = row_count
+        self.descriptors = descriptors
+
+    def attach(self):
+        return AttachedColumns(self)
+
+    def unlink(self):
+        self.attach().close(unlink=True)
+
+
+class AttachedColumns:
+    """The columns of a shared memory block as memoryviews over the block,
+    without copying. One-dimensional columns can be indexed, sliced and iterated
+    like lists of encoded values; two-dimensional ones are read with
+    columns[name][row, index] or tolist().
+
+    The views are released by close, after which they cannot be used anymore.
+    """
+
+    def __init__(self, shared_columns: SharedColumns):
+        self.shared_columns = shared_columns
+        self.shared_memory = shared_memory.SharedMemory(name=shared_columns.name)
+        self.columns = {
+            x.name: self.shared_memory.buf[x.offset : x.offset + x.nbytes].cast(
+                x.dtype, x.shape
+            )
+            for x in shared_columns.descriptors
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getitem__(self, name: str) -> memoryview:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def __len__(self) -> int:
+        return self.shared_columns.row_count
+
+    def close(self, unlink: bool = False):
+        for column in self.columns.values():
+            column.release()
+        self.columns = {}
+
+        self.shared_memory.close()
+        if unlink:
+            self.shared_memory.unlink()
+
+
+def collect_columns(records: Iterable[Record], global_id: int) -> tuple:
+    """Collect the encoded values of the data messages with the given global id
+    into columns keyed by field name, as FitFile.to_columns does in raw mode.
+    Returns the columns, the base type and largest number of values per row of
+    each column and the row count."""
+    columns = {}
+    base_types = {}
+    widths = {}
+    row_count = 0
+
+    for record in records:
+        message = record.message
+        if record.is_definition or message.global_id != global_id:
+            continue
+
+        for field in message.fields + message.developer_fields:
+            if field.is_not_valid() or field.base_type == BaseType.STRING:
+                continue
+
+            name = message.get_column_name(field)
+            column = columns.get(name)
+            if column is None:
+                column = [None] * row_count
+                columns[name] = column
+                base_types[name] = field.base_type
+                widths[name] = 1
+
+            values = field.encoded_values
+            if len(values) == 1:
+                column.append(values[0])
+            else:
+                column.append(values.copy())
+                widths[name] = max(widths[name], len(values))
+
+        row_count += 1
+        for column in columns.values():
+            if len(column) < row_count:
+                column.append(None)
+
+    return columns, base_types, widths, row_count
+
+
+def get_invalid_value(base_type: BaseType):
+    return float("nan") if TYPECODES[base_type] in "fd" else base_type.invalid_raw_value()
+
+
+def to_array(column: list, base_type: BaseType, width: int) -> array:
+    """Return the values of a column in an array of its base type, padded to
+    width values per row for array fields."""
+    invalid_value = get_invalid_value(base_type)
+    items = array(TYPECODES[base_type])
+
+    if width == 1:
+        if None in column:
+            column = [invalid_value if x is None else x for x in column]
+        items.fromlist(column)
+        return items
+
+    padding = [invalid_value] * width
+    for x in column:
+        if x is None:
+            items.extend(padding)
+        elif isinstance(x, int) or isinstance(x, float):
+            items.append(x)
+            items.extend(padding[1:])
+        else:
+            values = [invalid_value if y is None else y for y in x]
+            items.extend(values)
+            items.extend(padding[len(values) :])
+
+    return items
+
+
+def write_shared_columns(
+    columns: dict[str, list], base_types: dict, widths: dict, row_count: int
+) -> SharedColumns:
+    """Copy columns into a new shared memory block and return its descriptor.
+    A column with values that do not fit its base type is left out."""
+    arrays = []
+    descriptors = []
+    size = 0
+
+    for name, column in columns.items():
+        base_type = base_types[name]
+        width = widths[name]
+
+        try:
+            items = to_array(column, base_type, width)
+        except (OverflowError, TypeError) as e:
+            logger.warning(f"Column {name} does not fit base type {base_type.name}: {e}")
+            continue
+
+        size += -size % COLUMN_ALIGNMENT
+        shape = (row_count,) if width == 1 else (row_count, width)
+        descriptors.append(
+            ColumnDescriptor(name, items.typecode, shape, size, get_invalid_value(base_type))
+        )
+        arrays.append(items)
+        size += len(items) * items.itemsize
+
+    block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        for descriptor, items in zip(descriptors, arrays):
+            end = descriptor.offset + descriptor.nbytes
+            block.buf[descriptor.offset : end] = memoryview(items).cast("B")
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+
+    # the block is handed over to the process attaching it; without this the
+    # resource tracker of a worker process may remove it when the worker exits
+    resource_tracker.unregister(block._name, "shared_memory")
+    block.close()
+
+    return SharedColumns(block.name, row_count, descriptors)
+
+
+def decode_shared_columns(path: str, global_id: int, check_crc: bool = True) -> SharedColumns:
+    """Decode the messages with the given global id of a file into a shared memory
+    block. The records are streamed, only the columns are kept."""
+    with FitFileReader.from_file(path, check_crc=check_crc) as reader:
+        columns, base_types, widths, row_count = collect_columns(reader.records(), global_id)
+
+    return write_shared_columns(columns, base_types, widths, row_count)
+
+
+def decode_all_shared_columns(
+    paths: Iterable[str], global_id: int, max_workers: int = None, check_crc: bool = True
+) -> list[SharedColumns]:
+    """Decode files in worker processes into shared memory blocks, returned in the
+    same order as the paths. The parent attaches the columns without unpickling
+    or copying them. If a file fails to decode, the blocks of the other files are
+    removed and the error is raised."""
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(decode_shared_columns, x, global_id, check_crc) for x in paths
+        ]
+
+        results = []
+        error = None
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                error = error or e
+
+    if error is not None:
+        for shared_columns in results:
+            shared_columns.unlink()
+        raise error
+
+    return results
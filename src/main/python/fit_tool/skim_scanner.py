@@ -0,0 +1,279 @@
+import mmap
+import struct
+from datetime import datetime, timezone
+from typing import Dict as dict
+from typing import Optional
+
+from fit_tool.definition_message import DefinitionMessage
+from fit_tool.fit_file_header import FitFileHeader
+from fit_tool.record import RecordHeader
+from fit_tool.record_layout import (
+    COMPRESSED_TIMESTAMP_MASK,
+    MIN_DATE_TIME,
+    get_definition_size,
+    get_timestamp_layout,
+)
+from fit_tool.utils.conversions import MILLISECONDS_EPOCH_1989_DELTA
+from fit_tool.utils.crc import crc16
+
+INVALID_DATE_TIME = 0xFFFFFFFF
+
+CRC_OK = "ok"
+CRC_MISMATCH = "mismatch"
+CRC_MISSING = "missing"
+CRC_NOT_CHECKED = "not checked"
+
+
+def to_utc(timestamp: Optional[int]) -> Optional[datetime]:
+    if timestamp is None:
+        return None
+
+    return datetime.fromtimestamp(
+        timestamp + MILLISECONDS_EPOCH_1989_DELTA // 1000, tz=timezone.utc
+    )
+
+
+class SkimReport:
+    """What a skim of a FIT file found: counts of the data messages and definitions
+    per global message number, the developer fields used by definitions keyed by
+    (developer data index, field number), the earliest and latest timestamp in
+    seconds since the FIT epoch, and the sizes and CRC status of the file.
+
+    If the records could not be walked to the end, error says why, and the counts
+    cover the records up to there.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self.size = 0
+        self.header: Optional[FitFileHeader] = None
+        self.records_size = 0
+        self.record_count = 0
+        self.message_counts: dict[int, int] = {}
+        self.definition_counts: dict[int, int] = {}
+        self.developer_fields: dict[tuple, int] = {}
+        self.start_time: Optional[int] = None
+        self.end_time: Optional[int] = None
+        self.file_crc: Optional[int] = None
+        self.calculated_crc: Optional[int] = None
+        self.crc_status = CRC_NOT_CHECKED
+        self.trailing_size = 0
+        self.error: Optional[str] = None
+
+    @property
+    def definition_count(self) -> int:
+        return sum(self.definition_counts.values())
+
+    @property
+    def message_count(self) -> int:
+        return sum(self.message_counts.values())
+
+    @property
+    def duration(self) -> Optional[int]:
+        if self.start_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def to_dict(self) -> dict:
+        start_time = to_utc(self.start_time)
+        end_time = to_utc(self.end_time)
+        return {
+            "path": self.path,
+            "size": self.size,
+            "protocol_version": str(self.header.protocol_version) if self.header else None,
+            "profile_version": str(self.header.profile_version) if self.header else None,
+            "records_size": self.records_size,
+            "record_count": self.record_count,
+            "message_count": self.message_count,
+            "definition_count": self.definition_count,
+            "message_counts": {str(k): v for k, v in sorted(self.message_counts.items())},
+            "definition_counts": {
+                str(k): v for k, v in sorted(self.definition_counts.items())
+            },
+            "developer_fields": {
+                f"{k[0]}:{k[1]}": v for k, v in sorted(self.developer_fields.items())
+            },
+            "start_time": start_time.isoformat() if start_time else None,
+            "end_time": end_time.isoformat() if end_time else None,
+            "duration": self.duration,
+            "crc": self.crc_status,
+            "file_crc": self.file_crc,
+            "calculated_crc": self.calculated_crc,
+            "trailing_size": self.trailing_size,
+            "error": self.error,
+        }
+
+
+class SkimScanner:
+    """Walks the record headers and definitions of a FIT file without decoding any
+    data message: data records are skipped by the data size of their definition,
+    only the timestamp field is read from those that have one. Files are memory
+    mapped and scanned in place, so triage of many files is bound by reading them
+    and by the CRC check, which can be turned off.
+
+    Only the first FIT file of a chained file is scanned; the size of the bytes
+    after it is reported as trailing_size.
+    """
+
+    def __init__(self, check_crc: bool = True):
+        self.check_crc = check_crc
+
+    def scan_file(self, path: str) -> SkimReport:
+        with open(path, "rb") as file_object:
+            try:
+                bytes_buffer = mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped
+                bytes_buffer = b""
+
+            try:
+                return self.scan_bytes(bytes_buffer, path=path)
+            finally:
+                if isinstance(bytes_buffer, mmap.mmap):
+                    bytes_buffer.close()
+
+    def scan_bytes(self, bytes_buffer, path: str = None) -> SkimReport:
+        report = SkimReport(path)
+        report.size = len(bytes_buffer)
+
+        try:
+            end = self.scan_records(bytes_buffer, report)
+        except (IndexError, struct.error, ValueError) as e:
+            # keep the truncation found before running out of bytes
+            report.error = report.error or f"Unexpected end of file or invalid record: {e}"
+            return report
+
+        if report.error is not None:
+            return report
+
+        if len(bytes_buffer) < end + 2:
+            report.crc_status = CRC_MISSING
+            return report
+
+        (report.file_crc,) = struct.unpack_from("<H", bytes_buffer, end)
+        report.trailing_size = len(bytes_buffer) - end - 2
+
+        if self.check_crc:
+            report.calculated_crc = crc16(memoryview(bytes_buffer)[:end])
+            report.crc_status = CRC_OK if report.calculated_crc == report.file_crc else CRC_MISMATCH
+
+        return report
+
+    @staticmethod
+    def scan_records(bytes_buffer, report: SkimReport) -> int:
+        """Count the records of the buffer into report and return the offset of the
+        file CRC."""
+        try:
+            header_size = bytes_buffer[0]
+            header = FitFileHeader.from_bytes(bytes(bytes_buffer[:header_size]))
+        except Exception as e:
+            # not a FIT file, or shorter than its header
+            report.error = f"Invalid file header: {e}"
+            return 0
+
+        report.header = header
+        report.records_size = header.records_size
+
+        offset = header_size
+        end = offset + header.records_size
+        if len(bytes_buffer) < end:
+            report.error = (
+                f"Truncated file: records size is {header.records_size} bytes, "
+                f"{len(bytes_buffer) - offset} bytes available."
+            )
+            end = len(bytes_buffer)
+
+        # local id: global id, data size, timestamp layout
+        definitions = {}
+        message_counts = report.message_counts
+        last_timestamp = None
+        start_time = None
+        end_time = None
+        record_count = 0
+
+        while offset < end:
+            byte = bytes_buffer[offset]
+
+            if byte & RecordHeader.IS_TIME_COMPRESSED_BIT_MASK:
+                local_id = (byte & RecordHeader.TIME_COMPRESSED_LOCAL_ID_BIT_MASK) >> 5
+                definition = definitions.get(local_id)
+                if definition is None:
+                    break
+
+                global_id, data_size, _ = definition
+                if last_timestamp is not None:
+                    time_offset = byte & RecordHeader.TIME_OFFSET_BIT_MASK
+                    last_timestamp += (time_offset - last_timestamp) & COMPRESSED_TIMESTAMP_MASK
+
+            elif byte & RecordHeader.IS_DEFINITION_BIT_MASK:
+                record_header = RecordHeader.from_bytes(bytes_buffer, offset=offset)
+                size = get_definition_size(bytes_buffer, offset, record_header)
+                if offset + size > end:
+                    report.error = (
+                        report.error or f"Definition at offset {offset} exceeds the records."
+                    )
+                    break
+
+                definition_message = DefinitionMessage.from_bytes(
+                    bytes_buffer[offset : offset + size],
+                    offset=RecordHeader.HEADER_SIZE,
+                    has_developer_fields=record_header.has_developer_fields,
+                )
+                global_id = definition_message.global_id
+                definitions[record_header.local_id] = (
+                    global_id,
+                    definition_message.defined_data_size,
+                    get_timestamp_layout(definition_message),
+                )
+
+                report.definition_counts[global_id] = (
+                    report.definition_counts.get(global_id, 0) + 1
+                )
+                for x in definition_message.developer_field_definitions:
+                    key = (x.developer_data_index, x.field_id)
+                    report.developer_fields[key] = report.developer_fields.get(key, 0) + 1
+
+                offset += size
+                record_count += 1
+                continue
+
+            else:
+                definition = definitions.get(byte & RecordHeader.NORMAL_LOCAL_ID_BIT_MASK)
+                if definition is None:
+                    break
+
+                global_id, data_size, timestamp_layout = definition
+                if timestamp_layout is not None:
+                    (timestamp,) = struct.unpack_from(
+                        timestamp_layout[0], bytes_buffer, offset + timestamp_layout[1]
+                    )
+                    if MIN_DATE_TIME <= timestamp != INVALID_DATE_TIME:
+                        last_timestamp = timestamp
+
+            size = RecordHeader.HEADER_SIZE + data_size
+            if offset + size > end:
+                report.error = (
+                    report.error or f"Data record at offset {offset} exceeds the records."
+                )
+                break
+
+            message_counts[global_id] = message_counts.get(global_id, 0) + 1
+            if last_timestamp is not None:
+                if start_time is None or last_timestamp < start_time:
+                    start_time = last_timestamp
+                if end_time is None or last_timestamp > end_time:
+                    end_time = last_timestamp
+
+            offset += size
+            record_count += 1
+
+        else:
+            offset = None
+
+        if offset is not None and report.error is None:
+            report.error = f"Undefined local message type at offset {offset}."
+
+        report.record_count = record_count
+        report.start_time = start_time
+        report.end_time = end_time
+        return end
@@ -0,0 +1,229 @@
+import argparse
+import os
+import sqlite3
+from typing import Dict as dict
+from typing import Iterable
+from typing import List as list
+
+from fit_tool.base_type import BaseType
+from fit_tool.data_message import DataMessage
+from fit_tool.field import DecodeMode, Field
+from fit_tool.fit_file_reader import FitFileReader
+from fit_tool.generic_message import GenericMessage
+from fit_tool.record import Record
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class SqliteExporter:
+    """Loads decoded FIT records into a SQLite database with one table per message
+    type. Rows are inserted in batches with executemany, fields missing from a
+    message are stored as NULL and every row references its source file, so many
+    files can be appended to the same database."""
+
+    def __init__(self, connection: sqlite3.Connection, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.columns_by_table = {}
+        self.batches = {}
+
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS files "
+            "(id INTEGER PRIMARY KEY, name TEXT, crc INTEGER)"
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS columns "
+            "(table_name TEXT, column_name TEXT, units TEXT, "
+            "PRIMARY KEY (table_name, column_name))"
+        )
+
+    @classmethod
+    def from_path(cls, path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        return cls(sqlite3.connect(path), batch_size=batch_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def export(self, records: Iterable[Record], name: str = "", crc: int = None) -> int:
+        """Insert all data messages of one file in a single transaction and return
+        the id of the file row. If reading the records fails, the transaction is
+        rolled back together with the tables and columns it created, and the rows
+        not inserted yet are dropped."""
+        try:
+            with self.connection:
+                cursor = self.connection.execute(
+                    "INSERT INTO files (name, crc) VALUES (?, ?)", (name, crc)
+                )
+                file_id = cursor.lastrowid
+
+                for record in records:
+                    if not record.is_definition:
+                        self.add_message(file_id, record.message)
+
+                self.flush()
+        except Exception:
+            # the known columns are read again from the rolled back schema
+            self.batches = {}
+            self.columns_by_table = {}
+            raise
+
+        return file_id
+
+    def add_message(self, file_id: int, message: DataMessage):
+        table_name = self.get_table_name(message)
+        values_by_column = {"file_id": file_id}
+        fields_by_column = {}
+
+        for field in message.fields + message.developer_fields:
+            if field.is_not_valid():
+                continue
+
+            column_name = self.get_column_name(message, field)
+            values_by_column[column_name] = self.get_column_value(field)
+            fields_by_column[column_name] = field
+
+        self.add_columns(table_name, fields_by_column)
+
+        key = (table_name, tuple(values_by_column.keys()))
+        batch = self.batches.setdefault(key, [])
+        batch.append(tuple(values_by_column.values()))
+        if len(batch) >= self.batch_size:
+            self.flush_batch(key)
+
+    def flush(self):
+        while self.batches:
+            self.flush_batch(next(iter(self.batches)))
+
+    def flush_batch(self, key: tuple):
+        table_name, column_names = key
+        rows = self.batches.pop(key)
+        placeholders = ", ".join("?" for _ in column_names)
+        columns = ", ".join(quote_identifier(x) for x in column_names)
+        self.connection.executemany(
+            f"INSERT INTO {quote_identifier(table_name)} ({columns}) VALUES ({placeholders})",
+            rows,
+        )
+
+    @staticmethod
+    def get_table_name(message: DataMessage) -> str:
+        if isinstance(message, GenericMessage):
+            return f"message_{message.global_id}"
+
+        return message.name
+
+    @staticmethod
+    def get_column_name(message: DataMessage, field: Field) -> str:
+        return message.get_column_name(field)
+
+    @staticmethod
+    def get_column_type(field: Field) -> str:
+        if field.base_type == BaseType.STRING or field.length > 1:
+            return "TEXT"
+        elif field.type_name == "date_time":
+            return "INTEGER"
+        elif field.base_type.is_float() or (field.scale and field.scale != 1):
+            return "REAL"
+        else:
+            return "INTEGER"
+
+    @staticmethod
+    def get_column_value(field: Field):
+        if field.base_type == BaseType.STRING:
+            return field.encoded_values[0] if field.encoded_values else None
+
+        invalid_value = field.base_type.invalid_raw_value()
+        values = [
+            None
+            if encoded_value == invalid_value
+            else field.decode_value(encoded_value, decode_mode=DecodeMode.SCALED)
+            for encoded_value in field.encoded_values
+        ]
+
+        if len(values) == 1:
+            return values[0]
+
+        return "[" + ",".join([str(v) for v in values]) + "]"
+
+    def get_columns(self, table_name: str) -> set:
+        columns = self.columns_by_table.get(table_name)
+        if columns is None:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {quote_identifier(table_name)} "
+                "(file_id INTEGER REFERENCES files (id))"
+            )
+            columns = {
+                row[1]
+                for row in self.connection.execute(
+                    f"PRAGMA table_info({quote_identifier(table_name)})"
+                )
+            }
+            self.columns_by_table[table_name] = columns
+
+        return columns
+
+    def add_columns(self, table_name: str, fields_by_column: dict[str, Field]):
+        columns = self.get_columns(table_name)
+
+        for column_name, field in fields_by_column.items():
+            if column_name in columns:
+                continue
+
+            self.connection.execute(
+                f"ALTER TABLE {quote_identifier(table_name)} "
+                f"ADD COLUMN {quote_identifier(column_name)} {self.get_column_type(field)}"
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO columns (table_name, column_name, units) "
+                "VALUES (?, ?, ?)",
+                (table_name, column_name, field.units),
+            )
+            if column_name == "timestamp":
+                self.connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {quote_identifier(table_name + '_timestamp')} "
+                    f"ON {quote_identifier(table_name)} (timestamp)"
+                )
+            columns.add(column_name)
+
+
+def export_files(paths: list[str], database_path: str, check_crc: bool = True):
+    with SqliteExporter.from_path(database_path) as exporter:
+        for path in paths:
+            with FitFileReader.from_file(path, check_crc=check_crc) as reader:
+                file_id = exporter.export(reader.records(), name=os.path.basename(path))
+
+            exporter.connection.execute(
+                "UPDATE files SET crc = ? WHERE id = ?", (reader.crc, file_id)
+            )
+            exporter.connection.commit()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Load FIT files into a SQLite database, one table per message type."
+    )
+    parser.add_argument("database", help="path of the SQLite database")
+    parser.add_argument("files", nargs="+", help="FIT files to load")
+    parser.add_argument(
+        "--no-crc-check", action="store_true", help="do not fail on CRC mismatches"
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    export_files(args.files, args.database, check_crc=not args.no_crc_check)
+
+
+if __name__ == "__main__":
+    main()
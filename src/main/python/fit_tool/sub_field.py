@@ -31,12 +31,12 @@ class SubField:
         self.components.add(component)
 
     def is_valid(self, fields: list) -> bool:
-        for field_id in self.reference_map:
+        for field_id, reference_values in self.reference_map.items():
             field = next((x for x in fields if x.field_id == field_id), None)
             if field is None or field.is_not_valid():
                 continue
 
-            if self.reference_map[field_id] and field.get_value() in self.reference_map:
+            if reference_values and field.get_value() in reference_values:
                 return True
 
         return False
@@ -0,0 +1,351 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict as dict
+from typing import List as list
+from typing import Optional
+
+from fit_tool.data_message import DataMessage
+from fit_tool.field import Field
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_builder import FitFileBuilder
+from fit_tool.profile.messages.lap_message import LapMessage
+from fit_tool.profile.messages.record_message import RecordMessage
+from fit_tool.profile.messages.session_message import SessionMessage
+
+AVERAGE = "avg"
+MAXIMUM = "max"
+MINIMUM = "min"
+
+# summary field name, record columns in order of preference and statistic
+STATISTIC_FIELDS = [
+    ("avg_speed", ["enhanced_speed", "speed"], AVERAGE),
+    ("max_speed", ["enhanced_speed", "speed"], MAXIMUM),
+    ("enhanced_avg_speed", ["enhanced_speed"], AVERAGE),
+    ("enhanced_max_speed", ["enhanced_speed"], MAXIMUM),
+    ("avg_heart_rate", ["heart_rate"], AVERAGE),
+    ("max_heart_rate", ["heart_rate"], MAXIMUM),
+    ("min_heart_rate", ["heart_rate"], MINIMUM),
+    ("avg_cadence", ["cadence"], AVERAGE),
+    ("max_cadence", ["cadence"], MAXIMUM),
+    ("avg_power", ["power"], AVERAGE),
+    ("max_power", ["power"], MAXIMUM),
+    ("avg_altitude", ["enhanced_altitude", "altitude"], AVERAGE),
+    ("max_altitude", ["enhanced_altitude", "altitude"], MAXIMUM),
+    ("min_altitude", ["enhanced_altitude", "altitude"], MINIMUM),
+    ("enhanced_avg_altitude", ["enhanced_altitude"], AVERAGE),
+    ("enhanced_max_altitude", ["enhanced_altitude"], MAXIMUM),
+    ("enhanced_min_altitude", ["enhanced_altitude"], MINIMUM),
+    ("avg_temperature", ["temperature"], AVERAGE),
+    ("max_temperature", ["temperature"], MAXIMUM),
+    ("min_temperature", ["temperature"], MINIMUM),
+]
+
+# the fields of each message class by name, instantiated once
+_fields_by_name_by_type = {}
+
+
+def get_fields_by_name(message_type) -> dict[str, Field]:
+    fields_by_name = _fields_by_name_by_type.get(message_type)
+    if fields_by_name is None:
+        fields_by_name = {}
+        for field_type in message_type.FIELD_TYPES.values():
+            field = field_type(size=0, growable=False)
+            fields_by_name[field.name] = field
+        _fields_by_name_by_type[message_type] = fields_by_name
+
+    return fields_by_name
+
+
+def set_summary_value(message: DataMessage, name: str, value) -> bool:
+    """Set a field of a summary message by name. Returns True when the field was
+    not part of the message before, in which case the definition of a decoded
+    message has to be updated."""
+    profile_field = get_fields_by_name(type(message)).get(name)
+    if profile_field is None:
+        return False
+
+    if (
+        isinstance(value, float)
+        and profile_field.scale in (None, 1, 1.0)
+        and profile_field.offset in (None, 0, 0.0)
+    ):
+        value = round(value)
+
+    field = message.get_field(profile_field.field_id)
+    added = field is None or field.is_not_valid()
+    if added:
+        growable = message.growable
+        message.growable = True
+        if field is not None:
+            field.growable = True
+        setattr(message, name, value)
+        message.growable = growable
+    else:
+        setattr(message, name, value)
+
+    return added
+
+
+class ColumnStatistics:
+    """Encoded values of one record column with its invalid values removed, and
+    the scale and offset to convert statistics of them to profile units."""
+
+    def __init__(self, name: str, values: list, scale: float, offset: float):
+        self.name = name
+        self.values = values
+        self.scale = scale if scale else 1.0
+        self.offset = offset if offset else 0.0
+
+    def to_value(self, encoded_value: float) -> float:
+        return encoded_value / self.scale - self.offset
+
+    def average(self) -> float:
+        return self.to_value(sum(self.values) / len(self.values))
+
+    def maximum(self) -> float:
+        return self.to_value(max(self.values))
+
+    def minimum(self) -> float:
+        return self.to_value(min(self.values))
+
+
+class SummaryAggregator:
+    """Recomputes the totals of lap and session messages from record columns.
+
+    The columns are the encoded values of the records keyed by field name, as
+    returned by FitFile.to_columns(RecordMessage.ID) with the default raw decode
+    mode. A summary over a range of records is computed with one pass over each
+    column slice using the built-in sum, max and min over the valid values; only
+    ascent and descent need a loop over the altitude differences. Averages are
+    plain means of the samples.
+    """
+
+    def __init__(self, columns: dict[str, list]):
+        self.columns = columns
+        self.record_count = max((len(x) for x in columns.values()), default=0)
+        self.fields_by_name = get_fields_by_name(RecordMessage)
+
+        # forward fill missing timestamps (compressed timestamp headers) for the
+        # boundary search
+        self.timestamps = []
+        timestamp = None
+        invalid_timestamp = self.get_invalid_value("timestamp")
+        for value in columns.get("timestamp", []):
+            if value is not None and value != invalid_timestamp:
+                timestamp = value
+            self.timestamps.append(-1 if timestamp is None else timestamp)
+
+    def get_invalid_value(self, name: str) -> Optional[int]:
+        field = self.fields_by_name.get(name)
+        return field.base_type.invalid_raw_value() if field else None
+
+    def get_column(self, name: str, start: int, end: int) -> Optional[ColumnStatistics]:
+        column = self.columns.get(name)
+        field = self.fields_by_name.get(name)
+        if column is None or field is None:
+            return None
+
+        invalid_value = field.base_type.invalid_raw_value()
+        values = [x for x in column[start:end] if x is not None and x != invalid_value]
+        if not values:
+            return None
+
+        return ColumnStatistics(name, values, field.scale, field.offset)
+
+    def get_range(self, start_time: Optional[int], end_time: Optional[int]) -> range:
+        """Return the indexes of the records with start_time <= timestamp <= end_time,
+        both encoded as seconds since the FIT epoch. Records are expected to be in
+        time order."""
+        start = 0 if start_time is None else bisect_left(self.timestamps, start_time)
+        end = (
+            self.record_count
+            if end_time is None
+            else bisect_right(self.timestamps, end_time)
+        )
+        return range(start, max(start, end))
+
+    def get_previous_value(self, name: str, index: int) -> Optional[int]:
+        """Return the last valid encoded value of a column before index."""
+        column = self.columns.get(name)
+        if column is None:
+            return None
+
+        invalid_value = self.get_invalid_value(name)
+        for i in range(min(index, len(column)) - 1, -1, -1):
+            if column[i] is not None and column[i] != invalid_value:
+                return column[i]
+
+        return None
+
+    def summarize(
+        self,
+        start: int,
+        end: int,
+        elapsed_time: Optional[float] = None,
+        timer_time: Optional[float] = None,
+    ) -> dict[str, float]:
+        """Return the summary fields of the records with indexes in [start, end),
+        keyed by lap and session field name, in profile units.
+
+        The elapsed time defaults to the time from the first to the last record in
+        the range. The average speed falls back to the distance over the timer time,
+        or over the elapsed time if no timer time is given."""
+        summary = {}
+        if start >= end:
+            return summary
+
+        if elapsed_time is None:
+            timestamps = self.get_column("timestamp", start, end)
+            if timestamps is not None:
+                elapsed_time = float(timestamps.values[-1] - timestamps.values[0])
+
+        if elapsed_time is not None:
+            summary["total_elapsed_time"] = elapsed_time
+        if timer_time is not None:
+            summary["total_timer_time"] = timer_time
+
+        distances = self.get_column("distance", start, end)
+        if distances is not None:
+            start_distance = self.get_previous_value("distance", start)
+            if start_distance is None:
+                start_distance = distances.values[0]
+            summary["total_distance"] = max(
+                0.0, (distances.values[-1] - start_distance) / distances.scale
+            )
+
+        altitudes = self.get_column("enhanced_altitude", start, end) or self.get_column(
+            "altitude", start, end
+        )
+        if altitudes is not None:
+            ascent = 0
+            descent = 0
+            values = altitudes.values
+            previous = values[0]
+            for value in values:
+                delta = value - previous
+                if delta > 0:
+                    ascent += delta
+                else:
+                    descent -= delta
+                previous = value
+            summary["total_ascent"] = ascent / altitudes.scale
+            summary["total_descent"] = descent / altitudes.scale
+
+        latitudes = self.get_column("position_lat", start, end)
+        longitudes = self.get_column("position_long", start, end)
+        if latitudes is not None and longitudes is not None:
+            summary["start_position_lat"] = latitudes.to_value(latitudes.values[0])
+            summary["start_position_long"] = longitudes.to_value(longitudes.values[0])
+            summary["end_position_lat"] = latitudes.to_value(latitudes.values[-1])
+            summary["end_position_long"] = longitudes.to_value(longitudes.values[-1])
+
+        columns = {}
+        for name, column_names, statistic in STATISTIC_FIELDS:
+            column = None
+            for column_name in column_names:
+                if column_name not in columns:
+                    columns[column_name] = self.get_column(column_name, start, end)
+                column = columns[column_name]
+                if column is not None:
+                    break
+
+            if column is None:
+                continue
+
+            if statistic == AVERAGE:
+                summary[name] = column.average()
+            elif statistic == MAXIMUM:
+                summary[name] = column.maximum()
+            else:
+                summary[name] = column.minimum()
+
+        if "avg_speed" not in summary and "total_distance" in summary:
+            time = timer_time if timer_time is not None else elapsed_time
+            if time:
+                summary["avg_speed"] = summary["total_distance"] / time
+
+        return summary
+
+    def summarize_message(self, message: DataMessage) -> dict[str, float]:
+        """Return the summary of the records between the start time and the
+        timestamp of a lap or session message.
+
+        The elapsed time runs from the start time to the timestamp of the message,
+        so the times of consecutive laps add up to the time of their session. Pauses
+        cannot be told from the records, so the timer time of the message is kept
+        unless it is missing or longer than the elapsed time, in which case it is
+        set to the elapsed time."""
+        start, end = self.get_message_range(message)
+
+        elapsed_time = None
+        start_time = get_encoded_value(message, "start_time")
+        end_time = get_encoded_value(message, "timestamp")
+        if start_time is not None and end_time is not None and start_time <= end_time:
+            elapsed_time = float(end_time - start_time)
+
+        timer_time = None
+        if elapsed_time is not None:
+            timer_time = elapsed_time
+            field = message.get_field_by_name("total_timer_time")
+            value = get_encoded_value(message, "total_timer_time")
+            if value is not None and value / field.scale <= elapsed_time:
+                timer_time = value / field.scale
+
+        return self.summarize(start, end, elapsed_time=elapsed_time, timer_time=timer_time)
+
+    def get_message_range(self, message: DataMessage) -> tuple:
+        start_time = get_encoded_value(message, "start_time")
+        end_time = get_encoded_value(message, "timestamp")
+        record_range = self.get_range(start_time, end_time)
+        return record_range.start, record_range.stop
+
+    @staticmethod
+    def update(message: DataMessage, summary: dict[str, float]):
+        """Write a summary into a lap or session message. Fields the message does
+        not have yet are added, and the definition of a decoded message is updated
+        accordingly."""
+        added = False
+        for name, value in summary.items():
+            added |= set_summary_value(message, name, value)
+
+        if added and message.definition_message is not None:
+            message.update_definition_message()
+
+    def update_messages(self, messages: list[DataMessage]) -> int:
+        """Recompute the totals of the lap and session messages from the records
+        within their time range. Returns the number of messages updated."""
+        count = 0
+        for message in messages:
+            if not isinstance(message, (LapMessage, SessionMessage)):
+                continue
+
+            summary = self.summarize_message(message)
+            if summary:
+                self.update(message, summary)
+                count += 1
+
+        return count
+
+    @classmethod
+    def update_fit_file(cls, fit_file: FitFile) -> FitFile:
+        """Build a file with the totals of its laps and sessions recomputed, leaving
+        fit_file unchanged. The file is built again as fields added to decoded
+        messages change their definitions."""
+        aggregator = cls(fit_file.to_columns(RecordMessage.ID))
+        messages = [x.message.copy() for x in fit_file.records if not x.is_definition]
+        aggregator.update_messages(messages)
+
+        builder = FitFileBuilder(auto_define=True)
+        builder.add_all(messages)
+        return builder.build()
+
+
+def get_encoded_value(message: DataMessage, name: str) -> Optional[int]:
+    field = message.get_field_by_name(name)
+    if field is None or field.is_not_valid() or not field.encoded_values:
+        return None
+
+    value = field.encoded_values[0]
+    if value is None or value == field.base_type.invalid_raw_value():
+        return None
+
+    return value
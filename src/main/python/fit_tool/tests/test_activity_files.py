@@ -2,7 +2,10 @@
 import os
 import unittest
 
+from fit_tool.field import DecodeMode
 from fit_tool.fit_file import FitFile
+from fit_tool.profile.messages.record_message import RecordMessage
+from fit_tool.utils.conversions import to_datetimes
 
 
 class TestActivityFiles(unittest.TestCase):
@@ -38,3 +41,25 @@ class TestActivityFiles(unittest.TestCase):
             fit_file = FitFile.from_bytes(bytes_buffer)
             print(f"Profile version: {fit_file.header.profile_version}")
             fit_file.to_rows()
+
+    def test_decode_raw_columns(self):
+        """Test extracting raw record columns and converting them in bulk."""
+        path = os.path.join(
+            os.path.dirname(__file__), "data/sdk/activity_multisport.fit"
+        )
+
+        fit_file = FitFile.from_file(path)
+        raw_columns = fit_file.to_columns(RecordMessage.ID)
+        value_columns = fit_file.to_columns(RecordMessage.ID, DecodeMode.VALUE)
+
+        self.assertIsInstance(raw_columns["timestamp"][0], int)
+        self.assertEqual(to_datetimes(raw_columns["timestamp"]), value_columns["timestamp"])
+        self.assertEqual(len(raw_columns["timestamp"]), len(raw_columns["heart_rate"]))
+
+        raw_fit_file = FitFile.from_file(path, decode_mode=DecodeMode.RAW)
+        records = [
+            record.message
+            for record in raw_fit_file.records
+            if isinstance(record.message, RecordMessage)
+        ]
+        self.assertEqual(records[0].timestamp, raw_columns["timestamp"][0])
@@ -0,0 +1,47 @@
+# nosetests --nocapture  tests/test_benchmark.py
+import copy
+import os
+import unittest
+
+from fit_tool.benchmark import BENCHMARK_NAMES, compare, main, run
+
+
+class TestBenchmark(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_run(self):
+        """Test benchmarking a file and a generated activity."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/Settings.fit")
+        report = run(
+            [path], record_count=20, developer_field_count=2, repeat=1, thread_counts=[1, 2]
+        )
+
+        self.assertEqual(2, len(report["results"]))
+        for result in report["results"]:
+            self.assertEqual(BENCHMARK_NAMES, [x for x in result["benchmarks"]])
+            for benchmark in result["benchmarks"].values():
+                self.assertGreater(benchmark["records_per_second"], 0)
+                self.assertIn("peak_memory", benchmark)
+                self.assertIn("retained_blocks", benchmark)
+
+        threads = report["threads"]
+        self.assertEqual(4, threads["files"])
+        self.assertEqual([1, 2], [x["threads"] for x in threads["results"]])
+        self.assertEqual(1.0, threads["results"][0]["speedup"])
+
+        self.assertEqual([], compare(report, report))
+
+        baseline = copy.deepcopy(report)
+        baseline["results"][0]["benchmarks"]["decode"]["seconds"] /= 2
+        regressions = compare(report, baseline)
+        self.assertEqual(1, len(regressions))
+        self.assertTrue(regressions[0].startswith("Settings.fit decode seconds"))
+
+    def test_error_exit_code(self):
+        """Test a file that cannot be benchmarked is reported and fails the run."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/Settings.fit")
+        with self.assertRaises(SystemExit) as context:
+            main([__file__, path, "--records", "0", "--repeat", "1", "--no-trace"])
+
+        self.assertEqual(1, context.exception.code)
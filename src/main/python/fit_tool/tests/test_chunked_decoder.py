@@ -0,0 +1,65 @@
+# nosetests --nocapture  tests/test_chunked_decoder.py
+import os
+import unittest
+
+from fit_tool.chunked_decoder import ChunkedDecoder, scan_chunks
+from fit_tool.fit_file import FitFile
+from fit_tool.profile.messages.record_message import RecordMessage
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "sdk")
+
+
+def read_bytes(name: str) -> bytes:
+    with open(os.path.join(DATA_PATH, name), "rb") as file_object:
+        return file_object.read()
+
+
+class TestChunkedDecoder(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_scan_chunks(self):
+        """Test splitting the records of a file into chunks."""
+        bytes_buffer = read_bytes("activity_developerdata.fit")
+        header, chunks = scan_chunks(bytes_buffer, 4096)
+        fit_file = FitFile.from_bytes(bytes_buffer)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(bytes_buffer[0], chunks[0].start)
+        self.assertEqual(bytes_buffer[0] + header.records_size, chunks[-1].end)
+        self.assertEqual([], chunks[0].prelude)
+
+        offsets = [bytes_buffer[0]]
+        for record in fit_file.records:
+            offsets.append(offsets[-1] + len(record.to_bytes()))
+
+        for previous, chunk in zip(chunks, chunks[1:]):
+            self.assertEqual(previous.end, chunk.start)
+            self.assertEqual(offsets[chunk.record_index], chunk.start)
+            self.assertTrue(chunk.prelude)
+
+    def test_to_columns(self):
+        """Test decoding the chunks of files against decoding them in one piece."""
+        with ChunkedDecoder(max_workers=2, chunk_size=2048) as decoder:
+            for name in ["activity_developerdata.fit", "activity_multisport.fit"]:
+                bytes_buffer = read_bytes(name)
+                expected = FitFile.from_bytes(bytes_buffer).to_columns(RecordMessage.ID)
+                columns = decoder.to_columns(bytes_buffer, RecordMessage.ID)
+                self.assertEqual(expected, columns)
+
+            columns = decoder.file_to_columns(
+                os.path.join(DATA_PATH, "activity_developerdata.fit"), RecordMessage.ID
+            )
+            self.assertEqual(3601, len(columns["timestamp"]))
+            self.assertIn("Heart Rate", columns)
+
+    def test_crc(self):
+        """Test that a wrong file CRC is reported."""
+        bytes_buffer = bytearray(read_bytes("Settings.fit"))
+        bytes_buffer[-1] ^= 0xFF
+
+        with ChunkedDecoder(max_workers=1) as decoder:
+            self.assertRaises(Exception, decoder.to_columns, bytes(bytes_buffer), 0)
+
+        with ChunkedDecoder(max_workers=1, check_crc=False) as decoder:
+            self.assertIn("manufacturer", decoder.to_columns(bytes(bytes_buffer), 0))
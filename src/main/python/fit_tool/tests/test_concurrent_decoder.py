@@ -0,0 +1,107 @@
+# nosetests --nocapture  tests/test_concurrent_decoder.py
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from fit_tool.concurrent_decoder import ConcurrentDecoder
+from fit_tool.decoder_context import DecoderContext
+from fit_tool.definition_message import DefinitionMessage
+from fit_tool.field import Field
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_reader import FitFileReader
+from fit_tool.profile_schema import SchemaMessageFactory
+from fit_tool.profile.messages.record_message import RecordMessage
+from fit_tool.record import RecordHeader
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "sdk")
+
+
+def to_rows(fit_file: FitFile) -> list:
+    return [x.to_row() for x in fit_file.records if not x.is_definition]
+
+
+class TestConcurrentDecoder(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_decoder_context(self):
+        """Test decoding the records of a file with a decoder context."""
+        path = os.path.join(DATA_PATH, "activity_developerdata.fit")
+        with open(path, "rb") as file_object:
+            bytes_buffer = file_object.read()
+
+        with FitFileReader.from_bytes(bytes_buffer) as reader:
+            expected = [x.to_row() for x in reader.records()]
+            self.assertIs(reader.context.definition_messages, reader.definition_messages)
+            self.assertTrue(reader.developer_fields_by_data_index)
+
+        context = DecoderContext()
+        offset = bytes_buffer[0]
+        rows = []
+        while offset < len(bytes_buffer) - 2:
+            header = RecordHeader.from_bytes(bytes_buffer, offset=offset)
+            record = context.decode_record(bytes_buffer, offset)
+            rows.append(record.to_row())
+            if header.is_definition:
+                offset += len(record.to_bytes())
+            else:
+                offset += header.size + record.message.definition_message.defined_data_size
+
+        self.assertEqual(expected, rows)
+        self.assertEqual({0}, set(context.developer_fields_by_data_index))
+
+    def test_no_shared_field_values(self):
+        """Test that fields do not share a list of values."""
+        self.assertNotIn("encoded_values", vars(Field))
+
+        field = Field(size=1)
+        field.encoded_values = [1]
+        copy = Field.from_field(field)
+        copy.encoded_values[0] = 2
+        self.assertEqual([1], field.encoded_values)
+
+    def test_profile_field_names(self):
+        """Test that threads share one set of profile field names per message class."""
+        definition_message = DefinitionMessage(global_id=RecordMessage.ID)
+        schema_message = SchemaMessageFactory.from_definition(definition_message, [])
+        messages = [RecordMessage(), schema_message] * 8
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            names = list(executor.map(lambda x: x.get_profile_field_names(), messages))
+
+        self.assertIn("heart_rate", names[0])
+        self.assertEqual(names[0], names[1])
+        self.assertEqual(1, len({id(x) for x in names[0::2]}))
+        self.assertEqual(1, len({id(x) for x in names[1::2]}))
+
+    def test_decode_all(self):
+        """Test decoding files on several threads against decoding them in turn."""
+        names = [
+            "Settings.fit",
+            "WeightScaleMultiUser.fit",
+            "WorkoutIndividualSteps.fit",
+            "activity_developerdata.fit",
+            "activity_poolswim.fit",
+        ]
+        paths = [os.path.join(DATA_PATH, x) for x in names] * 2
+        expected = []
+        for path in paths:
+            expected.append(to_rows(FitFile.from_file(path)))
+
+        with ConcurrentDecoder(max_workers=4) as decoder:
+            fit_files = decoder.decode_all_files(paths)
+            self.assertEqual(expected, [to_rows(x) for x in fit_files])
+
+            with open(paths[0], "rb") as file_object:
+                bytes_buffer = file_object.read()
+            fit_files = decoder.decode_all_bytes([bytes_buffer] * 4)
+            self.assertEqual([expected[0]] * 4, [to_rows(x) for x in fit_files])
+
+        with ConcurrentDecoder(max_workers=4, message_factory=SchemaMessageFactory) as decoder:
+            fit_files = decoder.decode_all_files(paths)
+            self.assertEqual(expected, [to_rows(x) for x in fit_files])
+
+    def test_decode_error(self):
+        """Test that a decode error is raised by the future of its file."""
+        with ConcurrentDecoder(max_workers=2) as decoder:
+            future = decoder.submit_bytes(b"\x0e\x10")
+            self.assertIsNotNone(future.exception())
@@ -0,0 +1,125 @@
+# nosetests --nocapture  tests/test_course_simplifier.py
+import os
+import unittest
+
+from fit_tool.course_simplifier import (
+    VISVALINGAM,
+    CourseSimplifier,
+    douglas_peucker,
+    visvalingam,
+)
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_builder import FitFileBuilder
+from fit_tool.profile.messages.course_point_message import CoursePointMessage
+from fit_tool.profile.messages.lap_message import LapMessage
+from fit_tool.profile.messages.record_message import RecordMessage
+
+
+class TestCourseSimplifier(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_simplify_points(self):
+        """Test both methods keep the corner of an L-shaped line."""
+        xs = [float(x) for x in range(11)] + [10.0] * 10
+        ys = [0.0] * 11 + [float(y) for y in range(1, 11)]
+        ys[5] = 0.1
+
+        self.assertEqual([0, 10, 20], douglas_peucker(xs, ys, tolerance=0.5))
+        self.assertEqual([0, 5, 10, 20], douglas_peucker(xs, ys, tolerance=0.09))
+        self.assertEqual([0, 10, 20], douglas_peucker(xs, ys, max_points=3))
+        self.assertEqual(
+            [0, 3, 10, 20], douglas_peucker(xs, ys, tolerance=0.5, keep_indexes={3})
+        )
+        self.assertEqual([0, 10, 20], visvalingam(xs, ys, max_points=3))
+        self.assertEqual([0, 10, 20], visvalingam(xs, ys, tolerance=1.0))
+        self.assertIn(5, visvalingam(xs, ys, tolerance=0.01))
+        self.assertEqual([0, 4, 20], visvalingam(xs, ys, max_points=3, keep_indexes={4}))
+
+    def test_simplify_course(self):
+        """Test simplifying a course file keeps its course points and distances."""
+        path = os.path.join(os.path.dirname(__file__), "data/old_stage_lefthand_lee.fit")
+        fit_file = FitFile.from_file(path)
+        records = [x.message for x in fit_file.records if isinstance(x.message, RecordMessage)]
+        original_distance = records[-1].distance
+
+        for method in [None, VISVALINGAM]:
+            simplifier = (
+                CourseSimplifier(max_points=100)
+                if method is None
+                else CourseSimplifier(max_points=100, method=method)
+            )
+            simplified_file = FitFile.from_bytes(
+                simplifier.simplify_fit_file(FitFile.from_file(path)).to_bytes()
+            )
+            messages = [x.message for x in simplified_file.records if not x.is_definition]
+            simplified_records = [x for x in messages if isinstance(x, RecordMessage)]
+            course_points = [x for x in messages if isinstance(x, CoursePointMessage)]
+
+            self.assertEqual(100, len(simplified_records))
+            self.assertEqual(1, len(course_points))
+            self.assertEqual(0.0, simplified_records[0].distance)
+            self.assertAlmostEqual(
+                original_distance, simplified_records[-1].distance, delta=original_distance * 0.02
+            )
+            self.assertIn(
+                course_points[0].distance, [x.distance for x in simplified_records]
+            )
+            self.assertLess(len(simplified_file.to_bytes()), os.path.getsize(path) / 3)
+
+    def test_simplify_laps(self):
+        """Test that each lap gets the simplified distance of its own records, found
+        by time or by file order, and that the input file is left unchanged."""
+        path = os.path.join(os.path.dirname(__file__), "data/old_stage_lefthand_lee.fit")
+        messages = [x.message for x in FitFile.from_file(path).records]
+        records = []
+        for i, message in enumerate(x for x in messages if isinstance(x, RecordMessage)):
+            record = RecordMessage()
+            record.timestamp = 1000000000000 + i * 1000
+            record.position_lat = message.position_lat
+            record.position_long = message.position_long
+            record.distance = message.distance
+            records.append(record)
+
+        middle = len(records) // 2
+        laps = []
+        for first, last in [(records[0], records[middle]), (records[middle + 1], records[-1])]:
+            lap = LapMessage()
+            lap.start_time = first.timestamp
+            lap.timestamp = last.timestamp
+            lap.total_distance = last.distance - first.distance
+            laps.append(lap)
+
+        untimed_laps = []
+        for lap in laps:
+            untimed_lap = LapMessage()
+            untimed_lap.total_distance = lap.total_distance
+            untimed_laps.append(untimed_lap)
+
+        for messages in [
+            records + laps,
+            records[: middle + 1] + untimed_laps[:1] + records[middle + 1 :] + untimed_laps[1:],
+        ]:
+            builder = FitFileBuilder(auto_define=True)
+            builder.add_all(messages)
+            fit_file = builder.build()
+
+            bytes_buffer = fit_file.to_bytes()
+            simplified_file = CourseSimplifier(max_points=100).simplify_fit_file(fit_file)
+            self.assertEqual(bytes_buffer, fit_file.to_bytes())
+
+            messages = [x.message for x in simplified_file.records if not x.is_definition]
+            simplified_records = [x for x in messages if isinstance(x, RecordMessage)]
+            simplified_laps = [x for x in messages if isinstance(x, LapMessage)]
+            first_lap_records = [
+                x for x in simplified_records if x.timestamp <= records[middle].timestamp
+            ]
+            self.assertEqual(2, len(simplified_laps))
+            self.assertAlmostEqual(
+                first_lap_records[-1].distance, simplified_laps[0].total_distance, places=2
+            )
+            self.assertAlmostEqual(
+                simplified_records[-1].distance,
+                simplified_laps[0].total_distance + simplified_laps[1].total_distance,
+                places=2,
+            )
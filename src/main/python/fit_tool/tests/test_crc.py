@@ -1,6 +1,7 @@
+import random
 import unittest
 
-from fit_tool.utils.crc import crc16
+from fit_tool.utils.crc import crc16, crc16_combine, crc16_nibbles
 
 
 class TestCRC(unittest.TestCase):
@@ -8,3 +9,14 @@ class TestCRC(unittest.TestCase):
         data = "123456789".encode("utf-8")
         result = crc16(data)
         self.assertEqual(result, 0xBB3D)
+
+    def test_crc16_combine(self):
+        header = "123".encode("utf-8")
+        data = "456789".encode("utf-8")
+        result = crc16_combine(crc16(header), crc16(data), len(data))
+        self.assertEqual(result, 0xBB3D)
+
+    def test_crc16_table(self):
+        data = bytes(random.Random(1).randrange(256) for _ in range(1000))
+        self.assertEqual(crc16_nibbles(data), crc16(data))
+        self.assertEqual(crc16_nibbles(data, crc=0x1234), crc16(data, crc=0x1234))
@@ -3,8 +3,14 @@
 import unittest
 
 from fit_tool.definition_message import DefinitionMessage
+from fit_tool.profile.messages.event_message import (
+    EventDataField,
+    EventEventField,
+    EventMessage,
+    TimestampField,
+)
 from fit_tool.profile.messages.workout_step_message import WorkoutStepMessage
-from fit_tool.profile.profile_type import WorkoutStepDuration
+from fit_tool.profile.profile_type import Event, WorkoutStepDuration
 
 
 class TestDataMessage(unittest.TestCase):
@@ -34,3 +40,49 @@ class TestDataMessage(unittest.TestCase):
 
         row = dm1.to_row()
         print(row)
+
+    def test_sub_field_resolution(self):
+        dm1 = EventMessage()
+        dm1.event = Event.BATTERY
+        dm1.battery_level = 3.7
+
+        field = dm1.get_field(EventDataField.ID)
+        self.assertEqual("battery_level", field.get_valid_sub_field().name)
+        self.assertEqual(3700, field.encoded_values[0])
+        self.assertAlmostEqual(3.7, dm1.battery_level)
+
+        bytes1 = dm1.to_bytes()
+
+        definition_message = DefinitionMessage.from_data_message(dm1)
+        dm2 = EventMessage(definition_message=definition_message)
+        dm2.read_from_bytes(bytes1)
+
+        field = dm2.get_field(EventDataField.ID)
+        self.assertTrue(field.is_sub_field_resolved)
+        self.assertEqual("battery_level", field.resolved_sub_field.name)
+        self.assertAlmostEqual(3.7, dm2.battery_level)
+
+        # changing the reference field invalidates the cached sub-field
+        dm2.event = Event.TIMER
+        self.assertFalse(field.is_sub_field_resolved)
+        self.assertEqual("timer_trigger", field.get_valid_sub_field().name)
+
+    def test_sparse_fields(self):
+        dm1 = EventMessage()
+        self.assertEqual([], dm1.fields)
+        self.assertIsNone(dm1.battery_level)
+
+        dm1.event = Event.BATTERY
+        dm1.battery_level = 3.7
+        dm1.timestamp = 1700000000000
+
+        # fields are created on first set and kept in profile order
+        self.assertEqual(
+            [TimestampField.ID, EventEventField.ID, EventDataField.ID],
+            [x.field_id for x in dm1.fields],
+        )
+
+        definition_message = DefinitionMessage.from_data_message(dm1)
+        dm2 = EventMessage(definition_message=definition_message)
+        self.assertEqual(3, len(dm2.fields))
+        self.assertFalse(dm2.get_field(EventDataField.ID).growable)
@@ -0,0 +1,97 @@
+# nosetests --nocapture  tests/test_decode_cache.py
+import os
+import unittest
+
+from fit_tool.decode_cache import DecodeCache
+from fit_tool.field import DecodeMode
+from fit_tool.fit_file import FitFile
+from fit_tool.profile.messages.message_factory import MessageFactory
+from fit_tool.profile_schema import SchemaMessage, SchemaMessageFactory
+
+
+class TestDecodeCache(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_from_file(self):
+        """Test reading decoded files from the cache."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/activity_multisport.fit")
+        cache = DecodeCache(os.path.join(os.path.dirname(__file__), "out/cache"))
+        cache.clear()
+
+        fit_file = FitFile.from_file(path, cache=cache)
+        self.assertEqual(1, len(cache.entries()))
+
+        cached_file = FitFile.from_file(path, cache=cache)
+        self.assertEqual(fit_file.to_bytes(), cached_file.to_bytes())
+        self.assertEqual(fit_file.crc, cached_file.crc)
+
+        FitFile.from_file(path, decode_mode=DecodeMode.RAW, cache=cache)
+        self.assertEqual(2, len(cache.entries()))
+
+    def test_evict(self):
+        """Test least recently used entries are evicted."""
+        cache = DecodeCache(
+            os.path.join(os.path.dirname(__file__), "out/cache_evict"), max_size=2500
+        )
+        cache.clear()
+
+        cache.put("a", bytes(1000))
+        cache.put("b", bytes(1000))
+        os.utime(cache.get_path("a"), ns=(0, 0))
+        os.utime(cache.get_path("b"), ns=(1, 1))
+        self.assertIsNotNone(cache.get("a"))
+
+        cache.put("c", bytes(1000))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(bytes(1000), cache.get("a"))
+        self.assertEqual(bytes(1000), cache.get("c"))
+
+    def test_message_factory(self):
+        """Test that cached files are rebuilt with the message classes asked for."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/activity_developerdata.fit")
+        cache = DecodeCache(os.path.join(os.path.dirname(__file__), "out/cache"))
+        cache.clear()
+
+        fit_file = FitFile.from_file(path, cache=cache)
+        cached_file = FitFile.from_file(path, cache=cache)
+        self.assertEqual(fit_file.to_bytes(), cached_file.to_bytes())
+        self.assertEqual(
+            [x.to_row() for x in fit_file.records], [x.to_row() for x in cached_file.records]
+        )
+
+        schema_file = FitFile.from_file(path, cache=cache, message_factory=SchemaMessageFactory())
+        self.assertEqual(2, len(cache.entries()))
+        schema_file = FitFile.from_file(path, cache=cache, message_factory=SchemaMessageFactory())
+        self.assertIsInstance(schema_file.records[-1].message, SchemaMessage)
+        self.assertEqual(fit_file.to_bytes(), schema_file.to_bytes())
+
+        # messages rebuilt from one entry do not share fields
+        records = [x.message for x in cached_file.records if x.message.global_id == 20]
+        records[0].heart_rate = 1
+        self.assertNotEqual(1, records[1].heart_rate)
+
+    def test_message_factory_class(self):
+        """Test that message factories passed as classes get keys of their own."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/activity_developerdata.fit")
+        cache = DecodeCache(os.path.join(os.path.dirname(__file__), "out/cache"))
+        cache.clear()
+
+        schema_file = FitFile.from_file(path, cache=cache, message_factory=SchemaMessageFactory)
+        self.assertIsInstance(schema_file.records[-1].message, SchemaMessage)
+
+        fit_file = FitFile.from_file(path, cache=cache, message_factory=MessageFactory)
+        self.assertNotIsInstance(fit_file.records[-1].message, SchemaMessage)
+        self.assertEqual(2, len(cache.entries()))
+
+        schema_file = FitFile.from_file(path, cache=cache, message_factory=SchemaMessageFactory())
+        self.assertIsInstance(schema_file.records[-1].message, SchemaMessage)
+        self.assertEqual(2, len(cache.entries()))
+
+    def test_failed_put(self):
+        """Test that a failed write leaves no temporary file behind."""
+        cache = DecodeCache(os.path.join(os.path.dirname(__file__), "out/cache_evict"))
+        cache.clear()
+
+        self.assertRaises(Exception, cache.put, "a", lambda: None)
+        self.assertEqual([], os.listdir(cache.directory))
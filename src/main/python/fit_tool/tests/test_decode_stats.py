@@ -0,0 +1,54 @@
+# nosetests --nocapture  tests/test_decode_stats.py
+import os
+import unittest
+
+from fit_tool.decode_stats import DecodeStats
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_reader import FitFileReader
+from fit_tool.profile.messages.record_message import RecordMessage
+
+
+class TestDecodeStats(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_stats(self):
+        """Test collecting decode statistics."""
+        path = os.path.join(
+            os.path.dirname(__file__), "data/sdk/activity_developerdata.fit"
+        )
+        stats = DecodeStats()
+        fit_file = FitFile.from_file(path, stats=stats)
+
+        self.assertEqual(len(fit_file.records), stats.record_count)
+        self.assertEqual(fit_file.header.records_size, stats.size)
+
+        definitions = [x for x in fit_file.records if x.is_definition]
+        self.assertEqual(len(definitions), stats.definition_count)
+
+        records = [x for x in fit_file.records if isinstance(x.message, RecordMessage)]
+        record_stats = stats.messages_by_global_id[RecordMessage.ID]
+        self.assertEqual("record", record_stats.name)
+        self.assertEqual(len(records), record_stats.count)
+        self.assertEqual(sum(x.size for x in records), record_stats.size)
+        self.assertEqual(len(records), record_stats.developer_field_size)
+        self.assertGreater(record_stats.seconds, 0)
+
+        self.assertEqual(
+            stats.record_count - stats.definition_count,
+            sum(x.count for x in stats.messages_by_definition.values()),
+        )
+        self.assertEqual(stats.to_dict()["messages"][RecordMessage.ID]["count"], len(records))
+        self.assertIn("record (20)", stats.report())
+
+        # FitFile verifies every record, the stream reader does not by default
+        self.assertGreater(stats.verify_seconds, 0)
+        self.assertIn("verify seconds", stats.report())
+
+        stream_stats = DecodeStats()
+        with FitFileReader.from_file(path, stats=stream_stats) as reader:
+            for _ in reader.records():
+                pass
+        self.assertEqual(stats.record_count, stream_stats.record_count)
+        self.assertEqual(stats.redefinition_count, stream_stats.redefinition_count)
+        self.assertEqual(0.0, stream_stats.verify_seconds)
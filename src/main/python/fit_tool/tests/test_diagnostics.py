@@ -0,0 +1,51 @@
+# nosetests --nocapture  tests/test_diagnostics.py
+import os
+import unittest
+
+from fit_tool.diagnostics import SIZE_MISMATCH, UNDEFINED_FIELD, Diagnostics
+from fit_tool.fit_file_reader import FitFileReader
+from fit_tool.profile.messages.device_info_message import DeviceInfoMessage
+
+
+class TestDiagnostics(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_decode_diagnostics(self):
+        """Test decode problems are aggregated and summarized once decoding is done."""
+        path = os.path.join(os.path.dirname(__file__), "data/activity_deprecated_profile.fit")
+
+        with FitFileReader.from_file(path) as reader:
+            reader.verify_records = True
+            with self.assertLogs("fit_tool", level="WARNING") as logs:
+                for _ in reader.records():
+                    pass
+
+        diagnostics = reader.diagnostics
+        self.assertEqual(len(diagnostics.counts), len(logs.records))
+
+        key = (UNDEFINED_FIELD, "device_info", DeviceInfoMessage.ID, 8)
+        self.assertGreater(diagnostics.counts[key], 3)
+        self.assertEqual(3, len(diagnostics.samples[key]))
+        self.assertGreater(diagnostics.get_count(SIZE_MISMATCH), 0)
+
+        entry = next(
+            x for x in diagnostics.summary() if x["message"] == "device_info" and x["field_id"] == 8
+        )
+        self.assertEqual(
+            "Field id: 8 is not defined for message device_info:23. Skipping this field",
+            entry["samples"][0],
+        )
+
+    def test_samples(self):
+        """Test only the first samples are kept."""
+        diagnostics = Diagnostics(max_samples=1)
+        diagnostics.add(SIZE_MISMATCH, "record", 20, sample=(1, 10, 12))
+        diagnostics.add(SIZE_MISMATCH, "record", 20, sample=(2, 10, 12))
+
+        self.assertEqual(2, len(diagnostics))
+        self.assertEqual(
+            "2 x Record 1, record:20: size (10) != defined size (12). "
+            "Some fields were not read correctly.",
+            diagnostics.report(),
+        )
@@ -0,0 +1,67 @@
+# nosetests --nocapture  tests/test_field_spec.py
+import pickle
+import typing
+import unittest
+
+from fit_tool.field_spec import FieldProperty, SubFieldProperty
+from fit_tool.profile.messages import file_id_message
+from fit_tool.profile.messages.file_id_message import (
+    FileIdMessage,
+    FileIdProductField,
+    FileIdSerialNumberField,
+)
+from fit_tool.profile.messages.hrv_message import HrvMessage
+from fit_tool.profile.profile_type import FileType, Manufacturer
+
+
+class TestFieldSpec(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_field_types(self):
+        """Test the field classes built from the field spec table."""
+        self.assertEqual(2, FileIdProductField.ID)
+        self.assertIs(FileIdProductField, FileIdMessage.FIELD_TYPES[2])
+        self.assertEqual("fit_tool.profile.messages.file_id_message", FileIdProductField.__module__)
+
+        field = FileIdProductField(size=2, growable=False)
+        self.assertEqual("product", field.name)
+        self.assertFalse(field.growable)
+        self.assertEqual(["favero_product", "garmin_product"], [x.name for x in field.sub_fields])
+        self.assertEqual({1: [263]}, field.sub_fields[0].reference_map)
+        self.assertIsInstance(pickle.loads(pickle.dumps(field)), FileIdProductField)
+
+    def test_properties(self):
+        """Test the field and sub-field properties of a message."""
+        self.assertIsInstance(vars(FileIdMessage)["serial_number"], FieldProperty)
+        self.assertIsInstance(vars(FileIdMessage)["garmin_product"], SubFieldProperty)
+
+        message = FileIdMessage()
+        self.assertIsNone(message.serial_number)
+        message.serial_number = 1234
+        self.assertEqual(1234, message.get_field(FileIdSerialNumberField.ID).encoded_values[0])
+        self.assertEqual(1234, message.serial_number)
+        message.serial_number = None
+        self.assertIsNone(message.serial_number)
+
+        message.product = 3122
+        self.assertIsNone(message.garmin_product)
+        message.manufacturer = Manufacturer.GARMIN.value
+        self.assertEqual(3122, message.garmin_product)
+        self.assertIsNone(message.favero_product)
+
+        message = HrvMessage()
+        message.time = [0.5, 0.75]
+        self.assertEqual([0.5, 0.75], message.time)
+
+    def test_annotations(self):
+        """Test the value types of the properties and the re-exported profile types."""
+        self.assertIs(Manufacturer, file_id_message.Manufacturer)
+
+        hints = typing.get_type_hints(FileIdMessage)
+        self.assertEqual(FieldProperty[int], hints["serial_number"])
+        self.assertEqual(FieldProperty[FileType], hints["type"])
+        self.assertEqual(SubFieldProperty[int], hints["garmin_product"])
+        self.assertEqual(
+            FieldProperty[typing.List[float]], typing.get_type_hints(HrvMessage)["time"]
+        )
@@ -0,0 +1,74 @@
+# nosetests --nocapture  tests/test_fit_file_generator.py
+import os
+import unittest
+
+from fit_tool.endian import Endian
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_generator import FitFileGenerator
+from fit_tool.fit_file_tail_reader import FitFileTailReader
+from fit_tool.profile.messages.lap_message import LapMessage
+from fit_tool.profile.messages.location_message import LocationMessage
+from fit_tool.profile.messages.monitoring_message import MonitoringMessage
+from fit_tool.profile.messages.record_message import RecordMessage
+from fit_tool.record_index import RecordIndex
+
+
+class TestFitFileGenerator(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_activity(self):
+        """Test generating an activity is deterministic and decodes."""
+        generator = FitFileGenerator(
+            seed=7, record_count=120, developer_field_count=3, lap_interval=50
+        )
+        bytes_buffer = FitFileGenerator.to_bytes(generator.activity())
+        self.assertEqual(bytes_buffer, FitFileGenerator.to_bytes(generator.activity()))
+        self.assertNotEqual(
+            bytes_buffer,
+            FitFileGenerator.to_bytes(FitFileGenerator(seed=8, record_count=120).activity()),
+        )
+
+        fit_file = FitFile.from_bytes(bytes_buffer)
+        messages = [x.message for x in fit_file.records if not x.is_definition]
+        records = [x for x in messages if isinstance(x, RecordMessage)]
+        self.assertEqual(120, len(records))
+        self.assertEqual(3, len(records[0].developer_fields))
+        self.assertEqual(3, len([x for x in messages if isinstance(x, LapMessage)]))
+
+    def test_options(self):
+        """Test chained segments, compressed timestamps and big-endian definitions."""
+        out_path = os.path.join(os.path.dirname(__file__), "out/generated_monitoring.fit")
+        generator = FitFileGenerator(
+            record_count=90,
+            segment_count=3,
+            event_interval=20,
+            compressed_timestamps=True,
+            big_endian=True,
+        )
+        fit_files = generator.monitoring()
+        self.assertEqual(3, len(fit_files))
+
+        with open(out_path, "wb") as file_object:
+            file_object.write(FitFileGenerator.to_bytes(fit_files))
+
+        records = FitFileTailReader(out_path).poll()
+        messages = [x.message for x in records if isinstance(x.message, MonitoringMessage)]
+        self.assertEqual(90, len(messages))
+        self.assertTrue(all(x.header.is_time_compressed for x in records if x.message in messages))
+        self.assertTrue(all(x.message.endian == Endian.BIG for x in records))
+
+        index = RecordIndex.build(out_path)
+        timestamps = [index.timestamps[i] for i in index.get_record_indexes(MonitoringMessage.ID)]
+        self.assertEqual(list(range(timestamps[0], timestamps[0] + 30)), timestamps)
+
+    def test_locations(self):
+        """Test generating a locations file."""
+        fit_file = FitFileGenerator(record_count=10).locations()[0]
+        messages = [
+            x.message
+            for x in FitFile.from_bytes(fit_file.to_bytes()).records
+            if isinstance(x.message, LocationMessage)
+        ]
+        self.assertEqual(10, len(messages))
+        self.assertEqual("Location 9", messages[-1].location_name)
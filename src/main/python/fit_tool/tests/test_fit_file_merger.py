@@ -0,0 +1,106 @@
+# nosetests --nocapture  tests/test_fit_file_merger.py
+import os
+import unittest
+
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_generator import FitFileGenerator
+from fit_tool.fit_file_merger import FitFileMerger, get_encoded_timestamp
+from fit_tool.fit_file_transformer import FitFileTransformer
+from fit_tool.profile.messages.device_info_message import DeviceInfoMessage
+from fit_tool.profile.messages.file_id_message import FileIdMessage
+from fit_tool.profile.messages.record_message import RecordHeartRateField, RecordMessage
+
+
+class TestFitFileMerger(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    @staticmethod
+    def get_messages(fit_file: FitFile, message_type) -> list:
+        return [
+            x.message
+            for x in fit_file.records
+            if not x.is_definition and isinstance(x.message, message_type)
+        ]
+
+    @staticmethod
+    def get_keys(path: str) -> list:
+        return [
+            (x.message.global_id, get_encoded_timestamp(x.message))
+            for x in FitFile.from_file(path).records
+            if not x.is_definition
+        ]
+
+    def test_merge(self):
+        """Test merging records of two devices by timestamp."""
+        out_path = os.path.join(os.path.dirname(__file__), "out")
+        head_unit_path = os.path.join(out_path, "merge_head_unit.fit")
+        watch_path = os.path.join(out_path, "merge_watch.fit")
+        merged_path = os.path.join(out_path, "merged.fit")
+
+        generated_path = os.path.join(out_path, "merge_generated.fit")
+        with open(generated_path, "wb") as file_object:
+            generator = FitFileGenerator(seed=1, record_count=60, developer_field_count=2)
+            file_object.write(FitFileGenerator.to_bytes(generator.activity()))
+        FitFileTransformer().remove_field(RecordMessage.ID, RecordHeartRateField.ID).transform_file(
+            generated_path, head_unit_path
+        )
+
+        with open(watch_path, "wb") as file_object:
+            generator = FitFileGenerator(
+                seed=2, record_count=30, sample_rate=0.5, compressed_timestamps=True
+            )
+            file_object.write(FitFileGenerator.to_bytes(generator.activity()))
+
+        merger = FitFileMerger([head_unit_path, watch_path])
+        merger.merge_to_file(merged_path)
+        self.assertEqual(30, merger.combined_count)
+
+        head_unit_records = self.get_messages(FitFile.from_file(head_unit_path), RecordMessage)
+        merged_file = FitFile.from_file(merged_path)
+        records = self.get_messages(merged_file, RecordMessage)
+        self.assertEqual(60, len(records))
+        self.assertEqual(
+            [x.timestamp for x in head_unit_records], [x.timestamp for x in records]
+        )
+        self.assertEqual([x.power for x in head_unit_records], [x.power for x in records])
+        self.assertEqual(
+            [i % 2 == 0 for i in range(60)], [x.heart_rate is not None for x in records]
+        )
+        self.assertEqual(2, len(records[0].developer_fields))
+
+        file_ids = self.get_messages(merged_file, FileIdMessage)
+        self.assertEqual([1], [x.serial_number for x in file_ids])
+
+        merger = FitFileMerger([head_unit_path, watch_path], combine_records=False)
+        merger.merge_to_file(merged_path)
+        records = self.get_messages(FitFile.from_file(merged_path), RecordMessage)
+        self.assertEqual(90, len(records))
+        self.assertEqual(sorted(x.timestamp for x in records), [x.timestamp for x in records])
+
+    def test_merge_one_file(self):
+        """Test merging a single file keeps its messages in order."""
+        for name in ["Activity.fit", "activity_multisport.fit"]:
+            path = os.path.join(os.path.dirname(__file__), "data/sdk", name)
+            merged_path = os.path.join(os.path.dirname(__file__), "out/merged.fit")
+            FitFileMerger([path]).merge_to_file(merged_path)
+
+            self.assertEqual(self.get_keys(path), self.get_keys(merged_path))
+
+    def test_device_infos(self):
+        """Test device infos of the same device are written once."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/activity_multisport.fit")
+        merged_path = os.path.join(os.path.dirname(__file__), "out/merged_multisport.fit")
+
+        FitFileMerger([path, path]).merge_to_file(merged_path)
+
+        fit_file = FitFile.from_file(path)
+        merged_file = FitFile.from_file(merged_path)
+        self.assertEqual(
+            [x.to_row() for x in self.get_messages(fit_file, RecordMessage)],
+            [x.to_row() for x in self.get_messages(merged_file, RecordMessage)],
+        )
+        self.assertEqual(
+            len(self.get_messages(fit_file, DeviceInfoMessage)),
+            len(self.get_messages(merged_file, DeviceInfoMessage)),
+        )
@@ -0,0 +1,140 @@
+# nosetests --nocapture  tests/test_fit_file_patcher.py
+import os
+import shutil
+import unittest
+from datetime import timedelta
+
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_generator import FitFileGenerator
+from fit_tool.fit_file_patcher import FitFilePatcher
+from fit_tool.profile.messages.file_id_message import FileIdMessage, FileIdTimeCreatedField
+from fit_tool.profile.messages.lap_message import LapMessage
+from fit_tool.profile.messages.record_message import (
+    RecordMessage,
+    RecordPositionLatField,
+    RecordPositionLongField,
+)
+from fit_tool.record_index import RecordIndex, get_index_path
+from fit_tool.record_layout import TIMESTAMP_FIELD_ID
+
+
+class TestFitFilePatcher(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    @staticmethod
+    def get_messages(fit_file: FitFile, message_type) -> list:
+        return [
+            x.message
+            for x in fit_file.records
+            if not x.is_definition and isinstance(x.message, message_type)
+        ]
+
+    def test_patch_sdk_file(self):
+        """Test patching the serial number and timestamps of an SDK file."""
+        path = os.path.join(os.path.dirname(__file__), "out/activity_patched.fit")
+        shutil.copyfile(
+            os.path.join(os.path.dirname(__file__), "data/sdk/activity_developerdata.fit"),
+            path,
+        )
+        index = RecordIndex.build(path)
+        index.save(get_index_path(path))
+        original_file = FitFile.from_file(path)
+
+        with FitFilePatcher(path, index=index) as patcher:
+            self.assertEqual(1, patcher.set_serial_number(1234))
+            self.assertGreater(patcher.shift_timestamps(3600), 0)
+
+        patched_file = FitFile.from_file(path)
+        self.assertEqual(1234, self.get_messages(patched_file, FileIdMessage)[0].serial_number)
+        self.assertEqual(
+            [
+                x.timestamp + timedelta(hours=1)
+                for x in self.get_messages(original_file, RecordMessage)
+            ],
+            [x.timestamp for x in self.get_messages(patched_file, RecordMessage)],
+        )
+        self.assertEqual(
+            [
+                x.start_time + timedelta(hours=1)
+                for x in self.get_messages(original_file, LapMessage)
+            ],
+            [x.start_time for x in self.get_messages(patched_file, LapMessage)],
+        )
+        self.assertEqual(RecordIndex.build(path).columns(), RecordIndex.open(path).columns())
+
+    def test_patch_timestamp_field(self):
+        """Test the saved index follows timestamps patched as a field."""
+        path = os.path.join(os.path.dirname(__file__), "out/activity_patched.fit")
+        shutil.copyfile(
+            os.path.join(os.path.dirname(__file__), "data/sdk/activity_developerdata.fit"),
+            path,
+        )
+        index = RecordIndex.build(path)
+        index.save(get_index_path(path))
+
+        with FitFilePatcher(path, index=index) as patcher:
+            changed_count = patcher.patch_field(
+                RecordMessage.ID, TIMESTAMP_FIELD_ID, lambda value: value + 10
+            )
+
+        self.assertGreater(changed_count, 0)
+        self.assertEqual(RecordIndex.build(path).columns(), RecordIndex.open(path).columns())
+
+    def test_compressed_timestamps_and_positions(self):
+        """Test shifting compressed timestamps and anonymizing positions."""
+        path = os.path.join(os.path.dirname(__file__), "out/generated_patched.fit")
+        generator = FitFileGenerator(record_count=100, compressed_timestamps=True)
+        with open(path, "wb") as file_object:
+            file_object.write(FitFileGenerator.to_bytes(generator.activity()))
+        original_records = self.get_messages(FitFile.from_file(path), RecordMessage)
+        original_index = RecordIndex.build(path)
+
+        with FitFilePatcher(path) as patcher:
+            self.assertEqual(2 * len(original_records), patcher.anonymize_positions())
+            patcher.shift_timestamps(7)
+
+        patched_records = self.get_messages(FitFile.from_file(path), RecordMessage)
+        record_indexes = original_index.get_record_indexes(RecordMessage.ID)
+        self.assertEqual(
+            [original_index.timestamps[i] + 7 for i in record_indexes],
+            [RecordIndex.build(path).timestamps[i] for i in record_indexes],
+        )
+        for field_id in [RecordPositionLatField.ID, RecordPositionLongField.ID]:
+            self.assertEqual(
+                [[0x7FFFFFFF]] * len(patched_records),
+                [x.get_field(field_id).encoded_values for x in patched_records],
+            )
+        self.assertEqual(
+            [x.distance for x in original_records], [x.distance for x in patched_records]
+        )
+
+    def test_shift_out_of_range(self):
+        """Test a shift out of the date_time range leaves the file unchanged and
+        relative date_time values are not shifted."""
+        path = os.path.join(os.path.dirname(__file__), "out/generated_patched.fit")
+        generator = FitFileGenerator(record_count=100, compressed_timestamps=True)
+        with open(path, "wb") as file_object:
+            file_object.write(FitFileGenerator.to_bytes(generator.activity()))
+
+        # seconds since a device power up
+        with FitFilePatcher(path) as patcher:
+            patcher.patch_field(FileIdMessage.ID, FileIdTimeCreatedField.ID, lambda value: 1000)
+        with open(path, "rb") as file_object:
+            bytes_buffer = file_object.read()
+
+        for seconds in [-(2**32), 2**32, -RecordIndex.build(path).timestamps[-1]]:
+            with FitFilePatcher(path) as patcher:
+                with self.assertRaises(Exception):
+                    patcher.shift_timestamps(seconds)
+            with open(path, "rb") as file_object:
+                self.assertEqual(bytes_buffer, file_object.read())
+
+        with FitFilePatcher(path) as patcher:
+            self.assertGreater(patcher.shift_timestamps(-3600), 0)
+
+        patched_file = FitFile.from_file(path)
+        time_created = self.get_messages(patched_file, FileIdMessage)[0].get_field(
+            FileIdTimeCreatedField.ID
+        )
+        self.assertEqual([1000], time_created.encoded_values)
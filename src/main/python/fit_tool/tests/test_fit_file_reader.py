@@ -0,0 +1,58 @@
+# nosetests --nocapture  tests/test_fit_file_reader.py
+import csv
+import os
+import unittest
+
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_reader import FitFileReader
+
+
+class TestFitFileReader(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_read_records(self):
+        """Test streaming records yields the same records as FitFile."""
+        path = os.path.join(
+            os.path.dirname(__file__), "data/sdk/activity_developerdata.fit"
+        )
+        fit_file = FitFile.from_file(path)
+
+        with FitFileReader.from_file(path) as reader:
+            records = [record.to_bytes() for record in reader.records()]
+            crc = reader.crc
+
+        self.assertEqual([record.to_bytes() for record in fit_file.records], records)
+        self.assertEqual(fit_file.crc, crc)
+
+    def test_definitions(self):
+        """Test scanning definitions only."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/activity_multisport.fit")
+        fit_file = FitFile.from_file(path)
+
+        with FitFileReader.from_file(path) as reader:
+            definitions = [x.to_bytes() for x in reader.definitions()]
+
+        self.assertEqual(
+            [x.message.to_bytes() for x in fit_file.records if x.is_definition],
+            definitions,
+        )
+
+    def test_to_csv(self):
+        """Test streaming CSV export."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/activity_multisport.fit")
+        out_path = os.path.join(
+            os.path.dirname(__file__), "out/activity_multisport_stream.csv"
+        )
+
+        with FitFileReader.from_file(path) as reader:
+            reader.to_csv(out_path)
+
+        with open(out_path, newline="") as csv_file:
+            rows = [row for row in csv.reader(csv_file)]
+
+        expected_rows = FitFile.from_file(path).to_rows()
+        self.assertEqual(len(expected_rows), len(rows))
+        self.assertEqual(
+            [str(x) for x in expected_rows[1]], rows[1][: len(expected_rows[1])]
+        )
@@ -0,0 +1,89 @@
+# nosetests --nocapture  tests/test_fit_file_tail_reader.py
+import os
+import unittest
+
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_tail_reader import FitFileTailReader
+
+
+class TestFitFileTailReader(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_poll(self):
+        """Test decoding a file while it is being written in chunks."""
+        path = os.path.join(
+            os.path.dirname(__file__), "data/sdk/activity_developerdata.fit"
+        )
+        out_path = os.path.join(os.path.dirname(__file__), "out/activity_tail.fit")
+        with open(path, "rb") as file_object:
+            bytes_buffer = file_object.read()
+        fit_file = FitFile.from_bytes(bytes_buffer)
+
+        # the records size is only written once the file is complete
+        header_size = bytes_buffer[0]
+        incomplete_header = bytes_buffer[:4] + b"\x00\x00\x00\x00" + bytes_buffer[8:12]
+        if header_size == 14:
+            incomplete_header += b"\x00\x00"
+
+        callback_records = []
+        reader = FitFileTailReader(out_path, callback=callback_records.append)
+        with open(out_path, "wb") as file_object:
+            file_object.write(incomplete_header)
+        records = reader.poll()
+
+        chunk_size = 37
+        for offset in range(header_size, len(bytes_buffer), chunk_size):
+            with open(out_path, "ab") as file_object:
+                file_object.write(bytes_buffer[offset : offset + chunk_size])
+            records += reader.poll()
+
+        self.assertEqual(len(fit_file.records), len(records))
+
+        # the CRC is checked once the final header has been written
+        with open(out_path, "r+b") as file_object:
+            file_object.write(bytes_buffer[:header_size])
+        with open(out_path, "ab") as file_object:
+            file_object.write(bytes_buffer[:header_size])
+        records += reader.poll()
+
+        self.assertEqual(
+            [x.to_bytes() for x in fit_file.records], [x.to_bytes() for x in records]
+        )
+        self.assertEqual(records, callback_records)
+        self.assertEqual(fit_file.crc, reader.file_crc)
+
+        # header of a chained file
+        self.assertIsNotNone(reader.header)
+
+    def test_finalize_in_place(self):
+        """Test a writer that only rewrites the records size in the header once the
+        records and the CRC have been written."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/Settings.fit")
+        out_path = os.path.join(os.path.dirname(__file__), "out/activity_tail.fit")
+        with open(path, "rb") as file_object:
+            bytes_buffer = file_object.read()
+        fit_file = FitFile.from_bytes(bytes_buffer)
+
+        header_size = bytes_buffer[0]
+        incomplete_header = bytes_buffer[:4] + b"\x00\x00\x00\x00" + bytes_buffer[8:12]
+        if header_size == 14:
+            incomplete_header += b"\x00\x00"
+
+        with open(out_path, "wb") as file_object:
+            file_object.write(incomplete_header + bytes_buffer[header_size:])
+
+        reader = FitFileTailReader(out_path)
+        records = reader.poll()
+        self.assertIsNone(reader.file_crc)
+        self.assertEqual(0, reader.header.records_size)
+
+        with open(out_path, "r+b") as file_object:
+            file_object.write(bytes_buffer[:header_size])
+        records += reader.poll()
+
+        self.assertEqual(fit_file.crc, reader.file_crc)
+        self.assertEqual(
+            [x.to_bytes() for x in fit_file.records], [x.to_bytes() for x in records]
+        )
+        self.assertIsNone(reader.header)
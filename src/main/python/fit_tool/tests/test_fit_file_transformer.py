@@ -0,0 +1,96 @@
+# nosetests --nocapture  tests/test_fit_file_transformer.py
+import os
+import unittest
+
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_transformer import FitFileTransformer
+from fit_tool.profile.messages.record_message import (
+    RecordHeartRateField,
+    RecordMessage,
+    RecordPowerField,
+)
+
+
+class TestFitFileTransformer(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    @staticmethod
+    def get_records(fit_file: FitFile) -> list:
+        return [
+            x.message
+            for x in fit_file.records
+            if not x.is_definition and isinstance(x.message, RecordMessage)
+        ]
+
+    def test_copy(self):
+        """Test records without steps are copied byte for byte."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/activity_developerdata.fit")
+        out_path = os.path.join(os.path.dirname(__file__), "out/activity_copied.fit")
+
+        transformer = FitFileTransformer()
+        transformer.transform_file(path, out_path)
+        self.assertEqual(0, transformer.encoded_count)
+
+        with open(path, "rb") as file_object, open(out_path, "rb") as out_file_object:
+            self.assertEqual(file_object.read(), out_file_object.read())
+
+    def test_remove_field_and_filter(self):
+        """Test removing heart rate and dropping records with high power."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/activity_lowbattery.fit")
+        out_path = os.path.join(os.path.dirname(__file__), "out/activity_transformed.fit")
+
+        transformer = (
+            FitFileTransformer()
+            .remove_field(RecordMessage.ID, RecordHeartRateField.ID)
+            .filter(
+                lambda record: (record.get_encoded_value(RecordPowerField.ID) or 0) <= 700,
+                global_id=RecordMessage.ID,
+            )
+        )
+        transformer.transform_file(path, out_path)
+        self.assertEqual(0, transformer.encoded_count)
+        self.assertGreater(transformer.dropped_count, 0)
+
+        expected_records = [
+            x for x in self.get_records(FitFile.from_file(path)) if (x.power or 0) <= 700
+        ]
+        records = self.get_records(FitFile.from_file(out_path))
+        self.assertEqual(len(expected_records), len(records))
+        self.assertTrue(all(x.heart_rate is None for x in records))
+        self.assertEqual([x.power for x in expected_records], [x.power for x in records])
+        self.assertEqual([x.timestamp for x in expected_records], [x.timestamp for x in records])
+
+    def test_map(self):
+        """Test only the records changed by a map step are encoded again."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/activity_developerdata.fit")
+        out_path = os.path.join(os.path.dirname(__file__), "out/activity_mapped.fit")
+
+        def double_power(record):
+            message = record.message
+            if message.power is not None and message.power > 200:
+                message.power *= 2
+                message.remove_field(RecordHeartRateField.ID)
+                return message
+            return None
+
+        transformer = FitFileTransformer().map(double_power, global_id=RecordMessage.ID)
+        transformer.transform_file(path, out_path)
+
+        expected_records = self.get_records(FitFile.from_file(path))
+        records = self.get_records(FitFile.from_file(out_path))
+        changed = [x.power is not None and x.power > 200 for x in expected_records]
+        self.assertGreater(sum(changed), 0)
+        self.assertEqual(sum(changed), transformer.encoded_count)
+        self.assertEqual(
+            [x.power * 2 if y else x.power for x, y in zip(expected_records, changed)],
+            [x.power for x in records],
+        )
+        self.assertEqual(
+            [None if y else x.heart_rate for x, y in zip(expected_records, changed)],
+            [x.heart_rate for x in records],
+        )
+        self.assertEqual(
+            [x.developer_fields[0].get_value() for x in expected_records],
+            [x.developer_fields[0].get_value() for x in records],
+        )
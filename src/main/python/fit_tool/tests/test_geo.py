@@ -0,0 +1,67 @@
+# nosetests --nocapture  tests/test_geo.py
+import unittest
+
+from fit_tool.geo import (
+    INVALID_SEMICIRCLES,
+    VINCENTY,
+    bearing,
+    bounding_box,
+    cumulative_distances,
+    haversine_distance,
+    to_degrees_all,
+    to_semicircles_all,
+    vincenty_distance,
+)
+from fit_tool.utils.conversions import to_degrees, to_semicircles
+
+
+class TestGeo(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_conversions(self):
+        """Test bulk conversions match the single value conversions."""
+        degrees = [47.376887, -122.419, 0.0, None, 179.9999]
+        semicircles = to_semicircles_all(degrees)
+        self.assertEqual(
+            [None if x is None else to_semicircles(x) for x in degrees], semicircles
+        )
+        self.assertEqual(
+            [None if x is None else to_degrees(x) for x in semicircles],
+            to_degrees_all(semicircles),
+        )
+        self.assertEqual([None], to_degrees_all([INVALID_SEMICIRCLES]))
+
+    def test_distances(self):
+        """Test haversine and Vincenty distances against known values."""
+        # Flinders Peak to Buninyong, Vincenty's reference: 54972.271 m
+        self.assertAlmostEqual(
+            54972.271,
+            vincenty_distance(-37.95103342, 144.42486789, -37.65282114, 143.92649554),
+            delta=0.001,
+        )
+        # one degree of longitude along the equator
+        self.assertAlmostEqual(111319.491, vincenty_distance(0.0, 0.0, 0.0, 1.0), delta=0.001)
+        self.assertAlmostEqual(111195.08, haversine_distance(0.0, 0.0, 0.0, 1.0), delta=0.01)
+        self.assertEqual(0.0, vincenty_distance(10.0, 10.0, 10.0, 10.0))
+        # antipodal positions do not converge
+        self.assertGreater(vincenty_distance(0.0, 0.0, 0.5, 179.7), 19e6)
+
+        latitudes = [0.0, 0.0, None, 0.0]
+        longitudes = [0.0, 1.0, None, 3.0]
+        distances = cumulative_distances(latitudes, longitudes)
+        self.assertEqual(0.0, distances[0])
+        self.assertIsNone(distances[2])
+        self.assertAlmostEqual(3 * 111195.08, distances[3], delta=0.1)
+        distances = cumulative_distances(latitudes, longitudes, method=VINCENTY)
+        self.assertAlmostEqual(3 * 111319.491, distances[3], delta=0.01)
+
+    def test_bearing_and_bounding_box(self):
+        """Test bearings and bounding boxes of columns."""
+        self.assertAlmostEqual(90.0, bearing(0.0, 0.0, 0.0, 1.0))
+        self.assertAlmostEqual(0.0, bearing(0.0, 0.0, 1.0, 0.0))
+        self.assertAlmostEqual(270.0, bearing(0.0, 1.0, 0.0, 0.0))
+        self.assertEqual(
+            (-1.0, 2.0, 3.0, 5.0), bounding_box([1.0, None, -1.0, 3.0], [5.0, 2.0, 4.0, None])
+        )
+        self.assertIsNone(bounding_box([None], [None]))
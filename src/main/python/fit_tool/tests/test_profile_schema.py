@@ -0,0 +1,125 @@
+# nosetests --nocapture  tests/test_profile_schema.py
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+
+from fit_tool.fit_file_reader import FitFileReader
+from fit_tool.profile.messages.file_id_message import FileIdMessage
+from fit_tool.profile.messages.record_message import RecordMessage
+from fit_tool.profile_schema import SchemaMessage, SchemaMessageFactory, get_default_schema
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "sdk")
+
+
+def read_messages(path: str, message_factory=None) -> list:
+    with FitFileReader.from_file(path, message_factory=message_factory) as reader:
+        return [x.message for x in reader.records() if not x.is_definition]
+
+
+class TestProfileSchema(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_message_types(self):
+        """Test the message classes built from the schema against the generated ones."""
+        schema = get_default_schema()
+        self.assertEqual("record", schema.get_message_name(RecordMessage.ID))
+        self.assertIsNone(schema.get_message_type(0xFF00))
+
+        for message_class in (FileIdMessage, RecordMessage):
+            message_type = schema.get_message_type(message_class.ID)
+            self.assertIs(message_type, schema.get_message_type(message_class.ID))
+            self.assertTrue(issubclass(message_type, SchemaMessage))
+            self.assertEqual(message_class.__name__, message_type.__name__)
+            self.assertEqual(sorted(message_class.FIELD_TYPES), sorted(message_type.FIELD_TYPES))
+
+            for field_id, field_type in message_class.FIELD_TYPES.items():
+                expected = field_type(size=0, growable=False)
+                field = message_type.FIELD_TYPES[field_id](size=0, growable=False)
+                self.assertEqual(type(expected).__name__, type(field).__name__)
+                self.assertEqual(
+                    (expected.name, expected.base_type, expected.scale, expected.offset),
+                    (field.name, field.base_type, field.scale, field.offset),
+                )
+                self.assertEqual(expected.units, field.units)
+                self.assertEqual(
+                    [x.name for x in expected.sub_fields], [x.name for x in field.sub_fields]
+                )
+
+        message = schema.get_message_type(FileIdMessage.ID)()
+        message.manufacturer = 1
+        message.product = 263
+        self.assertEqual(263, message.garmin_product)
+
+    def test_value_names(self):
+        """Test the names of profile type values."""
+        schema = get_default_schema()
+        self.assertEqual("CYCLING", schema.get_value_name("sport", 2))
+        self.assertIsNone(schema.get_value_name("sport", 1000))
+        self.assertIsNone(schema.get_value_name("unknown", 2))
+        self.assertEqual("GARMIN", schema.get_field_value_name(FileIdMessage.ID, 1, 1))
+
+    def test_decode(self):
+        """Test that a file decodes the same with the schema and the generated classes."""
+        path = os.path.join(DATA_PATH, "activity_developerdata.fit")
+        expected = read_messages(path)
+        messages = read_messages(path, message_factory=SchemaMessageFactory)
+
+        self.assertEqual(len(expected), len(messages))
+        for expected_message, message in zip(expected, messages):
+            self.assertEqual(expected_message.name, message.name)
+            self.assertEqual(expected_message.to_row(), message.to_row())
+
+        records = [x for x in messages if x.global_id == RecordMessage.ID]
+        self.assertEqual(
+            [x.heart_rate for x in expected if x.global_id == RecordMessage.ID],
+            [x.heart_rate for x in records],
+        )
+        self.assertTrue(any(x.developer_fields for x in records))
+
+    def test_pickle(self):
+        """Test pickling schema messages, loaded here and in a new interpreter."""
+        path = os.path.join(DATA_PATH, "activity_developerdata.fit")
+        messages = read_messages(path, message_factory=SchemaMessageFactory)
+        pickled = pickle.dumps(messages)
+
+        copies = pickle.loads(pickled)
+        self.assertEqual([type(x) for x in messages], [type(x) for x in copies])
+        self.assertEqual([x.to_row() for x in messages], [x.to_row() for x in copies])
+
+        code = (
+            "import pickle, sys\n"
+            "messages = pickle.loads(sys.stdin.buffer.read())\n"
+            "print(sum(x.heart_rate is not None for x in messages if x.name == 'record'))\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        environment = dict(os.environ, PYTHONPATH=root)
+        output = subprocess.run(
+            [sys.executable, "-c", code], input=pickled, capture_output=True, env=environment
+        )
+        self.assertEqual(0, output.returncode, output.stderr)
+        records = [x for x in messages if x.global_id == RecordMessage.ID]
+        self.assertEqual(
+            str(sum(x.heart_rate is not None for x in records)), output.stdout.decode().strip()
+        )
+
+    def test_generated_modules_not_imported(self):
+        """Test that decoding with the schema does not import the message modules."""
+        path = os.path.join(DATA_PATH, "activity_developerdata.fit")
+        code = (
+            "import sys\n"
+            "from fit_tool.fit_file_reader import FitFileReader\n"
+            "from fit_tool.profile_schema import SchemaMessageFactory\n"
+            f"with FitFileReader.from_file({path!r}, "
+            "message_factory=SchemaMessageFactory) as reader:\n"
+            "    list(reader.records())\n"
+            "print('fit_tool.profile.messages.record_message' in sys.modules)\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        environment = dict(os.environ, PYTHONPATH=root)
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=environment
+        )
+        self.assertEqual("False", output.stdout.strip())
@@ -0,0 +1,96 @@
+# nosetests --nocapture  tests/test_record_index.py
+import os
+import shutil
+import unittest
+
+from fit_tool.fit_file import FitFile
+from fit_tool.profile.messages.file_id_message import FileIdMessage
+from fit_tool.profile.messages.record_message import RecordMessage
+from fit_tool.record_index import IndexedFitFile, RecordIndex, get_index_path
+
+
+class TestRecordIndex(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_index(self):
+        """Test building, saving and reloading a record index."""
+        path = os.path.join(os.path.dirname(__file__), "out/activity_developerdata.fit")
+        shutil.copyfile(
+            os.path.join(os.path.dirname(__file__), "data/sdk/activity_developerdata.fit"),
+            path,
+        )
+        index_path = get_index_path(path)
+        if os.path.exists(index_path):
+            os.remove(index_path)
+
+        fit_file = FitFile.from_file(path)
+        index = RecordIndex.open(path)
+        self.assertTrue(os.path.exists(index_path))
+        self.assertEqual(len(fit_file.records), len(index))
+
+        loaded_index = RecordIndex.open(path)
+        self.assertEqual(index.columns(), loaded_index.columns())
+        self.assertEqual(fit_file.crc, loaded_index.file_crc)
+
+        record_indexes = index.get_record_indexes(RecordMessage.ID)
+        messages = [
+            x.message
+            for x in fit_file.records
+            if not x.is_definition and isinstance(x.message, RecordMessage)
+        ]
+        self.assertEqual(len(messages), len(record_indexes))
+        self.assertEqual(
+            round(messages[-1].timestamp.timestamp()) - 631065600,
+            index.timestamps[record_indexes[-1]],
+        )
+
+        with IndexedFitFile(path, index=loaded_index) as indexed_file:
+            record = indexed_file.read_record(record_indexes[-1])
+            self.assertEqual(messages[-1].to_bytes(), record.message.to_bytes())
+            self.assertEqual(
+                [x.to_bytes() for x in fit_file.records],
+                [x.to_bytes() for x in indexed_file.records()],
+            )
+
+        with open(path, "ab") as file_object:
+            file_object.write(b"\x00")
+        self.assertFalse(loaded_index.is_valid_for(path))
+
+    def test_slice(self):
+        """Test decoding and writing a time slice of a file."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/activity_multisport.fit")
+        fit_file = FitFile.from_file(path)
+        messages = [
+            x.message
+            for x in fit_file.records
+            if not x.is_definition and isinstance(x.message, RecordMessage)
+        ]
+        start = messages[len(messages) // 3].timestamp
+        end = messages[len(messages) // 2].timestamp
+        expected_messages = [x for x in messages if start <= x.timestamp <= end]
+
+        with IndexedFitFile(path, index=RecordIndex.build(path)) as indexed_file:
+            records = [x for x in indexed_file.slice(start, end)]
+            sliced_file = indexed_file.slice_to_fit_file(start, end)
+
+        self.assertTrue(records[0].is_definition)
+        self.assertEqual(FileIdMessage.ID, records[1].message.global_id)
+        self.assertEqual(
+            [x.to_bytes() for x in expected_messages],
+            [
+                x.message.to_bytes()
+                for x in records
+                if not x.is_definition and isinstance(x.message, RecordMessage)
+            ],
+        )
+
+        decoded_file = FitFile.from_bytes(sliced_file.to_bytes())
+        self.assertEqual(
+            [x.timestamp for x in expected_messages],
+            [
+                x.message.timestamp
+                for x in decoded_file.records
+                if isinstance(x.message, RecordMessage)
+            ],
+        )
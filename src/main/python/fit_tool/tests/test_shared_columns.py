@@ -0,0 +1,112 @@
+# nosetests --nocapture  tests/test_shared_columns.py
+import math
+import os
+import pickle
+import unittest
+
+from fit_tool.base_type import BaseType
+from fit_tool.fit_file import FitFile
+from fit_tool.profile.messages.record_message import RecordMessage
+from fit_tool.shared_columns import decode_all_shared_columns, write_shared_columns
+from fit_tool.summary_aggregator import SummaryAggregator
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "sdk")
+
+
+class TestSharedColumns(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_write_shared_columns(self):
+        """Test the layout of scalar, array and float columns in a block."""
+        shared_columns = write_shared_columns(
+            {
+                "heart_rate": [120, None, 130],
+                "speeds": [[1, 2, 3], [4], None],
+                "temperature": [1.5, None, 2.5],
+            },
+            {
+                "heart_rate": BaseType.UINT8,
+                "speeds": BaseType.UINT16,
+                "temperature": BaseType.FLOAT32,
+            },
+            {"heart_rate": 1, "speeds": 3, "temperature": 1},
+            3,
+        )
+        shared_columns = pickle.loads(pickle.dumps(shared_columns))
+        descriptors = {x.name: x for x in shared_columns.descriptors}
+        heart_rate = descriptors["heart_rate"]
+        speeds = descriptors["speeds"]
+        self.assertEqual(("B", (3,)), (heart_rate.dtype, heart_rate.shape))
+        self.assertEqual(("H", (3, 3)), (speeds.dtype, speeds.shape))
+        self.assertEqual(0, speeds.offset % 8)
+
+        with shared_columns.attach() as columns:
+            self.assertEqual(3, len(columns))
+            self.assertEqual([120, 0xFF, 130], columns["heart_rate"].tolist())
+            self.assertEqual(
+                [[1, 2, 3], [4, 0xFFFF, 0xFFFF], [0xFFFF] * 3], columns["speeds"].tolist()
+            )
+            self.assertEqual(4, columns["speeds"][1, 0])
+            temperatures = columns["temperature"].tolist()
+            self.assertEqual(2.5, temperatures[2])
+            self.assertTrue(math.isnan(temperatures[1]))
+
+        shared_columns.unlink()
+        self.assertRaises(FileNotFoundError, shared_columns.attach)
+
+    def test_decode_all_shared_columns(self):
+        """Test decoding record columns in worker processes against to_columns."""
+        path = os.path.join(DATA_PATH, "activity_developerdata.fit")
+        expected = FitFile.from_file(path).to_columns(RecordMessage.ID)
+
+        results = decode_all_shared_columns([path, path], RecordMessage.ID, max_workers=2)
+        self.assertEqual(2, len(results))
+
+        for shared_columns in results:
+            with shared_columns.attach() as columns:
+                descriptors = {x.name: x for x in shared_columns.descriptors}
+                self.assertEqual(set(expected), set(descriptors))
+                for name, column in expected.items():
+                    invalid_value = descriptors[name].invalid_value
+                    self.assertEqual(
+                        [invalid_value if x is None else x for x in column],
+                        columns[name].tolist(),
+                    )
+
+                self.assertEqual(
+                    SummaryAggregator(expected).summarize(0, len(columns)),
+                    SummaryAggregator(columns.columns).summarize(0, len(columns)),
+                )
+
+            shared_columns.unlink()
+
+    def test_decode_error(self):
+        """Test that a file failing to decode raises its error."""
+        path = os.path.join(DATA_PATH, "activity_developerdata.fit")
+        self.assertRaises(
+            FileNotFoundError,
+            decode_all_shared_columns,
+            [path, os.path.join(DATA_PATH, "missing.fit")],
+            RecordMessage.ID,
+            max_workers=2,
+        )
+
+    def test_unique_column_names(self):
+        """Test that fields of one message sharing a name get columns of their own."""
+        path = os.path.join(os.path.dirname(__file__), "data", "activity_deprecated_profile.fit")
+        expected = FitFile.from_file(path).to_columns(13)
+        self.assertIn("field_1", expected)
+        self.assertNotIn("field", expected)
+
+        results = decode_all_shared_columns(
+            [path, os.path.join(DATA_PATH, "activity_developerdata.fit")], 13, max_workers=2
+        )
+        with results[0].attach() as columns:
+            self.assertEqual(1, len(columns))
+            for name, column in expected.items():
+                if name in columns:
+                    self.assertEqual(column, columns[name].tolist())
+
+        for shared_columns in results:
+            shared_columns.unlink()
@@ -0,0 +1,153 @@
+# nosetests --nocapture  tests/test_skim_scanner.py
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from fit_tool.fit_file import FitFile
+from fit_tool.skim_scanner import (
+    CRC_MISMATCH,
+    CRC_MISSING,
+    CRC_NOT_CHECKED,
+    CRC_OK,
+    SkimScanner,
+    to_utc,
+)
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "sdk")
+
+
+def read_bytes(name: str) -> bytes:
+    with open(os.path.join(DATA_PATH, name), "rb") as file_object:
+        return file_object.read()
+
+
+class TestSkimScanner(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_scan_file(self):
+        """Test the counts of a skim against decoding the file."""
+        path = os.path.join(DATA_PATH, "activity_developerdata.fit")
+        report = SkimScanner().scan_file(path)
+        fit_file = FitFile.from_file(path)
+
+        message_counts = {}
+        definition_counts = {}
+        for record in fit_file.records:
+            counts = definition_counts if record.is_definition else message_counts
+            global_id = record.message.global_id
+            counts[global_id] = counts.get(global_id, 0) + 1
+
+        self.assertIsNone(report.error)
+        self.assertEqual(CRC_OK, report.crc_status)
+        self.assertEqual(fit_file.header.records_size, report.records_size)
+        self.assertEqual(len(fit_file.records), report.record_count)
+        self.assertEqual(message_counts, report.message_counts)
+        self.assertEqual(definition_counts, report.definition_counts)
+        self.assertEqual({(0, 0): 1, (0, 1): 1}, report.developer_fields)
+        self.assertEqual("2020-09-04T22:00:04+00:00", to_utc(report.start_time).isoformat())
+        self.assertEqual(3601, report.duration)
+        self.assertEqual(0, report.trailing_size)
+
+    def test_damaged_files(self):
+        """Test reporting truncated files and CRC mismatches."""
+        bytes_buffer = read_bytes("Activity.fit")
+
+        report = SkimScanner().scan_bytes(bytes_buffer[:1000])
+        self.assertIn("Truncated", report.error)
+        self.assertGreater(report.message_count, 0)
+
+        report = SkimScanner().scan_bytes(bytes_buffer[:-2])
+        self.assertIsNone(report.error)
+        self.assertEqual(CRC_MISSING, report.crc_status)
+
+        damaged = bytearray(bytes_buffer)
+        damaged[-1] ^= 0xFF
+        report = SkimScanner().scan_bytes(bytes(damaged))
+        self.assertEqual(CRC_MISMATCH, report.crc_status)
+
+        report = SkimScanner(check_crc=False).scan_bytes(bytes(damaged))
+        self.assertEqual(CRC_NOT_CHECKED, report.crc_status)
+        self.assertIsNone(report.calculated_crc)
+
+        report = SkimScanner().scan_bytes(b"")
+        self.assertIn("Invalid file header", report.error)
+
+        # cut inside a definition
+        for size in range(14, 400):
+            report = SkimScanner().scan_bytes(read_bytes("activity_developerdata.fit")[:size])
+            self.assertTrue(report.error.startswith("Truncated file"), report.error)
+
+    def test_invalid_files(self):
+        """Test reporting files that are not FIT files or shorter than a header."""
+        for bytes_buffer in [b"not a FIT file, just some text", read_bytes("Settings.fit")[:5]]:
+            report = SkimScanner().scan_bytes(bytes_buffer)
+            self.assertIn("Invalid file header", report.error)
+            self.assertIsNone(report.header)
+            self.assertEqual(0, report.record_count)
+
+    def test_stat_command(self):
+        """Test the stat command of the package."""
+        paths = [
+            os.path.join(DATA_PATH, "Settings.fit"),
+            os.path.join(DATA_PATH, "activity_developerdata.fit"),
+        ]
+        python_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+        result = subprocess.run(
+            [sys.executable, "-m", "fit_tool", "stat", "--json"] + paths,
+            cwd=python_path,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+        reports = json.loads(result.stdout)
+        self.assertEqual(paths, [x["path"] for x in reports])
+        self.assertEqual(3601, reports[1]["message_counts"]["20"])
+
+        result = subprocess.run(
+            [sys.executable, "-m", "fit_tool", "stat", paths[1]],
+            cwd=python_path,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertIn("record", result.stdout)
+        self.assertIn("crc: ok", result.stdout)
+
+        # a file that is not a FIT file is reported, the files after it are scanned
+        result = subprocess.run(
+            [sys.executable, "-m", "fit_tool", "stat", "--json", __file__, paths[1]],
+            cwd=python_path,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(1, result.returncode, result.stderr)
+        reports = json.loads(result.stdout)
+        self.assertIn("Invalid file header", reports[0]["error"])
+        self.assertEqual(CRC_OK, reports[1]["crc"])
+
+    def test_imports(self):
+        """Test the scanner does not load the decoder, the profile or SQLite."""
+        python_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        modules = [
+            "fit_tool.fit_file",
+            "fit_tool.profile.messages.message_factory",
+            "sqlite3",
+            "concurrent.futures",
+        ]
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, fit_tool.skim_scanner; "
+                f"print([x for x in {modules} if x in sys.modules])",
+            ],
+            cwd=python_path,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertEqual("[]", result.stdout.strip())
@@ -0,0 +1,112 @@
+# nosetests --nocapture  tests/test_sqlite_exporter.py
+import os
+import sqlite3
+import unittest
+
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_reader import FitFileReader
+from fit_tool.profile.messages.device_info_message import DeviceInfoMessage
+from fit_tool.profile.messages.record_message import RecordMessage
+from fit_tool.record import Record
+from fit_tool.sqlite_exporter import SqliteExporter, export_files
+
+
+class TestSqliteExporter(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    def test_export_files(self):
+        """Test appending several files to one database."""
+        paths = [
+            os.path.join(os.path.dirname(__file__), "data/sdk/activity_multisport.fit"),
+            os.path.join(os.path.dirname(__file__), "data/sdk/MonitoringFile.fit"),
+        ]
+        database_path = os.path.join(os.path.dirname(__file__), "out/export.db")
+        if os.path.exists(database_path):
+            os.remove(database_path)
+
+        export_files(paths, database_path)
+
+        fit_file = FitFile.from_file(paths[0])
+        records = [x.message for x in fit_file.records if isinstance(x.message, RecordMessage)]
+
+        connection = sqlite3.connect(database_path)
+        try:
+            files = connection.execute("SELECT id, name, crc FROM files").fetchall()
+            self.assertEqual((1, "activity_multisport.fit", fit_file.crc), files[0])
+            self.assertEqual(2, len(files))
+
+            rows = connection.execute(
+                "SELECT timestamp, heart_rate, cadence FROM record "
+                "WHERE file_id = 1 ORDER BY rowid"
+            ).fetchall()
+            self.assertEqual(len(records), len(rows))
+            self.assertEqual(
+                round(records[0].timestamp.timestamp() * 1000), rows[0][0]
+            )
+            self.assertEqual(records[0].heart_rate, rows[0][1])
+            self.assertIsNone(rows[0][2])
+
+            (units,) = connection.execute(
+                "SELECT units FROM columns "
+                "WHERE table_name = 'record' AND column_name = 'heart_rate'"
+            ).fetchone()
+            self.assertEqual("bpm", units)
+
+            indexes = connection.execute("PRAGMA index_list(record)").fetchall()
+            self.assertIn("record_timestamp", [x[1] for x in indexes])
+        finally:
+            connection.close()
+
+    def test_developer_field_named_like_profile_field(self):
+        """Test that a developer field does not overwrite the profile field it is
+        named after."""
+        path = os.path.join(
+            os.path.dirname(__file__), "data/activity_multiple_developer_index.fit"
+        )
+        developer_field = next(
+            x
+            for record in FitFile.from_file(path).records
+            if not record.is_definition
+            for x in record.message.developer_fields
+            if x.name == "software_version"
+        )
+
+        message = DeviceInfoMessage()
+        message.software_version = 2.5
+        message.developer_fields = [developer_field]
+
+        with SqliteExporter(sqlite3.connect(":memory:")) as exporter:
+            exporter.export([Record.from_message(message)])
+            row = exporter.connection.execute(
+                "SELECT software_version, developer_10_0 FROM device_info"
+            ).fetchone()
+
+        self.assertEqual((2.5, developer_field.encoded_values[0]), row)
+
+    def test_export_after_failure(self):
+        """Test that a file failing to decode leaves nothing behind for the next one."""
+        path = os.path.join(os.path.dirname(__file__), "data/sdk/Activity.fit")
+        with open(path, "rb") as file_object:
+            bytes_buffer = file_object.read()
+        corrupt_bytes = bytes_buffer[:-1] + bytes([bytes_buffer[-1] ^ 0xFF])
+
+        with SqliteExporter(sqlite3.connect(":memory:")) as exporter:
+            with self.assertRaises(Exception):
+                exporter.export(FitFileReader.from_bytes(corrupt_bytes).records())
+
+            file_id = exporter.export(FitFileReader.from_bytes(bytes_buffer).records())
+            files = exporter.connection.execute("SELECT id FROM files").fetchall()
+            (record_count,) = exporter.connection.execute(
+                "SELECT COUNT(*) FROM record"
+            ).fetchone()
+            (file_id_count,) = exporter.connection.execute(
+                "SELECT COUNT(*) FROM file_id"
+            ).fetchone()
+
+        records = FitFile.from_bytes(bytes_buffer).records
+        self.assertEqual([(file_id,)], files)
+        self.assertEqual(
+            len([x for x in records if isinstance(x.message, RecordMessage)]), record_count
+        )
+        self.assertEqual(1, file_id_count)
@@ -0,0 +1,106 @@
+# nosetests --nocapture  tests/test_summary_aggregator.py
+import unittest
+
+from fit_tool.fit_file import FitFile
+from fit_tool.fit_file_generator import FitFileGenerator
+from fit_tool.profile.messages.lap_message import LapMessage
+from fit_tool.profile.messages.record_message import RecordMessage
+from fit_tool.profile.messages.session_message import SessionMessage
+from fit_tool.summary_aggregator import SummaryAggregator
+
+
+class TestSummaryAggregator(unittest.TestCase):
+    def shortDescription(self):
+        return None
+
+    @staticmethod
+    def get_messages(fit_file: FitFile, message_type) -> list:
+        return [
+            x.message
+            for x in fit_file.records
+            if not x.is_definition and isinstance(x.message, message_type)
+        ]
+
+    def test_update_fit_file(self):
+        """Test lap and session totals are recomputed from the records."""
+        generator = FitFileGenerator(seed=3, record_count=600, lap_interval=200)
+        fit_file = FitFile.from_bytes(FitFileGenerator.to_bytes(generator.activity()))
+        records = self.get_messages(fit_file, RecordMessage)
+
+        updated_file = FitFile.from_bytes(SummaryAggregator.update_fit_file(fit_file).to_bytes())
+        laps = self.get_messages(updated_file, LapMessage)
+        sessions = self.get_messages(updated_file, SessionMessage)
+        self.assertEqual(3, len(laps))
+        self.assertEqual(1, len(sessions))
+
+        for lap, lap_records in zip(laps, [records[i : i + 200] for i in range(0, 600, 200)]):
+            heart_rates = [x.heart_rate for x in lap_records]
+            powers = [x.power for x in lap_records]
+            self.assertEqual(round(sum(heart_rates) / len(heart_rates)), lap.avg_heart_rate)
+            self.assertEqual(max(heart_rates), lap.max_heart_rate)
+            self.assertEqual(min(heart_rates), lap.min_heart_rate)
+            self.assertEqual(max(powers), lap.max_power)
+            self.assertAlmostEqual(
+                max(x.speed for x in lap_records), lap.max_speed, delta=0.001
+            )
+            self.assertAlmostEqual(
+                lap_records[0].position_lat, lap.start_position_lat, delta=1e-6
+            )
+            self.assertAlmostEqual(lap_records[-1].position_long, lap.end_position_long, delta=1e-6)
+
+        distance = records[-1].distance - records[0].distance
+        self.assertAlmostEqual(distance, sum(x.total_distance for x in laps), delta=0.05)
+        self.assertAlmostEqual(distance, sessions[0].total_distance, delta=0.01)
+        self.assertEqual(599.0, sessions[0].total_elapsed_time)
+
+        altitudes = [x.altitude for x in records]
+        ascent = sum(max(0.0, b - a) for a, b in zip(altitudes, altitudes[1:]))
+        self.assertAlmostEqual(ascent, sessions[0].total_ascent, delta=1.0)
+
+    def test_update_fit_file_times(self):
+        """Test lap times add up to the session time and the input file is unchanged."""
+        generator = FitFileGenerator(seed=3, record_count=600, lap_interval=200)
+        fit_file = FitFile.from_bytes(FitFileGenerator.to_bytes(generator.activity()))
+        laps = self.get_messages(fit_file, LapMessage)
+        for previous_lap, lap in zip(laps, laps[1:]):
+            lap.start_time = previous_lap.timestamp
+        laps[0].total_timer_time = 1000.0
+        laps[1].total_timer_time = 150.0
+        records_bytes = [x.to_bytes() for x in fit_file.records]
+
+        updated_file = SummaryAggregator.update_fit_file(fit_file)
+        self.assertEqual(records_bytes, [x.to_bytes() for x in fit_file.records])
+
+        updated_file = FitFile.from_bytes(updated_file.to_bytes())
+        laps = self.get_messages(updated_file, LapMessage)
+        sessions = self.get_messages(updated_file, SessionMessage)
+        self.assertEqual([199.0, 200.0, 200.0], [x.total_elapsed_time for x in laps])
+        self.assertEqual(
+            sessions[0].total_elapsed_time, sum(x.total_elapsed_time for x in laps)
+        )
+
+        # timer times longer than the elapsed time are reset, shorter ones kept
+        self.assertEqual([199.0, 150.0, 199.0], [x.total_timer_time for x in laps])
+
+    def test_summarize(self):
+        """Test invalid values are ignored and ranges are found by timestamp."""
+        invalid = 0xFF
+        columns = {
+            "timestamp": [1000, 1001, None, 1003, 1004],
+            "heart_rate": [100, invalid, 120, 140, None],
+            "distance": [0, 500, 1000, 1500, 2000],
+        }
+        aggregator = SummaryAggregator(columns)
+
+        self.assertEqual(range(1, 4), aggregator.get_range(1001, 1003))
+        summary = aggregator.summarize(1, 4)
+        self.assertEqual(130.0, summary["avg_heart_rate"])
+        self.assertEqual(140.0, summary["max_heart_rate"])
+        self.assertEqual(15.0, summary["total_distance"])
+        self.assertEqual(2.0, summary["total_elapsed_time"])
+        self.assertEqual(7.5, summary["avg_speed"])
+
+        summary = aggregator.summarize(1, 4, elapsed_time=3.0, timer_time=1.5)
+        self.assertEqual(3.0, summary["total_elapsed_time"])
+        self.assertEqual(1.5, summary["total_timer_time"])
+        self.assertEqual(10.0, summary["avg_speed"])
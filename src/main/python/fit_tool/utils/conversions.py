@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta, timezone
+
 # milliseconds from Unix epoch (start of 1970) to Sun Dec 31 00:00:00 1989
 MILLISECONDS_EPOCH_1989_DELTA = 631065600000
 
@@ -22,3 +24,28 @@ def to_semicircles(degrees: int) -> int:
 
 def to_degrees(semicircles: int) -> float:
     return (semicircles * 180.0) / 2147483648
+
+
+def to_milliseconds_since_epoch_all(seconds_since_1989_epoch: list) -> list:
+    return [
+        None if seconds is None else seconds * 1000 + MILLISECONDS_EPOCH_1989_DELTA
+        for seconds in seconds_since_1989_epoch
+    ]
+
+
+def to_datetimes(seconds_since_1989_epoch: list) -> list:
+    epoch_1989 = datetime.fromtimestamp(
+        MILLISECONDS_EPOCH_1989_DELTA // 1000, tz=timezone.utc
+    )
+    return [
+        None if seconds is None else epoch_1989 + timedelta(seconds=seconds)
+        for seconds in seconds_since_1989_epoch
+    ]
+
+
+def un_scale_offset_values(encoded_values: list, scale: float, offset: float) -> list:
+    scale = scale if scale else 1.0
+    offset = offset if offset else 0.0
+    return [
+        None if value is None else value / scale - offset for value in encoded_values
+    ]
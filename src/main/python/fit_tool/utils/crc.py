@@ -18,19 +18,60 @@ CRC_TABLE = (
 )
 
 
-def crc16(buffer, crc=0):
-    if not buffer:
-        return crc
-
+def crc16_nibbles(buffer, crc=0):
     for byte in buffer:
-        # byte_char = ord(byte)
-        byte_char = byte
         # Taken verbatim from FIT SDK docs
         tmp = CRC_TABLE[crc & 0xF]
         crc = (crc >> 4) & 0x0FFF
-        crc = crc ^ tmp ^ CRC_TABLE[byte_char & 0xF]
+        crc = crc ^ tmp ^ CRC_TABLE[byte & 0xF]
         # now compute checksum of upper four bits of byte
         tmp = CRC_TABLE[crc & 0xF]
         crc = (crc >> 4) & 0x0FFF
-        crc = crc ^ tmp ^ CRC_TABLE[(byte_char >> 4) & 0xF]
+        crc = crc ^ tmp ^ CRC_TABLE[(byte >> 4) & 0xF]
+    return crc
+
+
+# crc of each byte value, to update the crc a byte at a time instead of a nibble
+CRC_BYTE_TABLE = tuple(crc16_nibbles((x,)) for x in range(256))
+
+
+def crc16(buffer, crc=0):
+    if not buffer:
+        return crc
+
+    table = CRC_BYTE_TABLE
+    for byte in buffer:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
     return crc
+
+
+def gf2_matrix_times(matrix, vector):
+    result = 0
+    index = 0
+    while vector:
+        if vector & 1:
+            result ^= matrix[index]
+        vector >>= 1
+        index += 1
+    return result
+
+
+def gf2_matrix_square(matrix):
+    return [gf2_matrix_times(matrix, column) for column in matrix]
+
+
+def crc16_combine(crc1, crc2, length2):
+    """Return the crc of two concatenated buffers from crc1 of the first (seeded
+    with the initial crc), crc2 of the second computed with crc=0 and the length
+    of the second, in O(log length2) like zlib's crc32_combine."""
+    # operator appending one zero byte, as the images of the 16 crc bits
+    operator = [crc16(b"\0", crc=1 << bit) for bit in range(16)]
+
+    while length2:
+        if length2 & 1:
+            crc1 = gf2_matrix_times(operator, crc1)
+        length2 >>= 1
+        if length2:
+            operator = gf2_matrix_square(operator)
+
+    return crc1 ^ crc2